@@ -1,4 +1,3 @@
-import csv
 import hashlib
 import importlib.util
 import logging
@@ -6,8 +5,8 @@ import multiprocessing
 import os
 import queue as queue_module
 import re
-import subprocess
 import sys
+import threading
 import time
 from collections import Counter
 from collections.abc import Callable, Mapping, Sequence
@@ -26,11 +25,20 @@ from filelock import Timeout as FileLockTimeout
 from query_spec import ToolCallSpec, ToolStage
 
 from langnet.cli_databuild import databuild
+from langnet.cli_reader import (
+    DEFAULT_CLASSIFICATION_MAX_ATTEMPTS,
+    DEFAULT_CLASSIFICATION_TIMEOUT_SECONDS,
+    DEFAULT_RECOMMENDATION_MODEL,
+    _reader_catalog_path,
+    reader_cli,
+)
+from langnet.cli_server import serve
 from langnet.cli_triples import (
     build_triples_dump_payload,
     display_claim_triples,
     display_dico_resolutions,
 )
+from langnet.cli_word_index import word_index_cli
 from langnet.clients.base import ToolClient
 from langnet.clients.http import HttpToolClient
 from langnet.encounter_display import (
@@ -44,6 +52,7 @@ from langnet.encounter_display import (
     shorten_text,
     source_detail_summary_payload,
 )
+from langnet.encounter_lookups import EncounterLookupScheduler, PerThreadClients
 from langnet.encounter_ranking import (
     bucket_learner_quality_order,
     bucket_lemma_values,
@@ -78,17 +87,20 @@ from langnet.execution import predicates
 from langnet.execution.clients import (
     StubToolClient,
     WhitakerFetchClient,
+    WhitakerNativeFetchClient,
     find_whitaker_binary,
     get_cltk_fetch_client,
     get_spacy_fetch_client,
 )
 from langnet.execution.executor import execute_plan_staged
+from langnet.execution.handler_pool import shared_handler_pool
 from langnet.execution.handlers import cdsl as cdsl_handlers
 from langnet.execution.handlers import gaffiot as gaffiot_handlers
 from langnet.execution.handlers import heritage as heritage_handlers
 from langnet.execution.handlers.diogenes import _parse_diogenes_html
 from langnet.execution.handlers.whitakers import _parse_whitaker_output
 from langnet.execution.source_text import analyze_source_entry, compact_source_gloss
+from langnet.execution.versioning import get_handler_version
 from langnet.heritage.velthuis_converter import to_heritage_velthuis
 from langnet.learning.concept_mapper import (
     concept_ids_for_features,
@@ -119,31 +131,6 @@ from langnet.paradigm.resolver import resolve_paradigm_request
 from langnet.paradigm.service import ParadigmService
 from langnet.parsing.integration import enrich_cltk_with_parsed_lewis
 from langnet.planner.core import PlannerConfig, ToolPlanner
-from langnet.reader.author_bulk_classification import (
-    AuthorClassificationRunConfig,
-    classify_author_csv,
-)
-from langnet.reader.author_classification import (
-    AUTHOR_AGENT_KIND_VALUES,
-    AUTHOR_CLASSIFICATION_OUTPUT_FIELDS,
-    AUTHOR_HISTORICITY_STATUS_VALUES,
-)
-from langnet.reader.bulk_classification import (
-    CLASSIFICATION_OUTPUT_FIELDS,
-    DEFAULT_CLASSIFICATION_ESCALATION_CONFIDENCES,
-    DEFAULT_CLASSIFICATION_ESCALATION_MIN_GLOBAL_SCORE,
-    DEFAULT_CLASSIFICATION_ESCALATION_MIN_GROUP_SCORE,
-    DEFAULT_CLASSIFICATION_ESCALATION_TIERS,
-    DEFAULT_CLASSIFICATION_SHUFFLE_SEED,
-    ClassificationEscalationConfig,
-    ClassificationRunConfig,
-    classify_work_csv,
-    export_classification_escalation_csv,
-)
-from langnet.reader.research_needs import (
-    ResearchNeedsConfig,
-    export_research_needs_csv,
-)
 from langnet.reader.search_index import search_reader_segments
 from langnet.reader_eval import (
     evaluate_reader_token,
@@ -152,6 +139,16 @@ from langnet.reader_eval import (
     summarize_reader_eval,
 )
 from langnet.reduction import reduce_claims
+from langnet.storage.cache_gc import (
+    DEFAULT_TTL_DAYS,
+    LRU_TABLE_KEYS,
+    CacheCompactReport,
+    CacheGcPolicy,
+    access_touch_due,
+    collect_garbage_path,
+    compact_cache,
+    touch_access_path,
+)
 from langnet.storage.claim_index import ClaimIndex
 from langnet.storage.db import connect_duckdb
 from langnet.storage.derivation_index import DerivationIndex
@@ -160,13 +157,11 @@ from langnet.storage.extraction_index import ExtractionIndex
 from langnet.storage.normalization_index import NormalizationIndex
 from langnet.storage.normalization_index import ensure_schema as ensure_normalization_schema
 from langnet.storage.path_indices import (
-    PathClaimIndex,
-    PathDerivationIndex,
-    PathExtractionIndex,
+    PathEffectBatch,
     PathPlanResponseIndex,
     PathRawResponseIndex,
 )
-from langnet.storage.paths import all_db_paths, normalization_db_path
+from langnet.storage.paths import all_db_paths, main_db_path, normalization_db_path
 from langnet.storage.plan_index import PlanResponseIndex, apply_schema
 from langnet.tool_catalog import canonical_language, catalog_payload, language_payload
 from langnet.translation import (
@@ -177,19 +172,24 @@ from langnet.translation import (
     project_cached_translations,
     translation_cache_status_counts,
 )
+from langnet.translation.scheduler import (
+    TranslationDeadlineExceeded,
+    translation_request_timeout,
+)
 from langnet.translation.structured import (
     requires_structured_translation,
     structured_translation_system_hint,
     structured_translation_user_content,
 )
+from langnet.whitakers.morphology import (
+    ENGINE_AUTO,
+    ENGINE_NATIVE,
+    shared_whitaker_morphology,
+    whitaker_engine,
+)
+from langnet.whitakers.pool import shared_whitaker_pool, whitaker_lookup_text
 from langnet.word_index import (
-    WordIndexHomographs,
-    word_index_browse_payload,
-    word_index_list_payload,
     word_index_neighborhood_payload,
-    word_index_sections_payload,
-    word_index_sources_payload,
-    word_index_wheel_payload,
 )
 from langnet.word_of_day import (
     _CANDIDATE_POOLS,
@@ -230,11 +230,6 @@ ENCOUNTER_GREEK_PARTIAL_SOURCE_RETRY_SUFFIXES = (
 TRANSLATION_CACHE_SCHEMA_VERSION = "langnet.translation_cache.v1"
 DOCTOR_SCHEMA_VERSION = "langnet.doctor.v1"
 DEFAULT_TRANSLATION_MODEL = "openai:google/gemini-2.5-flash"
-DEFAULT_CLASSIFICATION_MODEL = "openai:deepseek/deepseek-v4-flash"
-DEFAULT_CLASSIFICATION_AUDIT_MODEL = "openai:deepseek/deepseek-v4-pro"
-DEFAULT_CLASSIFICATION_BATCH_SIZE = 25
-DEFAULT_CLASSIFICATION_TIMEOUT_SECONDS = 120.0
-DEFAULT_CLASSIFICATION_MAX_ATTEMPTS = 3
 TRANSLATION_FALLBACK_MODELS_ENV = "LANGNET_TRANSLATION_FALLBACK_MODELS"
 DEFAULT_TRANSLATION_FALLBACK_MODELS = ("openai:deepseek/deepseek-v4-flash",)
 TRANSLATION_MIN_OUTPUT_TOKENS_PER_SECOND_ENV = "LANGNET_TRANSLATION_MIN_OUTPUT_TOKENS_PER_SECOND"
@@ -244,7 +239,6 @@ LEARNING_OVERLAY_SCHEMA_VERSION = "langnet.learning_overlay.v1"
 DEFAULT_TRANSLATION_MIN_OUTPUT_TOKENS_PER_SECOND = 8.0
 DEFAULT_TRANSLATION_MIN_RATE_TOKENS = 24
 DEFAULT_TRANSLATION_MIN_RATE_SECONDS = 5.0
-DEFAULT_RECOMMENDATION_MODEL = "openai:google/gemini-2.5-flash"
 WORD_INDEX_CONTEXT_RADIUS = 1
 GRAMMAR_CONCEPTS_SCHEMA_VERSION = "langnet.grammar_concepts.v1"
 GRAMMAR_EVIDENCE_REPORT_SCHEMA_VERSION = "langnet.grammar_evidence_report.v1"
@@ -588,13 +582,20 @@ def _normalization_cache_get(
     path: Path,
     text: str,
     lang_hint: LanguageValue,
+    track_access: bool = False,
 ) -> NormalizationResult | None:
     if not path.exists():
         return None
     query_hash = _hash_query(text, lang_hint)
+    touch_due = False
     try:
         with connect_duckdb(path, read_only=True, lock=False, allow_create=False) as conn:
             cached = NormalizationIndex(conn).get(query_hash)
+            touch_due = (
+                track_access
+                and cached is not None
+                and access_touch_due(conn, "query_normalization_index", query_hash)
+            )
             if cached is not None:
                 service = _create_normalization_service(config, conn, read_only=True)
                 if service._cached_greek_compatibility_is_stale(text, lang_hint, cached):
@@ -611,6 +612,8 @@ def _normalization_cache_get(
         cached = None
     if cached is None:
         return None
+    if touch_due:
+        touch_access_path(path, "query_normalization_index", [query_hash])
     return NormalizationResult(query_hash=query_hash, normalized=cached)
 
 
@@ -649,6 +652,7 @@ def _normalize_with_short_cache_lock(
             path=path,
             text=text,
             lang_hint=lang_hint,
+            track_access=cache_policy == "read-write",
         )
         if cached is not None:
             return cached
@@ -690,6 +694,13 @@ class _PathTranslationCache:
         with connect_duckdb(self.path, read_only=False, lock=True) as conn:
             return TranslationCache(conn, read_only=False).upsert(record)
 
+    def upsert_many(self, records) -> list[str]:
+        if self.read_only:
+            raise RuntimeError("translation cache is read-only")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with connect_duckdb(self.path, read_only=False, lock=True) as conn:
+            return TranslationCache(conn, read_only=False).upsert_many(records)
+
 
 def _norm_text_for_compare(s: str) -> str:
     """Normalize text for comparison (remove accents, fold omega/w, keep only letters)."""
@@ -869,6 +880,7 @@ def index_status(tool: str | None):
                 with connect_duckdb(path, read_only=True, lock=False) as conn:
                     tables = [
                         "raw_response_index",
+                        "raw_response_body",
                         "extraction_index",
                         "derivation_index",
                         "claims",
@@ -932,6 +944,133 @@ def index_rebuild(query: str, language: str):
     _plan_exec_impl(config, language, query)
 
 
+def _parse_table_limits(values: tuple[str, ...], option: str) -> dict[str, int]:
+    limits: dict[str, int] = {}
+    for value in values:
+        table, sep, raw = value.partition("=")
+        if not sep or table not in LRU_TABLE_KEYS:
+            raise click.BadParameter(
+                f"expected TABLE=N with TABLE one of {', '.join(LRU_TABLE_KEYS)}",
+                param_hint=option,
+            )
+        try:
+            limits[table] = int(raw)
+        except ValueError as exc:
+            raise click.BadParameter(f"{raw!r} is not an integer", param_hint=option) from exc
+    return limits
+
+
+def _current_handler_versions() -> dict[str, str]:
+    """Tool → handler version for every versioned extract/derive handler."""
+    registry = _default_registry(use_stubs=False)
+    versions: dict[str, str] = {}
+    for handlers in (registry.extract_handlers, registry.derive_handlers):
+        for tool, handler in handlers.items():
+            version = get_handler_version(handler)
+            if version is not None:
+                versions[tool] = version
+    return versions
+
+
+def _echo_compact_report(report: CacheCompactReport) -> None:
+    click.echo(
+        f"compacted {report.path}: {humanize.naturalsize(report.size_before)} → "
+        f"{humanize.naturalsize(report.size_after)}" + (" (rewritten)" if report.rewritten else "")
+    )
+
+
+@index.command("gc")
+@click.option("--db-path", type=click.Path(path_type=Path), help="Cache file (default: main).")
+@click.option(
+    "--ttl",
+    "ttl_values",
+    multiple=True,
+    help="TABLE=DAYS; drop entries unused for DAYS (0 disables). Repeatable.",
+)
+@click.option(
+    "--max-rows",
+    "max_row_values",
+    multiple=True,
+    help="TABLE=N; keep only the N most recently used entries. Repeatable.",
+)
+@click.option(
+    "--keep-handler-versions",
+    is_flag=True,
+    help="Keep effects written by superseded handler versions.",
+)
+@click.option("--no-orphan-sweep", is_flag=True, help="Skip sweeping orphaned effects.")
+@click.option("--dry-run", is_flag=True, help="Report what would be deleted, then roll back.")
+@click.option("--compact", "compact_after", is_flag=True, help="CHECKPOINT after collecting.")
+@click.option("--rewrite", is_flag=True, help="With --compact, rewrite the file to shrink it.")
+@click.option(
+    "--output",
+    type=click.Choice(["pretty", "json"]),
+    default="pretty",
+    show_default=True,
+    help="Output format.",
+)
+def index_gc(  # noqa: PLR0913
+    db_path: Path | None,
+    ttl_values: tuple[str, ...],
+    max_row_values: tuple[str, ...],
+    keep_handler_versions: bool,
+    no_orphan_sweep: bool,
+    dry_run: bool,
+    compact_after: bool,
+    rewrite: bool,
+    output: str,
+):
+    """Evict expired cache entries, superseded handler output, and orphaned effects."""
+    path = db_path.expanduser() if db_path else main_db_path()
+    if not path.exists():
+        raise click.ClickException(f"cache not found: {path}")
+    policy = CacheGcPolicy(
+        ttl_days={**DEFAULT_TTL_DAYS, **_parse_table_limits(ttl_values, "--ttl")},
+        max_rows=_parse_table_limits(max_row_values, "--max-rows"),
+        handler_versions={} if keep_handler_versions else _current_handler_versions(),
+        prune_handler_versions=not keep_handler_versions,
+        sweep_orphans=not no_orphan_sweep,
+    )
+    report = collect_garbage_path(path, policy, dry_run=dry_run)
+    compact_report = compact_cache(path, rewrite=rewrite) if compact_after and not dry_run else None
+
+    if output == "json":
+        payload: dict[str, object] = {"path": str(path), **report.to_dict()}
+        if compact_report is not None:
+            payload["compact"] = compact_report.to_dict()
+        click.echo(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8"))
+        return
+
+    verb = "would delete" if dry_run else "deleted"
+    for table, count in sorted(report.deleted.items()):
+        click.echo(f"{verb:>12} {count:>8}  {table}")
+    click.echo(f"{verb:>12} {sum(report.deleted.values()):>8}  total")
+    if compact_report is not None:
+        _echo_compact_report(compact_report)
+
+
+@index.command("compact")
+@click.option("--db-path", type=click.Path(path_type=Path), help="Cache file (default: main).")
+@click.option("--rewrite", is_flag=True, help="Copy into a fresh file so freed space is returned.")
+@click.option(
+    "--output",
+    type=click.Choice(["pretty", "json"]),
+    default="pretty",
+    show_default=True,
+    help="Output format.",
+)
+def index_compact(db_path: Path | None, rewrite: bool, output: str):
+    """CHECKPOINT the cache file and report its size before and after."""
+    path = db_path.expanduser() if db_path else main_db_path()
+    if not path.exists():
+        raise click.ClickException(f"cache not found: {path}")
+    report = compact_cache(path, rewrite=rewrite)
+    if output == "json":
+        click.echo(orjson.dumps(report.to_dict(), option=orjson.OPT_INDENT_2).decode("utf-8"))
+        return
+    _echo_compact_report(report)
+
+
 @click.group()
 def main() -> None:
     """langnet-cli — classical language tools."""
@@ -1631,6 +1770,9 @@ def foster_ossa_taxonomy_audit(
 main.add_command(index)
 main.add_command(databuild)
 main.add_command(foster_ossa)
+main.add_command(serve)
+main.add_command(reader_cli)
+main.add_command(word_index_cli)
 
 
 def _grammar_concept_payload(concept: GrammarConcept) -> dict[str, object]:
@@ -2516,3301 +2658,65 @@ def learn_doctor(kind: str | None, output: str) -> None:
 main.add_command(learn_cli)
 
 
-def _reader_service_from_context(ctx: click.Context):
-    from langnet.reader.service import ReaderService  # noqa: PLC0415
-
-    obj = ctx.obj if isinstance(ctx.obj, dict) else {}
-    catalog = obj.get("reader_catalog")
-    return ReaderService(_reader_catalog_path(str(catalog) if catalog else None))
-
-
-def _reader_catalog_path(catalog: str | None) -> Path:
-    from langnet.databuild.paths import default_reader_catalog_path  # noqa: PLC0415
-
-    env_catalog = os.environ.get("LANGNET_READER_CATALOG")
-    return (
-        Path(str(catalog)).expanduser()
-        if catalog
-        else Path(env_catalog).expanduser()
-        if env_catalog
-        else default_reader_catalog_path()
-    )
-
-
-def _reader_search_index_path(index: str | None) -> Path:
-    from langnet.databuild.paths import default_reader_search_index_path  # noqa: PLC0415
-
-    return Path(index).expanduser() if index else default_reader_search_index_path()
-
-
-def _emit_reader_payload(payload: Mapping[str, object], output: str) -> None:
-    if output == "json":
-        click.echo(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8"))
-        return
-    mode = str(payload.get("mode", "reader"))
-    if _emit_reader_single_payload(mode, payload):
-        return
-
-    items = payload.get("items")
-    if not isinstance(items, Sequence):
-        return
-    for item in items:
-        if not isinstance(item, Mapping):
-            continue
-        _emit_reader_item(mode, cast(Mapping[str, object], item))
-
-
-def _emit_reader_single_payload(  # noqa: C901, PLR0911, PLR0912, PLR0915
-    mode: str, payload: Mapping[str, object]
-) -> bool:
-    if mode == "show":
-        segment_value = payload.get("segment")
-        if not isinstance(segment_value, Mapping):
-            click.echo("No segment found.")
-            return True
-        segment = cast(Mapping[str, object], segment_value)
-        click.echo(f"{segment.get('address')}  {segment.get('citation_path')}")
-        click.echo(str(segment.get("text", "")))
-        return True
-    if mode == "resolve-address":
-        suffix = ""
-        if payload.get("resolution_kind"):
-            suffix = f" [{payload.get('resolution_kind')}]"
-        click.echo(f"{payload.get('address')} -> {payload.get('resolved_address')}{suffix}")
-        structure_node_value = payload.get("structure_node")
-        if isinstance(structure_node_value, Mapping):
-            structure_node = cast(Mapping[str, object], structure_node_value)
-            label = structure_node.get("traditional_reference") or structure_node.get("label")
-            click.echo(f"Structure: {label}")
-        segment_value = payload.get("segment")
-        if isinstance(segment_value, Mapping):
-            segment = cast(Mapping[str, object], segment_value)
-            click.echo(str(segment.get("text", "")))
-        return True
-    if mode == "work-dossier":
-        work_value = payload.get("work")
-        summary_value = payload.get("summary")
-        if isinstance(work_value, Mapping):
-            work = cast(Mapping[str, object], work_value)
-            click.echo(str(work.get("title") or work.get("work_id") or "Work"))
-            if work.get("author"):
-                click.echo(f"Author: {work.get('author')}")
-        if isinstance(summary_value, Mapping):
-            summary = cast(Mapping[str, object], summary_value)
-            if summary.get("structure_label"):
-                click.echo(f"Structure: {summary.get('structure_label')}")
-            if summary.get("division_bio_count"):
-                click.echo(f"Reviewed division bios: {summary.get('division_bio_count')}")
-        headings_value = payload.get("headings")
-        if isinstance(headings_value, Sequence) and headings_value:
-            click.echo("Headings:")
-            for item in headings_value:
-                if not isinstance(item, Mapping):
-                    continue
-                heading = cast(Mapping[str, object], item)
-                label = heading.get("traditional_reference") or heading.get("label")
-                click.echo(f"- {label}")
-        return True
-    if mode == "summary":
-        summary_value = payload.get("summary")
-        if isinstance(summary_value, Mapping):
-            summary = cast(Mapping[str, object], summary_value)
-            for key, value in sorted(summary.items()):
-                click.echo(f"{key}: {value}")
-        return True
-    if mode.startswith("sync-"):
-        summary_value = payload.get("summary")
-        if isinstance(summary_value, Mapping):
-            summary = cast(Mapping[str, object], summary_value)
-            for key, value in sorted(summary.items()):
-                click.echo(f"{key}: {value}")
-        return True
-    if mode.startswith("search-index-"):
-        summary_value = payload.get("summary")
-        if isinstance(summary_value, Mapping):
-            summary = cast(Mapping[str, object], summary_value)
-            for key, value in sorted(summary.items()):
-                click.echo(f"{key}: {value}")
-        return True
-    if mode == "work":
-        item_value = payload.get("item")
-        if not isinstance(item_value, Mapping):
-            click.echo("No work found.")
-            return True
-        item = cast(Mapping[str, object], item_value)
-        click.echo(
-            f"{item.get('language')}  {item.get('author')} — {item.get('title')}  "
-            f"[{item.get('work_id')}]"
-        )
-        return True
-    return False
-
-
-def _emit_reader_item(  # noqa: C901, PLR0912, PLR0915
-    mode: str, item: Mapping[str, object]
-) -> None:
-    if mode == "collections":
-        click.echo(
-            f"{item.get('collection_id')}  works={item.get('work_count')}  "
-            f"words={item.get('word_count')}"
-        )
-    elif mode == "authors":
-        lang = item.get("language")
-        source_author = (
-            item.get("source_author_name") or item.get("display_name") or item.get("author")
-        )
-        canonical_author = item.get("canonical_author_name") or item.get("author_canonical_name")
-        author = (
-            f"{canonical_author} <= {source_author}"
-            if canonical_author and canonical_author != source_author
-            else source_author
-        )
-        work_count = item.get("work_count")
-        section = item.get("section_key")
-        classifier = ""
-        if item.get("author_agent_kind"):
-            classifier = (
-                f"  kind={item.get('author_agent_kind')}"
-                f"  status={item.get('author_historicity_status')}"
-            )
-        click.echo(
-            f"{lang}  {section}  {author}  works={work_count}  words={item.get('word_count')}"
-            f"{classifier}"
-        )
-    elif mode == "author-sections":
-        click.echo(
-            f"{item.get('key')}  authors={item.get('author_count')}  "
-            f"works={item.get('work_count')}  words={item.get('word_count')}"
-        )
-    elif mode == "duplicate-audit":
-        click.echo(
-            f"{item.get('language')}  {item.get('kind')}  {item.get('display')}  "
-            f"works={item.get('work_count')}"
-        )
-    elif mode in {"popular", "works"}:
-        click.echo(
-            f"{item.get('language')}  {item.get('author')} — {item.get('title')}  "
-            f"[{item.get('work_id')}]  words={item.get('word_count')}"
-        )
-    elif mode == "search":
-        click.echo(
-            f"{item.get('score')}  {item.get('language')}  {item.get('author')} — "
-            f"{item.get('title')} {item.get('citation_path')}: {item.get('snippet')}"
-        )
-    elif mode == "contents":
-        click.echo(f"{item.get('citation_path')}  {item.get('text')}")
-    elif mode == "map":
-        click.echo(
-            f"{item.get('ordinal')}  {item.get('kind')}  {item.get('label')}  "
-            f"{item.get('start_citation')}..{item.get('end_citation')}  "
-            f"words={item.get('word_count')}"
-        )
-    elif mode == "structure":
-        label = item.get("short_label") or item.get("label")
-        reference = item.get("traditional_reference") or item.get("start_citation")
-        click.echo(
-            f"{item.get('ordinal')}  {item.get('kind')}  {label}  "
-            f"{reference}  {item.get('start_citation')}..{item.get('end_citation')}"
-        )
-    elif mode == "citation-maps":
-        click.echo(
-            f"{item.get('source_id')}  {item.get('status')}  {item.get('work_id')}  "
-            f"{item.get('source_pattern')} -> {item.get('machine_pattern')}  "
-            f"{item.get('projection_rule')}  {item.get('example_source_reference')} => "
-            f"{item.get('example_machine_citation')}"
-        )
-    elif mode == "aliases":
-        click.echo(f"{item.get('language')}  {item.get('alias')} -> {item.get('target')}")
-    elif mode == "alias-check":
-        click.echo(f"{item.get('language')}  {item.get('alias')}  {item.get('targets')}")
-    elif mode == "overlays":
-        click.echo(
-            f"{item.get('collection_id')}  {item.get('status')}  "
-            f"{item.get('match_field')}={item.get('match_value')}  "
-            f"{item.get('field')}={item.get('value')}"
-        )
-    elif mode == "attributions":
-        click.echo(
-            f"{item.get('collection_id')}  {item.get('status')}  "
-            f"{item.get('match_field')}={item.get('match_value')}  "
-            f"{item.get('relation_type')}={item.get('agent')}  "
-            f"confidence={item.get('confidence')}"
-        )
-    elif mode == "sources":
-        click.echo(
-            f"{item.get('collection_id')}  {item.get('file_status')}  "
-            f"{item.get('file_role')}  {item.get('source_path')}"
-        )
-    elif mode == "source-index":
-        click.echo(
-            f"{item.get('collection_id')}  {item.get('language')}  "
-            f"{item.get('author')} — {item.get('title')}  [{item.get('work_id')}]"
-        )
-        click.echo(
-            f"  source={item.get('source_id')}  edition={item.get('edition_label')}  "
-            f"segments={item.get('segment_count')}  words={item.get('token_count')}"
-        )
-        click.echo(f"  path={item.get('source_path')}")
-        canonical = item.get("canonical_text_id")
-        witnesses = item.get("source_witness_collections")
-        if canonical or witnesses:
-            click.echo(f"  canonical={canonical or ''}  witnesses={witnesses or 'none'}")
-    elif mode == "source-index-export":
-        click.echo(f"{item.get('kind')}  rows={item.get('row_count')}  {item.get('path')}")
-    elif mode == "ogl-audit":
-        click.echo(
-            f"{item.get('collection_id')}  candidates={item.get('candidate_count')}  "
-            f"selected={item.get('selected_count')}  catalog={item.get('catalog_row_count')}  "
-            f"missing_selected={item.get('catalog_missing_selected_count')}"
-        )
-        click.echo(f"  statuses={item.get('status_counts')}")
-        click.echo(f"  views={item.get('view_counts')}")
-        click.echo(f"  skip_reasons={item.get('skip_reason_counts')}")
-    elif mode == "metadata":
-        click.echo(
-            f"{item.get('collection_id')}  {item.get('subject_kind')}  "
-            f"{item.get('subject_id')}  {item.get('key')}={item.get('value')}"
-        )
-    elif mode == "validate":
-        click.echo(f"{item.get('code')}  {item.get('message')}")
-    elif mode == "catalogs":
-        click.echo(
-            f"{item.get('id')}  {item.get('readiness')}  "
-            f"works={item.get('work_count')}  {item.get('path')}"
-        )
-    elif mode == "facets":
-        detail = item.get("filter") or item.get("command") or ""
-        click.echo(f"{item.get('id')}  {item.get('label')}  {detail}")
-    elif mode == "author-facets":
-        click.echo(f"{item.get('id')}  {item.get('label')}  {item.get('filter')}")
-
-
-@click.group("reader")
-@click.option(
-    "--catalog",
-    "--catalog-path",
-    type=click.Path(),
-    default=None,
-    help=(
-        "Reader catalog DuckDB path "
-        "(defaults to LANGNET_READER_CATALOG, then data/build/reader/catalog.duckdb)."
-    ),
-)
-@click.pass_context
-def reader_cli(ctx: click.Context, catalog: str | None) -> None:
-    """Explore locally indexed reader corpora."""
-    ctx.obj = {"reader_catalog": catalog}
-
-
-@reader_cli.command("collections")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
+@main.command("bailly-xml-audit")
+@click.argument(
+    "xml_dir",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
 )
-@click.pass_context
-def reader_collections(ctx: click.Context, output: str) -> None:
-    """List reader corpus collections."""
-    _emit_reader_payload(_reader_service_from_context(ctx).collections_payload(), output)
-
-
-@reader_cli.command("catalogs")
 @click.option(
     "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Optional TSV output path.",
 )
-def reader_catalogs(output: str) -> None:
-    """List known reader catalog candidates for downstream UIs."""
-    from langnet.reader.service import READER_SCHEMA_VERSION, ReaderService  # noqa: PLC0415
+def bailly_xml_audit(xml_dir: Path, output: Path | None) -> None:
+    """Audit generated Bailly per-page Poppler XML files."""
+    from langnet.parsing.bailly_pdf_xml import audit_bailly_xml_pages  # noqa: PLC0415
 
-    candidates = [
-        (
-            "env",
-            "Environment reader catalog",
-            os.environ.get("LANGNET_READER_CATALOG"),
-            "configured" if os.environ.get("LANGNET_READER_CATALOG") else "not_configured",
-        ),
-        (
-            "default",
-            "Default reader catalog",
-            "data/build/reader/catalog.duckdb",
-            "default",
-        ),
-        (
-            "development",
-            "Development unified reader catalog",
-            "data/build/reader/catalog.duckdb",
-            "development",
-        ),
-        (
-            "classics",
-            "Audit: Greek and Latin Classics",
-            "examples/debug/reader_classics_legacy_full_curated_current/catalog.duckdb",
-            "audit_artifact",
-        ),
-        (
-            "sanskrit",
-            "Audit: Sanskrit",
-            "examples/debug/reader_sanskrit_full_curated_current/catalog.duckdb",
-            "audit_artifact",
-        ),
-        (
-            "perseus",
-            "Audit: Perseus Classics",
-            "examples/debug/reader_perseus_full_curated_current/catalog.duckdb",
-            "audit_artifact",
-        ),
-        (
-            "digiliblt",
-            "Audit: digilibLT",
-            "examples/debug/reader_digiliblt_anonymous_overlay_verify/catalog.duckdb",
-            "audit_artifact",
-        ),
+    report = audit_bailly_xml_pages(xml_dir)
+    rows = [
+        [
+            "page",
+            "path",
+            "section",
+            "text_node_count",
+            "entry_count",
+            "first_lemma",
+            "last_lemma",
+            "warning",
+        ],
+        *[page.as_tsv_row() for page in report.pages],
     ]
-    items = []
-    for catalog_id, label, path_value, readiness in candidates:
-        if not path_value:
-            continue
-        path = Path(path_value).expanduser()
-        exists = path.exists()
-        summary = ReaderService(path).summary()["summary"] if exists else {}
-        items.append(
-            {
-                "id": catalog_id,
-                "label": label,
-                "path": str(path),
-                "exists": exists,
-                "languages": _reader_catalog_languages(path),
-                "work_count": summary.get("work_count", 0),
-                "segment_count": summary.get("segment_count", 0),
-                "readiness": readiness if exists else "missing",
-            }
-        )
-    _emit_reader_payload(
-        {
-            "schema_version": READER_SCHEMA_VERSION,
-            "mode": "catalogs",
-            "items": items,
-        },
-        output,
-    )
-
-
-def _reader_catalog_languages(path: Path) -> list[str]:
-    if not path.exists():
-        return []
-    with duckdb.connect(str(path), read_only=True) as conn:
-        return [
-            str(row[0])
-            for row in conn.execute(
-                "SELECT DISTINCT language FROM works ORDER BY language"
-            ).fetchall()
-        ]
+    text = "\n".join("\t".join(row) for row in rows) + "\n"
+    if output is not None:
+        output.expanduser().parent.mkdir(parents=True, exist_ok=True)
+        output.expanduser().write_text(text, encoding="utf-8")
+        click.echo(f"wrote: {output.expanduser()}")
+    else:
+        click.echo(text, nl=False)
+    if report.missing_pages:
+        click.echo(f"missing_pages: {len(report.missing_pages)}", err=True)
 
 
-@reader_cli.command("authors")
-@click.option("--language", default=None, help="Optional language filter, e.g. grc, lat, san.")
-@click.option("--section", default=None, help="Optional native author-index section key.")
-@click.option("--query", default=None, help="Optional author/authority substring filter.")
-@click.option(
-    "--agent-kind",
-    type=click.Choice(AUTHOR_AGENT_KIND_VALUES),
-    default=None,
-    help="Generated author kind filter.",
-)
-@click.option(
-    "--historicity",
-    type=click.Choice(AUTHOR_HISTORICITY_STATUS_VALUES),
-    default=None,
-    help="Generated author historicity filter.",
-)
-@click.option(
-    "--sort",
-    "sort_order",
-    type=click.Choice(["catalog", "prominence"]),
-    default="catalog",
-    show_default=True,
-    help="Author ordering.",
+@main.command("bailly-xml-extract")
+@click.argument(
+    "xml_dir",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
 )
-@click.option("--limit", default=None, type=click.IntRange(1, 5000), help="Maximum rows.")
-@click.option("--cursor", default=None, help="Offset cursor returned by prior JSON response.")
 @click.option(
     "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
+    "-o",
+    type=click.Path(dir_okay=False, path_type=Path),
+    help="Optional JSONL output path. Defaults to stdout.",
 )
-@click.pass_context
-def reader_authors(  # noqa: PLR0913
-    ctx: click.Context,
-    language: str | None,
-    section: str | None,
-    query: str | None,
-    agent_kind: str | None,
-    historicity: str | None,
-    sort_order: str,
-    limit: int | None,
-    cursor: str | None,
-    output: str,
-) -> None:
-    """List reader corpus authors."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).authors_payload(
-            language=language,
-            section=section,
-            query=query,
-            agent_kind=agent_kind,
-            historicity=historicity,
-            sort=sort_order,
-            limit=limit,
-            cursor=cursor,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("author-sections")
-@click.option("--language", required=True, help="Reader language, e.g. grc, lat, san.")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_author_sections(ctx: click.Context, language: str, output: str) -> None:
-    """List native author-index sections for one reader language."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).author_sections_payload(language=language),
-        output,
-    )
-
-
-@reader_cli.command("author")
-@click.argument("author_ref")
-@click.option("--language", default=None, help="Optional language filter, e.g. grc, lat, san.")
-@click.option(
-    "--representative-limit",
-    default=8,
-    show_default=True,
-    type=click.IntRange(1, 50),
-    help="Representative works to include.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_author(
-    ctx: click.Context,
-    author_ref: str,
-    language: str | None,
-    representative_limit: int,
-    output: str,
-) -> None:
-    """Show detail metadata for one reader author selector or name."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).author_payload(
-            author_ref,
-            language=language,
-            representative_limit=representative_limit,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("author-facets")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_author_facets(ctx: click.Context, output: str) -> None:
-    """List generated author classification filters."""
-    _emit_reader_payload(_reader_service_from_context(ctx).author_facets_payload(), output)
-
-
-@reader_cli.command("duplicate-audit")
-@click.option(
-    "--kind",
-    type=click.Choice(["authors", "titles"]),
-    default="authors",
-    show_default=True,
-    help="Duplicate grouping to inspect.",
-)
-@click.option("--language", default=None, help="Optional language filter, e.g. grc, lat, san.")
-@click.option("--limit", default=100, show_default=True, type=click.IntRange(1, 5000))
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_duplicate_audit(
-    ctx: click.Context,
-    kind: str,
-    language: str | None,
-    limit: int,
-    output: str,
-) -> None:
-    """List duplicate-looking author or title groups for corpus QA."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).duplicate_audit_payload(
-            kind=kind,
-            language=language,
-            limit=limit,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("classification-export")
-@click.option("--language", default=None, help="Optional language filter, e.g. grc, lat, san.")
-@click.option("--limit", default=None, type=click.IntRange(1, 100000), help="Maximum rows.")
-@click.option(
-    "--path",
-    "output_path",
-    type=click.Path(path_type=Path),
-    default=None,
-    help="CSV output path. Defaults to stdout.",
-)
-@click.pass_context
-def reader_classification_export(
-    ctx: click.Context,
-    language: str | None,
-    limit: int | None,
-    output_path: Path | None,
-) -> None:
-    """Export work rows for bulk chronology/status/popularity classification."""
-    payload = _reader_service_from_context(ctx).works_payload(language=language, limit=limit)
-    items = payload.get("items")
-    if not isinstance(items, Sequence):
-        items = []
-    fieldnames = CLASSIFICATION_OUTPUT_FIELDS
-
-    def write_rows(handle) -> None:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for raw_item in items:
-            if not isinstance(raw_item, Mapping):
-                continue
-            item = cast(Mapping[str, object], raw_item)
-            writer.writerow({name: item.get(name, "") or "" for name in fieldnames})
-
-    if output_path is None:
-        write_rows(sys.stdout)
-        return
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8", newline="") as handle:
-        write_rows(handle)
-    click.echo(str(output_path))
-
-
-@reader_cli.command("classification-escalation-export")
-@click.option(
-    "--input-csv",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    required=True,
-    help="Generated classification CSV from a broad classifier pass.",
-)
-@click.option(
-    "--path",
-    "output_path",
-    type=click.Path(dir_okay=False, path_type=Path),
-    required=True,
-    help="Priority audit input CSV to write.",
-)
-@click.option(
-    "--min-global-score",
-    default=DEFAULT_CLASSIFICATION_ESCALATION_MIN_GLOBAL_SCORE,
-    show_default=True,
-    type=click.IntRange(0, 100),
-    help="Escalate rows at or above this language-corpus popularity score.",
-)
-@click.option(
-    "--min-group-score",
-    default=DEFAULT_CLASSIFICATION_ESCALATION_MIN_GROUP_SCORE,
-    show_default=True,
-    type=click.IntRange(0, 100),
-    help="Escalate rows at or above this within-group popularity score.",
-)
-@click.option(
-    "--include-tier",
-    "include_tiers",
-    multiple=True,
-    default=DEFAULT_CLASSIFICATION_ESCALATION_TIERS,
-    show_default=True,
-    type=click.Choice(["canonical", "major", "common", "specialist", "obscure"]),
-    help="Escalate rows with this global or group tier. May be repeated.",
-)
-@click.option(
-    "--include-confidence",
-    "include_confidences",
-    multiple=True,
-    default=DEFAULT_CLASSIFICATION_ESCALATION_CONFIDENCES,
-    show_default=True,
-    type=click.Choice(["high", "medium", "low"]),
-    help="Escalate rows with this confidence. May be repeated.",
-)
-@click.option("--limit", default=None, type=click.IntRange(1, 100000), help="Maximum rows.")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def reader_classification_escalation_export(  # noqa: PLR0913
-    input_csv: Path,
-    output_path: Path,
-    min_global_score: int,
-    min_group_score: int,
-    include_tiers: tuple[str, ...],
-    include_confidences: tuple[str, ...],
-    limit: int | None,
-    output: str,
-) -> None:
-    """Export high-priority generated classifications for stronger-model audit."""
-    summary = export_classification_escalation_csv(
-        config=ClassificationEscalationConfig(
-            input_csv=input_csv.expanduser(),
-            output_csv=output_path.expanduser(),
-            min_global_score=min_global_score,
-            min_group_score=min_group_score,
-            include_tiers=include_tiers,
-            include_confidences=include_confidences,
-            limit=limit,
-        ),
-    )
-    summary["recommended_audit_model"] = DEFAULT_CLASSIFICATION_AUDIT_MODEL
-    payload = {
-        "schema_version": "langnet.reader.v1",
-        "mode": "classification-escalation-export",
-        "summary": summary,
-    }
-    if output == "json":
-        click.echo(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8"))
-        return
-    click.echo(
-        f"Selected {summary['selected_count']} of {summary['input_count']} "
-        f"classification row(s): {summary['output_csv']}"
-    )
-
-
-@reader_cli.command("research-needs-export")
-@click.option(
-    "--classification-csv",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    required=True,
-    help="Generated work classification CSV to inspect for research gaps.",
-)
-@click.option(
-    "--path",
-    "output_path",
-    type=click.Path(dir_okay=False, path_type=Path),
-    required=True,
-    help="Research-needs queue CSV to write.",
-)
-@click.option("--language", default=None, help="Optional language filter, e.g. grc, lat, san.")
-@click.option("--limit", default=None, type=click.IntRange(1, 100000), help="Maximum rows.")
-@click.option(
-    "--per-need-type-limit",
-    default=5,
-    show_default=True,
-    type=click.IntRange(1, 100000),
-    help="Maximum rows per research need type before applying the overall limit.",
-)
-@click.option(
-    "--include-covered",
-    is_flag=True,
-    help="Include needs already covered by accepted curated metadata with lower priority.",
-)
-@click.option(
-    "--include-unresolved",
-    is_flag=True,
-    help=(
-        "Include generated rows that do not resolve in the current catalog as "
-        "catalog identity maintenance items."
-    ),
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_research_needs_export(  # noqa: PLR0913
-    ctx: click.Context,
-    classification_csv: Path,
-    output_path: Path,
-    language: str | None,
-    limit: int | None,
-    per_need_type_limit: int,
-    include_covered: bool,
-    include_unresolved: bool,
-    output: str,
-) -> None:
-    """Export generated-classification rows that need source-backed research."""
-    catalog_path = _reader_service_from_context(ctx).catalog_path
-    summary = export_research_needs_csv(
-        config=ResearchNeedsConfig(
-            catalog_path=catalog_path,
-            classification_csv=classification_csv.expanduser(),
-            output_csv=output_path.expanduser(),
-            language=language,
-            limit=limit,
-            per_need_type_limit=per_need_type_limit,
-            include_covered=include_covered,
-            include_unresolved=include_unresolved,
-        )
-    )
-    payload = {
-        "schema_version": "langnet.reader.v1",
-        "mode": "research-needs-export",
-        "catalog_path": str(catalog_path),
-        "summary": summary,
-    }
-    if output == "json":
-        click.echo(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8"))
-        return
-    click.echo(
-        f"Selected {summary['research_need_count']} research need row(s): {summary['output_csv']}"
-    )
-
-
-@reader_cli.command("author-classification-export")
-@click.option("--language", default=None, help="Optional language filter, e.g. grc, lat, san.")
-@click.option("--limit", default=None, type=click.IntRange(1, 100000), help="Maximum rows.")
-@click.option(
-    "--path",
-    "output_path",
-    type=click.Path(path_type=Path),
-    default=None,
-    help="CSV output path. Defaults to stdout.",
-)
-@click.pass_context
-def reader_author_classification_export(
-    ctx: click.Context,
-    language: str | None,
-    limit: int | None,
-    output_path: Path | None,
-) -> None:
-    """Export author rows for generated agent classification."""
-    payload = _reader_service_from_context(ctx).authors_payload(
-        language=language,
-        limit=limit,
-    )
-    items = payload.get("items")
-    if not isinstance(items, Sequence):
-        items = []
-    fieldnames = AUTHOR_CLASSIFICATION_OUTPUT_FIELDS
-
-    def write_rows(handle) -> None:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for raw_item in items:
-            if not isinstance(raw_item, Mapping):
-                continue
-            item = cast(Mapping[str, object], raw_item)
-            writer.writerow(
-                {
-                    "author_id": item.get("author_id", "") or "",
-                    "author_language": item.get("language", "") or "",
-                    "author_source_id": item.get("source_author_id", "") or "",
-                    "author_display_name": item.get("display_name", "") or "",
-                    "author_canonical_name": item.get("author_canonical_name", "") or "",
-                    "author_agent_kind": item.get("author_agent_kind", "") or "",
-                    "author_historicity_status": item.get(
-                        "author_historicity_status",
-                        "",
-                    )
-                    or "",
-                    "author_period": item.get("author_period", "") or "",
-                    "author_date_range": item.get("author_date_range", "") or "",
-                    "author_region": item.get("author_region", "") or "",
-                    "author_cultural_context": item.get("author_cultural_context", "") or "",
-                    "author_bio": item.get("author_bio", "") or "",
-                    "author_prominence_score": item.get("author_prominence_score", "") or "",
-                    "author_prominence_tier": item.get("author_prominence_tier", "") or "",
-                    "author_confidence": item.get("author_classification_confidence", "") or "",
-                    "author_notes": item.get("author_classification_notes", "") or "",
-                    "author_generator_models": item.get("author_generator_models", "") or "",
-                    "author_generator_run_id": item.get("author_generator_run_id", "") or "",
-                    "work_count": item.get("work_count", "") or "",
-                    "word_count": item.get("word_count", "") or "",
-                    "representative_titles": item.get("representative_titles", "") or "",
-                }
-            )
-
-    if output_path is None:
-        write_rows(sys.stdout)
-        return
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    with output_path.open("w", encoding="utf-8", newline="") as handle:
-        write_rows(handle)
-    click.echo(str(output_path))
-
-
-@reader_cli.command("classify-works")
-@click.option(
-    "--input-csv",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    required=True,
-    help="CSV produced by reader classification-export.",
-)
-@click.option(
-    "--output-csv",
-    type=click.Path(dir_okay=False, path_type=Path),
-    required=True,
-    help="Generated classification CSV to write.",
-)
-@click.option(
-    "--model",
-    default=DEFAULT_CLASSIFICATION_MODEL,
-    show_default=True,
-    help="OpenRouter/aisuite model identifier.",
-)
-@click.option("--run-id", default=None, help="Classifier run id. Defaults to timestamp.")
-@click.option(
-    "--batch-size",
-    default=DEFAULT_CLASSIFICATION_BATCH_SIZE,
-    show_default=True,
-    type=click.IntRange(1, 200),
-)
-@click.option(
-    "--timeout-seconds",
-    default=DEFAULT_CLASSIFICATION_TIMEOUT_SECONDS,
-    show_default=True,
-    type=click.FloatRange(1.0, 600.0),
-    help="Per-provider-call timeout.",
-)
-@click.option(
-    "--max-attempts",
-    default=DEFAULT_CLASSIFICATION_MAX_ATTEMPTS,
-    show_default=True,
-    type=click.IntRange(1, 10),
-    help="Attempts per model batch before failing.",
-)
-@click.option(
-    "--concurrency",
-    default=1,
-    show_default=True,
-    type=click.IntRange(1, 8),
-    help="Number of model batches to request concurrently.",
-)
-@click.option(
-    "--raw-response-dir",
-    type=click.Path(file_okay=False, path_type=Path),
-    default=None,
-    help="Optional directory for raw model JSON responses.",
-)
-@click.option(
-    "--shuffle-seed",
-    default=DEFAULT_CLASSIFICATION_SHUFFLE_SEED,
-    show_default=True,
-    help=(
-        "Deterministic seed for shuffling rows before batching. The output CSV keeps input order."
-    ),
-)
-@click.option(
-    "--batch-order",
-    type=click.Choice(["stratified", "shuffle", "input"]),
-    default="stratified",
-    show_default=True,
-    help="Prompt row ordering before batching.",
-)
-@click.option(
-    "--output-profile",
-    type=click.Choice(["slim", "full"]),
-    default="slim",
-    show_default=True,
-    help="Generated metadata fields requested from the model.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def reader_classify_works(  # noqa: PLR0913
-    input_csv: Path,
-    output_csv: Path,
-    model: str,
-    run_id: str | None,
-    batch_size: int,
-    timeout_seconds: float,
-    max_attempts: int,
-    concurrency: int,
-    raw_response_dir: Path | None,
-    shuffle_seed: str | None,
-    batch_order: str,
-    output_profile: str,
-    output: str,
-) -> None:
-    """Generate classifier-filled reader work metadata CSV with a model."""
-    resolved_run_id = run_id or time.strftime("reader-classifier-%Y%m%d-%H%M%S")
-    summary = classify_work_csv(
-        config=ClassificationRunConfig(
-            input_csv=input_csv.expanduser(),
-            output_csv=output_csv.expanduser(),
-            model=model,
-            run_id=resolved_run_id,
-            batch_size=batch_size,
-            raw_response_dir=raw_response_dir.expanduser() if raw_response_dir else None,
-            shuffle_seed=shuffle_seed,
-            batch_order=batch_order,
-            output_profile=output_profile,
-            concurrency=concurrency,
-        ),
-        classify=_openrouter_work_classifier_callback(
-            model,
-            timeout_seconds=timeout_seconds,
-            max_attempts=max_attempts,
-        ),
-    )
-    payload = {
-        "schema_version": "langnet.reader.v1",
-        "mode": "classify-works",
-        "summary": summary,
-    }
-    if output == "json":
-        click.echo(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8"))
-        return
-    click.echo(
-        f"Generated {summary['generated_count']} classification row(s) "
-        f"from {summary['input_count']} input row(s): {summary['output_csv']}"
-    )
-
-
-@reader_cli.command("classify-authors")
-@click.option(
-    "--input-csv",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    required=True,
-    help="CSV produced by author-classification-export.",
-)
-@click.option(
-    "--output-csv",
-    type=click.Path(dir_okay=False, path_type=Path),
-    required=True,
-    help="Generated author classification CSV to write.",
-)
-@click.option(
-    "--model",
-    default=DEFAULT_CLASSIFICATION_MODEL,
-    show_default=True,
-    help="OpenRouter/aisuite model identifier.",
-)
-@click.option("--run-id", default=None, help="Classifier run id. Defaults to timestamp.")
-@click.option(
-    "--batch-size",
-    default=DEFAULT_CLASSIFICATION_BATCH_SIZE,
-    show_default=True,
-    type=click.IntRange(1, 200),
-)
-@click.option(
-    "--timeout-seconds",
-    default=DEFAULT_CLASSIFICATION_TIMEOUT_SECONDS,
-    show_default=True,
-    type=click.FloatRange(1.0, 600.0),
-    help="Per-provider-call timeout.",
-)
-@click.option(
-    "--max-attempts",
-    default=DEFAULT_CLASSIFICATION_MAX_ATTEMPTS,
-    show_default=True,
-    type=click.IntRange(1, 10),
-    help="Attempts per model batch before failing.",
-)
-@click.option(
-    "--concurrency",
-    default=1,
-    show_default=True,
-    type=click.IntRange(1, 8),
-    help="Number of model batches to request concurrently.",
-)
-@click.option(
-    "--raw-response-dir",
-    type=click.Path(file_okay=False, path_type=Path),
-    default=None,
-    help="Optional directory for raw model JSON responses.",
-)
-@click.option(
-    "--shuffle-seed",
-    default=None,
-    help="Optional deterministic seed for shuffling rows before batching.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def reader_classify_authors(  # noqa: PLR0913
-    input_csv: Path,
-    output_csv: Path,
-    model: str,
-    run_id: str | None,
-    batch_size: int,
-    timeout_seconds: float,
-    max_attempts: int,
-    concurrency: int,
-    raw_response_dir: Path | None,
-    shuffle_seed: str | None,
-    output: str,
-) -> None:
-    """Generate author/agent classification CSV with a model."""
-    resolved_run_id = run_id or time.strftime("reader-author-classifier-%Y%m%d-%H%M%S")
-    summary = classify_author_csv(
-        config=AuthorClassificationRunConfig(
-            input_csv=input_csv.expanduser(),
-            output_csv=output_csv.expanduser(),
-            model=model,
-            run_id=resolved_run_id,
-            batch_size=batch_size,
-            raw_response_dir=raw_response_dir.expanduser() if raw_response_dir else None,
-            shuffle_seed=shuffle_seed,
-            concurrency=concurrency,
-        ),
-        classify=_openrouter_author_classifier_callback(
-            model,
-            timeout_seconds=timeout_seconds,
-            max_attempts=max_attempts,
-        ),
-    )
-    payload = {
-        "schema_version": "langnet.reader.v1",
-        "mode": "classify-authors",
-        "summary": summary,
-    }
-    if output == "json":
-        click.echo(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8"))
-        return
-    click.echo(
-        f"Generated {summary['generated_count']} author row(s) "
-        f"from {summary['input_count']} input row(s): {summary['output_csv']}"
-    )
-
-
-@reader_cli.command("works")
-@click.option("--language", default=None, help="Optional language filter, e.g. grc, lat, san.")
-@click.option("--collection", "collection_id", default=None, help="Optional collection filter.")
-@click.option("--author", default=None, help="Optional display-author substring filter.")
-@click.option("--author-id", default=None, help="Optional author index selector or authority id.")
-@click.option(
-    "--attributed-to",
-    default=None,
-    help="Optional catalog-only display author or accepted authorship-claim filter.",
-)
-@click.option(
-    "--scope",
-    "classification_scope",
-    default=None,
-    help="Optional generated classification scope/category filter, e.g. grammar or medicine.",
-)
-@click.option(
-    "--group",
-    "classification_group",
-    default=None,
-    help="Optional strict discovery group filter, e.g. grammar, medicine, or epic.",
-)
-@click.option(
-    "--tag",
-    "classification_tag",
-    default=None,
-    help="Optional strict discovery tag filter, e.g. ayurveda, tragedy, or patristics.",
-)
-@click.option("--query", default=None, help="Optional title/author/id/alias substring filter.")
-@click.option("--limit", default=None, type=click.IntRange(1, 5000), help="Maximum rows.")
-@click.option("--cursor", default=None, help="Offset cursor returned by prior JSON response.")
-@click.option(
-    "--sort",
-    "sort_order",
-    type=click.Choice(["catalog", "popularity", "global-popularity", "group-popularity"]),
-    default="catalog",
-    show_default=True,
-    help="Work ordering.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_works(  # noqa: PLR0913
-    ctx: click.Context,
-    language: str | None,
-    collection_id: str | None,
-    author: str | None,
-    author_id: str | None,
-    attributed_to: str | None,
-    classification_scope: str | None,
-    classification_group: str | None,
-    classification_tag: str | None,
-    query: str | None,
-    limit: int | None,
-    cursor: str | None,
-    sort_order: str,
-    output: str,
-) -> None:
-    """List reader corpus works."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).works_payload(
-            language=language,
-            collection_id=collection_id,
-            author=author,
-            author_id=author_id,
-            attributed_to=attributed_to,
-            classification_scope=classification_scope,
-            classification_group=classification_group,
-            classification_tag=classification_tag,
-            query=query,
-            limit=limit,
-            cursor=cursor,
-            sort=sort_order,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("popular")
-@click.option("--language", default=None, help="Optional language filter, e.g. grc, lat, san.")
-@click.option("--collection", "collection_id", default=None, help="Optional collection filter.")
-@click.option(
-    "--scope",
-    "classification_scope",
-    default=None,
-    help="Optional generated classification scope/category filter, e.g. grammar or medicine.",
-)
-@click.option(
-    "--group",
-    "classification_group",
-    default=None,
-    help="Optional strict discovery group filter, e.g. grammar, medicine, or epic.",
-)
-@click.option(
-    "--tag",
-    "classification_tag",
-    default=None,
-    help="Optional strict discovery tag filter, e.g. ayurveda, tragedy, or patristics.",
-)
-@click.option("--limit", default=50, show_default=True, type=click.IntRange(1, 5000))
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_popular(  # noqa: PLR0913
-    ctx: click.Context,
-    language: str | None,
-    collection_id: str | None,
-    classification_scope: str | None,
-    classification_group: str | None,
-    classification_tag: str | None,
-    limit: int,
-    output: str,
-) -> None:
-    """List works ordered by generated popularity metadata."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).works_payload(
-            language=language,
-            collection_id=collection_id,
-            classification_scope=classification_scope,
-            classification_group=classification_group,
-            classification_tag=classification_tag,
-            limit=limit,
-            sort="group-popularity" if classification_group or classification_tag else "popularity",
-        )
-        | {"mode": "popular"},
-        output,
-    )
-
-
-@reader_cli.command("groups")
-@click.option("--language", default=None, help="Optional language filter, e.g. grc, lat, san.")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_groups(ctx: click.Context, language: str | None, output: str) -> None:
-    """List strict reader discovery groups."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).discovery_groups_payload(language=language),
-        output,
-    )
-
-
-@reader_cli.command("tags")
-@click.option("--language", default=None, help="Optional language filter, e.g. grc, lat, san.")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_tags(ctx: click.Context, language: str | None, output: str) -> None:
-    """List strict reader discovery tags."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).discovery_tags_payload(language=language),
-        output,
-    )
-
-
-@reader_cli.command("facets")
-@click.option("--language", default=None, help="Optional language filter, e.g. grc, lat, san.")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_facets(ctx: click.Context, language: str | None, output: str) -> None:
-    """List reader discovery filters, sort modes, and example queries."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).discovery_facets_payload(language=language),
-        output,
-    )
-
-
-@reader_cli.command("shelves")
-@click.option("--language", default=None, help="Optional language filter, e.g. grc, lat, san.")
-@click.option("--limit", default=None, type=click.IntRange(1, None), help="Shelf count cap.")
-@click.option(
-    "--sample-limit",
-    default=3,
-    show_default=True,
-    type=click.IntRange(0, 20),
-    help="Representative works per shelf.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_shelves(
-    ctx: click.Context,
-    language: str | None,
-    limit: int | None,
-    sample_limit: int,
-    output: str,
-) -> None:
-    """List reader discovery shelves for a catalog or language."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).discovery_shelves_payload(
-            language=language,
-            limit=limit,
-            sample_limit=sample_limit,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("coverage")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_coverage(ctx: click.Context, output: str) -> None:
-    """List per-language reader discovery coverage."""
-    _emit_reader_payload(_reader_service_from_context(ctx).coverage_payload(), output)
-
-
-@reader_cli.group("search-index")
-def reader_search_index() -> None:
-    """Build and inspect the derived reader full-text search index."""
-
-
-@reader_search_index.command("build")
-@click.option("--index", "index_path", type=click.Path(), default=None, help="Search index path.")
-@click.option("--language", default=None, help="Optional language slice, e.g. grc, lat, san.")
-@click.option("--collection", "collection_id", default=None, help="Optional collection slice.")
-@click.option("--replace", is_flag=True, help="Replace existing derived search index tables.")
-@click.option("--batch-size", default=50000, show_default=True, type=click.IntRange(1, None))
-@click.option("--limit", default=None, type=click.IntRange(1, None), help="Debug segment cap.")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_search_index_build(  # noqa: PLR0913
-    ctx: click.Context,
-    index_path: str | None,
-    language: str | None,
-    collection_id: str | None,
-    replace: bool,
-    batch_size: int,
-    limit: int | None,
-    output: str,
-) -> None:
-    """Build a derived segment-level reader text index."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).search_index_build_payload(
-            index_path=_reader_search_index_path(index_path),
-            language=language,
-            collection_id=collection_id,
-            replace=replace,
-            batch_size=batch_size,
-            limit=limit,
-        ),
-        output,
-    )
-
-
-@reader_search_index.command("status")
-@click.option("--index", "index_path", type=click.Path(), default=None, help="Search index path.")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_search_index_status(ctx: click.Context, index_path: str | None, output: str) -> None:
-    """Show derived reader text index status."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).search_index_status_payload(
-            index_path=_reader_search_index_path(index_path)
-        ),
-        output,
-    )
-
-
-@reader_search_index.command("validate")
-@click.option("--index", "index_path", type=click.Path(), default=None, help="Search index path.")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_search_index_validate(ctx: click.Context, index_path: str | None, output: str) -> None:
-    """Validate the derived reader text index against the catalog."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).search_index_validate_payload(
-            index_path=_reader_search_index_path(index_path)
-        ),
-        output,
-    )
-
-
-@reader_search_index.command("inspect-normalize")
-@click.option("--language", required=True, help="Language code, e.g. grc, lat, san.")
-@click.argument("text")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_search_index_inspect_normalize(
-    ctx: click.Context,
-    language: str,
-    text: str,
-    output: str,
-) -> None:
-    """Inspect language-aware search normalization for text."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).search_index_inspect_normalize_payload(
-            language=language,
-            text=text,
-        ),
-        output,
-    )
-
-
-@reader_search_index.command("inspect-query")
-@click.option("--language", required=True, help="Language code, e.g. grc, lat, san.")
-@click.option(
-    "--mode",
-    "search_mode",
-    type=click.Choice(["keyword", "phrase", "exact", "fuzzy"]),
-    default="keyword",
-    show_default=True,
-)
-@click.option(
-    "--field",
-    type=click.Choice(["auto", "display", "search", "folded"]),
-    default="auto",
-    show_default=True,
-)
-@click.argument("text")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_search_index_inspect_query(  # noqa: PLR0913
-    ctx: click.Context,
-    language: str,
-    search_mode: str,
-    field: str,
-    text: str,
-    output: str,
-) -> None:
-    """Inspect language-aware reader search query candidates."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).search_index_inspect_query_payload(
-            language=language,
-            text=text,
-            mode=search_mode,
-            field=field,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("search")
-@click.argument("query")
-@click.option("--index", "index_path", type=click.Path(), default=None, help="Search index path.")
-@click.option("--language", default=None, help="Optional language filter, e.g. grc, lat, san.")
-@click.option("--collection", "collection_id", default=None, help="Optional collection filter.")
-@click.option("--work-id", default=None, help="Optional work id filter.")
-@click.option("--author-id", default=None, help="Optional canonical author id filter.")
-@click.option("--group", default=None, help="Optional discovery group filter.")
-@click.option("--tag", default=None, help="Optional discovery tag filter.")
-@click.option(
-    "--mode",
-    "search_mode",
-    type=click.Choice(["keyword", "phrase", "exact", "fuzzy"]),
-    default="keyword",
-    show_default=True,
-)
-@click.option(
-    "--field",
-    type=click.Choice(["auto", "display", "search", "folded"]),
-    default="auto",
-    show_default=True,
-)
-@click.option("--context", default=0, type=click.IntRange(0, 20), show_default=True)
-@click.option("--limit", default=20, type=click.IntRange(1, 500), show_default=True)
-@click.option("--cursor", default=None, help="Offset cursor returned by prior JSON response.")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_search(  # noqa: PLR0913
-    ctx: click.Context,
-    query: str,
-    index_path: str | None,
-    language: str | None,
-    collection_id: str | None,
-    work_id: str | None,
-    author_id: str | None,
-    group: str | None,
-    tag: str | None,
-    search_mode: str,
-    field: str,
-    context: int,
-    limit: int,
-    cursor: str | None,
-    output: str,
-) -> None:
-    """Search indexed reader corpus text."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).search_payload(
-            index_path=_reader_search_index_path(index_path),
-            query=query,
-            language=language,
-            collection_id=collection_id,
-            work_id=work_id,
-            author_id=author_id,
-            group=group,
-            tag=tag,
-            mode=search_mode,
-            field=field,
-            context=context,
-            limit=limit,
-            cursor=cursor,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("word-context")
-@click.argument("query")
-@click.option("--index", "index_path", type=click.Path(), default=None, help="Search index path.")
-@click.option("--language", required=True, help="Language code, e.g. grc, lat, san.")
-@click.option("--work", "work_ref", default=None, help="Optional current work ref.")
-@click.option(
-    "--segment", "segment_ref", default=None, help="Optional current citation/segment ref."
-)
-@click.option(
-    "--reader-search-limit",
-    default=8,
-    type=click.IntRange(0, 50),
-    show_default=True,
-    help="Maximum inline reader corpus hits.",
-)
-@click.option(
-    "--reader-search-context",
-    default=1,
-    type=click.IntRange(0, 10),
-    show_default=True,
-    help="Context radius for inline corpus hits.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_word_context(  # noqa: PLR0913
-    ctx: click.Context,
-    query: str,
-    index_path: str | None,
-    language: str,
-    work_ref: str | None,
-    segment_ref: str | None,
-    reader_search_limit: int,
-    reader_search_context: int,
-    output: str,
-) -> None:
-    """Build selected-word reader context for marginalia sidebars."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).word_context_payload(
-            query=query,
-            language=language,
-            index_path=_reader_search_index_path(index_path),
-            work_ref=work_ref,
-            segment_ref=segment_ref,
-            search_limit=reader_search_limit,
-            search_context=reader_search_context,
-            lexical_evidence_provider=_reader_word_context_lexical_evidence_provider(),
-            morphology_provider=_reader_word_context_morphology_provider(),
-        ),
-        output,
-    )
-
-
-@reader_cli.command("work")
-@click.argument("work_ref")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_work(ctx: click.Context, work_ref: str, output: str) -> None:
-    """Show exact metadata for one work id, CTS work URN, or alias."""
-    _emit_reader_payload(_reader_service_from_context(ctx).work_payload(work_ref), output)
-
-
-@reader_cli.command("about")
-@click.argument("work_ref")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_about(ctx: click.Context, work_ref: str, output: str) -> None:
-    """Show a work dossier with structure headings and reviewed division bios."""
-    _emit_reader_payload(_reader_service_from_context(ctx).work_dossier_payload(work_ref), output)
-
-
-@reader_cli.command("map")
-@click.argument("work_ref")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_map(ctx: click.Context, work_ref: str, output: str) -> None:
-    """Show a table-of-contents style map for one reader work."""
-    _emit_reader_payload(_reader_service_from_context(ctx).map_payload(work_ref), output)
-
-
-@reader_cli.command("structure")
-@click.argument("work_ref")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_structure(ctx: click.Context, work_ref: str, output: str) -> None:
-    """Show UI-ready traditional structure for one reader work."""
-    _emit_reader_payload(_reader_service_from_context(ctx).structure_payload(work_ref), output)
-
-
-@reader_cli.command("citation-maps")
-@click.argument("work_ref")
-@click.option(
-    "--source-id",
-    default=None,
-    help="Filter citation maps to one dictionary/source convention.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_citation_maps(
-    ctx: click.Context,
-    work_ref: str,
-    source_id: str | None,
-    output: str,
-) -> None:
-    """Show source-specific scholarly-to-machine citation maps for one reader work."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).citation_maps_payload(work_ref, source_id=source_id),
-        output,
-    )
-
-
-@reader_cli.command("sync-citation-maps")
-@click.option(
-    "--citation-map-dir",
-    type=click.Path(),
-    default="data/curated/reader_citation_maps",
-    show_default=True,
-    help="Curated reader citation-map directory.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_sync_citation_maps(ctx: click.Context, citation_map_dir: str, output: str) -> None:
-    """Sync curated source-specific citation maps into the reader catalog."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).sync_citation_maps_payload(
-            Path(citation_map_dir).expanduser()
-        ),
-        output,
-    )
-
-
-@reader_cli.command("sync-work-maps")
-@click.option(
-    "--work-map-dir",
-    type=click.Path(),
-    default="data/curated/reader_work_maps",
-    show_default=True,
-    help="Curated reader work-map/table-of-contents directory.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_sync_work_maps(ctx: click.Context, work_map_dir: str, output: str) -> None:
-    """Sync curated work-map/table-of-contents metadata into the reader catalog."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).sync_work_maps_payload(Path(work_map_dir).expanduser()),
-        output,
-    )
-
-
-@reader_cli.command("sync-division-metadata")
-@click.option(
-    "--division-metadata-dir",
-    type=click.Path(),
-    default="data/curated/reader_division_metadata",
-    show_default=True,
-    help="Curated reader division metadata directory.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_sync_division_metadata(
-    ctx: click.Context,
-    division_metadata_dir: str,
-    output: str,
-) -> None:
-    """Sync curated chapter/book/division metadata into the reader catalog."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).sync_division_metadata_payload(
-            Path(division_metadata_dir).expanduser()
-        ),
-        output,
-    )
-
-
-@reader_cli.command("sync-classifications")
-@click.option(
-    "--classification-csv",
-    type=click.Path(path_type=Path),
-    required=True,
-    help="Generated reader classification CSV file or directory of CSV files.",
-)
-@click.option(
-    "--merge",
-    is_flag=True,
-    help="Replace only rows present in the CSV, preserving other classifications.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_sync_classifications(
-    ctx: click.Context,
-    classification_csv: Path,
-    merge: bool,
-    output: str,
-) -> None:
-    """Sync generated work classification/popularity metadata into the reader catalog."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).sync_classifications_payload(
-            classification_csv.expanduser(),
-            merge=merge,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("sync-author-classifications")
-@click.option(
-    "--classification-csv",
-    type=click.Path(path_type=Path),
-    required=True,
-    help="Generated author classification CSV file or directory.",
-)
-@click.option(
-    "--merge",
-    is_flag=True,
-    help="Replace only author rows present in the CSV.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_sync_author_classifications(
-    ctx: click.Context,
-    classification_csv: Path,
-    merge: bool,
-    output: str,
-) -> None:
-    """Sync generated author classification metadata."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).sync_author_classifications_payload(
-            classification_csv.expanduser(),
-            merge=merge,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("sync-metadata-overlays")
-@click.option(
-    "--metadata-overlay-dir",
-    type=click.Path(path_type=Path),
-    default=Path("data/curated/reader_metadata"),
-    show_default=True,
-    help="Curated reader metadata overlay YAML root.",
-)
-@click.option(
-    "--dry-run",
-    is_flag=True,
-    help="Report accepted overlay updates without modifying works.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_sync_metadata_overlays(
-    ctx: click.Context,
-    metadata_overlay_dir: Path,
-    dry_run: bool,
-    output: str,
-) -> None:
-    """Sync curated metadata overlays and apply accepted display updates."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).sync_metadata_overlays_payload(
-            metadata_overlay_dir.expanduser(),
-            dry_run=dry_run,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("sync-metadata-attributions")
-@click.option(
-    "--metadata-attribution-dir",
-    type=click.Path(path_type=Path),
-    default=Path("data/curated/reader_attributions"),
-    show_default=True,
-    help="Curated reader metadata attribution YAML root.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_sync_metadata_attributions(
-    ctx: click.Context,
-    metadata_attribution_dir: Path,
-    output: str,
-) -> None:
-    """Sync curated attribution claims that support didactic display."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).sync_metadata_attributions_payload(
-            metadata_attribution_dir.expanduser(),
-        ),
-        output,
-    )
-
-
-@reader_cli.command("repair-languages")
-@click.option(
-    "--dry-run",
-    is_flag=True,
-    help="Report work-language repairs without modifying the catalog.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_repair_languages(ctx: click.Context, dry_run: bool, output: str) -> None:
-    """Repair primary work languages in an existing reader catalog."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).repair_languages_payload(dry_run=dry_run),
-        output,
-    )
-
-
-@reader_cli.command("prune-stale-classifications")
-@click.option(
-    "--dry-run",
-    is_flag=True,
-    help="Report stale generated classification rows without modifying the catalog.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_prune_stale_classifications(
-    ctx: click.Context,
-    dry_run: bool,
-    output: str,
-) -> None:
-    """Remove generated work classifications from the wrong language batch."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).prune_stale_classifications_payload(
-            dry_run=dry_run,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("sync-source-enrichment")
-@click.option(
-    "--dcs-corpus-table",
-    type=click.Path(path_type=Path),
-    default=None,
-    help="DCS corpus table capture with Text, Author, Time slot, and Subject columns.",
-)
-@click.option(
-    "--dcs-chapter-info",
-    type=click.Path(path_type=Path),
-    default=None,
-    help="DCS chapter-info.xml lookup file.",
-)
-@click.option(
-    "--perseus-catalog-results",
-    type=click.Path(path_type=Path),
-    multiple=True,
-    help="Scraped Perseus catalog search result markdown for one subject URL.",
-)
-@click.option(
-    "--perseus-collection-id",
-    default="perseus",
-    show_default=True,
-    help="Collection id for Perseus result metadata.",
-)
-@click.option(
-    "--perseus-subject",
-    default="",
-    help="Perseus subject label represented by the result page.",
-)
-@click.option(
-    "--perseus-source-url",
-    default="",
-    help="Source URL for the scraped Perseus result page.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_sync_source_enrichment(  # noqa: PLR0913
-    ctx: click.Context,
-    dcs_corpus_table: Path | None,
-    dcs_chapter_info: Path | None,
-    perseus_catalog_results: tuple[Path, ...],
-    perseus_collection_id: str,
-    perseus_subject: str,
-    perseus_source_url: str,
-    output: str,
-) -> None:
-    """Sync source-backed DCS/Perseus enrichment metadata into the reader catalog."""
-    if perseus_catalog_results and not perseus_subject:
-        raise click.ClickException("--perseus-subject is required with Perseus result files")
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).sync_source_enrichment_payload(
-            dcs_corpus_table=dcs_corpus_table.expanduser() if dcs_corpus_table else None,
-            dcs_chapter_info=dcs_chapter_info.expanduser() if dcs_chapter_info else None,
-            perseus_catalog_results=tuple(path.expanduser() for path in perseus_catalog_results),
-            perseus_collection_id=perseus_collection_id,
-            perseus_subject=perseus_subject,
-            perseus_source_url=perseus_source_url,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("contents")
-@click.argument("work_id")
-@click.option("--limit", default=50, show_default=True, type=click.IntRange(1, 500))
-@click.option("--cursor", default=None, help="Offset cursor returned by prior JSON response.")
-@click.option("--from", "from_citation", default=None, help="Start at a citation path.")
-@click.option("--around", default=None, help="Center contents around a citation path.")
-@click.option("--radius", default=20, show_default=True, type=click.IntRange(1, 250))
-@click.option(
-    "--char-budget",
-    default=None,
-    type=click.IntRange(500, 100_000),
-    help="Maximum text characters to return while preserving at least one segment.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_contents(  # noqa: PLR0913
-    ctx: click.Context,
-    work_id: str,
-    limit: int,
-    cursor: str | None,
-    from_citation: str | None,
-    around: str | None,
-    radius: int,
-    char_budget: int | None,
-    output: str,
-) -> None:
-    """List segments for one reader work."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).contents_payload(
-            work_id,
-            limit=limit,
-            cursor=cursor,
-            from_citation=from_citation,
-            around=around,
-            radius=radius,
-            char_budget=char_budget,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("show")
-@click.argument("address")
-@click.option("--segment", default=None, help="Citation path when ADDRESS is a work id or alias.")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_show(ctx: click.Context, address: str, segment: str | None, output: str) -> None:
-    """Retrieve one segment by address, or by work plus --segment."""
-    service = _reader_service_from_context(ctx)
-    payload = service.show_work_segment(address, segment) if segment else service.show(address)
-    _emit_reader_payload(payload, output)
-
-
-@reader_cli.command("resolve-address")
-@click.argument("address")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_resolve_address(ctx: click.Context, address: str, output: str) -> None:
-    """Resolve a reader address such as 'Od. 3.74'."""
-    _emit_reader_payload(_reader_service_from_context(ctx).resolve_address(address), output)
-
-
-@reader_cli.command("summary")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_summary(ctx: click.Context, output: str) -> None:
-    """Summarize the reader catalog."""
-    _emit_reader_payload(_reader_service_from_context(ctx).summary(), output)
-
-
-@reader_cli.command("aliases")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_aliases(ctx: click.Context, output: str) -> None:
-    """List reader aliases."""
-    _emit_reader_payload(_reader_service_from_context(ctx).aliases(), output)
-
-
-@reader_cli.command("alias-check")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_alias_check(ctx: click.Context, output: str) -> None:
-    """Report reader alias conflicts."""
-    _emit_reader_payload(_reader_service_from_context(ctx).alias_conflicts(), output)
-
-
-@reader_cli.command("overlays")
-@click.option("--collection", "collection_id", default=None, help="Optional collection filter.")
-@click.option("--status", default=None, help="Optional overlay status filter.")
-@click.option("--field", default=None, help="Optional metadata field filter.")
-@click.option("--match-value", default=None, help="Optional match value filter.")
-@click.option("--limit", default=500, show_default=True, type=click.IntRange(1, 20000))
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_overlays(  # noqa: PLR0913
-    ctx: click.Context,
-    collection_id: str | None,
-    status: str | None,
-    field: str | None,
-    match_value: str | None,
-    limit: int,
-    output: str,
-) -> None:
-    """List curated metadata overlay assertions and evidence."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).overlays(
-            collection_id=collection_id,
-            status=status,
-            field=field,
-            match_value=match_value,
-            limit=limit,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("attributions")
-@click.option("--collection", "collection_id", default=None, help="Optional collection filter.")
-@click.option("--status", default=None, help="Optional attribution status filter.")
-@click.option("--relation-type", default=None, help="Optional attribution relation type filter.")
-@click.option("--agent", default=None, help="Optional person/group filter.")
-@click.option("--match-value", default=None, help="Optional matched work/source value filter.")
-@click.option("--limit", default=500, show_default=True, type=click.IntRange(1, 5000))
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_attributions(  # noqa: PLR0913
-    ctx: click.Context,
-    collection_id: str | None,
-    status: str | None,
-    relation_type: str | None,
-    agent: str | None,
-    match_value: str | None,
-    limit: int,
-    output: str,
-) -> None:
-    """List curated attribution claims that do not necessarily alter display metadata."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).attributions(
-            collection_id=collection_id,
-            status=status,
-            relation_type=relation_type,
-            agent=agent,
-            match_value=match_value,
-            limit=limit,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("overlay-review")
-@click.option(
-    "--metadata-overlay-dir",
-    type=click.Path(path_type=Path),
-    default=Path("data/curated/reader_metadata"),
-    show_default=True,
-    help="Curated reader metadata overlay YAML root.",
-)
-@click.option("--collection", "collection_id", default=None, help="Optional collection filter.")
-@click.option("--field", default=None, help="Optional metadata field filter.")
-@click.option("--match-value", default=None, help="Optional match value filter.")
-@click.option("--limit", default=50, show_default=True, type=click.IntRange(1, 500))
-@click.option(
-    "--reviewer",
-    type=click.Choice(["rule", "llm"]),
-    default="rule",
-    show_default=True,
-    help="Use local rule recommendations or an OpenRouter LLM reviewer.",
-)
-@click.option(
-    "--model",
-    default=DEFAULT_RECOMMENDATION_MODEL,
-    show_default=True,
-    help="OpenRouter model id used when --reviewer llm.",
-)
-@click.option(
-    "--apply",
-    "apply_changes",
-    is_flag=True,
-    help="Prompt to promote reviewed candidates in their YAML files.",
-)
-@click.option(
-    "--yes",
-    is_flag=True,
-    help="With --apply, approve every accept recommendation without prompting.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def reader_overlay_review(  # noqa: PLR0913
-    metadata_overlay_dir: Path,
-    collection_id: str | None,
-    field: str | None,
-    match_value: str | None,
-    limit: int,
-    reviewer: str,
-    model: str,
-    apply_changes: bool,
-    yes: bool,
-    output: str,
-) -> None:
-    """Review candidate metadata overlays and optionally promote them."""
-    from langnet.reader.metadata_overlay_review import (  # noqa: PLC0415
-        llm_overlay_reviewer,
-        review_metadata_overlay_candidates,
-        review_to_payload,
-        rule_overlay_reviewer,
-    )
-
-    review_callback = (
-        (lambda overlay: llm_overlay_reviewer(overlay, model=model))
-        if reviewer == "llm"
-        else rule_overlay_reviewer
-    )
-
-    def approve(review) -> bool:
-        if yes:
-            return review.decision.recommendation == "accept"
-        _emit_reader_overlay_review_item(review_to_payload(review))
-        return click.confirm("Promote to accepted?", default=False)
-
-    reviews = review_metadata_overlay_candidates(
-        metadata_overlay_dir,
-        reviewer=review_callback,
-        collection_id=collection_id,
-        field=field,
-        match_value=match_value,
-        limit=limit,
-        apply=apply_changes,
-        approve=approve,
-    )
-    payload = {
-        "schema_version": "langnet.reader.overlay_review.v1",
-        "mode": "overlay-review",
-        "metadata_overlay_dir": str(metadata_overlay_dir),
-        "request": {
-            "collection_id": collection_id,
-            "field": field,
-            "match_value": match_value,
-            "limit": limit,
-            "reviewer": reviewer,
-            "model": model if reviewer == "llm" else "local-rule",
-            "apply": apply_changes,
-            "yes": yes,
-        },
-        "items": [review_to_payload(review) for review in reviews],
-    }
-    if output == "json":
-        click.echo(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8"))
-        return
-    if not reviews:
-        click.echo("No candidate overlays found.")
-        return
-    if not apply_changes:
-        for item in payload["items"]:
-            _emit_reader_overlay_review_item(cast(Mapping[str, object], item))
-    applied = sum(1 for review in reviews if review.applied)
-    click.echo(f"reviewed={len(reviews)} applied={applied}")
-
-
-def _emit_reader_overlay_review_item(item: Mapping[str, object]) -> None:
-    click.echo(
-        f"{item.get('collection_id')}  {item.get('match_value')}  "
-        f"{item.get('field')}={item.get('value')}"
-    )
-    click.echo(
-        f"  recommendation={item.get('recommendation')}  "
-        f"confidence={item.get('review_confidence')}  reviewer={item.get('reviewer')}"
-    )
-    flags = item.get("flags")
-    if isinstance(flags, Sequence) and not isinstance(flags, (str, bytes)):
-        click.echo(f"  flags={', '.join(str(flag) for flag in flags) or 'none'}")
-    click.echo(f"  rationale={item.get('rationale')}")
-
-
-@reader_cli.command("sources")
-@click.option("--collection", "collection_id", default=None, help="Optional collection filter.")
-@click.option(
-    "--status",
-    "file_status",
-    default=None,
-    help="Optional status filter: text, metadata, or support.",
-)
-@click.option("--limit", default=500, show_default=True, type=click.IntRange(1, 5000))
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_sources(
-    ctx: click.Context,
-    collection_id: str | None,
-    file_status: str | None,
-    limit: int,
-    output: str,
-) -> None:
-    """List source files classified during reader import."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).sources(
-            collection_id=collection_id,
-            file_status=file_status,
-            limit=limit,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("library-watchlist")
-@click.option(
-    "--query", "-q", default=None, help="Filter targets by name, alias, period, plan, or note."
-)
-@click.option("--language", default=None, help="Filter targets by language code.")
-@click.option("--status", default=None, help="Filter targets by acquisition status.")
-@click.option("--limit", default=100, show_default=True, type=click.IntRange(1, 5000))
-@click.option(
-    "--watchlist-path",
-    type=click.Path(path_type=Path),
-    default=Path("data/curated/reader_library_watchlist/high_value_targets.yaml"),
-    show_default=True,
-    help="Curated reader acquisition watchlist YAML.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def reader_library_watchlist(
-    query: str | None,
-    language: str | None,
-    status: str | None,
-    limit: int,
-    watchlist_path: Path,
-    output: str,
-) -> None:
-    """List curated high-value reader acquisition targets."""
-    from langnet.reader.library_watchlist import library_watchlist_payload  # noqa: PLC0415
-
-    payload = library_watchlist_payload(
-        watchlist_path=watchlist_path,
-        query=query,
-        language=language,
-        status=status,
-        limit=limit,
-    )
-    if output == "json":
-        click.echo(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8"))
-        return
-    for item in payload["items"]:
-        click.echo(
-            f"{item['id']}\t{item['status']}\t{','.join(item['languages'])}\t"
-            f"{item['display_name']}\t{item['source_plan']}"
-        )
-
-
-@reader_cli.command("source-index")
-@click.option("--collection", "collection_id", default=None, help="Optional collection filter.")
-@click.option("--language", default=None, help="Optional language filter, e.g. grc, lat, san.")
-@click.option(
-    "--source-id", default=None, help="Optional source id, CTS URN, or work id substring."
-)
-@click.option("--work-id", default=None, help="Optional exact work id filter.")
-@click.option("--query", default=None, help="Optional title/author/source/path substring filter.")
-@click.option("--limit", default=500, show_default=True, type=click.IntRange(1, 20000))
-@click.option("--cursor", default=None, help="Offset cursor returned by prior JSON response.")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_source_index(  # noqa: PLR0913
-    ctx: click.Context,
-    collection_id: str | None,
-    language: str | None,
-    source_id: str | None,
-    work_id: str | None,
-    query: str | None,
-    limit: int,
-    cursor: str | None,
-    output: str,
-) -> None:
-    """List imported works with source file, edition, artifact, and witness provenance."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).source_index(
-            collection_id=collection_id,
-            language=language,
-            source_id=source_id,
-            work_id=work_id,
-            query=query,
-            limit=limit,
-            cursor=cursor,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("stage-pl-wikisource")
-@click.option(
-    "--manifest",
-    "manifest_path",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    default=Path("data/sources_external/patrologia_latina/pl122/manifest.yaml"),
-    show_default=True,
-    help="Patrologia Latina Wikisource source manifest.",
-)
-@click.option(
-    "--works-tsv",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    help="Work table TSV. Defaults to <staging>/works.tsv from the manifest.",
-)
-@click.option(
-    "--raw-dir",
-    type=click.Path(exists=True, file_okay=False, path_type=Path),
-    help="Directory containing raw Wikisource markdown.",
-)
-@click.option(
-    "--output-dir",
-    type=click.Path(file_okay=False, path_type=Path),
-    help="Directory for segmented staging JSONL output.",
-)
-@click.option(
-    "--title",
-    "titles",
-    multiple=True,
-    help="Specific work title to stage. Repeatable. Defaults to rows marked staged_sample.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def reader_stage_pl_wikisource(
-    manifest_path: Path,
-    works_tsv: Path | None,
-    raw_dir: Path | None,
-    output_dir: Path | None,
-    titles: tuple[str, ...],
-    output: str,
-) -> None:
-    """Stage selected Patrologia Latina Wikisource work pages as segmented JSONL."""
-    from langnet.reader.source_acquisition import (  # noqa: PLC0415
-        PlWikisourceStageConfig,
-        stage_pl_wikisource,
-    )
-
-    payload = stage_pl_wikisource(
-        PlWikisourceStageConfig(
-            manifest_path=manifest_path,
-            works_tsv_path=works_tsv,
-            raw_dir=raw_dir,
-            output_dir=output_dir,
-            titles=titles,
-        )
-    )
-    _emit_reader_payload(payload, output)
-
-
-@reader_cli.command("import-pl-wikisource")
-@click.option(
-    "--summary",
-    "summary_path",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    default=Path(
-        "data/build/reader_import_staging/patrologia_latina/pl122/stage-pl-wikisource-summary.json"
-    ),
-    show_default=True,
-    help="Summary JSON produced by reader stage-pl-wikisource.",
-)
-@click.option(
-    "--data-root",
-    type=click.Path(file_okay=False, path_type=Path),
-    help="Optional data root for generated reader book DuckDB files.",
-)
-@click.option(
-    "--collection-id",
-    default="patrologia_latina_wikisource",
-    show_default=True,
-    help="Reader collection id for imported PL Wikisource works.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_import_pl_wikisource(
-    ctx: click.Context,
-    summary_path: Path,
-    data_root: Path | None,
-    collection_id: str,
-    output: str,
-) -> None:
-    """Import selected staged Patrologia Latina Wikisource JSONL into the reader catalog."""
-    from langnet.reader.source_acquisition import (  # noqa: PLC0415
-        PlWikisourceCatalogImportConfig,
-        import_pl_wikisource_catalog,
-    )
-
-    service = _reader_service_from_context(ctx)
-    payload = import_pl_wikisource_catalog(
-        PlWikisourceCatalogImportConfig(
-            catalog_path=service.catalog_path,
-            summary_path=summary_path,
-            data_root=data_root,
-            collection_id=collection_id,
-        )
-    )
-    _emit_reader_payload(payload, output)
-
-
-@reader_cli.command("stage-pg-pilot")
-@click.option(
-    "--manifest",
-    "manifest_path",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    default=Path("data/sources_external/patrologia_graeca/pilot/manifest.yaml"),
-    show_default=True,
-    help="Patrologia Graeca pilot manifest.",
-)
-@click.option(
-    "--raw-dir",
-    type=click.Path(exists=True, file_okay=False, path_type=Path),
-    help="Directory containing raw OGL PG .txt pages.",
-)
-@click.option(
-    "--output-dir",
-    type=click.Path(file_okay=False, path_type=Path),
-    help="Directory for segmented staging JSONL output.",
-)
-@click.option(
-    "--raw-page",
-    "raw_pages",
-    multiple=True,
-    help="Optional specific raw .txt file(s). Values may be bare file names under --raw-dir.",
-)
-@click.option(
-    "--title",
-    "title",
-    help="Optional work title used in Reader work metadata.",
-)
-@click.option(
-    "--author",
-    "author",
-    help="Optional author string used in Reader work metadata.",
-)
-@click.option(
-    "--language",
-    default="grc",
-    show_default=True,
-    help="Language tag for segmentation and segment indexing.",
-)
-@click.option(
-    "--max-pages",
-    type=click.IntRange(1, 3000),
-    help="Optional cap when staging from all available pages.",
-)
-@click.option(
-    "--quality-status",
-    default="machine_text_needs_segmentation",
-    show_default=True,
-    help="Quality status used in source metadata.",
-)
-@click.option(
-    "--boundary-confidence",
-    default="low_medium",
-    show_default=True,
-    help="Boundary confidence used in source metadata.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def reader_stage_pg_pilot(
-    manifest_path: Path,
-    raw_dir: Path | None,
-    output_dir: Path | None,
-    raw_pages: tuple[str, ...],
-    title: str | None,
-    author: str | None,
-    language: str,
-    max_pages: int | None,
-    quality_status: str,
-    boundary_confidence: str,
-    output: str,
-) -> None:
-    """Stage selected Patrologia Graeca pilot OCR pages as segmented JSONL."""
-    from langnet.reader.source_acquisition import (  # noqa: PLC0415
-        PgPilotStageConfig,
-        stage_pg_pilot,
-    )
-
-    payload = stage_pg_pilot(
-        PgPilotStageConfig(
-            manifest_path=manifest_path,
-            raw_dir=raw_dir,
-            output_dir=output_dir,
-            raw_pages=raw_pages,
-            title=title,
-            author=author,
-            language=language,
-            max_pages=max_pages,
-            quality_status=quality_status,
-            boundary_confidence=boundary_confidence,
-        )
-    )
-    _emit_reader_payload(payload, output)
-
-
-@reader_cli.command("import-pg-pilot")
-@click.option(
-    "--summary",
-    "summary_path",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    default=Path(
-        "data/build/reader_import_staging/patrologia_graeca/pilot/stage-pg-pilot-summary.json"
-    ),
-    show_default=True,
-    help="Summary JSON produced by reader stage-pg-pilot.",
-)
-@click.option(
-    "--data-root",
-    type=click.Path(file_okay=False, path_type=Path),
-    help="Optional data root for generated reader book DuckDB files.",
-)
-@click.option(
-    "--collection-id",
-    default="patrologia_graeca_pilot",
-    show_default=True,
-    help="Reader collection id for imported PG pilot works.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_import_pg_pilot(
-    ctx: click.Context,
-    summary_path: Path,
-    data_root: Path | None,
-    collection_id: str,
-    output: str,
-) -> None:
-    """Import selected staged Patrologia Graeca pilot JSONL into the reader catalog."""
-    from langnet.reader.source_acquisition import (  # noqa: PLC0415
-        PgPilotCatalogImportConfig,
-        import_pg_pilot_catalog,
-    )
-
-    service = _reader_service_from_context(ctx)
-    payload = import_pg_pilot_catalog(
-        PgPilotCatalogImportConfig(
-            catalog_path=service.catalog_path,
-            summary_path=summary_path,
-            data_root=data_root,
-            collection_id=collection_id,
-        )
-    )
-    _emit_reader_payload(payload, output)
-
-
-@reader_cli.command("stage-bruno-esoteric")
-@click.option(
-    "--manifest",
-    "manifest_path",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    default=Path("data/sources_external/bruno/esotericarchives/manifest.yaml"),
-    show_default=True,
-    help="Bruno Esoteric Archives source manifest.",
-)
-@click.option(
-    "--raw-dir",
-    type=click.Path(exists=True, file_okay=False, path_type=Path),
-    help="Directory containing raw Esoteric Archives markdown.",
-)
-@click.option(
-    "--output-dir",
-    type=click.Path(file_okay=False, path_type=Path),
-    help="Directory for segmented staging JSONL output.",
-)
-@click.option(
-    "--title",
-    "titles",
-    multiple=True,
-    help="Specific work title to stage. Repeatable. Defaults to candidate/staged rows.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def reader_stage_bruno_esoteric(
-    manifest_path: Path,
-    raw_dir: Path | None,
-    output_dir: Path | None,
-    titles: tuple[str, ...],
-    output: str,
-) -> None:
-    """Stage Bruno Esoteric Archives markdown pages as segmented JSONL."""
-    from langnet.reader.source_acquisition import (  # noqa: PLC0415
-        BrunoEsotericStageConfig,
-        stage_bruno_esoteric,
-    )
-
-    payload = stage_bruno_esoteric(
-        BrunoEsotericStageConfig(
-            manifest_path=manifest_path,
-            raw_dir=raw_dir,
-            output_dir=output_dir,
-            titles=titles,
-        )
-    )
-    _emit_reader_payload(payload, output)
-
-
-@reader_cli.command("import-staged-jsonl")
-@click.option(
-    "--segments",
-    "segments_path",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    required=True,
-    help="Manifest-backed staged reader JSONL file to import.",
-)
-@click.option(
-    "--collection-id",
-    required=True,
-    help="Reader collection id for the imported staged work.",
-)
-@click.option(
-    "--namespace",
-    required=True,
-    help="Reader book-path namespace for the imported staged work.",
-)
-@click.option(
-    "--edition-label",
-    required=True,
-    help="Reader edition label for the imported staged work.",
-)
-@click.option(
-    "--edition-suffix",
-    default="staged_jsonl",
-    show_default=True,
-    help="Stable edition id/path suffix for this staged import.",
-)
-@click.option(
-    "--acquisition-source",
-    default="manifest_backed_staged_jsonl",
-    show_default=True,
-    help="Source metadata label for the acquisition path.",
-)
-@click.option(
-    "--data-root",
-    type=click.Path(file_okay=False, path_type=Path),
-    help="Optional data root for generated reader book DuckDB files.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_import_staged_jsonl(
-    ctx: click.Context,
-    segments_path: Path,
-    collection_id: str,
-    namespace: str,
-    edition_label: str,
-    edition_suffix: str,
-    acquisition_source: str,
-    data_root: Path | None,
-    output: str,
-) -> None:
-    """Import one manifest-backed staged JSONL work into the reader catalog."""
-    from langnet.reader.source_acquisition import (  # noqa: PLC0415
-        StagedJsonlCatalogImportConfig,
-        import_staged_jsonl_catalog,
-    )
-
-    service = _reader_service_from_context(ctx)
-    payload = import_staged_jsonl_catalog(
-        StagedJsonlCatalogImportConfig(
-            catalog_path=service.catalog_path,
-            segments_path=segments_path,
-            collection_id=collection_id,
-            namespace=namespace,
-            edition_label=edition_label,
-            edition_suffix=edition_suffix,
-            data_root=data_root,
-            acquisition_source=acquisition_source,
-        )
-    )
-    _emit_reader_payload(payload, output)
-
-
-@reader_cli.group("export")
-def reader_export() -> None:
-    """Export canonical reader catalog bundles."""
-
-
-@reader_export.command("work")
-@click.argument("work_ref")
-@click.option(
-    "--output-path",
-    type=click.Path(path_type=Path, file_okay=False, dir_okay=True),
-    required=True,
-    help="Directory for the canonical work bundle.",
-)
-@click.option(
-    "--replace/--no-replace",
-    default=True,
-    show_default=True,
-    help="Replace an existing output directory.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_export_work(
-    ctx: click.Context,
-    work_ref: str,
-    output_path: Path,
-    replace: bool,
-    output: str,
-) -> None:
-    """Export one reader work as a canonical LangNet bundle."""
-    from langnet.reader.catalog_export import export_work_bundle  # noqa: PLC0415
-
-    catalog_path = _reader_service_from_context(ctx).catalog_path
-    _emit_reader_payload(
-        export_work_bundle(catalog_path, work_ref, output_path, replace=replace),
-        output,
-    )
-
-
-@reader_export.command("bundle")
-@click.option(
-    "--output-path",
-    type=click.Path(path_type=Path, file_okay=False, dir_okay=True),
-    required=True,
-    help="Directory for the canonical catalog bundle.",
-)
-@click.option("--collection", "collection_id", help="Optional collection id filter.")
-@click.option("--language", help="Optional language filter.")
-@click.option(
-    "--replace/--no-replace",
-    default=True,
-    show_default=True,
-    help="Replace an existing output directory.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_export_bundle(
-    ctx: click.Context,
-    output_path: Path,
-    collection_id: str | None,
-    language: str | None,
-    replace: bool,
-    output: str,
-) -> None:
-    """Export reader catalog works as a canonical LangNet bundle."""
-    from langnet.reader.catalog_export import export_catalog_bundle  # noqa: PLC0415
-
-    catalog_path = _reader_service_from_context(ctx).catalog_path
-    _emit_reader_payload(
-        export_catalog_bundle(
-            catalog_path,
-            output_path,
-            collection_id=collection_id,
-            language=language,
-            replace=replace,
-        ),
-        output,
-    )
-
-
-@reader_export.command("validate")
-@click.argument(
-    "export_path",
-    type=click.Path(path_type=Path, file_okay=False, dir_okay=True),
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def reader_export_validate(export_path: Path, output: str) -> None:
-    """Validate a canonical reader catalog export bundle."""
-    from langnet.reader.catalog_export import validate_catalog_export  # noqa: PLC0415
-
-    payload = validate_catalog_export(export_path)
-    _emit_reader_payload(payload, output)
-    if not payload["ok"]:
-        raise click.exceptions.Exit(1)
-
-
-@reader_cli.command("source-index-export")
-@click.option(
-    "--output-dir",
-    type=click.Path(path_type=Path, file_okay=False, dir_okay=True),
-    default=Path("data/reference/reader_source_index"),
-    show_default=True,
-    help="Directory for regenerated source-index TSV snapshots.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_source_index_export(
-    ctx: click.Context,
-    output_dir: Path,
-    output: str,
-) -> None:
-    """Regenerate flat source-index TSV snapshots and README."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).source_index_export(output_dir),
-        output,
-    )
-
-
-@reader_cli.command("ogl-audit")
-@click.option(
-    "--collection",
-    "collections",
-    multiple=True,
-    help="Optional OGL collection id to audit. May be repeated.",
-)
-@click.option(
-    "--opengreekandlatin-latin-dir",
-    type=click.Path(path_type=Path),
-    default=Path.home() / "opengreekandlatin" / "Latin",
-    show_default=True,
-)
-@click.option(
-    "--opengreekandlatin-csel-dir",
-    type=click.Path(path_type=Path),
-    default=Path.home() / "opengreekandlatin" / "csel-dev",
-    show_default=True,
-)
-@click.option(
-    "--opengreekandlatin-patrologia-dir",
-    type=click.Path(path_type=Path),
-    default=Path.home() / "opengreekandlatin" / "patrologia_latina-dev",
-    show_default=True,
-)
-@click.option(
-    "--opengreekandlatin-church-fathers-dir",
-    type=click.Path(path_type=Path),
-    default=Path.home() / "opengreekandlatin" / "church_fathers-dev",
-    show_default=True,
-)
-@click.option("--sample-limit", default=8, show_default=True, type=click.IntRange(0, 100))
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_ogl_audit(
-    ctx: click.Context,
-    collections: tuple[str, ...],
-    opengreekandlatin_latin_dir: Path,
-    opengreekandlatin_csel_dir: Path,
-    opengreekandlatin_patrologia_dir: Path,
-    opengreekandlatin_church_fathers_dir: Path,
-    sample_limit: int,
-    output: str,
-) -> None:
-    """Audit OpenGreekAndLatin source selection and catalog coverage."""
-    from langnet.reader.ogl_audit import audit_ogl_imports  # noqa: PLC0415
-
-    payload = audit_ogl_imports(
-        catalog_path=_reader_service_from_context(ctx).catalog_path,
-        roots={
-            "opengreekandlatin_latin": opengreekandlatin_latin_dir.expanduser(),
-            "opengreekandlatin_csel": opengreekandlatin_csel_dir.expanduser(),
-            "opengreekandlatin_patrologia": opengreekandlatin_patrologia_dir.expanduser(),
-            "opengreekandlatin_church_fathers": opengreekandlatin_church_fathers_dir.expanduser(),
-        },
-        collections=set(collections) if collections else None,
-        sample_limit=sample_limit,
-    )
-    _emit_reader_payload(payload, output)
-
-
-@reader_cli.command("ogl-view-comparison")
-@click.option(
-    "--collection",
-    "collection_id",
-    default="opengreekandlatin_patrologia",
-    show_default=True,
-    help="OGL collection id to compare.",
-)
-@click.option(
-    "--root",
-    type=click.Path(path_type=Path),
-    default=Path.home() / "opengreekandlatin" / "patrologia_latina-dev",
-    show_default=True,
-    help="OGL source checkout root.",
-)
-@click.option(
-    "--output-dir",
-    type=click.Path(path_type=Path, file_okay=False, dir_okay=True),
-    default=Path("data/reference/ogl_import_audit"),
-    show_default=True,
-    help="Directory for JSON and TSV comparison artifacts.",
-)
-@click.option(
-    "--limit-per-view",
-    default=10,
-    show_default=True,
-    type=click.IntRange(0, 100),
-    help="Maximum comparisons to write for each alternate source view.",
-)
-@click.option(
-    "--alternate-view",
-    "alternate_views",
-    multiple=True,
-    default=("alternate_view_corrected", "alternate_view_split"),
-    show_default=True,
-    help="Alternate source view to sample. May be repeated.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def reader_ogl_view_comparison(
-    collection_id: str,
-    root: Path,
-    output_dir: Path,
-    limit_per_view: int,
-    alternate_views: tuple[str, ...],
-    output: str,
-) -> None:
-    """Write bounded OGL selected-vs-alternate source-view comparison artifacts."""
-    from langnet.reader.ogl_audit import write_ogl_view_comparison_artifact  # noqa: PLC0415
-
-    payload = write_ogl_view_comparison_artifact(
-        root=root.expanduser(),
-        collection_id=collection_id,
-        output_dir=output_dir.expanduser(),
-        limit_per_view=limit_per_view,
-        alternate_views=alternate_views,
-    )
-    _emit_reader_payload(payload, output)
-
-
-@reader_cli.command("metadata")
-@click.option("--collection", "collection_id", default=None, help="Optional collection filter.")
-@click.option("--subject-kind", default=None, help="Optional subject kind filter.")
-@click.option("--subject-id", default=None, help="Optional subject id filter.")
-@click.option("--limit", default=500, show_default=True, type=click.IntRange(1, 5000))
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_metadata(  # noqa: PLR0913
-    ctx: click.Context,
-    collection_id: str | None,
-    subject_kind: str | None,
-    subject_id: str | None,
-    limit: int,
-    output: str,
-) -> None:
-    """List source metadata imported from corpus support files."""
-    _emit_reader_payload(
-        _reader_service_from_context(ctx).metadata(
-            collection_id=collection_id,
-            subject_kind=subject_kind,
-            subject_id=subject_id,
-            limit=limit,
-        ),
-        output,
-    )
-
-
-@reader_cli.command("validate")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-@click.pass_context
-def reader_validate(ctx: click.Context, output: str) -> None:
-    """Validate reader catalog and per-book artifacts."""
-    _emit_reader_payload(_reader_service_from_context(ctx).validate(), output)
-
-
-main.add_command(reader_cli)
-
-
-@main.command("bailly-xml-audit")
-@click.argument(
-    "xml_dir",
-    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
-)
-@click.option(
-    "--output",
-    "-o",
-    type=click.Path(dir_okay=False, path_type=Path),
-    help="Optional TSV output path.",
-)
-def bailly_xml_audit(xml_dir: Path, output: Path | None) -> None:
-    """Audit generated Bailly per-page Poppler XML files."""
-    from langnet.parsing.bailly_pdf_xml import audit_bailly_xml_pages  # noqa: PLC0415
-
-    report = audit_bailly_xml_pages(xml_dir)
-    rows = [
-        [
-            "page",
-            "path",
-            "section",
-            "text_node_count",
-            "entry_count",
-            "first_lemma",
-            "last_lemma",
-            "warning",
-        ],
-        *[page.as_tsv_row() for page in report.pages],
-    ]
-    text = "\n".join("\t".join(row) for row in rows) + "\n"
-    if output is not None:
-        output.expanduser().parent.mkdir(parents=True, exist_ok=True)
-        output.expanduser().write_text(text, encoding="utf-8")
-        click.echo(f"wrote: {output.expanduser()}")
-    else:
-        click.echo(text, nl=False)
-    if report.missing_pages:
-        click.echo(f"missing_pages: {len(report.missing_pages)}", err=True)
-
-
-@main.command("bailly-xml-extract")
-@click.argument(
-    "xml_dir",
-    type=click.Path(exists=True, file_okay=False, dir_okay=True, path_type=Path),
-)
-@click.option(
-    "--output",
-    "-o",
-    type=click.Path(dir_okay=False, path_type=Path),
-    help="Optional JSONL output path. Defaults to stdout.",
-)
-@click.option("--from-page", type=int, help="First physical PDF page to include.")
-@click.option("--to-page", type=int, help="Last physical PDF page to include.")
-@click.option("--limit", type=int, help="Maximum number of entries to write.")
-def bailly_xml_extract(
-    xml_dir: Path,
-    output: Path | None,
-    from_page: int | None,
-    to_page: int | None,
+@click.option("--from-page", type=int, help="First physical PDF page to include.")
+@click.option("--to-page", type=int, help="Last physical PDF page to include.")
+@click.option("--limit", type=int, help="Maximum number of entries to write.")
+def bailly_xml_extract(
+    xml_dir: Path,
+    output: Path | None,
+    from_page: int | None,
+    to_page: int | None,
     limit: int | None,
 ) -> None:
     """Extract Bailly Poppler XML pages to structural JSONL entries."""
@@ -5849,335 +2755,12 @@ def _bailly_page_number_from_path(path: Path) -> int:
 @main.command("bailly-db-lookup")
 @click.argument("headword")
 @click.option(
-    "--db",
-    "db_path",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    help="Bailly DuckDB path. Defaults to data/build/lex_bailly.duckdb.",
-)
-@click.option("--limit", type=int, default=10, show_default=True, help="Maximum entries.")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def bailly_db_lookup(
-    headword: str,
-    db_path: Path | None,
-    limit: int,
-    output: str,
-) -> None:
-    """Inspect PDF-derived Bailly entries from the local DuckDB index."""
-    from langnet.databuild.bailly import lookup_bailly_entries  # noqa: PLC0415
-
-    entries = lookup_bailly_entries(headword, db_path, limit=limit)
-    if output == "json":
-        click.echo(orjson.dumps({"entries": entries}, option=orjson.OPT_INDENT_2).decode("utf-8"))
-        return
-    if not entries:
-        click.echo(f"No Bailly entries found for {headword!r}.")
-        return
-    for entry in entries:
-        page_start = entry.get("page_start") or "?"
-        page_end = entry.get("page_end") or "?"
-        click.echo(f"{entry['lemma']} [{entry['entry_id']}] pages {page_start}-{page_end}")
-        for block in entry["blocks"]:
-            click.echo(f"  {block['path']} {block['marker']} {block['text']}")
-
-
-@main.command("lewis-1890-db-lookup")
-@click.argument("headword")
-@click.option(
-    "--db",
-    "db_path",
-    type=click.Path(exists=True, dir_okay=False, path_type=Path),
-    help="Lewis 1890 DuckDB path. Defaults to data/build/lex_lewis_1890.duckdb.",
-)
-@click.option("--limit", type=int, default=10, show_default=True, help="Maximum entries.")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def lewis_1890_db_lookup(
-    headword: str,
-    db_path: Path | None,
-    limit: int,
-    output: str,
-) -> None:
-    """Inspect Lewis 1890 entries from the local DuckDB index."""
-    from langnet.databuild.lewis_1890 import lookup_lewis_1890_entries  # noqa: PLC0415
-
-    entries = lookup_lewis_1890_entries(headword, db_path)[:limit]
-    if output == "json":
-        click.echo(orjson.dumps({"entries": entries}, option=orjson.OPT_INDENT_2).decode("utf-8"))
-        return
-    if not entries:
-        click.echo(f"No Lewis 1890 entries found for {headword!r}.")
-        return
-    for entry in entries:
-        click.echo(f"{entry['headword_raw']} [{entry['entry_id']}]")
-        click.echo(f"  {entry['plain_text']}")
-
-
-@main.command("tools")
-@click.argument("language", required=False)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def tools(language: str | None, output: str) -> None:
-    """List tool_filter values accepted by learner-facing commands."""
-    if language and canonical_language(language) is None:
-        raise click.UsageError(f"Unsupported language '{language}'. Use lat|grc|san.")
-
-    payload = catalog_payload(language, command="encounter")
-    if output == "json":
-        click.echo(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8"))
-        return
-
-    click.echo("Tool filters")
-    languages = cast(Sequence[Mapping[str, object]], payload["languages"])
-    tools_payload = cast(Sequence[Mapping[str, object]], payload["tools"])
-    for lang_map in languages:
-        click.echo(f"\n{lang_map['label']} ({lang_map['code']})")
-        click.echo("  all - All default tools for the language")
-        for entry in tools_payload:
-            if entry.get("language") != lang_map["code"]:
-                continue
-            suffix = " [translation-capable]" if entry.get("translation_capable") else ""
-            click.echo(f"  {entry['tool_filter']} - {entry['label']} ({entry['role']}){suffix}")
-
-
-@main.command("langs")
-@click.argument("language", required=False)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def langs(language: str | None, output: str) -> None:
-    """List supported language codes and aliases."""
-    if language and canonical_language(language) is None:
-        raise click.UsageError(f"Unsupported language '{language}'. Use lat|grc|san.")
-
-    payload = language_payload(language)
-    if output == "json":
-        click.echo(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8"))
-        return
-
-    click.echo("Languages")
-    languages = cast(Sequence[Mapping[str, object]], payload["languages"])
-    for lang_map in languages:
-        aliases = cast(Sequence[str], lang_map["aliases"])
-        click.echo(f"  {lang_map['code']} - {lang_map['label']} (aliases: {', '.join(aliases)})")
-
-
-@click.group("word-index")
-def word_index_cli() -> None:
-    """Explore locally indexed dictionary headwords."""
-
-
-@word_index_cli.command("sources")
-@click.argument("language", default="all")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def word_index_sources(language: str, output: str) -> None:
-    """List available word-index sources."""
-    try:
-        payload = word_index_sources_payload(language)
-    except ValueError as exc:
-        raise click.UsageError(str(exc)) from exc
-    _emit_word_index_payload(payload, output=output)
-
-
-@word_index_cli.command("sections")
-@click.argument("language")
-@click.option(
-    "--source",
-    default="all",
-    show_default=True,
-    help="Source filter: all, cdsl, dico, gaffiot, or diogenes.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def word_index_sections(language: str, source: str, output: str) -> None:
-    """List native alphabet/section anchors for word-index browsing."""
-    try:
-        payload = word_index_sections_payload(language, source=source)
-    except ValueError as exc:
-        raise click.UsageError(str(exc)) from exc
-    _emit_word_index_sections_payload(payload, output=output)
-
-
-@word_index_cli.command("list")
-@click.argument("language", default="all")
-@click.option(
-    "--source",
-    default="all",
-    show_default=True,
-    help="Source filter: all, cdsl, dico, gaffiot, or diogenes.",
-)
-@click.option("--prefix", default="", help="Optional headword prefix filter.")
-@click.option("--limit", default=50, show_default=True, type=click.IntRange(1, 500))
-@click.option("--cursor", default=None, help="Opaque pagination cursor from prior response.")
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def word_index_list(  # noqa: PLR0913
-    language: str,
-    source: str,
-    prefix: str,
-    limit: int,
-    cursor: str | None,
-    output: str,
-) -> None:
-    """List indexed headwords."""
-    try:
-        payload = word_index_list_payload(
-            language,
-            source=source,
-            prefix=prefix,
-            limit=limit,
-            cursor=cursor,
-        )
-    except ValueError as exc:
-        raise click.UsageError(str(exc)) from exc
-    _emit_word_index_payload(payload, output=output)
-
-
-@word_index_cli.command("browse")
-@click.argument("language")
-@click.option(
-    "--source",
-    default="all",
-    show_default=True,
-    help="Source filter: all, cdsl, dico, gaffiot, or diogenes.",
-)
-@click.option("--prefix", default="", help="Optional source-native browse prefix.")
-@click.option("--limit", default=50, show_default=True, type=click.IntRange(1, 500))
-@click.option(
-    "--homographs",
-    type=click.Choice(["grouped", "raw"]),
-    default="grouped",
-    show_default=True,
-    help="Group adjacent homographs or preserve raw source rows.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def word_index_browse(  # noqa: PLR0913
-    language: str,
-    source: str,
-    prefix: str,
-    limit: int,
-    homographs: str,
-    output: str,
-) -> None:
-    """Browse indexed headwords in grouped source-native order."""
-    try:
-        payload = word_index_browse_payload(
-            language,
-            source=source,
-            prefix=prefix,
-            limit=limit,
-            homographs=cast(WordIndexHomographs, homographs),
-        )
-    except ValueError as exc:
-        raise click.UsageError(str(exc)) from exc
-    _emit_word_index_payload(payload, output=output)
-
-
-@word_index_cli.command("neighborhood")
-@click.argument("language")
-@click.argument("query")
-@click.option(
-    "--source",
-    default="all",
-    show_default=True,
-    help="Source filter: all, cdsl, dico, gaffiot, or diogenes.",
-)
-@click.option("--radius", default=10, show_default=True, type=click.IntRange(1, 100))
-@click.option(
-    "--merge",
-    type=click.Choice(["auto", "none", "lexeme"]),
-    default="auto",
-    show_default=True,
-    help="Merge source-local groups into lexeme cards.",
-)
-@click.option(
-    "--output",
-    type=click.Choice(["pretty", "json"]),
-    default="pretty",
-    show_default=True,
-    help="Output format.",
-)
-def word_index_neighborhood(  # noqa: PLR0913
-    language: str, query: str, source: str, radius: int, merge: str, output: str
-) -> None:
-    """Show indexed words before and after a term."""
-    _run_word_index_neighborhood(language, query, source, radius, merge, output)
-
-
-def _run_word_index_neighborhood(  # noqa: PLR0913
-    language: str, query: str, source: str, radius: int, merge: str, output: str
-) -> None:
-    try:
-        payload = word_index_neighborhood_payload(
-            language,
-            query,
-            source=source,
-            radius=radius,
-            merge=merge,
-        )
-    except ValueError as exc:
-        raise click.UsageError(str(exc)) from exc
-    _emit_word_index_payload(payload, output=output)
-
-
-@word_index_cli.command("nearby")
-@click.argument("language")
-@click.argument("query")
-@click.option(
-    "--source",
-    default="all",
-    show_default=True,
-    help="Source filter: all, cdsl, dico, gaffiot, or diogenes.",
-)
-@click.option("--radius", default=10, show_default=True, type=click.IntRange(1, 100))
-@click.option(
-    "--merge",
-    type=click.Choice(["auto", "none", "lexeme"]),
-    default="auto",
-    show_default=True,
-    help="Merge source-local groups into lexeme cards.",
+    "--db",
+    "db_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Bailly DuckDB path. Defaults to data/build/lex_bailly.duckdb.",
 )
+@click.option("--limit", type=int, default=10, show_default=True, help="Maximum entries.")
 @click.option(
     "--output",
     type=click.Choice(["pretty", "json"]),
@@ -6185,29 +2768,39 @@ def _run_word_index_neighborhood(  # noqa: PLR0913
     show_default=True,
     help="Output format.",
 )
-def word_index_nearby(  # noqa: PLR0913
-    language: str, query: str, source: str, radius: int, merge: str, output: str
+def bailly_db_lookup(
+    headword: str,
+    db_path: Path | None,
+    limit: int,
+    output: str,
 ) -> None:
-    """Alias for neighborhood: find indexed words near a search query."""
-    _run_word_index_neighborhood(language, query, source, radius, merge, output)
+    """Inspect PDF-derived Bailly entries from the local DuckDB index."""
+    from langnet.databuild.bailly import lookup_bailly_entries  # noqa: PLC0415
+
+    entries = lookup_bailly_entries(headword, db_path, limit=limit)
+    if output == "json":
+        click.echo(orjson.dumps({"entries": entries}, option=orjson.OPT_INDENT_2).decode("utf-8"))
+        return
+    if not entries:
+        click.echo(f"No Bailly entries found for {headword!r}.")
+        return
+    for entry in entries:
+        page_start = entry.get("page_start") or "?"
+        page_end = entry.get("page_end") or "?"
+        click.echo(f"{entry['lemma']} [{entry['entry_id']}] pages {page_start}-{page_end}")
+        for block in entry["blocks"]:
+            click.echo(f"  {block['path']} {block['marker']} {block['text']}")
 
 
-@word_index_cli.command("wheel")
-@click.argument("language", default="all")
-@click.option(
-    "--language",
-    "language_option",
-    default=None,
-    help="Language filter: all, lat, grc, or san. Overrides the positional language.",
-)
+@main.command("lewis-1890-db-lookup")
+@click.argument("headword")
 @click.option(
-    "--source",
-    default="all",
-    show_default=True,
-    help="Source filter: all, cdsl, dico, gaffiot, or diogenes.",
+    "--db",
+    "db_path",
+    type=click.Path(exists=True, dir_okay=False, path_type=Path),
+    help="Lewis 1890 DuckDB path. Defaults to data/build/lex_lewis_1890.duckdb.",
 )
-@click.option("--count", default=12, show_default=True, type=click.IntRange(1, 100))
-@click.option("--seed", default=None, help="Seed for deterministic word selection.")
+@click.option("--limit", type=int, default=10, show_default=True, help="Maximum entries.")
 @click.option(
     "--output",
     type=click.Choice(["pretty", "json"]),
@@ -6215,229 +2808,83 @@ def word_index_nearby(  # noqa: PLR0913
     show_default=True,
     help="Output format.",
 )
-def word_index_wheel(  # noqa: PLR0913
-    language: str,
-    language_option: str | None,
-    source: str,
-    count: int,
-    seed: str | None,
+def lewis_1890_db_lookup(
+    headword: str,
+    db_path: Path | None,
+    limit: int,
     output: str,
 ) -> None:
-    """Return a deterministic wheel of indexed study words."""
-    requested_language = language_option or language
-    try:
-        payload = word_index_wheel_payload(
-            requested_language,
-            source=source,
-            count=count,
-            seed=seed,
-        )
-    except ValueError as exc:
-        raise click.UsageError(str(exc)) from exc
-    _emit_word_index_payload(payload, output=output)
-
+    """Inspect Lewis 1890 entries from the local DuckDB index."""
+    from langnet.databuild.lewis_1890 import lookup_lewis_1890_entries  # noqa: PLC0415
 
-def _emit_word_index_payload(payload: Mapping[str, object], *, output: str) -> None:
+    entries = lookup_lewis_1890_entries(headword, db_path)[:limit]
     if output == "json":
-        click.echo(orjson.dumps(dict(payload), option=orjson.OPT_INDENT_2).decode("utf-8"))
-        return
-    request = cast(Mapping[str, object], payload.get("request") or {})
-    mode = request.get("mode")
-    click.echo(f"Word index: {mode}")
-    sources = payload.get("sources")
-    if mode == "sources":
-        _echo_word_index_sources(sources)
+        click.echo(orjson.dumps({"entries": entries}, option=orjson.OPT_INDENT_2).decode("utf-8"))
         return
-    groups = payload.get("groups")
-    items = payload.get("items")
-    if mode == "browse":
-        if _has_sequence_items(items):
-            click.echo("Learner browse:")
-            _echo_word_index_items(items, indent="  ")
-            click.echo("Source groups:")
-        _echo_word_index_browse_groups(groups)
-    else:
-        _echo_word_index_items(items)
-    neighborhood = payload.get("neighborhood")
-    if isinstance(neighborhood, Mapping):
-        _echo_word_index_neighborhood(cast(Mapping[str, object], neighborhood))
-    _echo_word_index_warnings(payload.get("warnings"))
-
-
-def _echo_word_index_sources(sources: object) -> None:
-    if not isinstance(sources, Sequence) or isinstance(sources, (str, bytes)):
+    if not entries:
+        click.echo(f"No Lewis 1890 entries found for {headword!r}.")
         return
-    for source in sources:
-        if not isinstance(source, Mapping):
-            continue
-        source_map = cast(Mapping[str, object], source)
-        status = "available" if source_map.get("available") else "missing"
-        count = source_map.get("entry_count")
-        click.echo(
-            f"- {source_map.get('language')}:"
-            f"{source_map.get('source')}:"
-            f"{source_map.get('dictionary')} "
-            f"{status} entries={count}"
-        )
-
-
-def _has_sequence_items(value: object) -> bool:
-    return isinstance(value, Sequence) and not isinstance(value, (str, bytes)) and bool(value)
-
+    for entry in entries:
+        click.echo(f"{entry['headword_raw']} [{entry['entry_id']}]")
+        click.echo(f"  {entry['plain_text']}")
 
-def _echo_word_index_items(items: object, *, indent: str = "") -> None:
-    if not isinstance(items, Sequence) or isinstance(items, (str, bytes)):
-        return
-    for item in items:
-        if isinstance(item, Mapping):
-            click.echo(
-                f"{indent}{_word_index_item_line_with_count(cast(Mapping[str, object], item))}"
-            )
 
+@main.command("tools")
+@click.argument("language", required=False)
+@click.option(
+    "--output",
+    type=click.Choice(["pretty", "json"]),
+    default="pretty",
+    show_default=True,
+    help="Output format.",
+)
+def tools(language: str | None, output: str) -> None:
+    """List tool_filter values accepted by learner-facing commands."""
+    if language and canonical_language(language) is None:
+        raise click.UsageError(f"Unsupported language '{language}'. Use lat|grc|san.")
 
-def _echo_word_index_warnings(warnings: object) -> None:
-    if not isinstance(warnings, Sequence) or isinstance(warnings, (str, bytes)):
+    payload = catalog_payload(language, command="encounter")
+    if output == "json":
+        click.echo(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8"))
         return
-    for warning in warnings:
-        if isinstance(warning, Mapping):
-            warning_map = cast(Mapping[str, object], warning)
-            click.echo(f"Warning: {warning_map.get('message')}", err=True)
 
+    click.echo("Tool filters")
+    languages = cast(Sequence[Mapping[str, object]], payload["languages"])
+    tools_payload = cast(Sequence[Mapping[str, object]], payload["tools"])
+    for lang_map in languages:
+        click.echo(f"\n{lang_map['label']} ({lang_map['code']})")
+        click.echo("  all - All default tools for the language")
+        for entry in tools_payload:
+            if entry.get("language") != lang_map["code"]:
+                continue
+            suffix = " [translation-capable]" if entry.get("translation_capable") else ""
+            click.echo(f"  {entry['tool_filter']} - {entry['label']} ({entry['role']}){suffix}")
 
-def _echo_word_index_browse_groups(groups: object) -> None:
-    if not isinstance(groups, Sequence) or isinstance(groups, (str, bytes)):
-        return
-    for group in groups:
-        if not isinstance(group, Mapping):
-            continue
-        group_map = cast(Mapping[str, object], group)
-        click.echo(
-            f"{group_map.get('language')}:{group_map.get('source')}:"
-            f"{group_map.get('dictionary')} prefix={group_map.get('prefix')}"
-        )
-        group_items = group_map.get("items")
-        if isinstance(group_items, Sequence) and not isinstance(group_items, (str, bytes)):
-            for item in group_items:
-                if not isinstance(item, Mapping):
-                    continue
-                item_map = cast(Mapping[str, object], item)
-                click.echo(f"  {_word_index_item_line_with_count(item_map)}")
 
+@main.command("langs")
+@click.argument("language", required=False)
+@click.option(
+    "--output",
+    type=click.Choice(["pretty", "json"]),
+    default="pretty",
+    show_default=True,
+    help="Output format.",
+)
+def langs(language: str | None, output: str) -> None:
+    """List supported language codes and aliases."""
+    if language and canonical_language(language) is None:
+        raise click.UsageError(f"Unsupported language '{language}'. Use lat|grc|san.")
 
-def _emit_word_index_sections_payload(payload: Mapping[str, object], *, output: str) -> None:
+    payload = language_payload(language)
     if output == "json":
-        click.echo(orjson.dumps(dict(payload), option=orjson.OPT_INDENT_2).decode("utf-8"))
-        return
-    order = payload.get("order")
-    if isinstance(order, Mapping):
-        order_map = cast(Mapping[str, object], order)
-        click.echo(f"Word index sections: {order_map.get('label')}")
-    sections = payload.get("sections")
-    if isinstance(sections, Sequence) and not isinstance(sections, (str, bytes)):
-        for section in sections:
-            if not isinstance(section, Mapping):
-                continue
-            section_map = cast(Mapping[str, object], section)
-            marker = "*" if section_map.get("available") else "-"
-            click.echo(
-                f"{marker} {section_map.get('label')} "
-                f"({section_map.get('transliteration')}) "
-                f"{section_map.get('group_label')}"
-            )
-    warnings = payload.get("warnings")
-    if isinstance(warnings, Sequence) and not isinstance(warnings, (str, bytes)):
-        for warning in warnings:
-            if isinstance(warning, Mapping):
-                warning_map = cast(Mapping[str, object], warning)
-                click.echo(f"Warning: {warning_map.get('message')}", err=True)
-
-
-def _word_index_item_line(item: Mapping[str, object]) -> str:
-    display = item.get("display")
-    display_map = (
-        cast(Mapping[str, object], display)
-        if isinstance(display, Mapping)
-        else cast(Mapping[str, object], {})
-    )
-    romanized = (
-        display_map.get("transliteration") or item.get("lookup") or item.get("canonical_name")
-    )
-    native = item.get("canonical_name")
-    suffix = f" ({native})" if native and native != romanized else ""
-    source_label = _word_index_source_label(item)
-    return f"- {item.get('language')}:{source_label} {romanized}{suffix}"
-
-
-def _word_index_item_line_with_count(item: Mapping[str, object]) -> str:
-    line = _word_index_item_line(item)
-    count = item.get("homograph_count")
-    suffix = f" [{count} entries]" if isinstance(count, int) and count > 1 else ""
-    return f"{line}{suffix}"
-
-
-def _word_index_source_label(item: Mapping[str, object]) -> str:
-    source_count = item.get("source_count")
-    if not isinstance(source_count, int) or source_count <= 1:
-        return str(item.get("source") or "")
-
-    sources = item.get("sources")
-    if not isinstance(sources, Sequence) or isinstance(sources, (str, bytes)):
-        return str(item.get("source") or "all")
-    labels = []
-    for source in sources:
-        if not isinstance(source, Mapping):
-            continue
-        source = cast(Mapping[str, object], source)
-        source_id = str(source.get("source") or "")
-        dictionary = str(source.get("dictionary") or "")
-        if source_id and dictionary and source_id != dictionary:
-            labels.append(f"{source_id}/{dictionary}")
-        elif source_id:
-            labels.append(source_id)
-    return "+".join(labels) if labels else str(item.get("source") or "all")
-
-
-def _echo_word_index_neighborhood(neighborhood: Mapping[str, object]) -> None:  # noqa: C901
-    if neighborhood.get("policy") in {"merged_lexeme", "integrated_language_native"}:
-        policy = neighborhood.get("policy")
-        click.echo(
-            f"Neighborhood: {neighborhood.get('language')}:{neighborhood.get('source')} {policy}"
-        )
-        items = neighborhood.get("items")
-        if isinstance(items, Sequence) and not isinstance(items, (str, bytes)):
-            for item in items:
-                if not isinstance(item, Mapping):
-                    continue
-                item_map = cast(Mapping[str, object], item)
-                position = item_map.get("position") or "nearby"
-                click.echo(f"  {position}: {_word_index_item_line(item_map).removeprefix('- ')}")
-        return
-    groups = neighborhood.get("groups")
-    if isinstance(groups, Sequence):
-        for group in groups:
-            if isinstance(group, Mapping):
-                _echo_word_index_neighborhood(cast(Mapping[str, object], group))
+        click.echo(orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8"))
         return
-    anchor = neighborhood.get("anchor")
-    click.echo(f"Neighborhood: {neighborhood.get('language')}:{neighborhood.get('source')}")
-    if isinstance(anchor, Mapping):
-        click.echo(
-            f"  anchor "
-            f"{_word_index_item_line(cast(Mapping[str, object], anchor)).removeprefix('- ')}"
-        )
-    for label in ("before", "after"):
-        values = neighborhood.get(label)
-        if isinstance(values, Sequence):
-            rendered = [
-                _word_index_item_line(cast(Mapping[str, object], item)).removeprefix("- ")
-                for item in values
-                if isinstance(item, Mapping)
-            ]
-            if rendered:
-                click.echo(f"  {label}: " + "; ".join(rendered))
-
 
-main.add_command(word_index_cli)
+    click.echo("Languages")
+    languages = cast(Sequence[Mapping[str, object]], payload["languages"])
+    for lang_map in languages:
+        aliases = cast(Sequence[str], lang_map["aliases"])
+        click.echo(f"  {lang_map['code']} - {lang_map['label']} (aliases: {', '.join(aliases)})")
 
 
 def _exclude_recent_terms(path: Path | None) -> list[str]:
@@ -8137,8 +4584,7 @@ def parse(  # noqa: PLR0913, PLR0915
         payload = parsed
     elif tool_l == "whitakers":
         binary = opt or find_whitaker_binary() or "whitakers-words"
-        proc = subprocess.run([binary, query_word], check=False, capture_output=True, text=True)
-        text_out = proc.stdout or ""
+        text_out = whitaker_lookup_text(binary, query_word)
         parsed = _parse_whitaker_output(text_out)
         payload = parsed
     elif tool_l == "cltk":
@@ -8342,10 +4788,20 @@ def _create_http_client(tool: str) -> ToolClient:
 
 
 def _create_whitakers_client(tool: str, use_stubs: bool) -> ToolClient | None:
-    """Create a Whitakers client, with stub fallback."""
+    """Create a Whitakers client (binary or in-process engine), with stub fallback."""
     binary = find_whitaker_binary()
+    engine = whitaker_engine()
+    if engine == ENGINE_NATIVE or (engine == ENGINE_AUTO and not binary):
+        morphology = shared_whitaker_morphology()
+        if morphology is not None:
+            # Forms the analyzer does not model (UNIQUES.LAT, prefixes, suffixes,
+            # spelling variants) still reach the binary when it is installed.
+            fallback = (
+                WhitakerFetchClient(binary, pool=shared_whitaker_pool(binary)) if binary else None
+            )
+            return WhitakerNativeFetchClient(morphology, fallback=fallback)
     if binary:
-        return WhitakerFetchClient(binary)
+        return WhitakerFetchClient(binary, pool=shared_whitaker_pool(binary))
     if use_stubs:
         return StubToolClient(tool)
     return None
@@ -8484,24 +4940,45 @@ def _get_client_factory(tool: str, use_stubs: bool):
     return None
 
 
-def _build_exec_clients(plan, diogenes_endpoint: str, use_stubs: bool) -> dict[str, ToolClient]:
-    """Build execution clients for all tools in the plan."""
+def _build_exec_clients(
+    plan,
+    diogenes_endpoint: str,
+    use_stubs: bool,
+    shared: dict[str, ToolClient] | None = None,
+) -> dict[str, ToolClient]:
+    """
+    Build execution clients for all tools in the plan.
+
+    Passing `shared` reuses (and fills) one client per tool across lookups, e.g.
+    the concurrent fallback terms of a single encounter.
+    """
     clients: dict[str, ToolClient] = {}
 
     for call in plan.tool_calls:
         tool = call.tool
         if tool in clients:
             continue
+        if shared is not None and tool in shared:
+            clients[tool] = shared[tool]
+            continue
 
         factory = _get_client_factory(tool, use_stubs)
         if factory is not None:
             client = factory()
             if client is not None:
-                clients[tool] = client
+                clients[tool] = shared.setdefault(tool, client) if shared is not None else client
 
     return clients
 
 
+def _bound_http_clients(clients: Mapping[str, ToolClient], timeout: float | None) -> None:
+    """Cap the plan's HTTP requests at `timeout` seconds from now; None lifts the cap."""
+    deadline = None if timeout is None else time.monotonic() + timeout
+    for client in clients.values():
+        if isinstance(client, HttpToolClient):
+            client.deadline = deadline
+
+
 def _tool_stage_name(stage: int) -> str:
     try:
         return ToolStage.Name(stage).removeprefix("TOOL_STAGE_").lower()
@@ -8662,19 +5139,22 @@ def _plan_exec_impl(config: PlanExecConfig, language: str, text: str) -> None:
                 claim_index=ClaimIndex(conn),
                 plan_response_index=None,
                 allow_cache=False,
+                handler_pool=shared_handler_pool(use_stubs=config.use_stub_handlers),
             )
     else:
-        result = execute_plan_staged(
-            plan=plan,
-            clients=clients,
-            registry=registry,
-            raw_index=PathRawResponseIndex(path),
-            extraction_index=PathExtractionIndex(path),
-            derivation_index=PathDerivationIndex(path),
-            claim_index=PathClaimIndex(path),
-            plan_response_index=PathPlanResponseIndex(path),
-            allow_cache=True,
-        )
+        with PathEffectBatch(path) as batch:
+            result = execute_plan_staged(
+                plan=plan,
+                clients=clients,
+                registry=registry,
+                raw_index=batch.raw_index,
+                extraction_index=batch.extraction_index,
+                derivation_index=batch.derivation_index,
+                claim_index=batch.claim_index,
+                plan_response_index=batch.plan_response_index,
+                allow_cache=True,
+                handler_pool=shared_handler_pool(use_stubs=config.use_stub_handlers),
+            )
 
     if config.output == "json":
         payload = _plan_exec_summary_payload(plan, result, cache_enabled=not config.no_cache)
@@ -9075,6 +5555,7 @@ def triples_dump(  # noqa: PLR0913
             claim_index=claim_index,
             plan_response_index=plan_response_index,
             allow_cache=False,
+            handler_pool=shared_handler_pool(use_stubs=False),
         )
 
     if output_format == "json":
@@ -11798,24 +8279,28 @@ def _encounter_bucket_sort_key(
 
 def _openrouter_translation_callback(model: str):
     client = None
+    client_lock = threading.Lock()
     model_candidates = _translation_model_candidates(model)
 
     def translate(projection) -> str:
         nonlocal client
-        if client is None:
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
-                raise click.ClickException("Set OPENAI_API_KEY before populating translations.")
-            api_base = os.getenv(
-                "OPENAI_API_BASE",
-                os.getenv("OPENAI_BASE_URL", "https://openrouter.ai/api/v1"),
-            )
-            os.environ["OPENAI_BASE_URL"] = api_base
-            try:
-                import aisuite as ai  # noqa: PLC0415
-            except ImportError as exc:
-                raise click.ClickException("aisuite is required to populate translations.") from exc
-            client = ai.Client({"api_key": api_key})
+        with client_lock:
+            if client is None:
+                api_key = os.getenv("OPENAI_API_KEY")
+                if not api_key:
+                    raise click.ClickException("Set OPENAI_API_KEY before populating translations.")
+                api_base = os.getenv(
+                    "OPENAI_API_BASE",
+                    os.getenv("OPENAI_BASE_URL", "https://openrouter.ai/api/v1"),
+                )
+                os.environ["OPENAI_BASE_URL"] = api_base
+                try:
+                    import aisuite as ai  # noqa: PLC0415
+                except ImportError as exc:
+                    raise click.ClickException(
+                        "aisuite is required to populate translations."
+                    ) from exc
+                client = ai.Client({"api_key": api_key})
 
         messages = [
             {"role": "system", "content": BASE_SYSTEM},
@@ -11868,9 +8353,17 @@ def _create_translation_completion_with_model_fallback(
 ):
     last_exception: Exception | None = None
     for candidate in model_candidates:
+        # Under a TranslationScheduler deadline, the provider request gets only
+        # the time the projection has left, so an abandoned job stops paying.
+        timeout = translation_request_timeout()
+        if timeout is not None and timeout <= 0:
+            raise TranslationDeadlineExceeded(
+                f"translation deadline passed before {candidate}"
+            ) from last_exception
+        call_kwargs = {**request_kwargs, "timeout": timeout} if timeout else request_kwargs
         try:
             start = time.perf_counter()
-            response = completions.create(model=candidate, **request_kwargs)
+            response = completions.create(model=candidate, **call_kwargs)
             elapsed_seconds = time.perf_counter() - start
             if not _translation_response_content(response).strip():
                 raise ValueError("translation provider returned an empty response")
@@ -12183,6 +8676,8 @@ def _execute_lookup_plan(  # noqa: PLR0913
     no_cache: bool,
     include_cltk: bool,
     cache_policy: str = "read-write",
+    clients: dict[str, ToolClient] | None = None,
+    lookup_timeout: float | None = None,
 ):
     lang_hint = _parse_language(language)
     norm_cfg = NormalizeConfig(
@@ -12213,19 +8708,22 @@ def _execute_lookup_plan(  # noqa: PLR0913
 
     path = Path(norm_cfg.db_path).expanduser() if norm_cfg.db_path else normalization_db_path()
     registry = _default_registry(use_stubs=False)
-    clients = _build_exec_clients(plan, diogenes_endpoint, use_stubs=False)
+    clients = _build_exec_clients(plan, diogenes_endpoint, use_stubs=False, shared=clients)
+    _bound_http_clients(clients, lookup_timeout)
     if cache_policy == "read-write" and not no_cache:
-        return execute_plan_staged(
-            plan=plan,
-            clients=clients,
-            registry=registry,
-            raw_index=PathRawResponseIndex(path),
-            extraction_index=PathExtractionIndex(path),
-            derivation_index=PathDerivationIndex(path),
-            claim_index=PathClaimIndex(path),
-            plan_response_index=PathPlanResponseIndex(path),
-            allow_cache=True,
-        )
+        with PathEffectBatch(path) as batch:
+            return execute_plan_staged(
+                plan=plan,
+                clients=clients,
+                registry=registry,
+                raw_index=batch.raw_index,
+                extraction_index=batch.extraction_index,
+                derivation_index=batch.derivation_index,
+                claim_index=batch.claim_index,
+                plan_response_index=batch.plan_response_index,
+                allow_cache=True,
+                handler_pool=shared_handler_pool(use_stubs=False),
+            )
 
     if cache_policy == "read-only" and not no_cache and path.exists():
         cached_plan = PathPlanResponseIndex(path).get(plan.plan_hash)
@@ -12242,6 +8740,7 @@ def _execute_lookup_plan(  # noqa: PLR0913
                     claim_index=ClaimIndex(conn),
                     plan_response_index=PathPlanResponseIndex(path),
                     allow_cache=True,
+                    handler_pool=shared_handler_pool(use_stubs=False),
                 )
 
     with duckdb.connect(database=":memory:") as conn:
@@ -12261,6 +8760,7 @@ def _execute_lookup_plan(  # noqa: PLR0913
             claim_index=claim_index,
             plan_response_index=plan_response_index,
             allow_cache=False,
+            handler_pool=shared_handler_pool(use_stubs=False),
         )
 
 
@@ -13146,19 +9646,47 @@ def encounter(  # noqa: C901, PLR0912, PLR0913, PLR0915
         show_source = True
         source_details = True
     translation_cache: _PathTranslationCache | None = None
-    try:
-        result = _execute_lookup_plan(
+    lookups: EncounterLookupScheduler = EncounterLookupScheduler.from_env()
+    lookup_clients = PerThreadClients()
+
+    def uncached_lookup(term: str, lookup_timeout: float | None = None):
+        return _execute_lookup_plan(
             language=language,
-            text=text,
+            text=term,
             tool_filter=tool_filter,
             normalize=normalize,
             diogenes_endpoint=diogenes_endpoint,
             diogenes_parse_endpoint=diogenes_parse_endpoint,
             heritage_base=heritage_base,
             db_path=db_path,
-            no_cache=no_cache,
+            no_cache=True,
             include_cltk=include_cltk,
-            cache_policy=cache_policy,
+            clients=lookup_clients.current(),
+            lookup_timeout=lookup_timeout,
+        )
+
+    def fallback_lookup(term: str):
+        # Fallback HTTP requests must not outlive the encounter's lookup budget.
+        return uncached_lookup(term, lookup_timeout=lookups.remaining_seconds())
+
+    try:
+        result = lookups.run(
+            "primary",
+            text,
+            lambda: _execute_lookup_plan(
+                language=language,
+                text=text,
+                tool_filter=tool_filter,
+                normalize=normalize,
+                diogenes_endpoint=diogenes_endpoint,
+                diogenes_parse_endpoint=diogenes_parse_endpoint,
+                heritage_base=heritage_base,
+                db_path=db_path,
+                no_cache=no_cache,
+                include_cltk=include_cltk,
+                cache_policy=cache_policy,
+                clients=lookup_clients.current(),
+            ),
         )
         claims = _claims_as_mappings(result)
         resolved_translation_mode = _resolve_translation_mode(
@@ -13205,18 +9733,7 @@ def encounter(  # noqa: C901, PLR0912, PLR0913, PLR0915
             tool_filter=tool_filter,
             reduction=reduction,
         ):
-            fresh_result = _execute_lookup_plan(
-                language=language,
-                text=text,
-                tool_filter=tool_filter,
-                normalize=normalize,
-                diogenes_endpoint=diogenes_endpoint,
-                diogenes_parse_endpoint=diogenes_parse_endpoint,
-                heritage_base=heritage_base,
-                db_path=db_path,
-                no_cache=True,
-                include_cltk=include_cltk,
-            )
+            fresh_result = lookups.run("uncached-retry", text, lambda: uncached_lookup(text))
             fresh_claims = _claims_as_mappings(fresh_result)
             if translation_cache is not None:
                 try:
@@ -13251,17 +9768,8 @@ def encounter(  # noqa: C901, PLR0912, PLR0913, PLR0915
             reduction=reduction,
         ):
             cached_source_tools = _encounter_reduction_source_tools(reduction)
-            fresh_result = _execute_lookup_plan(
-                language=language,
-                text=text,
-                tool_filter=tool_filter,
-                normalize=normalize,
-                diogenes_endpoint=diogenes_endpoint,
-                diogenes_parse_endpoint=diogenes_parse_endpoint,
-                heritage_base=heritage_base,
-                db_path=db_path,
-                no_cache=True,
-                include_cltk=include_cltk,
+            fresh_result = lookups.run(
+                "greek-partial-source-retry", text, lambda: uncached_lookup(text)
             )
             fresh_claims = _claims_as_mappings(fresh_result)
             if translation_cache is not None:
@@ -13302,19 +9810,9 @@ def encounter(  # noqa: C901, PLR0912, PLR0913, PLR0915
         if fallback_terms:
             original_bucket_count = len(reduction.buckets)
             fallback_claims = list(claims)
-            for fallback_term in fallback_terms:
-                fallback_result = _execute_lookup_plan(
-                    language=language,
-                    text=fallback_term,
-                    tool_filter=tool_filter,
-                    normalize=normalize,
-                    diogenes_endpoint=diogenes_endpoint,
-                    diogenes_parse_endpoint=diogenes_parse_endpoint,
-                    heritage_base=heritage_base,
-                    db_path=db_path,
-                    no_cache=True,
-                    include_cltk=include_cltk,
-                )
+            for fallback_term, fallback_result in lookups.run_many(
+                "sanskrit-morphology-fallback", fallback_terms, fallback_lookup
+            ):
                 term_claims = _claims_as_mappings(fallback_result)
                 if translation_cache is not None:
                     try:
@@ -13367,19 +9865,9 @@ def encounter(  # noqa: C901, PLR0912, PLR0913, PLR0915
         if normalization_fallback_terms:
             original_bucket_count = len(reduction.buckets)
             fallback_claims = list(claims)
-            for fallback_term in normalization_fallback_terms:
-                fallback_result = _execute_lookup_plan(
-                    language=language,
-                    text=fallback_term,
-                    tool_filter=tool_filter,
-                    normalize=normalize,
-                    diogenes_endpoint=diogenes_endpoint,
-                    diogenes_parse_endpoint=diogenes_parse_endpoint,
-                    heritage_base=heritage_base,
-                    db_path=db_path,
-                    no_cache=True,
-                    include_cltk=include_cltk,
-                )
+            for fallback_term, fallback_result in lookups.run_many(
+                "sanskrit-normalization-fallback", normalization_fallback_terms, fallback_lookup
+            ):
                 term_claims = _claims_as_mappings(fallback_result)
                 if translation_cache is not None:
                     try:
@@ -13508,6 +9996,7 @@ def encounter(  # noqa: C901, PLR0912, PLR0913, PLR0915
                 for bucket in reduction.buckets
             ]
             payload["translation_cache"] = translation_diagnostics
+            payload["lookup_paths"] = lookups.payload()
             payload["word_index"] = _encounter_word_index_context(
                 language=language,
                 text=text,
@@ -14834,10 +11323,7 @@ def lookup(  # noqa: PLR0912, PLR0913, PLR0915, C901
             elif tool == "whitakers":
                 # Whitaker's Words
                 binary = find_whitaker_binary() or "whitakers-words"
-                proc = subprocess.run(
-                    [binary, query_word], check=False, capture_output=True, text=True
-                )
-                text_out = proc.stdout or ""
+                text_out = whitaker_lookup_text(binary, query_word)
                 parsed = _parse_whitaker_output(text_out)
                 results[tool] = parsed
 
@@ -0,0 +1,138 @@
+"""
+Lazy `langnet-cli` entrypoint.
+
+Click resolves the subcommand before anything heavy is imported. Command groups
+that live in their own modules (`reader`, `word-index`, `databuild`, `serve`)
+load only that module; everything else falls back to the full `langnet.cli`
+group. `--profile-startup` (or `LANGNET_PROFILE_STARTUP=1`) writes an
+import-time report to stderr when the command finishes.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import time
+
+import click
+import orjson
+
+from langnet.storage.pooling import enable_duckdb_pool
+
+_ENTRY_STARTED = time.perf_counter()
+
+STARTUP_PROFILE_SCHEMA_VERSION = "langnet.startup_profile.v1"
+STARTUP_PROFILE_ENV = "LANGNET_PROFILE_STARTUP"
+FULL_CLI_TARGET = "langnet.cli:main"
+LAZY_COMMANDS: dict[str, str] = {
+    "databuild": "langnet.cli_databuild:databuild",
+    "reader": "langnet.cli_reader:reader_cli",
+    "serve": "langnet.cli_server:serve",
+    "word-index": "langnet.cli_word_index:word_index_cli",
+}
+WATCHED_MODULES = (
+    "bs4",
+    "duckdb",
+    "humanize",
+    "lark",
+    "polars",
+    "pyarrow",
+    "query_spec",
+    "requests",
+    "langnet.cli",
+    "langnet.execution.executor",
+    "langnet.reader.service",
+    "langnet.translation",
+    "langnet.word_index.service",
+    "langnet.word_of_day",
+)
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 3)
+
+
+def _import_target(target: str) -> click.Command:
+    module_name, attr = target.split(":", 1)
+    command = getattr(importlib.import_module(module_name), attr)
+    if not isinstance(command, click.Command):
+        raise TypeError(f"{target} is not a click command")
+    return command
+
+
+class LazyCommandGroup(click.Group):
+    """Click group that imports a subcommand's module only when it is invoked."""
+
+    def __init__(self, *args, lazy_commands: dict[str, str], full_cli: str, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = dict(lazy_commands)
+        self.full_cli = full_cli
+
+    def _full_group(self) -> click.Group:
+        group = _import_target(self.full_cli)
+        if not isinstance(group, click.Group):
+            raise TypeError(f"{self.full_cli} is not a click group")
+        return group
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        names = set(self.lazy_commands) | set(super().list_commands(ctx))
+        names.update(self._full_group().list_commands(ctx))
+        return sorted(names)
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        command = super().get_command(ctx, cmd_name)
+        if command is not None:
+            return command
+        modules_before = len(sys.modules)
+        started = time.perf_counter()
+        target = self.lazy_commands.get(cmd_name)
+        if target is not None:
+            command = _import_target(target)
+        else:
+            target = self.full_cli
+            command = self._full_group().get_command(ctx, cmd_name)
+        ctx.meta["langnet.startup"] = {
+            "command": cmd_name,
+            "target": target,
+            "command_import_ms": _elapsed_ms(started),
+            "new_modules": len(sys.modules) - modules_before,
+        }
+        return command
+
+
+def startup_profile_payload(ctx: click.Context) -> dict[str, object]:
+    resolved = ctx.meta.get("langnet.startup", {})
+    return {
+        "schema_version": STARTUP_PROFILE_SCHEMA_VERSION,
+        **resolved,
+        "elapsed_ms": _elapsed_ms(_ENTRY_STARTED),
+        "modules_loaded": len(sys.modules),
+        "heavy_modules": [name for name in WATCHED_MODULES if name in sys.modules],
+    }
+
+
+@click.group(
+    cls=LazyCommandGroup,
+    lazy_commands=LAZY_COMMANDS,
+    full_cli=FULL_CLI_TARGET,
+)
+@click.option(
+    "--profile-startup",
+    is_flag=True,
+    envvar=STARTUP_PROFILE_ENV,
+    help="Report subcommand import time and loaded heavy modules on stderr.",
+)
+@click.pass_context
+def main(ctx: click.Context, profile_startup: bool) -> None:
+    """langnet-cli — classical language tools."""
+    # Reuse read-only lexicon/index connections for the rest of this command.
+    enable_duckdb_pool()
+    ctx.call_on_close(lambda: enable_duckdb_pool(False))
+    if profile_startup:
+        ctx.call_on_close(
+            lambda: click.echo(orjson.dumps(startup_profile_payload(ctx)).decode("utf-8"), err=True)
+        )
+
+
+if __name__ == "__main__":
+    main()
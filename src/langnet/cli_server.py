@@ -0,0 +1,352 @@
+"""
+Long-lived langnet-cli worker.
+
+`langnet-cli serve` keeps one Python process warm and runs the web-facing
+subcommands in-process, so callers stop paying interpreter startup, the CLI
+import, and handler/grammar warmup on every lookup. Requests carry the same
+argv a subprocess caller would pass; responses carry the command's stdout,
+stderr, and exit code unchanged, so the JSON contract is identical to
+`langnet-cli <command> ... --output json`.
+"""
+
+from __future__ import annotations
+
+import io
+import logging
+import sys
+import threading
+import time
+from collections.abc import Sequence
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any, TextIO
+
+import anyio
+import click
+import orjson
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.routing import Route
+
+logger = logging.getLogger(__name__)
+
+CLI_SERVER_SCHEMA_VERSION = "langnet.cli_server.v1"
+SERVED_COMMANDS = frozenset({"encounter", "reader", "word-index", "paradigm", "translation-cache"})
+DEFAULT_SERVER_HOST = "127.0.0.1"
+DEFAULT_SERVER_PORT = 8765
+DEFAULT_SERVER_MAX_CONCURRENCY = 4
+HTTP_BAD_REQUEST = 400
+HTTP_FORBIDDEN = 403
+
+
+class _ThreadLocalStream(io.TextIOBase):
+    """Route writes/reads to a per-thread buffer while a command is captured."""
+
+    def __init__(self, fallback: TextIO) -> None:
+        super().__init__()
+        self._fallback = fallback
+        self._local = threading.local()
+
+    @property
+    def current(self) -> TextIO:
+        return getattr(self._local, "stream", None) or self._fallback
+
+    def bind(self, stream: TextIO | None) -> None:
+        self._local.stream = stream
+
+    @property
+    def encoding(self) -> str:  # type: ignore[override]
+        return getattr(self.current, "encoding", None) or "utf-8"
+
+    @property
+    def errors(self) -> str | None:  # type: ignore[override]
+        return getattr(self.current, "errors", None) or "strict"
+
+    def write(self, text: str) -> int:  # type: ignore[override]
+        return self.current.write(text)
+
+    def read(self, size: int | None = -1) -> str:  # type: ignore[override]
+        return self.current.read(size)
+
+    def readline(self, size: int | None = -1) -> str:  # type: ignore[override]
+        return self.current.readline(size)
+
+    def flush(self) -> None:
+        self.current.flush()
+
+    def isatty(self) -> bool:
+        return False
+
+    def fileno(self) -> int:
+        return self.current.fileno()
+
+    def writable(self) -> bool:
+        return True
+
+    def readable(self) -> bool:
+        return True
+
+
+_STREAM_LOCK = threading.Lock()
+
+
+def _install_stream_proxies() -> tuple[_ThreadLocalStream, _ThreadLocalStream, _ThreadLocalStream]:
+    with _STREAM_LOCK:
+        if not isinstance(sys.stdin, _ThreadLocalStream):
+            sys.stdin = _ThreadLocalStream(sys.stdin)
+        if not isinstance(sys.stdout, _ThreadLocalStream):
+            sys.stdout = _ThreadLocalStream(sys.stdout)
+        if not isinstance(sys.stderr, _ThreadLocalStream):
+            sys.stderr = _ThreadLocalStream(sys.stderr)
+        return sys.stdin, sys.stdout, sys.stderr
+
+
+@dataclass(frozen=True)
+class CommandResult:
+    exit_code: int
+    stdout: str
+    stderr: str
+    elapsed_ms: float
+
+
+@dataclass
+class ServerStats:
+    started_at_unix_ms: int = field(default_factory=lambda: int(time.time() * 1000))
+    requests: int = 0
+    failures: int = 0
+    rejected: int = 0
+    in_flight: int = 0
+    by_command: dict[str, int] = field(default_factory=dict)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def begin(self, command: str) -> None:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.by_command[command] = self.by_command.get(command, 0) + 1
+
+    def finish(self, exit_code: int) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if exit_code != 0:
+                self.failures += 1
+
+    def reject(self) -> None:
+        with self._lock:
+            self.rejected += 1
+
+    def payload(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "started_at_unix_ms": self.started_at_unix_ms,
+                "requests": self.requests,
+                "failures": self.failures,
+                "rejected": self.rejected,
+                "in_flight": self.in_flight,
+                "by_command": dict(self.by_command),
+            }
+
+
+def _exit_code_from_system_exit(exc: SystemExit, stderr: TextIO) -> int:
+    code = exc.code
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    stderr.write(f"{code}\n")
+    return 1
+
+
+def run_cli_command(
+    command: click.Command, argv: Sequence[str], *, stdin: str = ""
+) -> CommandResult:
+    """
+    Invoke a Click command in-process and capture what a subprocess would emit.
+
+    The command runs in standalone mode so usage errors, aborts, and explicit
+    exits produce the same stderr text and exit codes as `langnet-cli`.
+    """
+    proxy_in, proxy_out, proxy_err = _install_stream_proxies()
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    proxy_in.bind(io.StringIO(stdin))
+    proxy_out.bind(stdout)
+    proxy_err.bind(stderr)
+    started = time.perf_counter()
+    exit_code = 0
+    try:
+        command.main(args=list(argv), prog_name="langnet-cli", standalone_mode=True)
+    except SystemExit as exc:
+        exit_code = _exit_code_from_system_exit(exc, stderr)
+    except Exception:
+        logger.exception("langnet-cli worker command failed: %s", list(argv)[:2])
+        stderr.write("langnet-cli worker command raised an unhandled exception\n")
+        exit_code = 1
+    finally:
+        proxy_in.bind(None)
+        proxy_out.bind(None)
+        proxy_err.bind(None)
+    return CommandResult(
+        exit_code=exit_code,
+        stdout=stdout.getvalue(),
+        stderr=stderr.getvalue(),
+        elapsed_ms=round((time.perf_counter() - started) * 1000, 3),
+    )
+
+
+def warm_cli_runtime() -> dict[str, float]:
+    """Import the CLI and build handler registries (and pool) once so requests start warm."""
+    timings: dict[str, float] = {}
+    started = time.perf_counter()
+    from langnet import cli as cli_module  # noqa: PLC0415
+
+    timings["import_cli_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    started = time.perf_counter()
+    cli_module._default_registry()
+    timings["handler_registry_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    started = time.perf_counter()
+    if cli_module.shared_handler_pool() is not None:
+        timings["handler_pool_ms"] = round((time.perf_counter() - started) * 1000, 3)
+    return timings
+
+
+def _json_response(payload: dict[str, object], status_code: int = 200) -> Response:
+    return Response(
+        orjson.dumps(payload),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
+def _request_error(message: str, status_code: int = HTTP_BAD_REQUEST) -> Response:
+    return _json_response(
+        {"schema_version": CLI_SERVER_SCHEMA_VERSION, "ok": False, "error": message},
+        status_code=status_code,
+    )
+
+
+def _parse_run_request(body: bytes) -> tuple[list[str], str] | str:
+    try:
+        data = orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return "request body must be JSON"
+    if not isinstance(data, dict):
+        return "request body must be a JSON object"
+    argv = data.get("argv")
+    if not isinstance(argv, list) or not argv or not all(isinstance(a, str) for a in argv):
+        return "argv must be a non-empty list of strings"
+    stdin = data.get("stdin", "")
+    if not isinstance(stdin, str):
+        return "stdin must be a string"
+    return argv, stdin
+
+
+def create_app(
+    command: click.Command | None = None,
+    *,
+    served_commands: frozenset[str] = SERVED_COMMANDS,
+    max_concurrency: int = DEFAULT_SERVER_MAX_CONCURRENCY,
+) -> Starlette:
+    """
+    Build the worker ASGI app.
+
+    `command` defaults to the `langnet-cli` group; tests pass a small group.
+    """
+    if command is None:
+        from langnet.cli import main as command  # noqa: PLC0415
+
+    stats = ServerStats()
+    limiter_holder: list[anyio.CapacityLimiter] = []
+
+    def limiter() -> anyio.CapacityLimiter:
+        if not limiter_holder:
+            limiter_holder.append(anyio.CapacityLimiter(max(1, max_concurrency)))
+        return limiter_holder[0]
+
+    async def health(_request: Request) -> Response:
+        from langnet.storage.db import duckdb_pool_stats  # noqa: PLC0415
+
+        return _json_response(
+            {
+                "schema_version": CLI_SERVER_SCHEMA_VERSION,
+                "ok": True,
+                "commands": sorted(served_commands),
+                "max_concurrency": max_concurrency,
+                "stats": stats.payload(),
+                "duckdb_pool": duckdb_pool_stats(),
+            }
+        )
+
+    async def run(request: Request) -> Response:
+        parsed = _parse_run_request(await request.body())
+        if isinstance(parsed, str):
+            stats.reject()
+            return _request_error(parsed)
+        argv, stdin = parsed
+        if argv[0] not in served_commands:
+            stats.reject()
+            return _request_error(
+                f"command '{argv[0]}' is not served by this worker", status_code=HTTP_FORBIDDEN
+            )
+        stats.begin(argv[0])
+        result = await anyio.to_thread.run_sync(
+            partial(run_cli_command, command, argv, stdin=stdin), limiter=limiter()
+        )
+        stats.finish(result.exit_code)
+        return _json_response(
+            {"schema_version": CLI_SERVER_SCHEMA_VERSION, "ok": result.exit_code == 0}
+            | asdict(result)
+        )
+
+    return Starlette(
+        routes=[
+            Route("/health", health, methods=["GET"]),
+            Route("/v1/run", run, methods=["POST"]),
+        ]
+    )
+
+
+@click.command("serve")
+@click.option("--host", default=DEFAULT_SERVER_HOST, show_default=True)
+@click.option("--port", default=DEFAULT_SERVER_PORT, show_default=True, type=int)
+@click.option(
+    "--uds",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Listen on a Unix domain socket instead of host/port.",
+)
+@click.option(
+    "--max-concurrency",
+    default=DEFAULT_SERVER_MAX_CONCURRENCY,
+    show_default=True,
+    type=click.IntRange(1, 64),
+    help="Commands executed at once; further requests wait.",
+)
+@click.option("--no-warm", is_flag=True, help="Skip handler/registry warmup at startup.")
+def serve(host: str, port: int, uds: Path | None, max_concurrency: int, no_warm: bool) -> None:
+    """Run a persistent worker for encounter, reader, word-index, paradigm, translation-cache.
+
+    POST /v1/run with {"argv": ["encounter", "lat", "lupus", "--output", "json"]}.
+    """
+    import uvicorn  # noqa: PLC0415
+
+    from langnet.reader.storage import enable_catalog_snapshot  # noqa: PLC0415
+    from langnet.storage.pooling import enable_duckdb_pool  # noqa: PLC0415
+
+    enable_duckdb_pool()
+    enable_catalog_snapshot()
+    if not no_warm:
+        timings = warm_cli_runtime()
+        click.echo(f"warmed: {orjson.dumps(timings).decode('utf-8')}", err=True)
+    _install_stream_proxies()
+    app = create_app(max_concurrency=max_concurrency)
+    config_kwargs: dict[str, Any] = {"log_level": "warning", "access_log": False}
+    if uds is not None:
+        uds.unlink(missing_ok=True)
+        config_kwargs["uds"] = str(uds)
+    else:
+        config_kwargs["host"] = host
+        config_kwargs["port"] = port
+    uvicorn.run(app, **config_kwargs)
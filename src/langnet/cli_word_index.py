@@ -0,0 +1,479 @@
+"""
+`langnet-cli word-index` command group.
+
+Kept out of `langnet.cli` so index browsing loads only the word index service.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import cast
+
+import click
+import orjson
+
+from langnet.word_index import (
+    WordIndexHomographs,
+    word_index_browse_payload,
+    word_index_list_payload,
+    word_index_neighborhood_payload,
+    word_index_sections_payload,
+    word_index_sources_payload,
+    word_index_wheel_payload,
+)
+
+
+@click.group("word-index")
+def word_index_cli() -> None:
+    """Explore locally indexed dictionary headwords."""
+
+
+@word_index_cli.command("sources")
+@click.argument("language", default="all")
+@click.option(
+    "--output",
+    type=click.Choice(["pretty", "json"]),
+    default="pretty",
+    show_default=True,
+    help="Output format.",
+)
+def word_index_sources(language: str, output: str) -> None:
+    """List available word-index sources."""
+    try:
+        payload = word_index_sources_payload(language)
+    except ValueError as exc:
+        raise click.UsageError(str(exc)) from exc
+    _emit_word_index_payload(payload, output=output)
+
+
+@word_index_cli.command("sections")
+@click.argument("language")
+@click.option(
+    "--source",
+    default="all",
+    show_default=True,
+    help="Source filter: all, cdsl, dico, gaffiot, or diogenes.",
+)
+@click.option(
+    "--output",
+    type=click.Choice(["pretty", "json"]),
+    default="pretty",
+    show_default=True,
+    help="Output format.",
+)
+def word_index_sections(language: str, source: str, output: str) -> None:
+    """List native alphabet/section anchors for word-index browsing."""
+    try:
+        payload = word_index_sections_payload(language, source=source)
+    except ValueError as exc:
+        raise click.UsageError(str(exc)) from exc
+    _emit_word_index_sections_payload(payload, output=output)
+
+
+@word_index_cli.command("list")
+@click.argument("language", default="all")
+@click.option(
+    "--source",
+    default="all",
+    show_default=True,
+    help="Source filter: all, cdsl, dico, gaffiot, or diogenes.",
+)
+@click.option("--prefix", default="", help="Optional headword prefix filter.")
+@click.option("--limit", default=50, show_default=True, type=click.IntRange(1, 500))
+@click.option("--cursor", default=None, help="Opaque pagination cursor from prior response.")
+@click.option(
+    "--output",
+    type=click.Choice(["pretty", "json"]),
+    default="pretty",
+    show_default=True,
+    help="Output format.",
+)
+def word_index_list(  # noqa: PLR0913
+    language: str,
+    source: str,
+    prefix: str,
+    limit: int,
+    cursor: str | None,
+    output: str,
+) -> None:
+    """List indexed headwords."""
+    try:
+        payload = word_index_list_payload(
+            language,
+            source=source,
+            prefix=prefix,
+            limit=limit,
+            cursor=cursor,
+        )
+    except ValueError as exc:
+        raise click.UsageError(str(exc)) from exc
+    _emit_word_index_payload(payload, output=output)
+
+
+@word_index_cli.command("browse")
+@click.argument("language")
+@click.option(
+    "--source",
+    default="all",
+    show_default=True,
+    help="Source filter: all, cdsl, dico, gaffiot, or diogenes.",
+)
+@click.option("--prefix", default="", help="Optional source-native browse prefix.")
+@click.option("--limit", default=50, show_default=True, type=click.IntRange(1, 500))
+@click.option(
+    "--homographs",
+    type=click.Choice(["grouped", "raw"]),
+    default="grouped",
+    show_default=True,
+    help="Group adjacent homographs or preserve raw source rows.",
+)
+@click.option(
+    "--output",
+    type=click.Choice(["pretty", "json"]),
+    default="pretty",
+    show_default=True,
+    help="Output format.",
+)
+def word_index_browse(  # noqa: PLR0913
+    language: str,
+    source: str,
+    prefix: str,
+    limit: int,
+    homographs: str,
+    output: str,
+) -> None:
+    """Browse indexed headwords in grouped source-native order."""
+    try:
+        payload = word_index_browse_payload(
+            language,
+            source=source,
+            prefix=prefix,
+            limit=limit,
+            homographs=cast(WordIndexHomographs, homographs),
+        )
+    except ValueError as exc:
+        raise click.UsageError(str(exc)) from exc
+    _emit_word_index_payload(payload, output=output)
+
+
+@word_index_cli.command("neighborhood")
+@click.argument("language")
+@click.argument("query")
+@click.option(
+    "--source",
+    default="all",
+    show_default=True,
+    help="Source filter: all, cdsl, dico, gaffiot, or diogenes.",
+)
+@click.option("--radius", default=10, show_default=True, type=click.IntRange(1, 100))
+@click.option(
+    "--merge",
+    type=click.Choice(["auto", "none", "lexeme"]),
+    default="auto",
+    show_default=True,
+    help="Merge source-local groups into lexeme cards.",
+)
+@click.option(
+    "--output",
+    type=click.Choice(["pretty", "json"]),
+    default="pretty",
+    show_default=True,
+    help="Output format.",
+)
+def word_index_neighborhood(  # noqa: PLR0913
+    language: str, query: str, source: str, radius: int, merge: str, output: str
+) -> None:
+    """Show indexed words before and after a term."""
+    _run_word_index_neighborhood(language, query, source, radius, merge, output)
+
+
+def _run_word_index_neighborhood(  # noqa: PLR0913
+    language: str, query: str, source: str, radius: int, merge: str, output: str
+) -> None:
+    try:
+        payload = word_index_neighborhood_payload(
+            language,
+            query,
+            source=source,
+            radius=radius,
+            merge=merge,
+        )
+    except ValueError as exc:
+        raise click.UsageError(str(exc)) from exc
+    _emit_word_index_payload(payload, output=output)
+
+
+@word_index_cli.command("nearby")
+@click.argument("language")
+@click.argument("query")
+@click.option(
+    "--source",
+    default="all",
+    show_default=True,
+    help="Source filter: all, cdsl, dico, gaffiot, or diogenes.",
+)
+@click.option("--radius", default=10, show_default=True, type=click.IntRange(1, 100))
+@click.option(
+    "--merge",
+    type=click.Choice(["auto", "none", "lexeme"]),
+    default="auto",
+    show_default=True,
+    help="Merge source-local groups into lexeme cards.",
+)
+@click.option(
+    "--output",
+    type=click.Choice(["pretty", "json"]),
+    default="pretty",
+    show_default=True,
+    help="Output format.",
+)
+def word_index_nearby(  # noqa: PLR0913
+    language: str, query: str, source: str, radius: int, merge: str, output: str
+) -> None:
+    """Alias for neighborhood: find indexed words near a search query."""
+    _run_word_index_neighborhood(language, query, source, radius, merge, output)
+
+
+@word_index_cli.command("wheel")
+@click.argument("language", default="all")
+@click.option(
+    "--language",
+    "language_option",
+    default=None,
+    help="Language filter: all, lat, grc, or san. Overrides the positional language.",
+)
+@click.option(
+    "--source",
+    default="all",
+    show_default=True,
+    help="Source filter: all, cdsl, dico, gaffiot, or diogenes.",
+)
+@click.option("--count", default=12, show_default=True, type=click.IntRange(1, 100))
+@click.option("--seed", default=None, help="Seed for deterministic word selection.")
+@click.option(
+    "--output",
+    type=click.Choice(["pretty", "json"]),
+    default="pretty",
+    show_default=True,
+    help="Output format.",
+)
+def word_index_wheel(  # noqa: PLR0913
+    language: str,
+    language_option: str | None,
+    source: str,
+    count: int,
+    seed: str | None,
+    output: str,
+) -> None:
+    """Return a deterministic wheel of indexed study words."""
+    requested_language = language_option or language
+    try:
+        payload = word_index_wheel_payload(
+            requested_language,
+            source=source,
+            count=count,
+            seed=seed,
+        )
+    except ValueError as exc:
+        raise click.UsageError(str(exc)) from exc
+    _emit_word_index_payload(payload, output=output)
+
+
+def _emit_word_index_payload(payload: Mapping[str, object], *, output: str) -> None:
+    if output == "json":
+        click.echo(orjson.dumps(dict(payload), option=orjson.OPT_INDENT_2).decode("utf-8"))
+        return
+    request = cast(Mapping[str, object], payload.get("request") or {})
+    mode = request.get("mode")
+    click.echo(f"Word index: {mode}")
+    sources = payload.get("sources")
+    if mode == "sources":
+        _echo_word_index_sources(sources)
+        return
+    groups = payload.get("groups")
+    items = payload.get("items")
+    if mode == "browse":
+        if _has_sequence_items(items):
+            click.echo("Learner browse:")
+            _echo_word_index_items(items, indent="  ")
+            click.echo("Source groups:")
+        _echo_word_index_browse_groups(groups)
+    else:
+        _echo_word_index_items(items)
+    neighborhood = payload.get("neighborhood")
+    if isinstance(neighborhood, Mapping):
+        _echo_word_index_neighborhood(cast(Mapping[str, object], neighborhood))
+    _echo_word_index_warnings(payload.get("warnings"))
+
+
+def _echo_word_index_sources(sources: object) -> None:
+    if not isinstance(sources, Sequence) or isinstance(sources, (str, bytes)):
+        return
+    for source in sources:
+        if not isinstance(source, Mapping):
+            continue
+        source_map = cast(Mapping[str, object], source)
+        status = "available" if source_map.get("available") else "missing"
+        count = source_map.get("entry_count")
+        click.echo(
+            f"- {source_map.get('language')}:"
+            f"{source_map.get('source')}:"
+            f"{source_map.get('dictionary')} "
+            f"{status} entries={count}"
+        )
+
+
+def _has_sequence_items(value: object) -> bool:
+    return isinstance(value, Sequence) and not isinstance(value, (str, bytes)) and bool(value)
+
+
+def _echo_word_index_items(items: object, *, indent: str = "") -> None:
+    if not isinstance(items, Sequence) or isinstance(items, (str, bytes)):
+        return
+    for item in items:
+        if isinstance(item, Mapping):
+            click.echo(
+                f"{indent}{_word_index_item_line_with_count(cast(Mapping[str, object], item))}"
+            )
+
+
+def _echo_word_index_warnings(warnings: object) -> None:
+    if not isinstance(warnings, Sequence) or isinstance(warnings, (str, bytes)):
+        return
+    for warning in warnings:
+        if isinstance(warning, Mapping):
+            warning_map = cast(Mapping[str, object], warning)
+            click.echo(f"Warning: {warning_map.get('message')}", err=True)
+
+
+def _echo_word_index_browse_groups(groups: object) -> None:
+    if not isinstance(groups, Sequence) or isinstance(groups, (str, bytes)):
+        return
+    for group in groups:
+        if not isinstance(group, Mapping):
+            continue
+        group_map = cast(Mapping[str, object], group)
+        click.echo(
+            f"{group_map.get('language')}:{group_map.get('source')}:"
+            f"{group_map.get('dictionary')} prefix={group_map.get('prefix')}"
+        )
+        group_items = group_map.get("items")
+        if isinstance(group_items, Sequence) and not isinstance(group_items, (str, bytes)):
+            for item in group_items:
+                if not isinstance(item, Mapping):
+                    continue
+                item_map = cast(Mapping[str, object], item)
+                click.echo(f"  {_word_index_item_line_with_count(item_map)}")
+
+
+def _emit_word_index_sections_payload(payload: Mapping[str, object], *, output: str) -> None:
+    if output == "json":
+        click.echo(orjson.dumps(dict(payload), option=orjson.OPT_INDENT_2).decode("utf-8"))
+        return
+    order = payload.get("order")
+    if isinstance(order, Mapping):
+        order_map = cast(Mapping[str, object], order)
+        click.echo(f"Word index sections: {order_map.get('label')}")
+    sections = payload.get("sections")
+    if isinstance(sections, Sequence) and not isinstance(sections, (str, bytes)):
+        for section in sections:
+            if not isinstance(section, Mapping):
+                continue
+            section_map = cast(Mapping[str, object], section)
+            marker = "*" if section_map.get("available") else "-"
+            click.echo(
+                f"{marker} {section_map.get('label')} "
+                f"({section_map.get('transliteration')}) "
+                f"{section_map.get('group_label')}"
+            )
+    warnings = payload.get("warnings")
+    if isinstance(warnings, Sequence) and not isinstance(warnings, (str, bytes)):
+        for warning in warnings:
+            if isinstance(warning, Mapping):
+                warning_map = cast(Mapping[str, object], warning)
+                click.echo(f"Warning: {warning_map.get('message')}", err=True)
+
+
+def _word_index_item_line(item: Mapping[str, object]) -> str:
+    display = item.get("display")
+    display_map = (
+        cast(Mapping[str, object], display)
+        if isinstance(display, Mapping)
+        else cast(Mapping[str, object], {})
+    )
+    romanized = (
+        display_map.get("transliteration") or item.get("lookup") or item.get("canonical_name")
+    )
+    native = item.get("canonical_name")
+    suffix = f" ({native})" if native and native != romanized else ""
+    source_label = _word_index_source_label(item)
+    return f"- {item.get('language')}:{source_label} {romanized}{suffix}"
+
+
+def _word_index_item_line_with_count(item: Mapping[str, object]) -> str:
+    line = _word_index_item_line(item)
+    count = item.get("homograph_count")
+    suffix = f" [{count} entries]" if isinstance(count, int) and count > 1 else ""
+    return f"{line}{suffix}"
+
+
+def _word_index_source_label(item: Mapping[str, object]) -> str:
+    source_count = item.get("source_count")
+    if not isinstance(source_count, int) or source_count <= 1:
+        return str(item.get("source") or "")
+
+    sources = item.get("sources")
+    if not isinstance(sources, Sequence) or isinstance(sources, (str, bytes)):
+        return str(item.get("source") or "all")
+    labels = []
+    for source in sources:
+        if not isinstance(source, Mapping):
+            continue
+        source = cast(Mapping[str, object], source)
+        source_id = str(source.get("source") or "")
+        dictionary = str(source.get("dictionary") or "")
+        if source_id and dictionary and source_id != dictionary:
+            labels.append(f"{source_id}/{dictionary}")
+        elif source_id:
+            labels.append(source_id)
+    return "+".join(labels) if labels else str(item.get("source") or "all")
+
+
+def _echo_word_index_neighborhood(neighborhood: Mapping[str, object]) -> None:  # noqa: C901
+    if neighborhood.get("policy") in {"merged_lexeme", "integrated_language_native"}:
+        policy = neighborhood.get("policy")
+        click.echo(
+            f"Neighborhood: {neighborhood.get('language')}:{neighborhood.get('source')} {policy}"
+        )
+        items = neighborhood.get("items")
+        if isinstance(items, Sequence) and not isinstance(items, (str, bytes)):
+            for item in items:
+                if not isinstance(item, Mapping):
+                    continue
+                item_map = cast(Mapping[str, object], item)
+                position = item_map.get("position") or "nearby"
+                click.echo(f"  {position}: {_word_index_item_line(item_map).removeprefix('- ')}")
+        return
+    groups = neighborhood.get("groups")
+    if isinstance(groups, Sequence):
+        for group in groups:
+            if isinstance(group, Mapping):
+                _echo_word_index_neighborhood(cast(Mapping[str, object], group))
+        return
+    anchor = neighborhood.get("anchor")
+    click.echo(f"Neighborhood: {neighborhood.get('language')}:{neighborhood.get('source')}")
+    if isinstance(anchor, Mapping):
+        click.echo(
+            f"  anchor "
+            f"{_word_index_item_line(cast(Mapping[str, object], anchor)).removeprefix('- ')}"
+        )
+    for label in ("before", "after"):
+        values = neighborhood.get(label)
+        if isinstance(values, Sequence):
+            rendered = [
+                _word_index_item_line(cast(Mapping[str, object], item)).removeprefix("- ")
+                for item in values
+                if isinstance(item, Mapping)
+            ]
+            if rendered:
+                click.echo(f"  {label}: " + "; ".join(rendered))
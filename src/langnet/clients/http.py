@@ -12,6 +12,9 @@ from .base import RawResponseEffect, _new_response_id
 class HttpToolClient:
     """
     Simple HTTP client wrapper that emits RawResponseEffect.
+
+    Setting `deadline` (a `time.monotonic()` value) caps each request's timeout
+    at the time left before it, and refuses requests once it has passed.
     """
 
     def __init__(
@@ -25,6 +28,7 @@ class HttpToolClient:
         self.method = method.upper()
         self.session = session or requests.Session()
         self.timeout = timeout if timeout is not None else _default_timeout()
+        self.deadline: float | None = None
 
     def execute(
         self, call_id: str, endpoint: str, params: Mapping[str, str] | None = None
@@ -38,11 +42,12 @@ class HttpToolClient:
             http_params = {}
             endpoint = f"{endpoint}&{raw_query}" if "?" in endpoint else f"{endpoint}?{raw_query}"
 
+        timeout = self._request_timeout()
         start = time.perf_counter()
         response = (
-            self.session.post(endpoint, data=http_params, timeout=self.timeout)
+            self.session.post(endpoint, data=http_params, timeout=timeout)
             if self.method == "POST"
-            else self.session.get(endpoint, params=http_params, timeout=self.timeout)
+            else self.session.get(endpoint, params=http_params, timeout=timeout)
         )
         duration_ms = int((time.perf_counter() - start) * 1000)
 
@@ -59,6 +64,14 @@ class HttpToolClient:
             fetch_duration_ms=duration_ms,
         )
 
+    def _request_timeout(self) -> float:
+        if self.deadline is None:
+            return self.timeout
+        remaining = self.deadline - time.monotonic()
+        if remaining <= 0:
+            raise requests.Timeout(f"{self.tool} lookup deadline passed before the request")
+        return min(self.timeout, remaining)
+
 
 def _default_timeout() -> float:
     raw = os.getenv("LANGNET_HTTP_TIMEOUT_SECONDS", "10")
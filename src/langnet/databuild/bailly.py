@@ -13,7 +13,7 @@ from returns.result import Failure, Success
 
 from langnet.normalizer.utils import normalize_greekish_token
 from langnet.parsing.bailly_text import repair_bailly_line_break_hyphenation
-from langnet.storage.db import connect_duckdb_ro
+from langnet.storage.db import READ_ONLY_POOL, connect_duckdb_pooled
 
 from .base import BuildErrorStats, BuildResult, BuildStatus, LexiconStats
 from .paths import default_bailly_path
@@ -92,6 +92,7 @@ class BaillyBuilder:
                     )
 
             self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            READ_ONLY_POOL.release(self.output_path)
             self._conn = duckdb.connect(str(self.output_path))
             apply_bailly_schema(self._conn)
             processed = self._load_entries()
@@ -320,7 +321,7 @@ def lookup_bailly_entries(
     if not keys:
         return []
     placeholders = ",".join(["?"] * len(keys))
-    with connect_duckdb_ro(db_path) as conn:
+    with connect_duckdb_pooled(db_path) as conn:
         entry_rows = conn.execute(
             f"""
             SELECT
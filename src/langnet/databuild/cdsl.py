@@ -13,6 +13,8 @@ import duckdb
 from bs4 import BeautifulSoup
 from returns.result import Failure, Success
 
+from langnet.storage.db import READ_ONLY_POOL
+
 from .base import BuildErrorStats, BuildResult, BuildStatus, CdslStats
 from .paths import default_cdsl_path
 
@@ -231,6 +233,7 @@ class CdslBuilder:
                 },
             )
             self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            READ_ONLY_POOL.release(self.output_path)
             self._conn = duckdb.connect(str(self.output_path))
             for stmt in SCHEMA_SQL.strip().split(";"):
                 sql_stmt = stmt.strip()
@@ -9,6 +9,8 @@ from pathlib import Path
 import duckdb
 from returns.result import Failure, Success
 
+from langnet.storage.db import READ_ONLY_POOL
+
 from .base import BuildErrorStats, BuildResult, BuildStatus, CTSStats
 from .paths import default_cts_path
 
@@ -487,6 +489,7 @@ class CtsUrnBuilder:
 
     def _build_duckdb(self) -> None:
         logger.info("Writing CTS index to %s", self.output_path)
+        READ_ONLY_POOL.release(self.output_path)
         self._connection = duckdb.connect(str(self.output_path))
         self._connection.execute("INSTALL 'json';")
         self._connection.execute("LOAD 'json';")
@@ -613,6 +616,7 @@ class CtsUrnBuilder:
 
     def _validate_duckdb(self) -> bool:
         if not self._connection:
+            READ_ONLY_POOL.release(self.output_path)
             self._connection = duckdb.connect(str(self.output_path))
         result = self._connection.execute("SELECT COUNT(*) FROM author_index").fetchone()
         author_count = result[0] if result else 0
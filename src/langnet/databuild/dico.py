@@ -16,6 +16,7 @@ from bs4.element import Tag
 from returns.result import Failure, Success
 
 from langnet.normalizer.utils import strip_accents
+from langnet.storage.db import READ_ONLY_POOL
 
 from .base import BuildErrorStats, BuildResult, BuildStatus, LexiconStats
 from .paths import default_dico_path
@@ -227,6 +228,7 @@ class DicoBuilder:
                 },
             )
             self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            READ_ONLY_POOL.release(self.output_path)
             self._conn = duckdb.connect(str(self.output_path))
             for stmt in SCHEMA_SQL.strip().split(";"):
                 sql_stmt = stmt.strip()
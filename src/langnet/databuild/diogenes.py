@@ -21,6 +21,7 @@ from returns.result import Failure, Success
 
 from langnet.execution.handlers.diogenes import _parse_diogenes_html
 from langnet.normalizer.utils import normalize_greekish_token, strip_accents
+from langnet.storage.db import READ_ONLY_POOL
 
 from .base import BuildErrorStats, BuildResult, BuildStatus, LexiconStats
 from .paths import default_diogenes_path, project_root
@@ -132,6 +133,7 @@ class DiogenesBuilder:
                     )
 
             self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            READ_ONLY_POOL.release(self.output_path)
             self._conn = duckdb.connect(str(self.output_path))
             self._conn.execute(SCHEMA_SQL)
             processed = self._build_entries()
@@ -17,7 +17,7 @@ from langnet.foster_ossa.structure import (
     structured_page_rows,
 )
 from langnet.foster_ossa.toc import parse_toc_entries
-from langnet.storage.db import connect_duckdb_ro
+from langnet.storage.db import READ_ONLY_POOL, connect_duckdb_ro
 
 from .base import BuildErrorStats, BuildResult, BuildStatus, FosterOssaStats
 from .paths import default_foster_ossa_path
@@ -140,6 +140,7 @@ class FosterOssaBuilder:
 
             self.output_path.parent.mkdir(parents=True, exist_ok=True)
             created_output = not self.output_path.exists()
+            READ_ONLY_POOL.release(self.output_path)
             self._conn = duckdb.connect(str(self.output_path))
             apply_foster_ossa_schema(self._conn)
             self._load_pages()
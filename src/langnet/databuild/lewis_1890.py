@@ -11,7 +11,7 @@ import pyarrow as pa
 from returns.result import Failure, Success
 
 from langnet.normalizer.utils import strip_accents
-from langnet.storage.db import connect_duckdb_ro
+from langnet.storage.db import READ_ONLY_POOL, connect_duckdb_pooled
 
 from .base import BuildErrorStats, BuildResult, BuildStatus, LexiconStats
 from .paths import default_lewis_1890_path
@@ -83,6 +83,7 @@ class Lewis1890Builder:
                     )
 
             self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            READ_ONLY_POOL.release(self.output_path)
             self._conn = duckdb.connect(str(self.output_path))
             apply_lewis_1890_schema(self._conn)
             processed = self._load_entries()
@@ -220,7 +221,7 @@ def lookup_lewis_1890_entries_by_headword(
 
     entries_by_key: dict[str, list[dict[str, Any]]] = {}
     placeholders = ",".join(["?"] * len(keys))
-    with connect_duckdb_ro(db_path) as conn:
+    with connect_duckdb_pooled(db_path) as conn:
         rows = conn.execute(
             f"""
             SELECT
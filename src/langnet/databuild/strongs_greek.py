@@ -17,7 +17,7 @@ import pyarrow as pa
 from returns.result import Failure, Success
 
 from langnet.normalizer.utils import strip_accents
-from langnet.storage.db import connect_duckdb_ro
+from langnet.storage.db import READ_ONLY_POOL, connect_duckdb_pooled
 
 from .base import BuildErrorStats, BuildResult, BuildStatus, LexiconStats
 from .paths import default_strongs_greek_path
@@ -115,6 +115,7 @@ class StrongsGreekBuilder:
                     )
 
             self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            READ_ONLY_POOL.release(self.output_path)
             self._conn = duckdb.connect(str(self.output_path))
             apply_strongs_greek_schema(self._conn)
             strongs_lemmas = self._load_combined_lexicon()
@@ -330,7 +331,7 @@ def lookup_strongs_greek_entries_by_headword(  # noqa: C901
 
     entries_by_key: dict[str, list[dict[str, Any]]] = {}
     placeholders = ",".join(["?"] * len(keys))
-    with connect_duckdb_ro(db_path) as conn:
+    with connect_duckdb_pooled(db_path) as conn:
         rows = conn.execute(
             f"""
             SELECT
@@ -3,14 +3,18 @@ from __future__ import annotations
 import logging
 import re
 import time
+from collections.abc import Iterable
 from dataclasses import dataclass, replace
 from itertools import islice
 from pathlib import Path
+from typing import cast
 
 import duckdb
 from returns.result import Failure, Success
 
 from langnet.execution.handlers.gaffiot import normalize_gaffiot_headword
+from langnet.storage.db import READ_ONLY_POOL
+from langnet.whitakers.morphology import whitaker_key
 
 from .base import BuildErrorStats, BuildResult, BuildStatus, LexiconStats
 from .paths import default_whitakers_path, project_root
@@ -42,8 +46,46 @@ CREATE INDEX IF NOT EXISTS whitakers_entries_headword_norm_idx ON entries(headwo
 CREATE INDEX IF NOT EXISTS whitakers_entries_headword_entry_idx
     ON entries(headword_norm, entry_id);
 CREATE INDEX IF NOT EXISTS whitakers_entries_source_stem_idx ON entries(source_stem);
+
+CREATE TABLE IF NOT EXISTS entry_stems (
+    entry_id BIGINT NOT NULL,
+    stem_key TINYINT NOT NULL,
+    stem VARCHAR NOT NULL,
+    stem_norm VARCHAR NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS whitakers_entry_stems_norm_idx ON entry_stems(stem_norm);
+
+CREATE TABLE IF NOT EXISTS inflections (
+    inflection_id BIGINT PRIMARY KEY,
+    pos VARCHAR NOT NULL,
+    which TINYINT NOT NULL,
+    variant TINYINT NOT NULL,
+    qualifiers VARCHAR NOT NULL,
+    stem_key TINYINT NOT NULL,
+    ending VARCHAR NOT NULL,
+    ending_norm VARCHAR NOT NULL,
+    age VARCHAR,
+    freq VARCHAR
+);
+
+CREATE INDEX IF NOT EXISTS whitakers_inflections_ending_idx ON inflections(ending_norm);
+
+CREATE TABLE IF NOT EXISTS addons (
+    addon_id BIGINT PRIMARY KEY,
+    kind VARCHAR NOT NULL,
+    fix VARCHAR NOT NULL,
+    fix_norm VARCHAR NOT NULL,
+    target VARCHAR,
+    meaning TEXT
+);
 """
 
+# Parts of speech whose INFLECTS.LAT records carry declension/conjugation and variant.
+_INFLECTION_CLASS_POS = frozenset({"N", "PRON", "ADJ", "NUM", "V", "VPAR", "SUPINE"})
+_ADDON_KINDS = frozenset({"PREFIX", "SUFFIX", "TACKON", "PACKON"})
+_INFLECTION_TAIL_FIELDS = 2
+
 
 @dataclass
 class WhitakersBuildConfig:
@@ -52,6 +94,8 @@ class WhitakersBuildConfig:
     """
 
     source_path: Path | None = None
+    inflections_path: Path | None = None
+    addons_path: Path | None = None
     output_path: Path | None = None
     limit: int | None = None
     batch_size: int = 5000
@@ -68,15 +112,46 @@ class _WhitakersEntry:
     pos: str
     codes: str
     plain_text: str
+    stems: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class _WhitakersInflection:
+    pos: str
+    which: int
+    variant: int
+    qualifiers: str
+    stem_key: int
+    ending: str
+    age: str
+    freq: str
+
+
+@dataclass(frozen=True)
+class _WhitakersAddon:
+    kind: str
+    fix: str
+    target: str
+    meaning: str
 
 
 class WhitakersBuilder:
     """
     Build a browseable Latin word index from Whitaker's generated DICTLINE.GEN.
+
+    When INFLECTS.LAT and ADDONS.LAT sit next to DICTLINE.GEN (or are passed
+    explicitly) their records are loaded too, together with every entry stem,
+    so `langnet.whitakers.morphology` can analyze forms without the binary.
     """
 
     def __init__(self, config: WhitakersBuildConfig) -> None:
         self.source_path = (config.source_path or DEFAULT_SOURCE).expanduser()
+        self.inflections_path = (
+            config.inflections_path or self.source_path.parent / "INFLECTS.LAT"
+        ).expanduser()
+        self.addons_path = (
+            config.addons_path or self.source_path.parent / "ADDONS.LAT"
+        ).expanduser()
         self.output_path = config.output_path or default_whitakers_path()
         self.limit = config.limit
         self.batch_size = config.batch_size
@@ -102,6 +177,7 @@ class WhitakersBuilder:
                     )
 
             self.output_path.parent.mkdir(parents=True, exist_ok=True)
+            READ_ONLY_POOL.release(self.output_path)
             self._conn = duckdb.connect(str(self.output_path))
             for stmt in SCHEMA_SQL.strip().split(";"):
                 sql_stmt = stmt.strip()
@@ -109,6 +185,8 @@ class WhitakersBuilder:
                     self._conn.execute(sql_stmt)
 
             processed = self._load_entries()
+            self._load_inflections()
+            self._load_addons()
             stats = replace(
                 self.get_stats(),
                 entry_count=processed,
@@ -145,6 +223,7 @@ class WhitakersBuilder:
                     entry.pos,
                     entry.codes,
                     entry.plain_text,
+                    entry.stems,
                 )
             )
             if len(batch) >= self.batch_size:
@@ -163,6 +242,54 @@ class WhitakersBuilder:
             self._flush_entries(batch)
         return total
 
+    def _load_inflections(self) -> int:
+        assert self._conn is not None
+        if not self.inflections_path.exists():
+            logger.info("No INFLECTS.LAT at %s; skipping inflection table", self.inflections_path)
+            return 0
+        rows: list[tuple[object, ...]] = []
+        with self.inflections_path.open(encoding="utf-8", errors="replace") as handle:
+            for line in handle:
+                inflection = _parse_inflection(line)
+                if inflection is None:
+                    continue
+                rows.append(
+                    (
+                        len(rows) + 1,
+                        inflection.pos,
+                        inflection.which,
+                        inflection.variant,
+                        inflection.qualifiers,
+                        inflection.stem_key,
+                        inflection.ending,
+                        whitaker_key(inflection.ending),
+                        inflection.age,
+                        inflection.freq,
+                    )
+                )
+        if rows:
+            self._conn.executemany(
+                "INSERT INTO inflections VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", rows
+            )
+        logger.info("Inserted %s Whitaker inflections", len(rows))
+        return len(rows)
+
+    def _load_addons(self) -> int:
+        assert self._conn is not None
+        if not self.addons_path.exists():
+            logger.info("No ADDONS.LAT at %s; skipping addon table", self.addons_path)
+            return 0
+        with self.addons_path.open(encoding="utf-8", errors="replace") as handle:
+            addons = _parse_addons(handle)
+        rows = [
+            (index, addon.kind, addon.fix, whitaker_key(addon.fix), addon.target, addon.meaning)
+            for index, addon in enumerate(addons, start=1)
+        ]
+        if rows:
+            self._conn.executemany("INSERT INTO addons VALUES (?, ?, ?, ?, ?, ?)", rows)
+        logger.info("Inserted %s Whitaker addons", len(rows))
+        return len(rows)
+
     def _iter_entries(self):
         with self.source_path.open(encoding="utf-8", errors="replace") as handle:
             for line_number, line in enumerate(handle, start=1):
@@ -172,7 +299,17 @@ class WhitakersBuilder:
 
     def _flush_entries(self, batch: list[tuple[object, ...]]) -> None:
         assert self._conn is not None
-        self._conn.executemany("INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)", batch)
+        self._conn.executemany(
+            "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?)", [row[:-1] for row in batch]
+        )
+        stem_rows = [
+            (row[0], stem_key, stem, whitaker_key(stem))
+            for row in batch
+            for stem_key, stem in enumerate(cast(tuple[str, ...], row[-1]), start=1)
+            if _is_real_stem(stem)
+        ]
+        if stem_rows:
+            self._conn.executemany("INSERT INTO entry_stems VALUES (?, ?, ?, ?)", stem_rows)
 
     def get_stats(self) -> LexiconStats:
         count = 0
@@ -229,12 +366,89 @@ def _parse_dictline(line_number: int, line: str) -> _WhitakersEntry | None:
         pos=pos,
         codes=codes,
         plain_text=plain_text,
+        stems=tuple(stems),
     )
 
 
+def _parse_inflection(line: str) -> _WhitakersInflection | None:
+    """
+    Parse one INFLECTS.LAT record.
+
+    Records read `POS [which variant] qualifiers... stem_key ending_len [ending] age freq`,
+    e.g. `N 2 1 NOM S C 1 2 us X A`; a zero-length ending has no ending token.
+    """
+    tokens = line.split("--", 1)[0].split()
+    if len(tokens) < 2 + _INFLECTION_TAIL_FIELDS:  # noqa: PLR2004
+        return None
+    age, freq = tokens[-_INFLECTION_TAIL_FIELDS:]
+    body = tokens[:-_INFLECTION_TAIL_FIELDS]
+    if body[-1] == "0":
+        ending, head = "", body[:-1]
+    else:
+        ending, head = body[-1], body[:-2]
+    if len(head) < 2 or not head[-1].isdigit():  # noqa: PLR2004
+        return None
+    stem_key = int(head[-1])
+    pos, qualifiers = head[0], head[1:-1]
+    which = variant = 0
+    if pos in _INFLECTION_CLASS_POS:
+        if len(qualifiers) < 2 or not "".join(qualifiers[:2]).isdigit():  # noqa: PLR2004
+            return None
+        which, variant, qualifiers = int(qualifiers[0]), int(qualifiers[1]), qualifiers[2:]
+    return _WhitakersInflection(
+        pos=pos,
+        which=which,
+        variant=variant,
+        qualifiers=" ".join(qualifiers),
+        stem_key=stem_key,
+        ending=ending,
+        age=age,
+        freq=freq,
+    )
+
+
+def _parse_addons(lines: Iterable[str]) -> list[_WhitakersAddon]:
+    """
+    Group ADDONS.LAT into records.
+
+    A record starts with `PREFIX|SUFFIX|TACKON|PACKON <fix> ...`. Its last
+    non-comment line is the meaning; anything between (or after the fix on the
+    header line) describes the word it attaches to.
+    """
+    addons: list[_WhitakersAddon] = []
+    header: list[str] | None = None
+    body: list[str] = []
+
+    def flush() -> None:
+        if header is None or len(header) < 2:  # noqa: PLR2004
+            return
+        meaning = body[-1] if body else ""
+        target = " ".join([*header[2:], *body[:-1]]).strip()
+        fix = header[1].strip("-")
+        if fix:
+            addons.append(_WhitakersAddon(kind=header[0], fix=fix, target=target, meaning=meaning))
+
+    for raw in lines:
+        line = raw.strip()
+        if not line or line.startswith("--"):
+            continue
+        tokens = line.split()
+        if tokens[0] in _ADDON_KINDS:
+            flush()
+            header, body = tokens, []
+        elif header is not None:
+            body.append(line)
+    flush()
+    return addons
+
+
+def _is_real_stem(stem: str) -> bool:
+    return bool(stem) and stem.lower() != "zzz"
+
+
 def _first_real_stem(stems: list[str]) -> str:
     for stem in stems:
-        if stem and stem.lower() != "zzz":
+        if _is_real_stem(stem):
             return stem
     return ""
 
@@ -11,6 +11,7 @@ from bs4.element import NavigableString, Tag
 
 from langnet.clients.base import ToolClient
 from langnet.normalizer.utils import strip_accents
+from langnet.parsing.html_soup import make_soup
 
 
 @dataclass(frozen=True)
@@ -219,7 +220,7 @@ class DiogenesClient:
     def _build_soup(self, body: bytes) -> BeautifulSoup | None:
         try:
             html = body.decode("utf-8", errors="ignore")
-            return BeautifulSoup(html, "html.parser")
+            return make_soup(html)
         except Exception:
             return None
 
@@ -4,10 +4,9 @@ import re
 from collections.abc import Iterable, Mapping
 from dataclasses import dataclass
 
-from bs4 import BeautifulSoup
-
 from langnet.clients.base import ToolClient
 from langnet.normalizer.utils import strip_accents
+from langnet.parsing.html_soup import make_soup
 from langnet.storage.effects_index import RawResponseIndex
 from langnet.storage.extraction_index import ExtractionIndex
 
@@ -83,7 +82,7 @@ class DiogenesParseAdapter:
     def _parse_lemmas(self, body: bytes) -> list[str]:
         lemmas: list[str] = []
         try:
-            soup = BeautifulSoup(body, "html.parser")
+            soup = make_soup(body)
             # Common diogenes parse pages have lemmas in <i> or bold tags.
             for tag in soup.find_all(["i", "b", "em", "strong"]):
                 text = (tag.get_text() or "").strip()
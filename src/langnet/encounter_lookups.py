@@ -0,0 +1,218 @@
+"""
+Lookup scheduling for `encounter`.
+
+An encounter runs one primary lookup, maybe an uncached retry, and then zero or
+more fallback terms (Sanskrit morphology lemmas, normalization alternates).
+Fallback terms do not depend on each other, so `EncounterLookupScheduler` runs
+them on a few daemon worker threads under a shared deadline. The deadline starts
+when the fallbacks first fan out. Results come back in term order, so claim
+merging stays deterministic. Every lookup is recorded as a path so the JSON
+output shows what actually ran.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import FIRST_EXCEPTION, Future, wait
+from dataclasses import asdict, dataclass, field
+from typing import Any, Generic, TypeVar
+
+ENCOUNTER_LOOKUP_WORKERS_ENV = "LANGNET_ENCOUNTER_LOOKUP_WORKERS"
+ENCOUNTER_LOOKUP_BUDGET_ENV = "LANGNET_ENCOUNTER_LOOKUP_BUDGET_SECONDS"
+DEFAULT_ENCOUNTER_LOOKUP_WORKERS = 4
+DEFAULT_ENCOUNTER_LOOKUP_BUDGET_SECONDS = 30.0
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class LookupPath:
+    path: str
+    term: str
+    status: str
+    elapsed_ms: float
+
+
+@dataclass
+class EncounterLookupScheduler(Generic[_T]):
+    """
+    Run encounter lookups and record which paths ran.
+
+    `run()` is for lookups later steps depend on (primary, uncached retries);
+    `run_many()` fans independent fallback terms out and drops any that miss
+    the budget, which is counted from the first fan-out. A failing fallback
+    term re-raises, as the serial loop did.
+
+    Fallback lookups run on daemon threads. A lookup that misses the budget is
+    abandoned rather than interrupted; it cannot keep the process alive at exit.
+    Lookups should bound their own requests by `remaining_seconds()`. Once
+    `run_many()` returns or raises, its workers take no further queued terms,
+    and a lookup that fails after the budget ran out is recorded as a timeout.
+    """
+
+    max_workers: int = DEFAULT_ENCOUNTER_LOOKUP_WORKERS
+    budget_seconds: float = DEFAULT_ENCOUNTER_LOOKUP_BUDGET_SECONDS
+    clock: Callable[[], float] = time.monotonic
+    paths: list[LookupPath] = field(default_factory=list)
+    started: float = field(default=0.0, init=False)
+    fanout_started: float | None = field(default=None, init=False)
+
+    def __post_init__(self) -> None:
+        self.started = self.clock()
+
+    @classmethod
+    def from_env(cls) -> EncounterLookupScheduler[_T]:
+        return cls(
+            max_workers=_env_int(ENCOUNTER_LOOKUP_WORKERS_ENV, DEFAULT_ENCOUNTER_LOOKUP_WORKERS),
+            budget_seconds=_env_float(
+                ENCOUNTER_LOOKUP_BUDGET_ENV, DEFAULT_ENCOUNTER_LOOKUP_BUDGET_SECONDS
+            ),
+        )
+
+    def remaining_seconds(self) -> float:
+        if self.fanout_started is None:
+            return self.budget_seconds
+        return max(0.0, self.budget_seconds - (self.clock() - self.fanout_started))
+
+    def run(self, path: str, term: str, lookup: Callable[[], _T]) -> _T:
+        started = self.clock()
+        try:
+            result = lookup()
+        except Exception:
+            self._record(path, term, "error", started)
+            raise
+        self._record(path, term, "ok", started)
+        return result
+
+    def run_many(
+        self,
+        path: str,
+        terms: Sequence[str],
+        lookup: Callable[[str], _T],
+    ) -> list[tuple[str, _T]]:
+        """Look up `terms` concurrently; completed results come back in `terms` order."""
+        if not terms:
+            return []
+        started = self.clock()
+        if self.fanout_started is None:
+            self.fanout_started = started
+        remaining = self.remaining_seconds()
+        if remaining <= 0:
+            for term in terms:
+                self._record(path, term, "skipped", started)
+            return []
+        futures: list[Future[tuple[_T, float]]] = [Future() for _term in terms]
+        queued = deque(zip(terms, futures, strict=True))
+        stopped = threading.Event()
+        for index in range(max(1, min(self.max_workers, len(terms)))):
+            threading.Thread(
+                target=self._drain,
+                args=(queued, lookup, stopped),
+                name=f"encounter-lookup-{index}",
+                daemon=True,
+            ).start()
+        wait(futures, timeout=remaining, return_when=FIRST_EXCEPTION)
+        stopped.set()
+        for future in futures:
+            future.cancel()
+        return self._collect(path, terms, futures, started)
+
+    def payload(self) -> dict[str, object]:
+        return {
+            "max_workers": self.max_workers,
+            "budget_seconds": self.budget_seconds,
+            "elapsed_ms": _elapsed_ms(self.clock, self.started),
+            "paths": [asdict(path) for path in self.paths],
+        }
+
+    def _collect(
+        self,
+        path: str,
+        terms: Sequence[str],
+        futures: list[Future[tuple[_T, float]]],
+        started: float,
+    ) -> list[tuple[str, _T]]:
+        expired = self.remaining_seconds() <= 0
+        results: list[tuple[str, _T]] = []
+        for term, future in zip(terms, futures, strict=True):
+            if not future.done() or future.cancelled():
+                self._record(path, term, "timeout", started)
+                continue
+            error = future.exception()
+            if error is not None and expired:
+                self._record(path, term, "timeout", started)
+                continue
+            if error is not None:
+                self._record(path, term, "error", started)
+                raise error
+            result, elapsed_ms = future.result()
+            self.paths.append(LookupPath(path, term, "ok", elapsed_ms))
+            results.append((term, result))
+        return results
+
+    def _drain(
+        self,
+        queued: deque[tuple[str, Future[tuple[_T, float]]]],
+        lookup: Callable[[str], _T],
+        stopped: threading.Event,
+    ) -> None:
+        while not stopped.is_set():
+            try:
+                term, future = queued.popleft()
+            except IndexError:
+                return
+            if not future.set_running_or_notify_cancel():
+                continue
+            started = self.clock()
+            try:
+                result = lookup(term)
+            except Exception as exc:  # noqa: BLE001
+                stopped.set()
+                future.set_exception(exc)
+            else:
+                future.set_result((result, _elapsed_ms(self.clock, started)))
+
+    def _record(self, path: str, term: str, status: str, started: float) -> None:
+        self.paths.append(LookupPath(path, term, status, _elapsed_ms(self.clock, started)))
+
+
+class PerThreadClients:
+    """
+    One tool-client cache per thread for concurrent encounter lookups.
+
+    Tool clients hold `requests.Session`s and, for Whitaker, a subprocess
+    wrapper; neither is safe to share across threads, so every lookup thread
+    builds and reuses its own.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+
+    def current(self) -> dict[str, Any]:
+        clients = getattr(self._local, "clients", None)
+        if clients is None:
+            clients = {}
+            self._local.clients = clients
+        return clients
+
+
+def _elapsed_ms(clock: Callable[[], float], started: float) -> float:
+    return round((clock() - started) * 1000, 3)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ[name]))
+    except (KeyError, ValueError):
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.environ[name]))
+    except (KeyError, ValueError):
+        return default
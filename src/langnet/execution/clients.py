@@ -7,8 +7,14 @@ from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
-from langnet.clients.base import RawResponseEffect, _new_response_id
+from langnet.clients.base import RawResponseEffect, ToolClient, _new_response_id
 from langnet.clients.subprocess import SubprocessToolClient
+from langnet.whitakers.morphology import (
+    NATIVE_CONTENT_TYPE,
+    NATIVE_INCOMPLETE_STATUS,
+    WhitakerMorphology,
+)
+from langnet.whitakers.pool import WhitakerPool
 
 
 class StubToolClient:
@@ -47,6 +53,51 @@ def find_whitaker_binary() -> str | None:
     return None
 
 
+class WhitakerNativeFetchClient:
+    """
+    fetch.whitakers answered in-process from the Whitaker DuckDB build.
+
+    The body carries the analyzed word list next to the rendered Whitaker
+    text, so `extract_lines` skips reparsing it. The analyzer does not model
+    every form the binary knows, so an empty analysis is handed to `fallback`
+    (the binary client) when there is one. Without one it is answered with
+    `NATIVE_INCOMPLETE_STATUS` and `"incomplete": true`, not as a plain miss.
+    """
+
+    def __init__(self, morphology: WhitakerMorphology, fallback: ToolClient | None = None) -> None:
+        self.morphology = morphology
+        self.fallback = fallback
+        self.tool = "fetch.whitakers"
+
+    def execute(
+        self, call_id: str, endpoint: str, params: Mapping[str, str] | None = None
+    ) -> RawResponseEffect:
+        import orjson  # noqa: PLC0415
+
+        params = params or {}
+        word = params.get("word") or params.get("q") or ""
+        wordlist = self.morphology.analyze(word)
+        if not wordlist and self.fallback is not None:
+            return self.fallback.execute(call_id=call_id, endpoint=endpoint, params=params)
+        payload: dict[str, Any] = {
+            "word": word,
+            "wordlist": wordlist,
+            "raw_text": self.morphology.render(wordlist),
+        }
+        if not wordlist:
+            payload["incomplete"] = True
+        return RawResponseEffect(
+            response_id=_new_response_id(),
+            tool=self.tool,
+            call_id=call_id,
+            endpoint=endpoint or f"whitakers-native:{word}",
+            status_code=200 if wordlist else NATIVE_INCOMPLETE_STATUS,
+            content_type=NATIVE_CONTENT_TYPE,
+            headers={},
+            body=orjson.dumps(payload),
+        )
+
+
 class CLTKFetchClient:
     """
     In-process client for fetch.cltk (Latin and Greek lemmatization via CLTK).
@@ -260,10 +311,14 @@ def get_spacy_fetch_client(model_name: str = "grc_odycy_joint_sm") -> SpacyFetch
 class WhitakerFetchClient:
     """
     Client wrapper for fetch.whitakers using the local whitakers-words binary.
+
+    With a `WhitakerPool` the form is answered by a persistent worker; without
+    one, each call starts its own process.
     """
 
-    def __init__(self, binary: str) -> None:
+    def __init__(self, binary: str, pool: WhitakerPool | None = None) -> None:
         self.binary = binary
+        self.pool = pool
         self.tool = "fetch.whitakers"
 
     def execute(
@@ -271,6 +326,17 @@ class WhitakerFetchClient:
     ) -> RawResponseEffect:
         params = params or {}
         word = params.get("word") or params.get("q") or ""
+        if self.pool is not None:
+            return RawResponseEffect(
+                response_id=_new_response_id(),
+                tool=self.tool,
+                call_id=call_id,
+                endpoint=endpoint or f"{self.binary} {word}",
+                status_code=0,
+                content_type="text/plain",
+                headers={},
+                body=self.pool.lookup(word),
+            )
         client = SubprocessToolClient(tool=self.tool, command=[self.binary, word])
         # Whitaker's Words treats every argv token as a lookup term. Do not pass
         # LangNet planning metadata such as "stage=..." as extra subprocess args.
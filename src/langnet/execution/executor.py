@@ -3,20 +3,30 @@ from __future__ import annotations
 import time
 from collections import defaultdict
 from collections.abc import Callable, Mapping, Sequence
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, field
-from typing import Protocol, cast
+from typing import TYPE_CHECKING, Protocol, cast
 
 import structlog
 from query_spec import ExecutedPlan, ToolCallSpec, ToolPlan, ToolResponseRef, ToolStage
 
 from langnet.clients.base import RawResponseEffect, ToolClient
 from langnet.execution import handlers_stub
-from langnet.execution.effects import ClaimEffect, DerivationEffect, ExtractionEffect
-from langnet.execution.versioning import get_handler_version
+from langnet.execution.effects import (
+    ClaimEffect,
+    DerivationEffect,
+    ExtractionEffect,
+    stable_effect_id,
+)
+from langnet.execution.handler_pool import MIN_POOLED_JOBS
+from langnet.execution.versioning import get_effect_prefix, get_handler_version
 from langnet.logging import setup_logging
 from langnet.planner.core import stable_plan_hash
 
+if TYPE_CHECKING:
+    from langnet.execution.handler_pool import HandlerPool
+
 ExtractHandler = Callable[[ToolCallSpec, RawResponseEffect], ExtractionEffect]
 DeriveHandler = Callable[[ToolCallSpec, ExtractionEffect], DerivationEffect]
 ClaimHandler = Callable[[ToolCallSpec, DerivationEffect], ClaimEffect]
@@ -31,6 +41,7 @@ class ExecutionArtifacts:
     derivations: list[DerivationEffect] = field(default_factory=list)
     claims: list[ClaimEffect] = field(default_factory=list)
     skipped_calls: list[SkippedCall] = field(default_factory=list)
+    memoized_calls: list[str] = field(default_factory=list)
     from_cache: bool = False
 
 
@@ -52,14 +63,47 @@ class RawResponseIndexProtocol(Protocol):
 class ExtractionIndexProtocol(Protocol):
     def store_effect(self, effect: ExtractionEffect) -> str: ...
 
+    def get_memoized(  # noqa: PLR0913
+        self,
+        response_id: str,
+        tool: str,
+        handler_version: str,
+        *,
+        effect_id: str,
+        call_id: str,
+        source_call_id: str,
+    ) -> ExtractionEffect | None: ...
+
 
 class DerivationIndexProtocol(Protocol):
     def store_effect(self, effect: DerivationEffect) -> str: ...
 
+    def get_memoized(  # noqa: PLR0913
+        self,
+        extraction_id: str,
+        tool: str,
+        handler_version: str,
+        *,
+        effect_id: str,
+        call_id: str,
+        source_call_id: str,
+    ) -> DerivationEffect | None: ...
+
 
 class ClaimIndexProtocol(Protocol):
     def store_effect(self, effect: ClaimEffect) -> str: ...
 
+    def get_memoized(  # noqa: PLR0913
+        self,
+        derivation_id: str,
+        tool: str,
+        handler_version: str,
+        *,
+        effect_id: str,
+        call_id: str,
+        source_call_id: str,
+    ) -> ClaimEffect | None: ...
+
 
 class PlanResponseIndexProtocol(Protocol):
     def get(self, plan_hash: str) -> ExecutedPlan | None: ...
@@ -126,6 +170,8 @@ class _ExecutionState:
     derivation_by_call: dict[str, DerivationEffect] = field(default_factory=dict)
     completed: set[str] = field(default_factory=set)
     skipped: dict[str, SkippedCall] = field(default_factory=dict)
+    memoized: list[str] = field(default_factory=list)
+    memoized_ids: set[str] = field(default_factory=set)
 
 
 @dataclass(slots=True)
@@ -139,9 +185,23 @@ class _ExecutionContext:
     extraction_index: ExtractionIndexProtocol
     derivation_index: DerivationIndexProtocol
     claim_index: ClaimIndexProtocol
+    memoize: bool = False
+    handler_pool: HandlerPool | None = None
+
+
+@dataclass(slots=True)
+class _HandlerJob:
+    """An extract/derive/claim call whose handler still has to run."""
+
+    call: ToolCallSpec
+    stage: str
+    handler: Callable[..., object]
+    source: object
+    source_call_id: str
 
 
 MAX_PARALLEL_FETCHES = 8
+HTTP_PARTIAL_CONTENT = 206
 
 
 def _stage_name(stage: int) -> str:
@@ -167,6 +227,55 @@ def _record_skip(
     )
 
 
+def _memo_key(
+    ctx: _ExecutionContext,
+    handler: Callable[..., object],
+    call_id: str,
+    source_id: str,
+    *,
+    source_memoized: bool = True,
+) -> tuple[str, str] | None:
+    """
+    Handler version and expected effect id to memoize under, or None when off.
+
+    Unversioned handlers are never memoized: without a version there is no way
+    to invalidate rows written by an older implementation. The handler's
+    declared effect prefix gives the id it would produce for this call, so the
+    memo lookup reads that one row. Derive/claim calls only reuse rows when
+    their source was itself memoized; effect ids are stable across handler
+    versions, so a re-run upstream handler must re-run downstream.
+    """
+    if not ctx.memoize or not source_memoized:
+        return None
+    version = get_handler_version(handler)
+    prefix = get_effect_prefix(handler)
+    if version is None or prefix is None:
+        return None
+    return version, stable_effect_id(prefix, call_id, source_id)
+
+
+def _memo_reads(ctx: _ExecutionContext) -> AbstractContextManager[object]:
+    """
+    Share one cache connection across a wave's memo lookups when the index offers it.
+
+    `PathEffectBatch` views expose `memo_reads()`; other indices read per lookup.
+    """
+    memo_reads = getattr(ctx.extraction_index, "memo_reads", None)
+    if not ctx.memoize or memo_reads is None:
+        return nullcontext()
+    return memo_reads()
+
+
+def _record_memo_hit(
+    call: ToolCallSpec, ctx: _ExecutionContext, state: _ExecutionState, stage: str, source: str
+) -> None:
+    state.memoized.append(call.call_id)
+    state.memoized_ids.add(call.call_id)
+    ctx.logger.info(  # type: ignore[attr-defined]
+        f"executor.{stage}.memoized", call_id=call.call_id, tool=call.tool, source_call=source
+    )
+
+
 def _initialize_cache_and_state(  # noqa: PLR0913
     plan: ToolPlan,  # type: ignore
     plan_hash: str,
@@ -207,37 +316,8 @@ def _initialize_cache_and_state(  # noqa: PLR0913
     return executed_plan, state, raw_effects
 
 
-def _handle_fetch_stage(
-    call: ToolCallSpec,
-    ctx: _ExecutionContext,
-    state: _ExecutionState,
-    raw_effects: list[RawResponseEffect],
-    executed_plan: ExecutedPlan,
-) -> bool:
-    """
-    Handle FETCH stage for a tool call.
-
-    Returns True if the call was processed (completed or skipped).
-    """
-    call_id = call.call_id
-    if call_id in state.raw_by_call:
-        state.completed.add(call_id)
-        ctx.logger.debug("executor.skip.fetch.cached", call_id=call_id, tool=call.tool)  # type: ignore[attr-defined]
-        return True
-
-    client = ctx.clients.get(call.tool)
-    if client is None:
-        if call.optional:
-            ctx.logger.info("executor.skip.missing_client", call_id=call_id, tool=call.tool)  # type: ignore[attr-defined]
-            _record_skip(state, call, "missing_client")
-            state.completed.add(call_id)
-            return True
-        raise ValueError(f"No client registered for tool '{call.tool}'")
-
-    params = call.params or {}
-    effect = _execute_fetch_call(call, client, params)
-    _store_fetch_effect(call, effect, ctx, state, raw_effects, executed_plan)
-    return True
+def _has_partial_response(raw_effects: Sequence[RawResponseEffect]) -> bool:
+    return any(effect.status_code == HTTP_PARTIAL_CONTENT for effect in raw_effects)
 
 
 def _execute_fetch_call(
@@ -321,16 +401,17 @@ def _handle_ready_fetch_calls(
     return processed_call_ids
 
 
-def _handle_extract_stage(
+def _prepare_extract_call(
     call: ToolCallSpec,
     ctx: _ExecutionContext,
     state: _ExecutionState,
     extractions: list[ExtractionEffect],
-) -> bool:
+) -> _HandlerJob | None:
     """
-    Handle EXTRACT stage for a tool call.
+    Resolve the EXTRACT handler and source for a tool call.
 
-    Returns True if the call was processed (completed or skipped).
+    Skips and memo hits are recorded here and return None; otherwise the
+    returned job still has to run and be completed.
     """
     call_id = call.call_id
     handler = ctx.registry.get_extract(call.tool)
@@ -341,7 +422,7 @@ def _handle_extract_stage(
             )
             _record_skip(state, call, "missing_extract_handler")
             state.completed.add(call_id)
-            return True
+            return None
         raise ValueError(f"No extract handler registered for tool '{call.tool}'")
 
     params = call.params or {}
@@ -356,7 +437,7 @@ def _handle_extract_stage(
             )
             _record_skip(state, call, "missing_source_extract", source_call_id=source_call_id)
             state.completed.add(call_id)
-            return True
+            return None
         raise RuntimeError(f"Missing source raw response for call '{call_id}'")
 
     source_raw = state.raw_by_call.get(source_call_id)
@@ -370,41 +451,46 @@ def _handle_extract_stage(
             )
             _record_skip(state, call, "missing_source_extract", source_call_id=source_call_id)
             state.completed.add(call_id)
-            return True
+            return None
         raise RuntimeError(f"Missing source raw response for call '{call_id}'")
 
-    handler_start = time.time()
-    extraction = handler(call, source_raw)
-    handler_ms = int((time.time() - handler_start) * 1000)
-
-    # Inject handler version for cache invalidation
-    handler_version = get_handler_version(handler)
-    if handler_version is not None:
-        extraction.handler_version = handler_version
-
-    ctx.extraction_index.store_effect(extraction)
-    extractions.append(extraction)
-    state.extraction_by_call[call_id] = extraction
-    ctx.logger.info(  # type: ignore[attr-defined]
-        "executor.extract.completed",
-        call_id=call_id,
-        tool=call.tool,
-        source_call=source_call_id,
-        duration_ms=handler_ms,
+    memo_key = _memo_key(ctx, handler, call_id, source_raw.response_id)
+    if memo_key is not None:
+        memo_version, effect_id = memo_key
+        memoized = ctx.extraction_index.get_memoized(
+            source_raw.response_id,
+            call.tool,
+            memo_version,
+            effect_id=effect_id,
+            call_id=call_id,
+            source_call_id=source_call_id,
+        )
+        if memoized is not None:
+            extractions.append(memoized)
+            state.extraction_by_call[call_id] = memoized
+            _record_memo_hit(call, ctx, state, "extract", source_call_id)
+            return None
+
+    return _HandlerJob(
+        call=call,
+        stage="extract",
+        handler=handler,
+        source=source_raw,
+        source_call_id=source_call_id,
     )
-    return True
 
 
-def _handle_derive_stage(
+def _prepare_derive_call(
     call: ToolCallSpec,
     ctx: _ExecutionContext,
     state: _ExecutionState,
     derivations: list[DerivationEffect],
-) -> bool:
+) -> _HandlerJob | None:
     """
-    Handle DERIVE stage for a tool call.
+    Resolve the DERIVE handler and source for a tool call.
 
-    Returns True if the call was processed (completed or skipped).
+    Skips and memo hits are recorded here and return None; otherwise the
+    returned job still has to run and be completed.
     """
     call_id = call.call_id
     handler = ctx.registry.get_derive(call.tool)
@@ -413,7 +499,7 @@ def _handle_derive_stage(
             ctx.logger.info("executor.skip.missing_derive_handler", call_id=call_id, tool=call.tool)  # type: ignore[attr-defined]
             _record_skip(state, call, "missing_derive_handler")
             state.completed.add(call_id)
-            return True
+            return None
         raise ValueError(f"No derive handler registered for tool '{call.tool}'")
 
     params = call.params or {}
@@ -428,7 +514,7 @@ def _handle_derive_stage(
             )
             _record_skip(state, call, "missing_source_derive", source_call_id=source_call_id)
             state.completed.add(call_id)
-            return True
+            return None
         raise RuntimeError(f"Missing source extraction for call '{call_id}'")
 
     source_extraction = state.extraction_by_call.get(source_call_id)
@@ -442,41 +528,52 @@ def _handle_derive_stage(
             )
             _record_skip(state, call, "missing_source_derive", source_call_id=source_call_id)
             state.completed.add(call_id)
-            return True
+            return None
         raise RuntimeError(f"Missing source extraction for call '{call_id}'")
 
-    handler_start = time.time()
-    derivation = handler(call, source_extraction)
-    handler_ms = int((time.time() - handler_start) * 1000)
-
-    # Inject handler version for cache invalidation
-    handler_version = get_handler_version(handler)
-    if handler_version is not None:
-        derivation.handler_version = handler_version
-
-    ctx.derivation_index.store_effect(derivation)
-    derivations.append(derivation)
-    state.derivation_by_call[call_id] = derivation
-    ctx.logger.info(  # type: ignore[attr-defined]
-        "executor.derive.completed",
-        call_id=call_id,
-        tool=call.tool,
-        source_call=source_call_id,
-        duration_ms=handler_ms,
+    memo_key = _memo_key(
+        ctx,
+        handler,
+        call_id,
+        source_extraction.extraction_id,
+        source_memoized=source_call_id in state.memoized_ids,
+    )
+    if memo_key is not None:
+        memo_version, effect_id = memo_key
+        memoized = ctx.derivation_index.get_memoized(
+            source_extraction.extraction_id,
+            call.tool,
+            memo_version,
+            effect_id=effect_id,
+            call_id=call_id,
+            source_call_id=source_call_id,
+        )
+        if memoized is not None:
+            derivations.append(memoized)
+            state.derivation_by_call[call_id] = memoized
+            _record_memo_hit(call, ctx, state, "derive", source_call_id)
+            return None
+
+    return _HandlerJob(
+        call=call,
+        stage="derive",
+        handler=handler,
+        source=source_extraction,
+        source_call_id=source_call_id,
     )
-    return True
 
 
-def _handle_claim_stage(
+def _prepare_claim_call(
     call: ToolCallSpec,
     ctx: _ExecutionContext,
     state: _ExecutionState,
     claims: list[ClaimEffect],
-) -> bool:
+) -> _HandlerJob | None:
     """
-    Handle CLAIM stage for a tool call.
+    Resolve the CLAIM handler and source for a tool call.
 
-    Returns True if the call was processed (completed or skipped).
+    Skips and memo hits are recorded here and return None; otherwise the
+    returned job still has to run and be completed.
     """
     call_id = call.call_id
     handler = ctx.registry.get_claim(call.tool)
@@ -485,7 +582,7 @@ def _handle_claim_stage(
             ctx.logger.info("executor.skip.missing_claim_handler", call_id=call_id, tool=call.tool)  # type: ignore[attr-defined]
             _record_skip(state, call, "missing_claim_handler")
             state.completed.add(call_id)
-            return True
+            return None
         raise ValueError(f"No claim handler registered for tool '{call.tool}'")
 
     params = call.params or {}
@@ -500,7 +597,7 @@ def _handle_claim_stage(
             )
             _record_skip(state, call, "missing_source_claim", source_call_id=source_call_id)
             state.completed.add(call_id)
-            return True
+            return None
         raise RuntimeError(f"Missing source derivation for call '{call_id}'")
 
     source_derivation = state.derivation_by_call.get(source_call_id)
@@ -514,28 +611,225 @@ def _handle_claim_stage(
             )
             _record_skip(state, call, "missing_source_claim", source_call_id=source_call_id)
             state.completed.add(call_id)
-            return True
+            return None
         raise RuntimeError(f"Missing source derivation for call '{call_id}'")
 
+    memo_key = _memo_key(
+        ctx,
+        handler,
+        call_id,
+        source_derivation.derivation_id,
+        source_memoized=source_call_id in state.memoized_ids,
+    )
+    if memo_key is not None:
+        memo_version, effect_id = memo_key
+        memoized = ctx.claim_index.get_memoized(
+            source_derivation.derivation_id,
+            call.tool,
+            memo_version,
+            effect_id=effect_id,
+            call_id=call_id,
+            source_call_id=source_call_id,
+        )
+        if memoized is not None:
+            claims.append(memoized)
+            _record_memo_hit(call, ctx, state, "claim", source_call_id)
+            return None
+
+    return _HandlerJob(
+        call=call,
+        stage="claim",
+        handler=handler,
+        source=source_derivation,
+        source_call_id=source_call_id,
+    )
+
+
+def _run_handler_job(job: _HandlerJob) -> tuple[object, int]:
     handler_start = time.time()
-    claim = handler(call, source_derivation)
-    handler_ms = int((time.time() - handler_start) * 1000)
+    effect = job.handler(job.call, job.source)
+    return effect, int((time.time() - handler_start) * 1000)
+
 
+def _complete_handler_job(  # noqa: PLR0913
+    job: _HandlerJob,
+    effect: object,
+    handler_ms: int,
+    *,
+    ctx: _ExecutionContext,
+    state: _ExecutionState,
+    outputs: list,
+) -> None:
+    """Stamp the handler version, persist the effect and record it for its stage."""
+    typed = cast(ExtractionEffect | DerivationEffect | ClaimEffect, effect)
     # Inject handler version for cache invalidation
-    handler_version = get_handler_version(handler)
+    handler_version = get_handler_version(job.handler)
     if handler_version is not None:
-        claim.handler_version = handler_version
-
-    ctx.claim_index.store_effect(claim)
-    claims.append(claim)
+        typed.handler_version = handler_version
+
+    call_id = job.call.call_id
+    if isinstance(typed, ExtractionEffect):
+        ctx.extraction_index.store_effect(typed)
+        state.extraction_by_call[call_id] = typed
+    elif isinstance(typed, DerivationEffect):
+        ctx.derivation_index.store_effect(typed)
+        state.derivation_by_call[call_id] = typed
+    else:
+        ctx.claim_index.store_effect(typed)
+    outputs.append(typed)
     ctx.logger.info(  # type: ignore[attr-defined]
-        "executor.claim.completed",
+        f"executor.{job.stage}.completed",
         call_id=call_id,
-        tool=call.tool,
-        source_call=source_call_id,
+        tool=job.call.tool,
+        source_call=job.source_call_id,
         duration_ms=handler_ms,
     )
-    return True
+
+
+def _prepare_handler_call(
+    call: ToolCallSpec,
+    ctx: _ExecutionContext,
+    state: _ExecutionState,
+    outputs_by_stage: Mapping[int, list],
+) -> _HandlerJob | None:
+    """
+    Resolve the handler for an extract/derive/claim call.
+
+    Returns None when the call was skipped or served from the stage memo.
+    """
+    outputs = outputs_by_stage.get(call.stage)
+    if outputs is None:
+        raise ValueError(f"Unsupported tool stage for call '{call.call_id}': {call.stage}")
+    if call.stage == ToolStage.TOOL_STAGE_EXTRACT:
+        return _prepare_extract_call(call, ctx, state, outputs)
+    if call.stage == ToolStage.TOOL_STAGE_DERIVE:
+        return _prepare_derive_call(call, ctx, state, outputs)
+    return _prepare_claim_call(call, ctx, state, outputs)
+
+
+def _dispatch_pooled_jobs(
+    jobs: Sequence[_HandlerJob], ctx: _ExecutionContext
+) -> dict[str, Future[tuple[object, int]]]:
+    """Submit the jobs whose handlers the pool also registers, when enough are ready."""
+    pool = ctx.handler_pool
+    if pool is None:
+        return {}
+    pooled = [job for job in jobs if pool.accepts(job.stage, job.call.tool, job.handler)]
+    if len(pooled) < MIN_POOLED_JOBS:
+        return {}
+    futures = {job.call.call_id: pool.submit(job.stage, job.call, job.source) for job in pooled}
+    ctx.logger.debug(  # type: ignore[attr-defined]
+        "executor.handlers.pooled", pooled=len(futures), inline=len(jobs) - len(futures)
+    )
+    return futures
+
+
+def _collect_handler_results(
+    jobs: Sequence[_HandlerJob],
+    futures: Mapping[str, Future[tuple[object, int]]],
+    *,
+    ctx: _ExecutionContext,
+    state: _ExecutionState,
+    outputs_by_stage: Mapping[int, list],
+) -> list[str]:
+    """Complete jobs in plan order, running those without a pooled future here."""
+    completed: list[str] = []
+    try:
+        for job in jobs:
+            future = futures.get(job.call.call_id)
+            effect, handler_ms = future.result() if future is not None else _run_handler_job(job)
+            _complete_handler_job(
+                job,
+                effect,
+                handler_ms,
+                ctx=ctx,
+                state=state,
+                outputs=outputs_by_stage[job.call.stage],
+            )
+            completed.append(job.call.call_id)
+    finally:
+        for future in futures.values():
+            future.cancel()
+    return completed
+
+
+def _handle_ready_handler_calls(
+    calls: Sequence[ToolCallSpec],
+    *,
+    ctx: _ExecutionContext,
+    state: _ExecutionState,
+    outputs_by_stage: Mapping[int, list],
+) -> list[str]:
+    """
+    Run one wave of ready extract/derive/claim calls through the handler pool.
+
+    Skips and memo lookups happen up front in plan order. Handlers the pool
+    also registers go to worker processes; the rest run here while the workers
+    are busy. Effects are completed in plan order either way, so stage outputs
+    and effect ids match a serial run.
+    """
+    processed_call_ids: list[str] = []
+    jobs: list[_HandlerJob] = []
+    for call in calls:
+        job = _prepare_handler_call(call, ctx, state, outputs_by_stage)
+        if job is None:
+            processed_call_ids.append(call.call_id)
+        else:
+            jobs.append(job)
+    futures = _dispatch_pooled_jobs(jobs, ctx)
+    processed_call_ids.extend(
+        _collect_handler_results(
+            jobs, futures, ctx=ctx, state=state, outputs_by_stage=outputs_by_stage
+        )
+    )
+    return processed_call_ids
+
+
+def _run_ready_calls_inline(
+    pending: dict[str, ToolCallSpec],
+    deps: dict[str, set[str]],
+    *,
+    ctx: _ExecutionContext,
+    state: _ExecutionState,
+    outputs_by_stage: Mapping[int, list],
+) -> bool:
+    """
+    Walk pending extract/derive/claim calls in plan order, running handlers here.
+
+    A call becomes ready as soon as its dependencies complete earlier in the
+    same walk. Fetch calls are left for the next iteration's fetch wave.
+    """
+    progressed = False
+    for call_id, call in list(pending.items()):
+        if call.stage == ToolStage.TOOL_STAGE_FETCH or not _dependencies_met(call_id, deps, state):
+            continue
+        job = _prepare_handler_call(call, ctx, state, outputs_by_stage)
+        if job is not None:
+            effect, handler_ms = _run_handler_job(job)
+            _complete_handler_job(
+                job,
+                effect,
+                handler_ms,
+                ctx=ctx,
+                state=state,
+                outputs=outputs_by_stage[call.stage],
+            )
+        _mark_processed([call_id], pending, state)
+        progressed = True
+    return progressed
+
+
+def _dependencies_met(call_id: str, deps: dict[str, set[str]], state: _ExecutionState) -> bool:
+    return all(dep in state.completed for dep in deps.get(call_id, set()))
+
+
+def _mark_processed(
+    call_ids: Sequence[str], pending: dict[str, ToolCallSpec], state: _ExecutionState
+) -> bool:
+    for call_id in call_ids:
+        state.completed.add(call_id)
+        pending.pop(call_id, None)
+    return bool(call_ids)
 
 
 def _process_pending_calls(  # noqa: PLR0913
@@ -552,12 +846,10 @@ def _process_pending_calls(  # noqa: PLR0913
     """
     Process one iteration of pending calls. Returns True if progress was made.
     """
-    ready_fetch_calls = [
-        call
-        for call_id, call in list(pending.items())
-        if call.stage == ToolStage.TOOL_STAGE_FETCH
-        and not any(dep not in state.completed for dep in deps.get(call_id, set()))
+    ready_calls = [
+        call for call_id, call in pending.items() if _dependencies_met(call_id, deps, state)
     ]
+    ready_fetch_calls = [call for call in ready_calls if call.stage == ToolStage.TOOL_STAGE_FETCH]
     if ready_fetch_calls:
         processed_call_ids = _handle_ready_fetch_calls(
             ready_fetch_calls,
@@ -566,36 +858,22 @@ def _process_pending_calls(  # noqa: PLR0913
             raw_effects,
             executed_plan,
         )
-        for call_id in processed_call_ids:
-            state.completed.add(call_id)
-            pending.pop(call_id, None)
-        return bool(processed_call_ids)
-
-    progressed = False
-    for call_id, call in list(pending.items()):
-        if any(dep not in state.completed for dep in deps.get(call_id, set())):
-            continue
-
-        stage = call.stage
-        processed = False
-
-        if stage == ToolStage.TOOL_STAGE_FETCH:
-            processed = _handle_fetch_stage(call, ctx, state, raw_effects, executed_plan)
-        elif stage == ToolStage.TOOL_STAGE_EXTRACT:
-            processed = _handle_extract_stage(call, ctx, state, extractions)
-        elif stage == ToolStage.TOOL_STAGE_DERIVE:
-            processed = _handle_derive_stage(call, ctx, state, derivations)
-        elif stage == ToolStage.TOOL_STAGE_CLAIM:
-            processed = _handle_claim_stage(call, ctx, state, claims)
-        else:
-            raise ValueError(f"Unsupported tool stage for call '{call_id}': {stage}")
-
-        if processed:
-            state.completed.add(call_id)
-            pending.pop(call_id)
-            progressed = True
-
-    return progressed
+        return _mark_processed(processed_call_ids, pending, state)
+
+    outputs_by_stage: dict[int, list] = {
+        ToolStage.TOOL_STAGE_EXTRACT: extractions,
+        ToolStage.TOOL_STAGE_DERIVE: derivations,
+        ToolStage.TOOL_STAGE_CLAIM: claims,
+    }
+    with _memo_reads(ctx):
+        if ctx.handler_pool is not None:
+            processed_call_ids = _handle_ready_handler_calls(
+                ready_calls, ctx=ctx, state=state, outputs_by_stage=outputs_by_stage
+            )
+            return _mark_processed(processed_call_ids, pending, state)
+        return _run_ready_calls_inline(
+            pending, deps, ctx=ctx, state=state, outputs_by_stage=outputs_by_stage
+        )
 
 
 def execute_plan_staged(  # noqa: PLR0913
@@ -609,6 +887,7 @@ def execute_plan_staged(  # noqa: PLR0913
     claim_index: ClaimIndexProtocol,
     plan_response_index: PlanResponseIndexProtocol | None = None,
     allow_cache: bool = True,
+    handler_pool: HandlerPool | None = None,
 ) -> ExecutionArtifacts:
     """
     Execute a ToolPlan through fetch → extract → derive → claim stages.
@@ -616,6 +895,16 @@ def execute_plan_staged(  # noqa: PLR0913
     Fetch calls use ToolClient instances. Subsequent stages dispatch to
     handlers registered in ToolRegistry, and all effects are persisted
     to DuckDB indices with memoizable plan_hash reuse.
+
+    With `allow_cache`, extract/derive/claim calls whose handler carries a
+    version (see `versioning.versioned`) first look for a stored effect keyed
+    by (source id, tool, handler_version) and skip the handler on a hit, so a
+    warm plan loads claims from DuckDB without re-parsing. Bumping the handler
+    version invalidates those rows.
+
+    With a `handler_pool` (see `handler_pool.HandlerPool`), each wave of ready
+    extract/derive/claim calls across the DAG runs its handlers in worker
+    processes. Effects are still persisted and returned in plan order.
     """
     setup_logging()
     logger = structlog.get_logger(__name__)
@@ -644,6 +933,8 @@ def execute_plan_staged(  # noqa: PLR0913
         extraction_index=extraction_index,
         derivation_index=derivation_index,
         claim_index=claim_index,
+        memoize=allow_cache,
+        handler_pool=handler_pool,
     )
 
     while pending:
@@ -663,10 +954,13 @@ def execute_plan_staged(  # noqa: PLR0913
         extraction_count=len(extractions),
         derivation_count=len(derivations),
         claim_count=len(claims),
+        memoized_count=len(state.memoized),
     )
 
-    if plan_response_index is not None and raw_effects:
+    if plan_response_index is not None and raw_effects and not _has_partial_response(raw_effects):
         # Only upsert when we have new responses; cache reuse keeps prior index.
+        # A partial response (e.g. an inconclusive in-process Whitaker analysis)
+        # keeps the plan out of the cache so the next run fetches it again.
         plan_response_index.upsert(
             plan_hash=executed_plan.plan_hash,
             plan_id=executed_plan.plan_id,
@@ -681,5 +975,6 @@ def execute_plan_staged(  # noqa: PLR0913
         derivations=derivations,
         claims=claims,
         skipped_calls=list(state.skipped.values()),
+        memoized_calls=list(state.memoized),
         from_cache=executed_plan.from_cache,
     )
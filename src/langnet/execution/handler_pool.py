@@ -0,0 +1,153 @@
+"""Process pool for CPU-bound extract/derive/claim handlers.
+
+The executor parallelizes FETCH calls on threads, but handlers that parse HTML,
+XML or Whitaker output hold the GIL. `HandlerPool` runs them in worker
+processes that each build (and keep) their own warmed `ToolRegistry`, so a job
+only ships the call spec and its source effect across the process boundary.
+
+The executor still resolves handlers, memoizes, persists effects and appends
+them to the artifacts in the main process, in plan order. Workers only run the
+handler body, so effect ids and ordering match a serial run.
+"""
+
+from __future__ import annotations
+
+import atexit
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import TYPE_CHECKING
+
+from query_spec import ToolCallSpec
+
+if TYPE_CHECKING:
+    from langnet.execution.executor import ToolRegistry
+
+HANDLER_WORKERS_ENV = "LANGNET_EXECUTOR_HANDLER_WORKERS"
+DEFAULT_HANDLER_WORKERS = 0
+MIN_POOLED_JOBS = 2
+
+RegistryFactory = Callable[..., "ToolRegistry"]
+
+_WORKER_REGISTRY: ToolRegistry | None = None
+_SHARED_POOLS: dict[bool, HandlerPool] = {}
+_SHARED_POOLS_LOCK = threading.Lock()
+
+
+def handler_pool_workers() -> int:
+    """Handler worker processes; `0` or `1` keeps extract/derive/claim in-process."""
+    raw = os.getenv(HANDLER_WORKERS_ENV, "")
+    try:
+        return max(0, int(raw)) if raw else DEFAULT_HANDLER_WORKERS
+    except ValueError:
+        return DEFAULT_HANDLER_WORKERS
+
+
+def _default_registry_factory(*, use_stubs: bool = False) -> ToolRegistry:
+    from langnet.execution.registry import default_registry  # noqa: PLC0415
+
+    return default_registry(use_stubs=use_stubs)
+
+
+def _lookup_handler(registry: ToolRegistry, stage: str, tool: str) -> Callable[..., object] | None:
+    if stage == "extract":
+        return registry.get_extract(tool)
+    if stage == "derive":
+        return registry.get_derive(tool)
+    if stage == "claim":
+        return registry.get_claim(tool)
+    raise ValueError(f"Unsupported handler stage: {stage}")
+
+
+def _init_worker(factory: RegistryFactory, use_stubs: bool) -> None:
+    global _WORKER_REGISTRY  # noqa: PLW0603
+    _WORKER_REGISTRY = factory(use_stubs=use_stubs)
+
+
+def _run_handler(stage: str, call: ToolCallSpec, source: object) -> tuple[object, int]:
+    if _WORKER_REGISTRY is None:
+        raise RuntimeError("Handler worker started without a registry")
+    handler = _lookup_handler(_WORKER_REGISTRY, stage, call.tool)
+    if handler is None:
+        raise ValueError(f"No {stage} handler registered for tool '{call.tool}' in worker")
+    handler_start = time.time()
+    effect = handler(call, source)
+    return effect, int((time.time() - handler_start) * 1000)
+
+
+class HandlerPool:
+    """
+    Worker processes holding warmed handler registries.
+
+    The pool keeps its own copy of the registry built by `registry_factory` so
+    the executor can check that a handler it resolved is the one a worker will
+    run. Handlers that are not in that registry (test closures, ad-hoc
+    registries) keep running in the calling process.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        use_stubs: bool = False,
+        registry_factory: RegistryFactory | None = None,
+    ) -> None:
+        factory = registry_factory or _default_registry_factory
+        self.workers = workers
+        self.registry = factory(use_stubs=use_stubs)
+        # Workers come from a forkserver, not a fork of this process: callers
+        # usually hold DuckDB connections and client threads that must not be
+        # copied. `_init_worker` rebuilds the registry in each worker anyway.
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("forkserver"),
+            initializer=_init_worker,
+            initargs=(factory, use_stubs),
+        )
+
+    def accepts(self, stage: str, tool: str, handler: Callable[..., object]) -> bool:
+        return _lookup_handler(self.registry, stage, tool) is handler
+
+    def submit(self, stage: str, call: ToolCallSpec, source: object) -> Future[tuple[object, int]]:
+        return self._executor.submit(_run_handler, stage, call, source)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def __enter__(self) -> HandlerPool:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def shared_handler_pool(*, use_stubs: bool = False) -> HandlerPool | None:
+    """
+    Process-wide pool sized by `LANGNET_EXECUTOR_HANDLER_WORKERS`, or None when off.
+
+    Workers start lazily and live until interpreter exit, so the serve worker
+    and repeated encounter lookups pay the registry warm-up once.
+    """
+    workers = handler_pool_workers()
+    if workers <= 1:
+        return None
+    with _SHARED_POOLS_LOCK:
+        pool = _SHARED_POOLS.get(use_stubs)
+        if pool is None:
+            pool = HandlerPool(workers, use_stubs=use_stubs)
+            _SHARED_POOLS[use_stubs] = pool
+        return pool
+
+
+def close_shared_handler_pools() -> None:
+    with _SHARED_POOLS_LOCK:
+        pools = list(_SHARED_POOLS.values())
+        _SHARED_POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_shared_handler_pools)
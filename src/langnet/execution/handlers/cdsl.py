@@ -24,7 +24,7 @@ from langnet.execution.effects import (
     stable_effect_id,
 )
 from langnet.execution.versioning import versioned
-from langnet.storage.db import connect_duckdb_ro
+from langnet.storage.db import connect_duckdb_pooled
 
 _IAST_TO_SLP1 = {
     "ā": "A",
@@ -888,7 +888,7 @@ def _parse_body_metadata(body_xml: str) -> dict[str, object]:
     return grammar
 
 
-@versioned("v1")
+@versioned("v1", effect_prefix="ext")
 def extract_xml(call: ToolCallSpec, raw_response) -> ExtractionEffect:
     """
     Load CDSL rows returned by the DuckDB fetch client.
@@ -913,7 +913,7 @@ def extract_xml(call: ToolCallSpec, raw_response) -> ExtractionEffect:
     )
 
 
-@versioned("v1")
+@versioned("v1", effect_prefix="drv")
 def derive_sense(call: ToolCallSpec, extraction: ExtractionEffect) -> DerivationEffect:
     """
     Convert CDSL rows into simple sense payloads.
@@ -1100,7 +1100,7 @@ def _make_triple(
     }
 
 
-@versioned("v1")
+@versioned("v1", effect_prefix="clm")
 def claim_sense(call: ToolCallSpec, derivation: DerivationEffect) -> ClaimEffect:
     """
     Emit `has_sense` triples for CDSL glosses.
@@ -1248,7 +1248,7 @@ class CdslFetchClient:
             keys = _candidate_keys(lemma)
             rows: list[tuple] = []
             cols: list[str] = []
-            with connect_duckdb_ro(path) as conn:
+            with connect_duckdb_pooled(path) as conn:
                 if keys:
                     placeholders = ",".join(["?"] * len(keys))
                     rows = conn.execute(
@@ -22,7 +22,7 @@ from langnet.normalizer.utils import contains_greek, normalize_greekish_token, s
 from langnet.parsing.integration import enrich_cltk_with_parsed_lewis
 
 
-@versioned("v2")
+@versioned("v2", effect_prefix="cltk-ext")
 def extract_cltk(call: ToolCallSpec, raw: RawResponseEffect) -> ExtractionEffect:
     """
     Extract CLTK lexicon data from JSON response.
@@ -58,7 +58,7 @@ def extract_cltk(call: ToolCallSpec, raw: RawResponseEffect) -> ExtractionEffect
     )
 
 
-@versioned("v1")
+@versioned("v1", effect_prefix="cltk-der")
 def derive_cltk(call: ToolCallSpec, extraction: ExtractionEffect) -> DerivationEffect:
     prov = [
         ProvenanceLink(
@@ -274,7 +274,7 @@ def _build_triples(
     return triples
 
 
-@versioned("v1")
+@versioned("v1", effect_prefix="cltk-clm")
 def claim_cltk(call: ToolCallSpec, derivation: DerivationEffect) -> ClaimEffect:
     prov = derivation.provenance_chain[:] if derivation.provenance_chain else []
     prov.append(
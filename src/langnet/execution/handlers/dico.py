@@ -31,7 +31,7 @@ from langnet.execution.source_text import (
 )
 from langnet.heritage.velthuis_converter import to_heritage_velthuis
 from langnet.normalizer.utils import strip_accents
-from langnet.storage.db import connect_duckdb_ro
+from langnet.storage.db import connect_duckdb_pooled
 
 _DICO_URL_RE = re.compile(r"/DICO/(?P<page>[^/#?]+)\.html#(?P<entry>[^?]+)")
 _SANSKRIT_FINAL_S_STEM_MARKERS = frozenset("āīūṛṝḷḹṅñṇśṣṃṁḥ.fFxX")
@@ -126,7 +126,7 @@ def lookup_dico_entries(refs: list[tuple[str, str]], db_path: Path | None = None
         return []
 
     entries: list[dict] = []
-    with connect_duckdb_ro(db_path) as conn:
+    with connect_duckdb_pooled(db_path) as conn:
         for source_page, entry_id in refs:
             rows = conn.execute(
                 """
@@ -174,7 +174,7 @@ def lookup_dico_entries_by_headword(
         return []
 
     placeholders = ",".join(["?"] * len(keys))
-    with connect_duckdb_ro(db_path) as conn:
+    with connect_duckdb_pooled(db_path) as conn:
         rows = conn.execute(
             f"""
             SELECT
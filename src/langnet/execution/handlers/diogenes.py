@@ -27,6 +27,7 @@ from langnet.execution.source_text import (
 )
 from langnet.execution.versioning import versioned
 from langnet.normalizer.utils import contains_greek, normalize_greekish_token, strip_accents
+from langnet.parsing.html_soup import make_soup
 from langnet.parsing.integration import enrich_extraction_with_parsed_header
 
 
@@ -75,7 +76,6 @@ class DiogenesParsedResult(TypedDict, total=False):
     is_fuzzy_overall: bool
 
 
-_PARSER_PREFERENCE = ("lxml", "html5lib", "html.parser")
 PERSEUS_MORPH_PART_COUNT = 2
 _POS_CANONICAL = {
     "verb": "verb",
@@ -136,15 +136,6 @@ _MORPHEUS_TAG_FEATURES: dict[str, tuple[str, str]] = {
 }
 
 
-def _make_soup(html: str) -> BeautifulSoup:
-    for parser in _PARSER_PREFERENCE:
-        try:
-            return BeautifulSoup(html, parser)
-        except Exception:
-            continue
-    return BeautifulSoup(html, "html.parser")
-
-
 def _find_nd_coordinate(event_id: str) -> tuple[int, ...]:
     """
     Translate padding indent histories into n-dimensional array coordinates.
@@ -399,7 +390,7 @@ def _handle_references(soup: BeautifulSoup) -> DiogenesDefinitions:
         return ":".join([str(i).zfill(2) for i in indent_history])
 
     def insert_block(block: Tag | BeautifulSoup) -> None:
-        blocks.append({"indentid": shift_cursor(block), "soup": _make_soup(f"{block}")})
+        blocks.append({"indentid": shift_cursor(block), "soup": make_soup(f"{block}")})
 
     for block in soup.select("#sense"):
         insert_block(block)
@@ -448,7 +439,7 @@ def _parse_diogenes_html(html: str) -> DiogenesParsedResult:
     documents = html.split("<hr />")
     fuzzy_flag = is_fuzzy_overall
     for doc in documents:
-        soup = _make_soup(doc)
+        soup = make_soup(doc)
         looks_like_header = bool(soup.find_all(class_="logeion-link"))
         is_perseus_analysis = any(
             tag.get_text().strip().startswith("Perseus an") for tag in soup.find_all("h1")
@@ -539,7 +530,7 @@ def _parse_fallback_lemmas(body: bytes) -> list[str]:
     """
     lemmas: list[str] = []
     try:
-        soup = BeautifulSoup(body, "html.parser")
+        soup = make_soup(body)
         # Common diogenes parse pages have lemmas in <i> or bold tags.
         for tag in soup.find_all(["i", "b", "em", "strong"]):
             text = (tag.get_text() or "").strip()
@@ -561,7 +552,7 @@ def _parse_fallback_lemmas(body: bytes) -> list[str]:
     return out
 
 
-@versioned("v2")
+@versioned("v2", effect_prefix="dio-ext")
 def extract_html(call: ToolCallSpec, raw: RawResponseEffect) -> ExtractionEffect:
     """
     Parse Diogenes HTML directly (no refetch) to extract lemmas and definitions.
@@ -599,7 +590,7 @@ def extract_html(call: ToolCallSpec, raw: RawResponseEffect) -> ExtractionEffect
     )
 
 
-@versioned("v1")
+@versioned("v1", effect_prefix="dio-der")
 def derive_morph(call: ToolCallSpec, extraction: ExtractionEffect) -> DerivationEffect:
     prov = [
         ProvenanceLink(
@@ -843,7 +834,7 @@ def _has_no_match_header(chunks: Sequence[object]) -> bool:
     )
 
 
-@versioned("v1")
+@versioned("v1", effect_prefix="dio-clm")
 def claim_morph(call: ToolCallSpec, derivation: DerivationEffect) -> ClaimEffect:
     prov = derivation.provenance_chain[:] if derivation.provenance_chain else []
     prov.append(
@@ -28,7 +28,7 @@ from langnet.execution.source_text import (
     trim_empty,
 )
 from langnet.normalizer.utils import strip_accents
-from langnet.storage.db import connect_duckdb_ro
+from langnet.storage.db import connect_duckdb_pooled
 
 
 def normalize_gaffiot_headword(raw: str) -> str:
@@ -70,7 +70,7 @@ def lookup_gaffiot_entries_by_headword(
 
     entries: list[dict] = []
     placeholders = ",".join(["?"] * len(keys))
-    with connect_duckdb_ro(db_path) as conn:
+    with connect_duckdb_pooled(db_path) as conn:
         rows = conn.execute(
             f"""
             SELECT
@@ -29,7 +29,7 @@ from langnet.execution.source_text import (
     trim_empty,
 )
 from langnet.normalizer.utils import strip_accents
-from langnet.storage.db import connect_duckdb_ro
+from langnet.storage.db import connect_duckdb_pooled
 
 
 def normalize_georges_1913_headword(raw: str) -> str:
@@ -71,7 +71,7 @@ def lookup_georges_1913_entries_by_headword(
         return []
 
     placeholders = ",".join(["?"] * len(keys))
-    with connect_duckdb_ro(db_path) as conn:
+    with connect_duckdb_pooled(db_path) as conn:
         rows = conn.execute(
             f"""
             SELECT
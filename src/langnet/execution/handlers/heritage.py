@@ -8,7 +8,6 @@ from functools import lru_cache
 from pathlib import Path
 from typing import TypedDict, cast
 
-from bs4 import BeautifulSoup
 from query_spec import ToolCallSpec
 
 from langnet.clients.base import RawResponseEffect
@@ -26,6 +25,7 @@ from langnet.heritage.html_extractor import (
     MorphologySolution,
     extract_solutions,
 )
+from langnet.parsing.html_soup import make_soup
 
 
 class HeritageAnalysisVariant(TypedDict, total=False):
@@ -242,14 +242,14 @@ def _build_analyses_from_solutions(solutions: list[MorphologySolution]) -> list[
     return analyses
 
 
-@versioned("v1")
+@versioned("v1", effect_prefix="ext")
 def extract_html(call: ToolCallSpec, raw_response: RawResponseEffect) -> ExtractionEffect:
     """
     Decode Heritage HTML and capture structured solutions/patterns for derivation.
     """
     start = time.perf_counter()
     html = raw_response.body.decode("utf-8", errors="ignore") if raw_response.body else ""
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
 
     lemma = _extract_lemma_from_response(soup, call.params)
     slp1 = _velthuis_to_slp1(lemma)
@@ -287,7 +287,7 @@ def extract_html(call: ToolCallSpec, raw_response: RawResponseEffect) -> Extract
     )
 
 
-@versioned("v1")
+@versioned("v1", effect_prefix="drv")
 def derive_morph(call: ToolCallSpec, extraction: ExtractionEffect) -> DerivationEffect:
     """
     Build a richer derivation record from extracted Heritage HTML.
@@ -573,7 +573,7 @@ def _build_claim_value(
     return value
 
 
-@versioned("v1")
+@versioned("v1", effect_prefix="clm")
 def claim_morph(call: ToolCallSpec, derivation: DerivationEffect) -> ClaimEffect:
     """
     Emit `has_morphology` claims with parsed Heritage payload preserved.
@@ -23,7 +23,7 @@ from langnet.execution.handlers.cltk import (  # Reuse Greek normalization helpe
 from langnet.execution.versioning import versioned
 
 
-@versioned("v1")
+@versioned("v1", effect_prefix="spacy-ext")
 def extract_spacy(call: ToolCallSpec, raw: RawResponseEffect) -> ExtractionEffect:
     payload = {}
     HTTP_OK = 200
@@ -53,7 +53,7 @@ def extract_spacy(call: ToolCallSpec, raw: RawResponseEffect) -> ExtractionEffec
     )
 
 
-@versioned("v1")
+@versioned("v1", effect_prefix="spacy-der")
 def derive_spacy(call: ToolCallSpec, extraction: ExtractionEffect) -> DerivationEffect:
     prov = [
         ProvenanceLink(
@@ -235,7 +235,7 @@ def _build_triples(
     return triples
 
 
-@versioned("v1")
+@versioned("v1", effect_prefix="spacy-clm")
 def claim_spacy(call: ToolCallSpec, derivation: DerivationEffect) -> ClaimEffect:
     prov = derivation.provenance_chain[:] if derivation.provenance_chain else []
     prov.append(
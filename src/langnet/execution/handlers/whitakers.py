@@ -5,6 +5,7 @@ import re
 from collections.abc import Mapping, Sequence
 from typing import Any, Protocol, TypedDict, cast
 
+import orjson
 from query_spec import ToolCallSpec
 
 from langnet.clients.base import RawResponseEffect
@@ -23,6 +24,7 @@ from langnet.execution.source_text import (
 )
 from langnet.execution.versioning import versioned
 from langnet.parsing.whitakers import CodesReducer, FactsReducer, SensesReducer
+from langnet.whitakers.morphology import NATIVE_CONTENT_TYPE
 
 
 class Reducer(Protocol):
@@ -775,10 +777,23 @@ def _extract_response_id(provenance: list[ProvenanceLink] | None) -> str | None:
     return None
 
 
-@versioned("v1")
-def extract_lines(call: ToolCallSpec, raw: RawResponseEffect) -> ExtractionEffect:
+def _read_raw_wordlist(raw: RawResponseEffect) -> tuple[str, list[WhitakerWord]]:
+    """Raw text and word list, reusing the analysis the in-process engine already made."""
+    if raw.content_type == NATIVE_CONTENT_TYPE:
+        native = orjson.loads(raw.body) if raw.body else {}
+        wordlist = native.get("wordlist")
+        raw_text = native.get("raw_text")
+        return (
+            raw_text if isinstance(raw_text, str) else "",
+            cast(list[WhitakerWord], wordlist) if isinstance(wordlist, list) else [],
+        )
     text = raw.body.decode("utf-8", errors="ignore")
-    wordlist = _parse_whitaker_output(text)
+    return text, _parse_whitaker_output(text)
+
+
+@versioned("v1", effect_prefix="ww-ext")
+def extract_lines(call: ToolCallSpec, raw: RawResponseEffect) -> ExtractionEffect:
+    text, wordlist = _read_raw_wordlist(raw)
     lemmas = _collect_lemmas(wordlist)
     canonical = lemmas[0] if lemmas else None
     return ExtractionEffect(
@@ -793,7 +808,7 @@ def extract_lines(call: ToolCallSpec, raw: RawResponseEffect) -> ExtractionEffec
     )
 
 
-@versioned("v1")
+@versioned("v1", effect_prefix="ww-der")
 def derive_facts(call: ToolCallSpec, extraction: ExtractionEffect) -> DerivationEffect:
     prov = [
         ProvenanceLink(
@@ -827,7 +842,7 @@ def derive_facts(call: ToolCallSpec, extraction: ExtractionEffect) -> Derivation
     )
 
 
-@versioned("v2")
+@versioned("v2", effect_prefix="ww-clm")
 def claim_whitakers(call: ToolCallSpec, derivation: DerivationEffect) -> ClaimEffect:
     prov = derivation.provenance_chain[:] if derivation.provenance_chain else []
     prov.append(
@@ -23,14 +23,16 @@ from typing import Any, TypeVar
 F = TypeVar("F", bound=Callable[..., Any])
 
 
-def versioned(version: str) -> Callable[[F], F]:
+def versioned(version: str, *, effect_prefix: str | None = None) -> Callable[[F], F]:
     """Decorator to mark handler functions with version strings.
 
     Args:
         version: Version string (e.g., "v1", "v1.0", "v2.1")
+        effect_prefix: Prefix the handler passes to `stable_effect_id`, so the
+            executor can compute a memoized effect's id up front
 
     Returns:
-        Decorator that attaches __handler_version__ attribute
+        Decorator that attaches __handler_version__ (and __effect_prefix__)
 
     Example:
         >>> @versioned("v1")
@@ -47,11 +49,15 @@ def versioned(version: str) -> Callable[[F], F]:
 
     Integration:
         The executor reads __handler_version__ and stores it in effect metadata,
-        enabling cache invalidation when handler versions don't match.
+        enabling cache invalidation when handler versions don't match. Stage
+        memoization also needs __effect_prefix__ to look a stored effect up
+        by id.
     """
 
     def decorator(func: F) -> F:
         func.__handler_version__ = version  # type: ignore[attr-defined]
+        if effect_prefix is not None:
+            func.__effect_prefix__ = effect_prefix  # type: ignore[attr-defined]
         return func
 
     return decorator
@@ -79,6 +85,11 @@ def get_handler_version(func: Callable[..., Any]) -> str | None:
     return getattr(func, "__handler_version__", None)
 
 
+def get_effect_prefix(func: Callable[..., Any]) -> str | None:
+    """Return the `stable_effect_id` prefix declared with @versioned, if any."""
+    return getattr(func, "__effect_prefix__", None)
+
+
 def versioned_with_fallback(version: str) -> Callable[[F], F]:
     """Decorator that preserves function behavior while adding version.
 
@@ -2,15 +2,16 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 from collections.abc import Mapping
 from dataclasses import dataclass
 from urllib.parse import urlencode, urljoin
 
 import requests
-from bs4 import BeautifulSoup
 from heritage_spec import MonierWilliamsResult, SktSearchResult
 
 from langnet.clients.base import ToolClient
+from langnet.parsing.html_soup import make_soup
 
 from .config import HeritageConfig, heritage_config
 
@@ -42,9 +43,21 @@ class HeritageHTTPClient:
         tool_client: ToolClient | None = None,
     ) -> None:
         self.config = config or heritage_config
-        self.session = session or requests.Session()
+        self._session = session
+        self._thread_sessions = threading.local()
         self._tool_client = tool_client
 
+    @property
+    def session(self) -> requests.Session:
+        """The injected session, or a `requests.Session` owned by the calling thread."""
+        if self._session is not None:
+            return self._session
+        session = getattr(self._thread_sessions, "session", None)
+        if session is None:
+            session = requests.Session()
+            self._thread_sessions.session = session
+        return session
+
     def _build_url(self, script_name: str, params: Mapping[str, str] | None = None) -> str:
         base_url = self.config.base_url.rstrip("/")
         cgi_path = self.config.cgi_path.rstrip("/") + "/"
@@ -107,7 +120,7 @@ class HeritageHTTPClient:
         if text is None:
             return []
 
-        soup = BeautifulSoup(text, "html.parser")
+        soup = make_soup(text)
         matches: list[SktSearchMatch] = []
 
         for link in soup.find_all("a", href=True):
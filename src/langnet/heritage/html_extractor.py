@@ -4,7 +4,9 @@ import re
 from dataclasses import dataclass
 from typing import TypedDict, cast
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
+
+from langnet.parsing.html_soup import make_soup
 
 """
 Lightweight Heritage HTML extractor.
@@ -58,7 +60,7 @@ class HeritageHTMLExtractor:
     ]
 
     def extract(self, html: str) -> list[MorphologySolution]:
-        soup = BeautifulSoup(html, "html.parser")
+        soup = make_soup(html)
         solutions = self._extract_solution_blocks(soup)
         if solutions:
             return solutions
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import re
 
-from bs4 import BeautifulSoup
 from bs4.element import Tag
 
 from langnet.heritage.client import SktSearchMatch
+from langnet.parsing.html_soup import make_soup
 
 
 def parse_user_feedback(html: str) -> list[SktSearchMatch]:
@@ -15,7 +15,7 @@ def parse_user_feedback(html: str) -> list[SktSearchMatch]:
     The feedback page lists radio inputs named ``guess`` with values like
     ``{vi.s.nu},{n.}`` and nearby anchors pointing to dictionary entries.
     """
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     matches: list[SktSearchMatch] = []
     seen: set[tuple[str, str]] = set()
     for input_el in soup.find_all("input", attrs={"name": "guess"}):
@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import importlib
 import logging
+import os
 import re
+import threading
+import time
 from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from types import ModuleType
 from typing import Protocol, cast
@@ -35,6 +39,8 @@ MAX_ASCII_CODE = 127
 DEVANAGARI_UNICODE_START = 0x0900
 DEVANAGARI_UNICODE_END = 0x097F
 ASCII_FINAL_VOWEL_COMPLETION_MIN_LENGTH = 4
+HERITAGE_PROBE_WORKERS_ENV = "LANGNET_HERITAGE_PROBE_WORKERS"
+DEFAULT_HERITAGE_PROBE_WORKERS = 4
 
 
 class HeritageClientProtocol(Protocol):
@@ -60,6 +66,21 @@ class SktSearchMatch:
     entry_url: str
 
 
+@dataclass(frozen=True)
+class HeritageProbe:
+    query: str
+    matches: list[SktSearchMatch]
+
+
+def heritage_probe_workers() -> int:
+    """Concurrent sktsearch probes per query; `1` restores one-at-a-time probing."""
+    raw = os.getenv(HERITAGE_PROBE_WORKERS_ENV, "")
+    try:
+        return max(1, int(raw)) if raw else DEFAULT_HERITAGE_PROBE_WORKERS
+    except ValueError:
+        return DEFAULT_HERITAGE_PROBE_WORKERS
+
+
 class HeritageCanonicalizer:
     """
     Thin wrapper for Heritage lookups. It is intentionally dumb: callers inject
@@ -68,6 +89,42 @@ class HeritageCanonicalizer:
 
     def __init__(self, client: HeritageClientProtocol | None = None) -> None:
         self.client = client
+        self._pool: ThreadPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    def probe_all_matches(self, queries: Sequence[str]) -> list[HeritageProbe]:
+        """
+        Run independent sktsearch probes, concurrently when allowed.
+
+        Probes run on one pool kept for the canonicalizer's lifetime. Results
+        come back in `queries` order, so callers rank exactly as if they had
+        probed in turn.
+        """
+        workers = min(len(queries), heritage_probe_workers())
+        if workers <= 1 or self.client is None:
+            return [self._timed_all_matches(query) for query in queries]
+        return list(self._probe_pool().map(self._timed_all_matches, queries))
+
+    def _probe_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(
+                    max_workers=heritage_probe_workers(), thread_name_prefix="heritage-probe"
+                )
+            return self._pool
+
+    def _timed_all_matches(self, query: str) -> HeritageProbe:
+        started = time.perf_counter()
+        matches = self.all_matches(query)
+        logger.debug(
+            "heritage_probe",
+            extra={
+                "query": query,
+                "hit": bool(matches),
+                "elapsed_ms": round((time.perf_counter() - started) * 1000, 3),
+            },
+        )
+        return HeritageProbe(query=query, matches=matches)
 
     def all_matches(self, text: str) -> list[SktSearchMatch]:
         if self.client is None:
@@ -369,15 +426,14 @@ class SanskritNormalizer(LanguageNormalizer):
         if not heritage_query:
             return []
 
-        matches = self.heritage.all_matches(heritage_query)
-        if encoding in {ENC_ASCII, ENC_HK, ENC_SLP1}:
-            matches.extend(
-                self._final_vowel_completion_matches(
-                    stripped,
-                    heritage_query,
-                    steps,
-                )
-            )
+        completion_queries = (
+            self._final_vowel_completion_queries(stripped, heritage_query)
+            if encoding in {ENC_ASCII, ENC_HK, ENC_SLP1}
+            else []
+        )
+        probes = self.heritage.probe_all_matches([heritage_query, *completion_queries])
+        matches = list(probes[0].matches)
+        matches.extend(self._final_vowel_completion_matches(stripped, probes[1:], steps))
         if not matches:
             return []
 
@@ -470,7 +526,9 @@ class SanskritNormalizer(LanguageNormalizer):
         """
         variants = self._heuristic_ascii_variants(text)
         candidates: list[CanonicalCandidate] = []
-        for variant in variants:
+        probed: dict[str, HeritageProbe] = {}
+        wave_size = 1
+        for index, variant in enumerate(variants):
             vel = to_heritage_velthuis(variant).lower()
             heritage_query = self._strip_to_alpha(vel)
             steps.append(
@@ -483,7 +541,13 @@ class SanskritNormalizer(LanguageNormalizer):
             )
             if not heritage_query:
                 continue
-            matches = self.heritage.all_matches(heritage_query)
+            if heritage_query not in probed:
+                # Probe this variant and, after earlier misses, the next few with it;
+                # the walk below still stops at the first variant that hits, as the
+                # one-at-a-time loop did. Waves start at one probe and double.
+                self._probe_variant_wave(variants[index:], probed, wave_size)
+                wave_size = min(wave_size * 2, heritage_probe_workers())
+            matches = list(probed[heritage_query].matches)
             if not matches:
                 steps.append(
                     NormalizationStep(
@@ -523,6 +587,22 @@ class SanskritNormalizer(LanguageNormalizer):
             candidates.extend(self._local_reader_ascii_variant_candidates(text, variants, steps))
         return candidates
 
+    def _probe_variant_wave(
+        self,
+        variants: Sequence[str],
+        probed: dict[str, HeritageProbe],
+        wave_size: int,
+    ) -> None:
+        wave: list[str] = []
+        for variant in variants:
+            heritage_query = self._strip_to_alpha(to_heritage_velthuis(variant).lower())
+            if heritage_query and heritage_query not in probed and heritage_query not in wave:
+                wave.append(heritage_query)
+            if len(wave) >= wave_size:
+                break
+        probes = self.heritage.probe_all_matches(wave)
+        probed.update((probe.query, probe) for probe in probes)
+
     def _local_reader_ascii_variant_candidates(
         self,
         original_text: str,
@@ -546,14 +626,9 @@ class SanskritNormalizer(LanguageNormalizer):
             break
         return candidates
 
-    def _final_vowel_completion_matches(
-        self,
-        original_text: str,
-        heritage_query: str,
-        steps: list[NormalizationStep],
-    ) -> list[SktSearchMatch]:
+    def _final_vowel_completion_queries(self, original_text: str, heritage_query: str) -> list[str]:
         """
-        Add bounded Sanskrit final-vowel completions for reader-style truncated ASCII.
+        Bounded Sanskrit final-vowel completions for reader-style truncated ASCII.
 
         This catches common searches like ``karun`` where the user is aiming for
         ``karuṇa``/``karuṇā`` but Heritage's bare ``sktsearch`` prefers ``karin``.
@@ -566,10 +641,18 @@ class SanskritNormalizer(LanguageNormalizer):
             or raw[-1] in "aeiou"
         ):
             return []
+        return [f"{heritage_query}a", f"{heritage_query}aa"]
+
+    def _final_vowel_completion_matches(
+        self,
+        original_text: str,
+        probes: Sequence[HeritageProbe],
+        steps: list[NormalizationStep],
+    ) -> list[SktSearchMatch]:
         matches: list[SktSearchMatch] = []
-        seen = {(match.canonical, match.display) for match in matches}
-        for query in (f"{heritage_query}a", f"{heritage_query}aa"):
-            for match in self.heritage.all_matches(query):
+        seen: set[tuple[str, str]] = set()
+        for probe in probes:
+            for match in probe.matches:
                 key = (match.canonical, match.display)
                 if key in seen:
                     continue
@@ -580,7 +663,7 @@ class SanskritNormalizer(LanguageNormalizer):
                     NormalizationStep(
                         operation="heritage_final_vowel_completion",
                         input=original_text,
-                        output=query,
+                        output=probe.query,
                         tool="heritage_sktsearch",
                     )
                 )
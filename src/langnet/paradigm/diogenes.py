@@ -4,10 +4,11 @@ import re
 from collections.abc import Sequence
 from typing import cast
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from langnet.paradigm.grammar import FeatureValue, FetchableParadigmKind, LanguageCode
 from langnet.paradigm.models import ParadigmBlock, ParadigmForm, ParadigmPayload, ParadigmSlot
+from langnet.parsing.html_soup import make_soup
 
 CASE_MAP = {
     "nom": "nominative",
@@ -73,7 +74,7 @@ def parse_diogenes_inflect_html(
     kind: FetchableParadigmKind,
     request_url: str | None = None,
 ) -> ParadigmPayload:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     slots = [_slot_from_span(span) for span in soup.select("span.form_span_visible")]
     return ParadigmPayload(
         language=language,
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
-from bs4 import BeautifulSoup, Tag
+from bs4 import Tag
 
 from langnet.paradigm.models import ParadigmBlock, ParadigmForm, ParadigmPayload, ParadigmSlot
+from langnet.parsing.html_soup import make_soup
 
 CASE_LABELS = {
     "nominative": "nominative",
@@ -57,7 +58,7 @@ def parse_heritage_declension_html(
     gender: str,
     request_url: str | None = None,
 ) -> ParadigmPayload:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     table = soup.select_one("table.inflexion")
     warnings: list[str] = []
     if table is None:
@@ -93,7 +94,7 @@ def parse_heritage_conjugation_html(
     present_class: str,
     request_url: str | None = None,
 ) -> ParadigmPayload:
-    soup = BeautifulSoup(html, "html.parser")
+    soup = make_soup(html)
     tables = soup.select("table.inflexion")
     warnings: list[str] = []
     blocks = [_conjugation_block(table, index) for index, table in enumerate(tables, start=1)]
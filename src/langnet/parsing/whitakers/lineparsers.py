@@ -1,22 +1,83 @@
-"""Lark reducers for Whitaker's Words line-oriented output."""
+"""
+Lark reducers for Whitaker's Words line-oriented output.
+
+Each reducer first tries an LALR parser, which is compiled once and pickled
+under the langnet cache directory, and falls back to the original Earley
+grammar for lines the LALR grammar rejects. Whitaker output repeats the same
+code and sense lines across forms, so `reduce` results are memoized per raw
+line; callers get a fresh copy they are free to mutate.
+"""
 
 from __future__ import annotations
 
+import copy
 import re
+import threading
 from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
 from typing import cast
 
 from lark import Lark, Transformer, Tree
+from lark.exceptions import LarkError
 from lark.visitors import Discard
 
+from langnet.databuild.paths import cache_dir
+
 _GRAMMAR_DIR = Path(__file__).parent / "grammars"
 
+LINE_MEMO_SIZE = 4096
+
 
 def _grammar(name: str) -> str:
     return (_GRAMMAR_DIR / name).read_text(encoding="utf-8")
 
 
+def _lalr_cache(name: str) -> str | bool:
+    """Pickled LALR tables live in the cache dir; Lark checks the grammar hash on load."""
+    try:
+        directory = cache_dir() / "lark"
+        directory.mkdir(exist_ok=True)
+    except OSError:
+        return True
+    return str(directory / f"whitakers_{Path(name).stem}.lark")
+
+
+class LineParser:
+    """LALR parser for the common line shapes, backed by the Earley grammar."""
+
+    def __init__(self, grammar: str, lalr_grammar: str | None = None) -> None:
+        self.grammar = grammar
+        self.lalr_grammar = lalr_grammar or grammar
+        self._lalr: Lark | None = None
+        self._earley: Lark | None = None
+        self._lock = threading.Lock()
+
+    def parse(self, line: str) -> Tree:
+        try:
+            return self._lalr_parser().parse(line)
+        except LarkError:
+            return self._earley_parser().parse(line)
+
+    def _lalr_parser(self) -> Lark:
+        if self._lalr is None:
+            with self._lock:
+                if self._lalr is None:
+                    self._lalr = Lark(
+                        _grammar(self.lalr_grammar),
+                        parser="lalr",
+                        cache=_lalr_cache(self.lalr_grammar),
+                    )
+        return self._lalr
+
+    def _earley_parser(self) -> Lark:
+        if self._earley is None:
+            with self._lock:
+                if self._earley is None:
+                    self._earley = Lark(_grammar(self.grammar))
+        return self._earley
+
+
 class SenseTransformer(Transformer):
     """Transform Whitaker semicolon-separated sense lines."""
 
@@ -61,13 +122,18 @@ class SenseTransformer(Transformer):
 class SensesReducer:
     """Parse Whitaker sense lines."""
 
-    parser = Lark(_grammar("senses.ebnf"))
+    parser = LineParser("senses.ebnf")
     xformer = SenseTransformer()
 
     @staticmethod
     def reduce(line: str) -> dict[str, object]:
-        tree = SensesReducer.parser.parse(line)
-        return cast(dict[str, object], SensesReducer.xformer.transform(tree))
+        return copy.deepcopy(_reduce_sense_line(line))
+
+
+@lru_cache(maxsize=LINE_MEMO_SIZE)
+def _reduce_sense_line(line: str) -> dict[str, object]:
+    tree = SensesReducer.parser.parse(line)
+    return cast(dict[str, object], SensesReducer.xformer.transform(tree))
 
 
 class CodesTransformer(Transformer):
@@ -165,13 +231,18 @@ class CodesTransformer(Transformer):
 class CodesReducer:
     """Parse Whitaker dictionary codelines."""
 
-    parser = Lark(_grammar("term_codes.ebnf"))
+    parser = LineParser("term_codes.ebnf", "term_codes_lalr.ebnf")
     xformer = CodesTransformer()
 
     @staticmethod
     def reduce(line: str) -> dict[str, object]:
-        tree = CodesReducer.parser.parse(line)
-        return cast(dict[str, object], CodesReducer.xformer.transform(tree))
+        return copy.deepcopy(_reduce_code_line(line))
+
+
+@lru_cache(maxsize=LINE_MEMO_SIZE)
+def _reduce_code_line(line: str) -> dict[str, object]:
+    tree = CodesReducer.parser.parse(line)
+    return cast(dict[str, object], CodesReducer.xformer.transform(tree))
 
 
 class FactsTransformer(Transformer):
@@ -288,10 +359,15 @@ class FactsTransformer(Transformer):
 class FactsReducer:
     """Parse Whitaker morphology fact lines."""
 
-    parser = Lark(_grammar("term_facts.ebnf"))
+    parser = LineParser("term_facts.ebnf", "term_facts_lalr.ebnf")
     xformer = FactsTransformer()
 
     @staticmethod
     def reduce(line: str) -> dict[str, object]:
-        tree = FactsReducer.parser.parse(line)
-        return cast(dict[str, object], FactsReducer.xformer.transform(tree))
+        return copy.deepcopy(_reduce_facts_line(line))
+
+
+@lru_cache(maxsize=LINE_MEMO_SIZE)
+def _reduce_facts_line(line: str) -> dict[str, object]:
+    tree = FactsReducer.parser.parse(line)
+    return cast(dict[str, object], FactsReducer.xformer.transform(tree))
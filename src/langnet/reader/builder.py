@@ -357,6 +357,7 @@ class ReaderBuilder:
             pending_book.book_path,
             segments=pending_book.segments,
             addresses=pending_book.addresses,
+            catalog_path=self.catalog_path,
         )
         for source in pending_book.sources:
             artifact = self._artifact(source, pending_book.book_path)
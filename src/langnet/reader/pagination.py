@@ -0,0 +1,58 @@
+"""
+Opaque reader pagination cursors.
+
+A cursor is either a plain offset (`"50"`, what older responses returned) or a
+keyset cursor, `"k1."` followed by base64url JSON holding the offset and the
+sort tuple of the last row on the page. Storage seeks past that tuple instead
+of scanning `OFFSET` rows, so page N costs about the same as page 1. The offset
+rides along for `prev_cursor` and for listings that cannot seek.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+
+KEYSET_CURSOR_PREFIX = "k1."
+
+
+@dataclass(frozen=True)
+class ReaderCursor:
+    offset: int = 0
+    after: tuple[Any, ...] | None = None
+
+
+def encode_reader_cursor(offset: int, after: Sequence[Any] | None = None) -> str:
+    if after is None:
+        return str(offset)
+    body = orjson.dumps({"o": offset, "k": list(after)})
+    return KEYSET_CURSOR_PREFIX + base64.urlsafe_b64encode(body).rstrip(b"=").decode("ascii")
+
+
+def decode_reader_cursor(cursor: str | None) -> ReaderCursor:
+    """Parse a cursor; anything unreadable starts from the first page."""
+    if cursor is None or cursor == "":
+        return ReaderCursor()
+    if not cursor.startswith(KEYSET_CURSOR_PREFIX):
+        try:
+            return ReaderCursor(offset=max(0, int(cursor)))
+        except ValueError:
+            return ReaderCursor()
+    encoded = cursor[len(KEYSET_CURSOR_PREFIX) :]
+    try:
+        data = orjson.loads(base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)))
+    except (binascii.Error, ValueError):
+        return ReaderCursor()
+    if not isinstance(data, dict):
+        return ReaderCursor()
+    offset = data.get("o")
+    after = data.get("k")
+    return ReaderCursor(
+        offset=max(0, offset) if isinstance(offset, int) else 0,
+        after=tuple(after) if isinstance(after, list) and after else None,
+    )
@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import hashlib
+import multiprocessing
+import os
 import re
 import shutil
-from collections import Counter
+import threading
+from collections import Counter, deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from functools import lru_cache
+from functools import lru_cache, partial
 from pathlib import Path
+from time import perf_counter
 from typing import Any
 
 import duckdb
+import orjson
 import polars as pl
 
 from langnet.normalizer.greek_transliterator import transliterate_variants
@@ -19,9 +28,12 @@ from langnet.reader.search_normalization import (
     normalize_query_for_search,
     normalize_segment_for_search,
 )
+from langnet.reader.storage import connect_reader_book
 
 SEARCH_INDEX_SCHEMA_VERSION = "langnet.reader_search_index.v1"
 SEARCH_RESULT_SCHEMA_VERSION = "langnet.reader_search.v1"
+SEARCH_INDEX_MANIFEST_SCHEMA_VERSION = "langnet.reader_search_index_manifest.v1"
+SEARCH_INDEX_MANIFEST_SUFFIX = ".manifest.json"
 LANCE_FTS_INDEX_OPTIONS = """
 base_tokenizer='simple',
 language='English',
@@ -32,8 +44,20 @@ ascii_folding=false,
 with_position=true,
 replace=true
 """
+LANCE_FTS_INDEX_COLUMNS = {
+    "search_text_idx": "search_text",
+    "search_text_folded_idx": "search_text_folded",
+    "token_text_idx": "token_text",
+}
+LANCE_DELETE_BATCH_SIZE = 500
+SEARCH_BUILD_INFLIGHT_PER_WORKER = 2
 LANCE_DATASET_SUFFIX = ".lance"
+LANCE_VERSIONS_DIR = "_versions"
 LANCE_SEARCH_FIELDS = {"search_text", "search_text_folded", "token_text", "display_text"}
+LANCE_FTS_FALLBACK_MAX_K_ENV = "LANGNET_READER_SEARCH_FALLBACK_MAX_K"
+DEFAULT_LANCE_FTS_FALLBACK_MAX_K = 200_000
+LANCE_FTS_FALLBACK_GROWTH = 4
+BOOK_CONTEXT_SORT_KEY_SPAN = 4
 READER_SEARCH_CONCEPT_ROOT = Path("data/curated/reader_search")
 TOKEN_RE = re.compile(r"\S+")
 SEARCH_INDEX_POLARS_SCHEMA = {
@@ -73,6 +97,10 @@ SEARCH_INDEX_POLARS_SCHEMA = {
     "source_artifact_hash": pl.String,
 }
 
+_StatusCacheKey = tuple[tuple[int, ...], tuple[int, ...] | None]
+_STATUS_CACHE: dict[str, tuple[_StatusCacheKey, dict[str, Any]]] = {}
+_STATUS_CACHE_LOCK = threading.Lock()
+
 
 def build_reader_search_index(  # noqa: PLR0913
     catalog_path: Path,
@@ -81,9 +109,28 @@ def build_reader_search_index(  # noqa: PLR0913
     language: str | None = None,
     collection_id: str | None = None,
     replace: bool = False,
+    incremental: bool = False,
     batch_size: int = 50000,
     limit: int | None = None,
+    workers: int = 1,
 ) -> dict[str, Any]:
+    """
+    Normalize catalog segments into the Lance search dataset.
+
+    With `workers > 1`, artifacts are read and normalized in a process pool and
+    a single writer appends the resulting frames to Lance in catalog order.
+
+    `incremental` compares catalog `artifacts.source_hash` with the
+    `source_artifact_hash` already indexed for the same language/collection
+    slice, deletes rows for changed or removed artifacts, appends only the
+    changed artifacts, and refreshes the FTS indexes over the new fragments.
+    It cannot be combined with `limit`, since a truncated artifact would be
+    indexed under its full source hash and never picked up again.
+    """
+    if replace and incremental:
+        raise ValueError("replace and incremental search index builds are exclusive")
+    if incremental and limit is not None:
+        raise ValueError("incremental search index builds cannot be limited")
     dataset_path = _lance_dataset_path(index_path)
     if replace and dataset_path.exists():
         shutil.rmtree(dataset_path)
@@ -97,52 +144,346 @@ def build_reader_search_index(  # noqa: PLR0913
         "language_counts": {},
         "normalizer_version": NORMALIZER_VERSION,
         "replaced": replace,
+        "incremental": incremental,
         "fts_indexed": False,
     }
-    seen_works: set[str] = set()
-    language_counts: Counter[str] = Counter()
+    started = perf_counter()
     with duckdb.connect(":memory:") as conn:
         _load_lance(conn)
-        segment_rows: list[dict[str, Any]] = []
-        wrote_dataset = dataset_path.exists()
-        wrote_rows = False
-        for artifact in _catalog_artifact_rows(
+        artifacts = _catalog_artifact_rows(
             catalog_path,
             language=language,
             collection_id=collection_id,
-        ):
-            if limit is not None and summary["segment_count"] >= limit:
-                break
-            book_path = Path(str(artifact["artifact_path"]))
-            if not book_path.exists():
-                continue
-            for segment in _book_segment_rows(book_path, work_id=str(artifact["work_id"])):
-                if limit is not None and summary["segment_count"] >= limit:
-                    break
-                search_row = _search_row(catalog_path, artifact, segment, indexed_at=indexed_at)
-                segment_rows.append(search_row)
-                summary["segment_count"] += 1
-                seen_works.add(str(search_row["work_id"]))
-                language_counts.update([str(search_row["language"])])
-                if len(segment_rows) >= batch_size:
-                    _write_lance_rows(conn, dataset_path, segment_rows, append=wrote_dataset)
-                    wrote_dataset = True
-                    wrote_rows = True
-                    segment_rows.clear()
-        if segment_rows:
-            _write_lance_rows(conn, dataset_path, segment_rows, append=wrote_dataset)
-            wrote_dataset = True
-            wrote_rows = True
-        if not wrote_dataset and not wrote_rows:
+        )
+        existing_indexes: set[str] = set()
+        if incremental and dataset_path.exists():
+            existing_indexes = set(_lance_index_names(conn, dataset_path))
+            artifacts, changes = _apply_incremental_artifact_changes(
+                conn,
+                dataset_path,
+                artifacts,
+                language=language,
+                collection_id=collection_id,
+            )
+            summary.update(changes)
+        written = _write_normalized_artifacts(
+            conn,
+            dataset_path,
+            _normalized_artifacts(
+                artifacts,
+                catalog_path=catalog_path,
+                indexed_at=indexed_at,
+                limit=limit,
+                workers=workers,
+            ),
+            batch_size=batch_size,
+            limit=limit,
+        )
+        if not dataset_path.exists():
             _write_empty_lance_dataset(conn, dataset_path)
-        _create_lance_fts_indexes(conn, dataset_path)
-        summary["fts_indexed"] = True
-    summary["work_count"] = len(seen_works)
-    summary["language_counts"] = dict(sorted(language_counts.items()))
+        index_started = perf_counter()
+        summary.update(
+            _index_search_dataset(
+                conn,
+                dataset_path,
+                catalog_path=catalog_path,
+                existing_indexes=existing_indexes,
+                dataset_changed=written.segment_count > 0 or bool(summary.get("rows_deleted")),
+            )
+        )
+        written.index_seconds = perf_counter() - index_started
+    summary["segment_count"] = written.segment_count
+    summary["work_count"] = len(written.work_ids)
+    summary["language_counts"] = dict(sorted(written.language_counts.items()))
+    summary["throughput"] = written.throughput(workers=workers, started=started)
     return summary
 
 
+@dataclass(slots=True)
+class _NormalizedArtifact:
+    frame: pl.DataFrame | None
+    work_id: str
+    read_seconds: float
+    normalize_seconds: float
+
+
+@dataclass(slots=True)
+class _SearchWriteStats:
+    segment_count: int = 0
+    work_ids: set[str] = field(default_factory=set)
+    language_counts: Counter[str] = field(default_factory=Counter)
+    read_seconds: float = 0.0
+    normalize_seconds: float = 0.0
+    write_seconds: float = 0.0
+    index_seconds: float = 0.0
+
+    def throughput(self, *, workers: int, started: float) -> dict[str, Any]:
+        elapsed = perf_counter() - started
+
+        def stage(seconds: float) -> dict[str, float | None]:
+            return {
+                "seconds": round(seconds, 3),
+                "segments_per_second": (
+                    round(self.segment_count / seconds, 1) if seconds > 0 else None
+                ),
+            }
+
+        return {
+            "workers": workers,
+            "elapsed_seconds": round(elapsed, 3),
+            "segments_per_second": round(self.segment_count / elapsed, 1) if elapsed > 0 else None,
+            "stages": {
+                "read": stage(self.read_seconds),
+                "normalize": stage(self.normalize_seconds),
+                "write": stage(self.write_seconds),
+                "index": {"seconds": round(self.index_seconds, 3)},
+            },
+        }
+
+
+def _normalize_artifact(
+    artifact: dict[str, Any],
+    *,
+    catalog_path: Path,
+    indexed_at: str,
+    limit: int | None,
+) -> _NormalizedArtifact:
+    work_id = str(artifact["work_id"])
+    started = perf_counter()
+    book_path = Path(str(artifact["artifact_path"]))
+    if not book_path.exists():
+        return _NormalizedArtifact(None, work_id, perf_counter() - started, 0.0)
+    segments = _book_segment_rows(book_path, work_id=work_id)
+    if limit is not None:
+        segments = segments[:limit]
+    read_done = perf_counter()
+    rows = [
+        _search_row(catalog_path, artifact, segment, indexed_at=indexed_at) for segment in segments
+    ]
+    frame = pl.DataFrame(rows, schema=SEARCH_INDEX_POLARS_SCHEMA) if rows else None
+    return _NormalizedArtifact(frame, work_id, read_done - started, perf_counter() - read_done)
+
+
+def _normalized_artifacts(
+    artifacts: list[dict[str, Any]],
+    *,
+    catalog_path: Path,
+    indexed_at: str,
+    limit: int | None,
+    workers: int,
+) -> Iterator[_NormalizedArtifact]:
+    task = partial(
+        _normalize_artifact, catalog_path=catalog_path, indexed_at=indexed_at, limit=limit
+    )
+    if workers <= 1:
+        yield from map(task, artifacts)
+        return
+    # Keep a bounded window of artifacts in flight and yield them in catalog
+    # order, so memory stays flat and the dataset layout matches serial builds.
+    # Workers are spawned rather than forked: the caller already holds a DuckDB
+    # connection with the Lance extension loaded, and its threads and locks
+    # must not be copied into the children.
+    pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+    pending: deque[Future[_NormalizedArtifact]] = deque()
+    remaining = limit
+    try:
+        for artifact in artifacts:
+            if remaining is not None and remaining <= 0:
+                break
+            pending.append(pool.submit(task, artifact))
+            if len(pending) >= workers * SEARCH_BUILD_INFLIGHT_PER_WORKER:
+                result = pending.popleft().result()
+                remaining = _remaining_segments(remaining, result)
+                yield result
+        while pending and (remaining is None or remaining > 0):
+            result = pending.popleft().result()
+            remaining = _remaining_segments(remaining, result)
+            yield result
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _remaining_segments(remaining: int | None, result: _NormalizedArtifact) -> int | None:
+    if remaining is None or result.frame is None:
+        return remaining
+    return remaining - result.frame.height
+
+
+def _write_normalized_artifacts(
+    conn: duckdb.DuckDBPyConnection,
+    dataset_path: Path,
+    results: Iterator[_NormalizedArtifact],
+    *,
+    batch_size: int,
+    limit: int | None,
+) -> _SearchWriteStats:
+    stats = _SearchWriteStats()
+    buffered: list[pl.DataFrame] = []
+    buffered_rows = 0
+
+    def flush(frame: pl.DataFrame) -> None:
+        write_started = perf_counter()
+        _write_lance_frame(conn, dataset_path, frame, append=dataset_path.exists())
+        stats.write_seconds += perf_counter() - write_started
+
+    for result in results:
+        stats.read_seconds += result.read_seconds
+        stats.normalize_seconds += result.normalize_seconds
+        frame = result.frame
+        if frame is None:
+            continue
+        if limit is not None:
+            frame = frame.head(limit - stats.segment_count)
+        stats.segment_count += frame.height
+        stats.work_ids.add(result.work_id)
+        stats.language_counts.update(frame.get_column("language").to_list())
+        buffered.append(frame)
+        buffered_rows += frame.height
+        if buffered_rows >= batch_size:
+            combined = pl.concat(buffered)
+            offset = 0
+            while combined.height - offset >= batch_size:
+                flush(combined.slice(offset, batch_size))
+                offset += batch_size
+            buffered = [combined.slice(offset)] if offset < combined.height else []
+            buffered_rows = combined.height - offset
+        if limit is not None and stats.segment_count >= limit:
+            break
+    if buffered:
+        flush(pl.concat(buffered))
+    return stats
+
+
+def _index_search_dataset(
+    conn: duckdb.DuckDBPyConnection,
+    dataset_path: Path,
+    *,
+    catalog_path: Path,
+    existing_indexes: set[str],
+    dataset_changed: bool,
+) -> dict[str, Any]:
+    if existing_indexes >= set(LANCE_FTS_INDEX_COLUMNS):
+        if dataset_changed:
+            _optimize_lance_fts_indexes(dataset_path)
+    else:
+        _create_lance_fts_indexes(conn, dataset_path)
+    manifest = _write_search_index_manifest(
+        dataset_path,
+        _scan_search_index_status(conn, dataset_path),
+        catalog_path=catalog_path,
+    )
+    return {
+        "fts_indexed": True,
+        "manifest_path": str(_search_index_manifest_path(dataset_path)),
+        "index_segment_count": manifest["segment_count"],
+    }
+
+
+def _apply_incremental_artifact_changes(
+    conn: duckdb.DuckDBPyConnection,
+    dataset_path: Path,
+    artifacts: list[dict[str, Any]],
+    *,
+    language: str | None,
+    collection_id: str | None,
+) -> tuple[list[dict[str, Any]], dict[str, int]]:
+    indexed = _indexed_artifact_hashes(
+        conn,
+        dataset_path,
+        language=language,
+        collection_id=collection_id,
+    )
+    changed = [
+        artifact
+        for artifact in artifacts
+        if indexed.get(str(artifact["artifact_id"])) != str(artifact.get("source_hash") or "")
+    ]
+    catalog_ids = {str(artifact["artifact_id"]) for artifact in artifacts}
+    removed_ids = sorted(set(indexed) - catalog_ids)
+    stale_ids = sorted(
+        {str(artifact["artifact_id"]) for artifact in changed if artifact["artifact_id"] in indexed}
+        | set(removed_ids)
+    )
+    return changed, {
+        "artifacts_changed": len(changed),
+        "artifacts_unchanged": len(artifacts) - len(changed),
+        "artifacts_removed": len(removed_ids),
+        "rows_deleted": _delete_lance_artifact_rows(dataset_path, stale_ids),
+    }
+
+
+def _indexed_artifact_hashes(
+    conn: duckdb.DuckDBPyConnection,
+    dataset_path: Path,
+    *,
+    language: str | None,
+    collection_id: str | None,
+) -> dict[str, str]:
+    conditions: list[str] = []
+    params: list[object] = []
+    if language:
+        conditions.append("language = ?")
+        params.append(language)
+    if collection_id:
+        conditions.append("collection_id = ?")
+        params.append(collection_id)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    # Rows written by another normalizer or schema version count as changed.
+    return {
+        str(artifact_id): str(source_hash or "") if current else ""
+        for artifact_id, source_hash, current in conn.execute(
+            f"""
+            SELECT
+                artifact_id,
+                any_value(source_artifact_hash),
+                bool_and(normalizer_version = ? AND index_schema_version = ?)
+            FROM {_sql_literal(dataset_path)}
+            {where}
+            GROUP BY artifact_id
+            """,
+            [NORMALIZER_VERSION, SEARCH_INDEX_SCHEMA_VERSION, *params],
+        ).fetchall()
+    }
+
+
+def _delete_lance_artifact_rows(dataset_path: Path, artifact_ids: list[str]) -> int:
+    if not artifact_ids:
+        return 0
+    dataset = _open_lance_dataset(dataset_path)
+    deleted = 0
+    for start in range(0, len(artifact_ids), LANCE_DELETE_BATCH_SIZE):
+        batch = artifact_ids[start : start + LANCE_DELETE_BATCH_SIZE]
+        predicate = f"artifact_id IN ({', '.join(_sql_literal(value) for value in batch)})"
+        deleted += dataset.count_rows(filter=predicate)
+        dataset.delete(predicate)
+    return deleted
+
+
+def _optimize_lance_fts_indexes(dataset_path: Path) -> None:
+    dataset = _open_lance_dataset(dataset_path)
+    dataset.optimize.optimize_indices(index_names=list(LANCE_FTS_INDEX_COLUMNS))
+
+
+def _open_lance_dataset(dataset_path: Path) -> Any:
+    try:
+        import lance  # noqa: PLC0415
+    except ImportError as exc:
+        raise RuntimeError(
+            "Incremental reader search index builds require the pylance package; "
+            "reinstall langnet to pick up its dependencies."
+        ) from exc
+    return lance.dataset(str(dataset_path))
+
+
 def reader_search_index_status(index_path: Path) -> dict[str, Any]:
+    """
+    Describe the search index without scanning it when possible.
+
+    The manifest written by `build_reader_search_index` is trusted while the
+    Lance dataset's version directory is unchanged; otherwise the dataset is
+    scanned. Either result is cached in-process against the same signature, so
+    repeated word-context requests only pay a couple of `stat` calls.
+    """
     dataset_path = _lance_dataset_path(index_path)
     if not dataset_path.exists():
         return {
@@ -155,46 +496,179 @@ def reader_search_index_status(index_path: Path) -> dict[str, Any]:
             "normalizer_version": None,
             "fts_indexes": [],
         }
-    with duckdb.connect(":memory:") as conn:
-        _load_lance(conn)
-        dataset = _sql_literal(dataset_path)
-        language_counts = {
-            str(language): int(count)
-            for language, count in conn.execute(
-                f"""
-                SELECT language, count(*)
-                FROM {dataset}
-                GROUP BY language
-                ORDER BY language
-                """
-            ).fetchall()
-        }
-        row = conn.execute(
+    manifest_path = _search_index_manifest_path(dataset_path)
+    signature = _dataset_signature(dataset_path)
+    cache_key = (signature, _file_signature(manifest_path))
+    with _STATUS_CACHE_LOCK:
+        cached = _STATUS_CACHE.get(str(dataset_path))
+    if cached is not None and cached[0] == cache_key:
+        return _copy_status(cached[1])
+    status = _manifest_search_index_status(manifest_path, signature)
+    if status is None:
+        with duckdb.connect(":memory:") as conn:
+            _load_lance(conn)
+            status = _scan_search_index_status(conn, dataset_path)
+    with _STATUS_CACHE_LOCK:
+        _STATUS_CACHE[str(dataset_path)] = (cache_key, status)
+    return _copy_status(status)
+
+
+def clear_reader_search_index_status_cache() -> None:
+    with _STATUS_CACHE_LOCK:
+        _STATUS_CACHE.clear()
+
+
+def _copy_status(status: dict[str, Any]) -> dict[str, Any]:
+    return {
+        **status,
+        "language_counts": dict(status.get("language_counts") or {}),
+        "fts_indexes": list(status.get("fts_indexes") or []),
+    }
+
+
+def _scan_search_index_status(
+    conn: duckdb.DuckDBPyConnection, dataset_path: Path
+) -> dict[str, Any]:
+    dataset = _sql_literal(dataset_path)
+    language_counts = {
+        str(language): int(count)
+        for language, count in conn.execute(
             f"""
-            SELECT
-                any_value(index_schema_version),
-                any_value(normalizer_version),
-                any_value(catalog_path),
-                max(indexed_at)
+            SELECT language, count(*)
             FROM {dataset}
+            GROUP BY language
+            ORDER BY language
             """
-        ).fetchone()
-        assert row is not None
-        count_row = conn.execute(f"SELECT count(*) FROM {dataset}").fetchone()
-        assert count_row is not None
-        indexes = _lance_index_names(conn, dataset_path)
-        return {
-            "exists": True,
-            "backend": "duckdb-lance",
-            "dataset_path": str(dataset_path),
-            "segment_count": int(count_row[0]),
-            "language_counts": language_counts,
-            "schema_version": row[0],
-            "normalizer_version": row[1],
-            "catalog_path": row[2],
-            "indexed_at": row[3],
-            "fts_indexes": indexes,
-        }
+        ).fetchall()
+    }
+    row = conn.execute(
+        f"""
+        SELECT
+            any_value(index_schema_version),
+            any_value(normalizer_version),
+            any_value(catalog_path),
+            max(indexed_at),
+            count(DISTINCT work_id)
+        FROM {dataset}
+        """
+    ).fetchone()
+    assert row is not None
+    return {
+        "exists": True,
+        "backend": "duckdb-lance",
+        "dataset_path": str(dataset_path),
+        "segment_count": sum(language_counts.values()),
+        "work_count": int(row[4]),
+        "language_counts": language_counts,
+        "schema_version": row[0],
+        "normalizer_version": row[1],
+        "catalog_path": row[2],
+        "indexed_at": row[3],
+        "fts_indexes": _lance_index_names(conn, dataset_path),
+        "status_source": "scan",
+    }
+
+
+def _search_index_manifest_path(dataset_path: Path) -> Path:
+    return dataset_path.with_suffix(SEARCH_INDEX_MANIFEST_SUFFIX)
+
+
+def _file_signature(path: Path) -> tuple[int, ...] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+def _dataset_signature(dataset_path: Path) -> tuple[int, ...]:
+    # Every Lance write, including index creation, commits a new manifest under
+    # _versions, so its mtime moves with the dataset. A replaced dataset gets a
+    # new inode.
+    dataset_stat = dataset_path.stat()
+    versions_path = dataset_path / LANCE_VERSIONS_DIR
+    try:
+        versions_stat = versions_path.stat()
+    except OSError:
+        return (dataset_stat.st_ino, dataset_stat.st_mtime_ns)
+    return (
+        dataset_stat.st_ino,
+        dataset_stat.st_mtime_ns,
+        versions_stat.st_ino,
+        versions_stat.st_mtime_ns,
+    )
+
+
+def _manifest_search_index_status(
+    manifest_path: Path,
+    signature: tuple[int, ...],
+) -> dict[str, Any] | None:
+    try:
+        manifest = orjson.loads(manifest_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(manifest, dict):
+        return None
+    if manifest.get("schema_version") != SEARCH_INDEX_MANIFEST_SCHEMA_VERSION:
+        return None
+    if tuple(manifest.get("dataset_signature") or ()) != signature:
+        return None
+    return {
+        "exists": True,
+        "backend": "duckdb-lance",
+        "dataset_path": str(manifest.get("dataset_path") or ""),
+        "segment_count": int(manifest.get("segment_count") or 0),
+        "work_count": int(manifest.get("work_count") or 0),
+        "language_counts": dict(manifest.get("language_counts") or {}),
+        "schema_version": manifest.get("index_schema_version"),
+        "normalizer_version": manifest.get("normalizer_version"),
+        "catalog_path": manifest.get("catalog_path"),
+        "catalog_hash": manifest.get("catalog_hash"),
+        "indexed_at": manifest.get("indexed_at"),
+        "fts_indexes": list(manifest.get("fts_indexes") or []),
+        "status_source": "manifest",
+        "manifest_path": str(manifest_path),
+    }
+
+
+def _write_search_index_manifest(
+    dataset_path: Path,
+    status: dict[str, Any],
+    *,
+    catalog_path: Path,
+) -> dict[str, Any]:
+    manifest = {
+        "schema_version": SEARCH_INDEX_MANIFEST_SCHEMA_VERSION,
+        "dataset_path": str(dataset_path),
+        "dataset_signature": list(_dataset_signature(dataset_path)),
+        "segment_count": status["segment_count"],
+        "work_count": status.get("work_count", 0),
+        "language_counts": status["language_counts"],
+        "index_schema_version": status.get("schema_version"),
+        "normalizer_version": status.get("normalizer_version"),
+        "catalog_path": status.get("catalog_path") or str(catalog_path),
+        "catalog_hash": _catalog_artifact_hash(catalog_path),
+        "indexed_at": status.get("indexed_at"),
+        "fts_indexes": status.get("fts_indexes") or [],
+        "written_at": datetime.now(UTC).isoformat(),
+    }
+    manifest_path = _search_index_manifest_path(dataset_path)
+    tmp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+    tmp_path.replace(manifest_path)
+    return manifest
+
+
+def _catalog_artifact_hash(catalog_path: Path) -> str | None:
+    if not catalog_path.exists():
+        return None
+    digest = hashlib.sha256()
+    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+        for artifact_id, source_hash in conn.execute(
+            "SELECT artifact_id, source_hash FROM artifacts ORDER BY artifact_id"
+        ).fetchall():
+            digest.update(f"{artifact_id}\t{source_hash}\n".encode())
+    return digest.hexdigest()
 
 
 def validate_reader_search_index(catalog_path: Path, index_path: Path) -> dict[str, Any]:
@@ -225,8 +699,16 @@ def validate_reader_search_index(catalog_path: Path, index_path: Path) -> dict[s
                 "message": "Reader search index was built from a different catalog path.",
             }
         )
+    indexed_catalog_hash = status.get("catalog_hash")
+    if indexed_catalog_hash and indexed_catalog_hash != _catalog_artifact_hash(catalog_path):
+        issues.append(
+            {
+                "code": "catalog_changed",
+                "message": "Reader catalog artifacts changed since the search index was built.",
+            }
+        )
     index_names = set(status.get("fts_indexes") or [])
-    for required_index in ("search_text_idx", "search_text_folded_idx", "token_text_idx"):
+    for required_index in LANCE_FTS_INDEX_COLUMNS:
         if required_index not in index_names:
             issues.append(
                 {
@@ -253,10 +735,13 @@ def search_reader_segments(  # noqa: PLR0913
     context: int = 0,
     limit: int = 20,
     offset: int = 0,
+    fallback_max_k: int | None = None,
 ) -> dict[str, Any]:
     dataset_path = _lance_dataset_path(index_path)
     query_language = language or ""
     normalized = normalize_query_for_search(query_language, query)
+    max_k = fallback_max_k if fallback_max_k is not None else _fallback_max_k()
+    strategy_log: list[dict[str, Any]] = []
     if not dataset_path.exists():
         items: list[dict[str, Any]] = []
     else:
@@ -278,6 +763,8 @@ def search_reader_segments(  # noqa: PLR0913
                     field=field,
                     limit=limit,
                     offset=offset,
+                    fallback_max_k=max_k,
+                    strategy_log=strategy_log,
                 )
             else:
                 search_query = _search_query(normalized, search_field, mode)
@@ -294,6 +781,8 @@ def search_reader_segments(  # noqa: PLR0913
                     tag=tag,
                     limit=limit,
                     offset=offset,
+                    fallback_max_k=max_k,
+                    strategy_log=strategy_log,
                 )
             if context > 0:
                 _attach_context_windows(catalog_path, conn, dataset_path, items, context=context)
@@ -320,6 +809,7 @@ def search_reader_segments(  # noqa: PLR0913
             ),
         },
         "items": items,
+        "search_strategy": strategy_log,
         "pagination": {
             "next_cursor": str(offset + limit) if len(items) == limit else None,
             "prev_cursor": str(max(0, offset - limit)) if offset > 0 else None,
@@ -365,14 +855,13 @@ def _lance_dataset_path(index_path: Path) -> Path:
     )
 
 
-def _write_lance_rows(
+def _write_lance_frame(
     conn: duckdb.DuckDBPyConnection,
     dataset_path: Path,
-    rows: list[dict[str, Any]],
+    frame: pl.DataFrame,
     *,
     append: bool,
 ) -> None:
-    frame = pl.DataFrame(rows, schema=SEARCH_INDEX_POLARS_SCHEMA)
     conn.register("reader_search_rows", frame)
     mode = "append" if append else "overwrite"
     conn.execute(
@@ -437,11 +926,7 @@ def _write_empty_lance_dataset(conn: duckdb.DuckDBPyConnection, dataset_path: Pa
 
 
 def _create_lance_fts_indexes(conn: duckdb.DuckDBPyConnection, dataset_path: Path) -> None:
-    for index_name, column_name in (
-        ("search_text_idx", "search_text"),
-        ("search_text_folded_idx", "search_text_folded"),
-        ("token_text_idx", "token_text"),
-    ):
+    for index_name, column_name in LANCE_FTS_INDEX_COLUMNS.items():
         conn.execute(
             f"""
             CREATE INDEX {index_name}
@@ -494,7 +979,7 @@ def _catalog_artifact_rows(
 
 
 def _book_segment_rows(book_path: Path, *, work_id: str) -> list[dict[str, Any]]:
-    with duckdb.connect(str(book_path), read_only=True) as conn:
+    with connect_reader_book(book_path) as conn:
         return _dict_rows(
             conn,
             """
@@ -573,6 +1058,8 @@ def _lance_fts_search(  # noqa: PLR0913
     tag: str | None,
     limit: int,
     offset: int,
+    fallback_max_k: int = DEFAULT_LANCE_FTS_FALLBACK_MAX_K,
+    strategy_log: list[dict[str, Any]] | None = None,
 ) -> list[dict[str, Any]]:
     if not search_query:
         return []
@@ -586,19 +1073,17 @@ def _lance_fts_search(  # noqa: PLR0913
     )
     where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
     prefilter = bool(conditions)
-    rows = _lance_fts_rows(
-        conn,
-        dataset_path,
-        search_field,
-        search_query,
-        where=where,
-        params=params,
-        k=max(limit + offset, limit * 5, 50),
-        limit=limit,
-        offset=offset,
-        prefilter=prefilter,
-    )
-    if prefilter and not rows:
+    k = max(limit + offset, limit * 5, 50)
+    strategy: dict[str, Any] = {
+        "field": search_field,
+        "query": search_query,
+        "strategy": "prefilter" if prefilter else "unfiltered",
+        "k": k,
+        "attempts": 1,
+        "capped": False,
+    }
+    rows: list[dict[str, Any]] = []
+    try:
         rows = _lance_fts_rows(
             conn,
             dataset_path,
@@ -606,15 +1091,35 @@ def _lance_fts_search(  # noqa: PLR0913
             search_query,
             where=where,
             params=params,
-            k=_dataset_row_count(conn, dataset_path),
+            k=k,
+            limit=limit,
+            offset=offset,
+            prefilter=prefilter,
+        )
+    except duckdb.Error:
+        if not prefilter:
+            raise
+        strategy["prefilter_error"] = True
+    if prefilter and not rows:
+        rows = _expanding_postfilter_rows(
+            conn,
+            dataset_path,
+            search_field,
+            search_query,
+            where=where,
+            params=params,
+            start_k=k,
+            max_k=fallback_max_k,
             limit=limit,
             offset=offset,
-            prefilter=False,
+            strategy=strategy,
         )
+    if strategy_log is not None:
+        strategy_log.append(strategy)
     return [_result_item(row) for row in rows]
 
 
-def _lance_fts_rows(  # noqa: PLR0913
+def _expanding_postfilter_rows(  # noqa: PLR0913
     conn: duckdb.DuckDBPyConnection,
     dataset_path: Path,
     search_field: str,
@@ -622,55 +1127,144 @@ def _lance_fts_rows(  # noqa: PLR0913
     *,
     where: str,
     params: list[object],
-    k: int,
+    start_k: int,
+    max_k: int,
     limit: int,
     offset: int,
-    prefilter: bool,
+    strategy: dict[str, Any],
 ) -> list[dict[str, Any]]:
-    try:
-        return _dict_rows(
+    """
+    Retry an empty prefiltered search by filtering the global top-k instead.
+
+    `k` grows geometrically until a full page survives the filter, the
+    unfiltered search returns fewer than `k` hits (every match has been seen),
+    or `max_k` is reached. Any page that fills up is exact, because filtered
+    hits inside the global top-k are the best filtered hits overall; a capped
+    search is reported as such.
+    """
+    row_count = _dataset_row_count(dataset_path)
+    ceiling = min(row_count, max(max_k, start_k))
+    strategy["strategy"] = "postfilter_expand"
+    rows: list[dict[str, Any]] = []
+    if ceiling <= 0:
+        strategy["k"] = 0
+        return rows
+    k = min(start_k * LANCE_FTS_FALLBACK_GROWTH, ceiling)
+    while True:
+        rows, hit_count = _lance_fts_postfilter_page(
             conn,
-            f"""
+            dataset_path,
+            search_field,
+            search_query,
+            where=where,
+            params=params,
+            k=k,
+            limit=limit,
+            offset=offset,
+        )
+        strategy["attempts"] += 1
+        strategy["k"] = k
+        exhausted = hit_count < k
+        if len(rows) >= limit or exhausted or k >= ceiling:
+            break
+        k = min(k * LANCE_FTS_FALLBACK_GROWTH, ceiling)
+    strategy["capped"] = len(rows) < limit and not exhausted and k < row_count
+    return rows
+
+
+def _lance_fts_postfilter_page(  # noqa: PLR0913
+    conn: duckdb.DuckDBPyConnection,
+    dataset_path: Path,
+    search_field: str,
+    search_query: str,
+    *,
+    where: str,
+    params: list[object],
+    k: int,
+    limit: int,
+    offset: int,
+) -> tuple[list[dict[str, Any]], int]:
+    """Filter one unfiltered top-k page, returning it with the unfiltered hit count."""
+    rows = _dict_rows(
+        conn,
+        f"""
+        WITH hits AS MATERIALIZED (
             SELECT s.*, s._score AS score
             FROM lance_fts(
                 {_sql_literal(dataset_path)},
                 {_sql_literal(search_field)},
                 ?,
                 k = ?,
-                prefilter = {str(prefilter).lower()}
+                prefilter = false
             ) s
+        ),
+        page AS (
+            SELECT s.*
+            FROM hits s
             {where}
-            ORDER BY s._score DESC, s.language, s.title, s.sort_key
+            ORDER BY s.score DESC, s.language, s.title, s.sort_key
             LIMIT ? OFFSET ?
-            """,
-            [search_query, k, *params, limit, offset],
         )
-    except duckdb.Error:
-        if prefilter:
-            return _lance_fts_rows(
-                conn,
-                dataset_path,
-                search_field,
-                search_query,
-                where=where,
-                params=params,
-                k=_dataset_row_count(conn, dataset_path),
-                limit=limit,
-                offset=offset,
-                prefilter=False,
-            )
-        raise
+        SELECT (SELECT count(*) FROM hits) AS fts_hit_count, page.*
+        FROM (SELECT 1) AS anchor
+        LEFT JOIN page ON TRUE
+        ORDER BY page.score DESC, page.language, page.title, page.sort_key
+        """,
+        [search_query, k, *params, limit, offset],
+    )
+    hit_count = int(rows[0]["fts_hit_count"]) if rows else 0
+    page = []
+    for row in rows:
+        del row["fts_hit_count"]
+        if row.get("segment_id") is not None:
+            page.append(row)
+    return page, hit_count
 
 
-def _dataset_row_count(conn: duckdb.DuckDBPyConnection, dataset_path: Path) -> int:
-    row = conn.execute(
+def _lance_fts_rows(  # noqa: PLR0913
+    conn: duckdb.DuckDBPyConnection,
+    dataset_path: Path,
+    search_field: str,
+    search_query: str,
+    *,
+    where: str,
+    params: list[object],
+    k: int,
+    limit: int,
+    offset: int,
+    prefilter: bool,
+) -> list[dict[str, Any]]:
+    return _dict_rows(
+        conn,
         f"""
-        SELECT count(*)
-        FROM {_sql_literal(dataset_path)}
-        """
-    ).fetchone()
-    assert row is not None
-    return int(row[0])
+        SELECT s.*, s._score AS score
+        FROM lance_fts(
+            {_sql_literal(dataset_path)},
+            {_sql_literal(search_field)},
+            ?,
+            k = ?,
+            prefilter = {str(prefilter).lower()}
+        ) s
+        {where}
+        ORDER BY s._score DESC, s.language, s.title, s.sort_key
+        LIMIT ? OFFSET ?
+        """,
+        [search_query, k, *params, limit, offset],
+    )
+
+
+def _dataset_row_count(dataset_path: Path) -> int:
+    return int(reader_search_index_status(dataset_path).get("segment_count") or 0)
+
+
+def _fallback_max_k() -> int:
+    value = os.environ.get(LANCE_FTS_FALLBACK_MAX_K_ENV, "").strip()
+    if not value:
+        return DEFAULT_LANCE_FTS_FALLBACK_MAX_K
+    try:
+        return max(1, int(value))
+    except ValueError:
+        return DEFAULT_LANCE_FTS_FALLBACK_MAX_K
 
 
 def _fuzzy_lance_search(  # noqa: PLR0913
@@ -688,6 +1282,8 @@ def _fuzzy_lance_search(  # noqa: PLR0913
     field: str,
     limit: int,
     offset: int,
+    fallback_max_k: int = DEFAULT_LANCE_FTS_FALLBACK_MAX_K,
+    strategy_log: list[dict[str, Any]] | None = None,
 ) -> list[dict[str, Any]]:
     candidates = _reader_search_query_candidates(language, query, mode="fuzzy", field=field)
     target_count = limit + offset
@@ -707,6 +1303,8 @@ def _fuzzy_lance_search(  # noqa: PLR0913
             tag=tag,
             limit=target_count,
             offset=0,
+            fallback_max_k=fallback_max_k,
+            strategy_log=strategy_log,
         )
         for item in candidate_items:
             dedupe_key = _result_dedupe_key(item)
@@ -962,12 +1560,15 @@ def _attach_context_windows(
     context: int,
 ) -> None:
     artifact_paths = _context_artifact_paths(catalog_path, items)
+    items_by_book: dict[Path, list[dict[str, Any]]] = {}
     for item in items:
         artifact_path = artifact_paths.get(_context_artifact_key(item))
         if artifact_path is None:
             _attach_context(conn, dataset_path, item, context=context)
             continue
-        _attach_book_context(artifact_path, item, context=context)
+        items_by_book.setdefault(artifact_path, []).append(item)
+    for book_path, book_items in items_by_book.items():
+        _attach_book_context(book_path, book_items, context=context)
 
 
 def _context_artifact_paths(
@@ -1025,46 +1626,119 @@ def _resolve_artifact_path(catalog_path: Path, artifact_path: str) -> Path:
 
 def _attach_book_context(
     book_path: Path,
-    item: dict[str, Any],
+    items: list[dict[str, Any]],
     *,
     context: int,
 ) -> None:
-    if not book_path.exists():
+    """
+    Hydrate the context windows of every hit in one book with a single query.
+
+    Each hit only reads segments within `context * BOOK_CONTEXT_SORT_KEY_SPAN`
+    sort keys of its own, so the query never touches the rest of the work.
+    Rows tied with the hit's `sort_key` are excluded, as in a per-hit
+    `sort_key < ?` / `sort_key > ?` lookup. A hit left with a short side (near
+    the work's edges, or across a gap in sort keys) is re-read without the bound.
+    """
+    for item in items:
         item["context_before"] = []
         item["context_after"] = []
+    if not book_path.exists() or not items or context <= 0:
         return
+    with connect_reader_book(book_path) as book_conn:
+        for row in _book_context_window_rows(book_conn, items, context=context):
+            side = "context_before" if row["is_before"] else "context_after"
+            items[int(row["hit_index"])][side].append(_context_item(row))
+        for item in items:
+            if len(item["context_before"]) < context or len(item["context_after"]) < context:
+                _attach_book_context_by_sort_key(book_conn, item, context=context)
+
+
+def _book_context_window_rows(
+    book_conn: duckdb.DuckDBPyConnection,
+    items: list[dict[str, Any]],
+    *,
+    context: int,
+) -> list[dict[str, Any]]:
+    values = ", ".join("(?::INTEGER, ?::VARCHAR, ?::BIGINT)" for _ in items)
+    params: list[object] = []
+    for hit_index, item in enumerate(items):
+        params.extend([hit_index, str(item["work_id"]), int(item["sort_key"])])
+    span = context * BOOK_CONTEXT_SORT_KEY_SPAN
+    params.extend([span, span, context])
+    return _dict_rows(
+        book_conn,
+        f"""
+        WITH hits(hit_index, work_id, sort_key) AS (VALUES {values}),
+        nearby AS (
+            SELECT
+                h.hit_index, s.citation_path, s.text, s.sort_key,
+                s.sort_key < h.sort_key AS is_before
+            FROM hits h
+            JOIN segments s
+              ON s.work_id = h.work_id
+             AND s.sort_key BETWEEN h.sort_key - ? AND h.sort_key + ?
+             AND s.sort_key <> h.sort_key
+        ),
+        ranked AS (
+            SELECT
+                *,
+                CASE WHEN is_before
+                    THEN row_number() OVER (
+                        PARTITION BY hit_index, is_before
+                        ORDER BY sort_key DESC, citation_path DESC
+                    )
+                    ELSE row_number() OVER (
+                        PARTITION BY hit_index, is_before ORDER BY sort_key, citation_path
+                    )
+                END AS side_rank
+            FROM nearby
+        )
+        SELECT hit_index, citation_path, text, sort_key, is_before
+        FROM ranked
+        WHERE side_rank <= ?
+        ORDER BY hit_index, sort_key, citation_path
+        """,
+        params,
+    )
+
+
+def _attach_book_context_by_sort_key(
+    book_conn: duckdb.DuckDBPyConnection,
+    item: dict[str, Any],
+    *,
+    context: int,
+) -> None:
     params = [item["work_id"], item["sort_key"], context]
-    with duckdb.connect(str(book_path), read_only=True) as book_conn:
-        item["context_before"] = [
-            _context_item(row)
-            for row in reversed(
-                _dict_rows(
-                    book_conn,
-                    """
-                    SELECT citation_path, text, sort_key
-                    FROM segments
-                    WHERE work_id = ? AND sort_key < ?
-                    ORDER BY sort_key DESC
-                    LIMIT ?
-                    """,
-                    params,
-                )
-            )
-        ]
-        item["context_after"] = [
-            _context_item(row)
-            for row in _dict_rows(
+    item["context_before"] = [
+        _context_item(row)
+        for row in reversed(
+            _dict_rows(
                 book_conn,
                 """
                 SELECT citation_path, text, sort_key
                 FROM segments
-                WHERE work_id = ? AND sort_key > ?
-                ORDER BY sort_key
+                WHERE work_id = ? AND sort_key < ?
+                ORDER BY sort_key DESC, citation_path DESC
                 LIMIT ?
                 """,
                 params,
             )
-        ]
+        )
+    ]
+    item["context_after"] = [
+        _context_item(row)
+        for row in _dict_rows(
+            book_conn,
+            """
+            SELECT citation_path, text, sort_key
+            FROM segments
+            WHERE work_id = ? AND sort_key > ?
+            ORDER BY sort_key, citation_path
+            LIMIT ?
+            """,
+            params,
+        )
+    ]
 
 
 def _result_item(row: dict[str, Any]) -> dict[str, Any]:
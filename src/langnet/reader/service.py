@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import contextlib
 import csv
+import functools
 import re
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 from pathlib import Path
 from time import perf_counter
 from typing import Any
@@ -33,6 +35,7 @@ from langnet.reader.division_metadata import (
 from langnet.reader.metadata_attribution import load_metadata_attributions
 from langnet.reader.metadata_overlay import load_metadata_overlays
 from langnet.reader.models import ReaderMetadataOverlay, ReaderWorkMapNode
+from langnet.reader.pagination import decode_reader_cursor, encode_reader_cursor
 from langnet.reader.search_index import (
     build_reader_search_index,
     inspect_reader_search_query,
@@ -52,7 +55,9 @@ from langnet.reader.source_enrichment import (
     sync_dcs_corpus_metadata,
 )
 from langnet.reader.storage import (
+    CatalogSession,
     apply_metadata_overlays_to_catalog,
+    catalog_session,
     citation_maps_for_work,
     current_divisions_for_segment,
     get_work,
@@ -90,6 +95,7 @@ from langnet.reader.storage import (
     resolve_structure_reference,
     resolve_work_ref,
     segment_navigation,
+    source_index_sort_key,
     structure_for_work,
     work_map_for_work,
 )
@@ -142,16 +148,32 @@ _ROMAN_CITATION_VALUES = {
 MIN_CITATION_PARTS = 2
 
 
+def _catalog_scoped(method: Callable[..., dict[str, Any]]) -> Callable[..., dict[str, Any]]:
+    """Run a read-side `ReaderService` method inside one request-scoped catalog session."""
+
+    @functools.wraps(method)
+    def wrapper(self: ReaderService, *args: Any, **kwargs: Any) -> dict[str, Any]:
+        with catalog_session(self.catalog_path):
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class ReaderService:
     def __init__(self, catalog_path: Path) -> None:
         self.catalog_path = catalog_path
 
+    def catalog_session(self) -> contextlib.AbstractContextManager[CatalogSession]:
+        """Share one read-only catalog connection and lookup memo across several calls."""
+        return catalog_session(self.catalog_path)
+
     def collections_payload(self) -> dict[str, Any]:
         return self._payload("collections", list_collections(self.catalog_path))
 
     def collections(self) -> dict[str, Any]:
         return self.collections_payload()
 
+    @_catalog_scoped
     def authors_payload(  # noqa: PLR0913
         self,
         *,
@@ -199,6 +221,7 @@ class ReaderService:
             language=language,
         )
 
+    @_catalog_scoped
     def author_payload(
         self,
         author_ref: str,
@@ -281,6 +304,7 @@ class ReaderService:
             sort=sort,
         )
 
+    @_catalog_scoped
     def works_payload(  # noqa: PLR0913
         self,
         *,
@@ -525,6 +549,7 @@ class ReaderService:
             language=language,
         )
 
+    @_catalog_scoped
     def discovery_shelves_payload(
         self,
         *,
@@ -555,8 +580,10 @@ class ReaderService:
         language: str | None = None,
         collection_id: str | None = None,
         replace: bool = False,
+        incremental: bool = False,
         batch_size: int = 50000,
         limit: int | None = None,
+        workers: int = 1,
     ) -> dict[str, Any]:
         summary = build_reader_search_index(
             self.catalog_path,
@@ -564,8 +591,10 @@ class ReaderService:
             language=language,
             collection_id=collection_id,
             replace=replace,
+            incremental=incremental,
             batch_size=batch_size,
             limit=limit,
+            workers=workers,
         )
         return {
             "schema_version": READER_SCHEMA_VERSION,
@@ -576,8 +605,10 @@ class ReaderService:
                 "language": language,
                 "collection_id": collection_id,
                 "replace": replace,
+                "incremental": incremental,
                 "batch_size": batch_size,
                 "limit": limit,
+                "workers": workers,
             },
             "summary": summary,
         }
@@ -650,6 +681,7 @@ class ReaderService:
             ),
         }
 
+    @_catalog_scoped
     def search_payload(  # noqa: PLR0913
         self,
         *,
@@ -684,6 +716,7 @@ class ReaderService:
             offset=_cursor_offset(cursor),
         )
 
+    @_catalog_scoped
     def word_context_payload(  # noqa: PLR0913, PLR0915
         self,
         *,
@@ -921,6 +954,7 @@ class ReaderService:
             },
         }
 
+    @_catalog_scoped
     def contents_payload(  # noqa: PLR0913
         self,
         work_id: str,
@@ -932,7 +966,8 @@ class ReaderService:
         radius: int = 20,
         char_budget: int | None = None,
     ) -> dict[str, Any]:
-        offset = _cursor_offset(cursor)
+        page = decode_reader_cursor(cursor)
+        offset = page.offset
         fetch_limit = limit + 1 if around is None else limit
         items = list_segments_for_work(
             self.catalog_path,
@@ -942,6 +977,7 @@ class ReaderService:
             from_citation=from_citation,
             around=around,
             radius=radius,
+            after=page.after if around is None else None,
         )
         source_count = len(items)
         if around is None:
@@ -983,12 +1019,16 @@ class ReaderService:
                 offset=offset,
                 has_more=has_more,
                 next_offset=offset + len(items),
+                next_after=(items[-1].get("sort_key"), items[-1].get("citation_path"))
+                if items
+                else None,
             ),
         )
 
     def contents(self, work_id: str, *, limit: int = 50) -> dict[str, Any]:
         return self.contents_payload(work_id, limit=limit)
 
+    @_catalog_scoped
     def segment_payload(self, address: str) -> dict[str, Any]:
         resolved_address = address
         if " " in address.strip():
@@ -1023,6 +1063,7 @@ class ReaderService:
     def show(self, address: str) -> dict[str, Any]:
         return self.segment_payload(address)
 
+    @_catalog_scoped
     def show_work_segment(self, work_ref: str, citation_path: str) -> dict[str, Any]:
         segment = lookup_segment_by_work_and_citation(self.catalog_path, work_ref, citation_path)
         return {
@@ -1045,6 +1086,7 @@ class ReaderService:
             "navigation": segment_navigation(self.catalog_path, segment) if segment else None,
         }
 
+    @_catalog_scoped
     def work_payload(self, work_ref: str) -> dict[str, Any]:
         item = get_work(self.catalog_path, work_ref)
         if item is not None and item.get("work_kind") == "work":
@@ -1066,6 +1108,7 @@ class ReaderService:
             "item": item,
         }
 
+    @_catalog_scoped
     def map_payload(self, work_ref: str) -> dict[str, Any]:
         return self._payload(
             "map",
@@ -1073,6 +1116,7 @@ class ReaderService:
             work_ref=work_ref,
         )
 
+    @_catalog_scoped
     def structure_payload(self, work_ref: str) -> dict[str, Any]:
         items = structure_for_work(self.catalog_path, work_ref)
         top_level = [item for item in items if int(item.get("level") or 0) == 1]
@@ -1086,6 +1130,7 @@ class ReaderService:
         }
         return payload
 
+    @_catalog_scoped
     def work_dossier_payload(self, work_ref: str) -> dict[str, Any]:
         work = get_work(self.catalog_path, work_ref)
         items = structure_for_work(self.catalog_path, work_ref)
@@ -1111,6 +1156,7 @@ class ReaderService:
             "provenance_chips": _merge_provenance_chips(items),
         }
 
+    @_catalog_scoped
     def citation_maps_payload(
         self,
         work_ref: str,
@@ -1323,6 +1369,7 @@ class ReaderService:
             ],
         }
 
+    @_catalog_scoped
     def resolve_address(self, address: str) -> dict[str, Any]:  # noqa: C901, PLR0912
         resolved_address = address
         segment = None
@@ -1423,6 +1470,7 @@ class ReaderService:
     def aliases(self) -> dict[str, Any]:
         return self._payload("aliases", list_aliases(self.catalog_path))
 
+    @_catalog_scoped
     def source_index(  # noqa: PLR0913
         self,
         *,
@@ -1434,7 +1482,8 @@ class ReaderService:
         limit: int = 500,
         cursor: str | None = None,
     ) -> dict[str, Any]:
-        offset = _cursor_offset(cursor)
+        page = decode_reader_cursor(cursor)
+        offset = page.offset
         fetch_limit = limit + 1
         items = list_source_index(
             self.catalog_path,
@@ -1445,6 +1494,7 @@ class ReaderService:
             query=query,
             limit=fetch_limit,
             offset=offset,
+            after=page.after,
         )
         has_more = len(items) > limit
         items = items[:limit]
@@ -1463,6 +1513,7 @@ class ReaderService:
                 offset=offset,
                 has_more=has_more,
                 next_offset=offset + len(items),
+                next_after=source_index_sort_key(items[-1]) if items else None,
             ),
         )
 
@@ -1771,12 +1822,7 @@ def _roman_citation_to_int(value: str) -> int:
 
 
 def _cursor_offset(cursor: str | None) -> int:
-    if cursor is None or cursor == "":
-        return 0
-    try:
-        return max(0, int(cursor))
-    except ValueError:
-        return 0
+    return decode_reader_cursor(cursor).offset
 
 
 def _word_context_lexical_evidence(
@@ -1978,12 +2024,16 @@ def _pagination(
     offset: int,
     has_more: bool,
     next_offset: int | None = None,
+    next_after: Sequence[Any] | None = None,
 ) -> dict[str, Any] | None:
     if limit is None:
         return None
     previous_offset = max(0, offset - limit)
     return {
-        "next_cursor": str(next_offset if next_offset is not None else offset + limit)
+        "next_cursor": encode_reader_cursor(
+            next_offset if next_offset is not None else offset + limit,
+            next_after,
+        )
         if has_more
         else None,
         "prev_cursor": str(previous_offset) if offset > 0 else None,
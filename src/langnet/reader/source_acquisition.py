@@ -290,7 +290,12 @@ def import_pl_wikisource_catalog(config: PlWikisourceCatalogImportConfig) -> dic
             str(first.get("source_path") or item.get("source_path") or segments_path)
         )
         source_hash = _hash_paths([segments_path, source_path])
-        register_segment_rows(book_path, segments=reader_segments, addresses=addresses)
+        register_segment_rows(
+            book_path,
+            segments=reader_segments,
+            addresses=addresses,
+            catalog_path=config.catalog_path,
+        )
         work = ReaderWork(
             work_id=work_id,
             collection_id=config.collection_id,
@@ -551,7 +556,12 @@ def import_pg_pilot_catalog(config: PgPilotCatalogImportConfig) -> dict[str, Any
         )
         token_count = sum(_token_count(segment.text) for segment in reader_segments)
         source_hash = _hash_paths([segments_path] + source_paths)
-        register_segment_rows(book_path, segments=reader_segments, addresses=addresses)
+        register_segment_rows(
+            book_path,
+            segments=reader_segments,
+            addresses=addresses,
+            catalog_path=config.catalog_path,
+        )
         source_id_for_rows = f"{source_id}:{_safe_slug(title)}"
         work = ReaderWork(
             work_id=work_id,
@@ -804,7 +814,12 @@ def import_staged_jsonl_catalog(config: StagedJsonlCatalogImportConfig) -> dict[
     )
     token_count = sum(_token_count(segment.text) for segment in reader_segments)
     source_hash = _hash_paths(source_paths)
-    register_segment_rows(book_path, segments=reader_segments, addresses=addresses)
+    register_segment_rows(
+        book_path,
+        segments=reader_segments,
+        addresses=addresses,
+        catalog_path=config.catalog_path,
+    )
     register_book(
         config.catalog_path,
         ReaderWork(
@@ -1,10 +1,17 @@
 from __future__ import annotations
 
+import contextlib
+import contextvars
+import copy
+import functools
+import os
 import re
-from collections.abc import Iterable, Mapping, Sequence
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Any
+from typing import Any, ParamSpec, TypeVar
 
 import duckdb
 import polars as pl
@@ -50,6 +57,7 @@ from langnet.reader.models import (
     ReaderWorkMapNode,
     ReaderWorkRelation,
 )
+from langnet.storage.db import ReadOnlyConnectionPool, connect_duckdb_pooled
 
 ASCII_MAX_CODEPOINT = 127
 CATALOG_ENGLISH_WORDS = frozenset(
@@ -371,6 +379,20 @@ CREATE TABLE IF NOT EXISTS author_classifications (
     PRIMARY KEY (author_id, language)
 );
 
+CREATE TABLE IF NOT EXISTS address_index (
+    address VARCHAR NOT NULL,
+    artifact_path VARCHAR NOT NULL,
+    work_id VARCHAR NOT NULL,
+    segment_id VARCHAR NOT NULL,
+    address_kind VARCHAR NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS address_index_books (
+    artifact_path VARCHAR NOT NULL,
+    work_id VARCHAR NOT NULL,
+    address_count INTEGER NOT NULL
+);
+
 CREATE INDEX IF NOT EXISTS works_language_idx ON works(language);
 CREATE INDEX IF NOT EXISTS works_collection_idx ON works(collection_id);
 CREATE INDEX IF NOT EXISTS artifacts_work_idx ON artifacts(work_id);
@@ -396,6 +418,8 @@ CREATE INDEX IF NOT EXISTS division_metadata_work_idx ON division_metadata(work_
 CREATE INDEX IF NOT EXISTS citation_maps_work_idx ON citation_maps(work_id, source_id);
 CREATE INDEX IF NOT EXISTS citation_references_ref_idx ON citation_references(normalized_ref);
 CREATE INDEX IF NOT EXISTS citation_references_work_idx ON citation_references(work_id);
+CREATE INDEX IF NOT EXISTS address_index_address_idx ON address_index(address);
+CREATE INDEX IF NOT EXISTS address_index_book_idx ON address_index(artifact_path, work_id);
 CREATE INDEX IF NOT EXISTS work_classifications_work_idx ON work_classifications(work_id);
 CREATE INDEX IF NOT EXISTS work_classification_tags_tag_idx
     ON work_classification_tags(tag_id, work_id);
@@ -444,6 +468,9 @@ ROMAN_CITATION_RE = re.compile(r"[ivxlcdm]+", re.IGNORECASE)
 
 def _connect_write(path: Path) -> duckdb.DuckDBPyConnection:
     path.parent.mkdir(parents=True, exist_ok=True)
+    invalidate_catalog_snapshot(path)
+    # DuckDB refuses a read-write open while this process holds the file read-only.
+    READER_BOOK_POOL.release(path)
     return duckdb.connect(str(path), read_only=False)
 
 
@@ -451,6 +478,306 @@ def _connect_read(path: Path) -> duckdb.DuckDBPyConnection:
     return duckdb.connect(str(path), read_only=True)
 
 
+READER_BOOK_POOL_MAX_ENV = "LANGNET_READER_BOOK_POOL_MAX"
+DEFAULT_READER_BOOK_POOL_MAX_DATABASES = 16
+# Open file descriptors budgeted per pooled book (database file, WAL, temp files).
+READER_BOOK_POOL_FDS_PER_BOOK = 4
+READER_BOOK_POOL_FD_SHARE = 4
+
+
+def _reader_book_pool_max_databases() -> int:
+    raw = os.getenv(READER_BOOK_POOL_MAX_ENV)
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            pass
+    try:
+        import resource  # noqa: PLC0415
+
+        soft_limit, _hard_limit = resource.getrlimit(resource.RLIMIT_NOFILE)
+    except (ImportError, OSError, ValueError):
+        return DEFAULT_READER_BOOK_POOL_MAX_DATABASES
+    if soft_limit == resource.RLIM_INFINITY:
+        return DEFAULT_READER_BOOK_POOL_MAX_DATABASES
+    fd_bound = soft_limit // (READER_BOOK_POOL_FD_SHARE * READER_BOOK_POOL_FDS_PER_BOOK)
+    return max(1, min(DEFAULT_READER_BOOK_POOL_MAX_DATABASES, fd_bound))
+
+
+READER_BOOK_POOL = ReadOnlyConnectionPool(max_databases=_reader_book_pool_max_databases())
+
+
+def connect_reader_book(
+    book_path: Path,
+) -> contextlib.AbstractContextManager[duckdb.DuckDBPyConnection]:
+    """
+    Read-only connection to a reader book, from `READER_BOOK_POOL` when pooling is on.
+
+    Books are kept open least-recently-used first, up to a bound derived from
+    the process file-descriptor limit (or `LANGNET_READER_BOOK_POOL_MAX`), and
+    reopened when the file's inode, mtime, or size changes.
+    """
+    return connect_duckdb_pooled(book_path, pool=READER_BOOK_POOL)
+
+
+class CatalogSession:
+    """
+    Request-scoped read-only view of one reader catalog.
+
+    While a session is active (see `catalog_session`), catalog reads in this
+    module share one read-only connection, and work, artifact, alias,
+    contained-work, and structure lookups are memoized for the rest of the
+    request. Rendering a page of segments then costs a handful of catalog
+    queries instead of several connection opens per row.
+    """
+
+    def __init__(self, catalog_path: Path) -> None:
+        self.catalog_path = catalog_path
+        self._conn: duckdb.DuckDBPyConnection | None = None
+        self._memo: dict[tuple[str, Hashable], Any] = {}
+        self.connections_opened = 0
+        self.queries = 0
+        self.memo_hits = 0
+
+    @contextlib.contextmanager
+    def cursor(self) -> Iterator[duckdb.DuckDBPyConnection]:
+        if self._conn is None:
+            self._conn = _connect_read(self.catalog_path)
+            self.connections_opened += 1
+        self.queries += 1
+        cursor = self._conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+
+    def memo(self, kind: str, key: Hashable, load: Callable[[], Any]) -> Any:
+        memo_key = (kind, key)
+        if memo_key in self._memo:
+            self.memo_hits += 1
+            return self._memo[memo_key]
+        value = load()
+        self._memo[memo_key] = value
+        return value
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "connections_opened": self.connections_opened,
+            "queries": self.queries,
+            "memo_entries": len(self._memo),
+            "memo_hits": self.memo_hits,
+        }
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        self._memo.clear()
+
+
+_ACTIVE_CATALOG_SESSION: contextvars.ContextVar[CatalogSession | None] = contextvars.ContextVar(
+    "langnet_reader_catalog_session", default=None
+)
+
+
+@contextlib.contextmanager
+def catalog_session(catalog_path: Path) -> Iterator[CatalogSession]:
+    """Activate a `CatalogSession` for `catalog_path`, reusing an enclosing one."""
+    active = _ACTIVE_CATALOG_SESSION.get()
+    if active is not None and active.catalog_path == catalog_path:
+        yield active
+        return
+    session = CatalogSession(catalog_path)
+    token = _ACTIVE_CATALOG_SESSION.set(session)
+    try:
+        yield session
+    finally:
+        _ACTIVE_CATALOG_SESSION.reset(token)
+        session.close()
+
+
+def _active_catalog_session(catalog_path: Path) -> CatalogSession | None:
+    session = _ACTIVE_CATALOG_SESSION.get()
+    if session is None or session.catalog_path != catalog_path:
+        return None
+    return session
+
+
+@contextlib.contextmanager
+def _catalog_read(catalog_path: Path) -> Iterator[duckdb.DuckDBPyConnection]:
+    session = _active_catalog_session(catalog_path)
+    if session is None:
+        with _connect_read(catalog_path) as conn:
+            yield conn
+        return
+    with session.cursor() as conn:
+        yield conn
+
+
+def _catalog_memo(catalog_path: Path, kind: str, key: Hashable, load: Callable[[], Any]) -> Any:
+    session = _active_catalog_session(catalog_path)
+    if session is None:
+        return load()
+    return session.memo(kind, key, load)
+
+
+READER_CATALOG_SNAPSHOT_ENV = "LANGNET_READER_CATALOG_SNAPSHOT"
+DEFAULT_CATALOG_SNAPSHOT_MAX_RESULTS = 256
+_P = ParamSpec("_P")
+_R = TypeVar("_R")
+
+
+_CATALOG_SNAPSHOT_DEFAULT = {"enabled": False}
+
+
+def enable_catalog_snapshot(enabled: bool = True) -> None:
+    """
+    Keep warm catalog snapshots in this process unless the env var says otherwise.
+
+    The switch is process-local and is not inherited by subprocesses;
+    `LANGNET_READER_CATALOG_SNAPSHOT`, when set, still takes precedence.
+    """
+    _CATALOG_SNAPSHOT_DEFAULT["enabled"] = enabled
+
+
+def _catalog_snapshot_enabled() -> bool:
+    raw = os.getenv(READER_CATALOG_SNAPSHOT_ENV, "").strip().casefold()
+    if not raw:
+        return _CATALOG_SNAPSHOT_DEFAULT["enabled"]
+    return raw in {"1", "true", "yes", "on"}
+
+
+def _catalog_file_signature(catalog_path: Path) -> tuple[int, ...] | None:
+    try:
+        stat = catalog_path.stat()
+    except FileNotFoundError:
+        return None
+    signature = (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+    wal_path = catalog_path.with_name(f"{catalog_path.name}.wal")
+    try:
+        wal_stat = wal_path.stat()
+    except FileNotFoundError:
+        return signature
+    return (*signature, wal_stat.st_mtime_ns, wal_stat.st_size)
+
+
+class CatalogSnapshot:
+    """
+    Warm, process-level copy of static catalog tables for one catalog version.
+
+    Tables (artifacts, work refs, aliases, contained works, citation-map
+    projections, author classifications, TLG canon metadata) are loaded once
+    into dict indexes on first use, and browse results (`list_works`,
+    `list_author_index`, `list_discovery_shelves`) are kept per request
+    arguments. Because those arguments include free-text queries and offsets,
+    only the `max_results` most recently used results are kept. A snapshot is
+    replaced as soon as the catalog file or its WAL changes size or mtime, or
+    this process opens the catalog for writing.
+    """
+
+    def __init__(
+        self,
+        catalog_path: Path,
+        signature: tuple[int, ...],
+        max_results: int = DEFAULT_CATALOG_SNAPSHOT_MAX_RESULTS,
+    ) -> None:
+        self.catalog_path = catalog_path
+        self.signature = signature
+        self.max_results = max_results
+        self._tables: dict[str, Any] = {}
+        self._results: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.table_loads = 0
+        self.result_hits = 0
+        self.result_evictions = 0
+
+    def table(self, name: str, load: Callable[[], _R]) -> _R:
+        with self._lock:
+            if name in self._tables:
+                return self._tables[name]
+        value = load()
+        with self._lock:
+            self.table_loads += 1
+            return self._tables.setdefault(name, value)
+
+    def result(self, key: Hashable, load: Callable[[], _R]) -> _R:
+        with self._lock:
+            if key in self._results:
+                self.result_hits += 1
+                self._results.move_to_end(key)
+                return self._results[key]
+        value = load()
+        with self._lock:
+            value = self._results.setdefault(key, value)
+            self._results.move_to_end(key)
+            while len(self._results) > self.max_results:
+                self._results.popitem(last=False)
+                self.result_evictions += 1
+            return value
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "tables": len(self._tables),
+                "table_loads": self.table_loads,
+                "results": len(self._results),
+                "result_hits": self.result_hits,
+                "result_evictions": self.result_evictions,
+            }
+
+
+_CATALOG_SNAPSHOTS: dict[str, CatalogSnapshot] = {}
+_CATALOG_SNAPSHOTS_LOCK = threading.Lock()
+
+
+def catalog_snapshot(catalog_path: Path) -> CatalogSnapshot | None:
+    """Return the warm snapshot for `catalog_path` when snapshots are enabled."""
+    if not _catalog_snapshot_enabled():
+        return None
+    signature = _catalog_file_signature(catalog_path)
+    if signature is None:
+        return None
+    key = str(catalog_path.resolve())
+    with _CATALOG_SNAPSHOTS_LOCK:
+        snapshot = _CATALOG_SNAPSHOTS.get(key)
+        if snapshot is None or snapshot.signature != signature:
+            snapshot = CatalogSnapshot(catalog_path, signature)
+            _CATALOG_SNAPSHOTS[key] = snapshot
+        return snapshot
+
+
+def invalidate_catalog_snapshot(catalog_path: Path | None = None) -> None:
+    with _CATALOG_SNAPSHOTS_LOCK:
+        if catalog_path is None:
+            _CATALOG_SNAPSHOTS.clear()
+        else:
+            _CATALOG_SNAPSHOTS.pop(str(catalog_path.resolve()), None)
+
+
+def _catalog_snapshot_table(catalog_path: Path, name: str, load: Callable[[], _R]) -> _R:
+    snapshot = catalog_snapshot(catalog_path)
+    if snapshot is None:
+        return load()
+    return snapshot.table(name, load)
+
+
+def _snapshot_cached(
+    function: Callable[_P, list[dict[str, Any]]],
+) -> Callable[_P, list[dict[str, Any]]]:
+    """Serve a catalog-only listing from the warm snapshot, keyed by its arguments."""
+
+    @functools.wraps(function)
+    def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> list[dict[str, Any]]:
+        catalog_path = args[0]
+        snapshot = catalog_snapshot(catalog_path) if isinstance(catalog_path, Path) else None
+        if snapshot is None:
+            return function(*args, **kwargs)
+        key = (function.__name__, args[1:], tuple(sorted(kwargs.items())))
+        return copy.deepcopy(snapshot.result(key, lambda: function(*args, **kwargs)))
+
+    return wrapper
+
+
 def create_catalog_db(path: Path) -> None:
     with _connect_write(path) as conn:
         conn.execute(CATALOG_SCHEMA_SQL)
@@ -745,6 +1072,15 @@ def delete_reader_works(catalog_path: Path, work_ids: Iterable[str]) -> None:
                 WHERE work_id IN (SELECT work_id FROM delete_work_ids)
                 """
             )
+            conn.execute(
+                "DELETE FROM address_index WHERE work_id IN (SELECT work_id FROM delete_work_ids)"
+            )
+            conn.execute(
+                """
+                DELETE FROM address_index_books
+                WHERE work_id IN (SELECT work_id FROM delete_work_ids)
+                """
+            )
             conn.execute(
                 "DELETE FROM artifacts WHERE work_id IN (SELECT work_id FROM delete_work_ids)"
             )
@@ -785,7 +1121,14 @@ def register_segment_rows(
     segments: Iterable[ReaderSegment],
     addresses: Iterable[ReaderSegmentAddress],
     replace_work_id: str | None = None,
+    catalog_path: Path | None = None,
 ) -> None:
+    """
+    Write segments and addresses into a book file.
+
+    With `catalog_path`, the book's addresses are also copied into the catalog
+    `address_index` so address lookups can route without opening book files.
+    """
     segment_rows = [
         (
             segment.segment_id,
@@ -879,6 +1222,132 @@ def register_segment_rows(
                 )
                 conn.unregister("address_rows")
             conn.execute(BOOK_INDEX_SQL)
+            index_rows, index_work_ids = (
+                _book_address_index_rows(conn, replace_work_id)
+                if catalog_path is not None
+                else ([], [])
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+    if catalog_path is not None:
+        register_address_index(
+            catalog_path,
+            book_path,
+            index_rows,
+            work_ids=index_work_ids,
+            replace_work_id=replace_work_id,
+        )
+
+
+def _book_address_index_rows(
+    conn: duckdb.DuckDBPyConnection,
+    work_id: str | None,
+) -> tuple[list[tuple[str, str, str, str]], list[str]]:
+    where = "WHERE s.work_id = ?" if work_id is not None else ""
+    params = [work_id] if work_id is not None else []
+    rows = conn.execute(
+        f"""
+        SELECT a.address, s.work_id, a.segment_id, a.address_kind
+        FROM addresses a
+        JOIN segments s ON s.segment_id = a.segment_id
+        {where}
+        """,
+        params,
+    ).fetchall()
+    work_ids = {
+        str(row[0])
+        for row in conn.execute(
+            f"SELECT DISTINCT s.work_id FROM segments s {where}", params
+        ).fetchall()
+    }
+    if work_id is not None:
+        work_ids.add(work_id)
+    return (
+        [
+            (str(address), str(work), str(segment_id), str(kind))
+            for address, work, segment_id, kind in rows
+        ],
+        sorted(work_ids),
+    )
+
+
+def register_address_index(
+    catalog_path: Path,
+    book_path: Path,
+    rows: Iterable[tuple[str, str, str, str]],
+    *,
+    work_ids: Iterable[str],
+    replace_work_id: str | None = None,
+) -> None:
+    """
+    Replace the catalog address index entries for one book file.
+
+    `rows` are `(address, work_id, segment_id, address_kind)`. Every work in
+    `work_ids` is marked as indexed for this book, including works without
+    addresses, so lookups never fall back to probing the book for them.
+    """
+    artifact_path = str(book_path)
+    address_rows = [
+        (address, artifact_path, work_id, segment_id, kind)
+        for address, work_id, segment_id, kind in rows
+    ]
+    address_counts: dict[str, int] = dict.fromkeys(work_ids, 0)
+    for _address, _path, work_id, _segment_id, _kind in address_rows:
+        address_counts[work_id] = address_counts.get(work_id, 0) + 1
+    create_catalog_db(catalog_path)
+    with _connect_write(catalog_path) as conn:
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            if replace_work_id is None:
+                conn.execute("DELETE FROM address_index WHERE artifact_path = ?", [artifact_path])
+                conn.execute(
+                    "DELETE FROM address_index_books WHERE artifact_path = ?", [artifact_path]
+                )
+            else:
+                conn.execute(
+                    "DELETE FROM address_index WHERE artifact_path = ? AND work_id = ?",
+                    [artifact_path, replace_work_id],
+                )
+                conn.execute(
+                    "DELETE FROM address_index_books WHERE artifact_path = ? AND work_id = ?",
+                    [artifact_path, replace_work_id],
+                )
+            if address_rows:
+                address_frame = pl.DataFrame(
+                    address_rows,
+                    schema={
+                        "address": pl.Utf8,
+                        "artifact_path": pl.Utf8,
+                        "work_id": pl.Utf8,
+                        "segment_id": pl.Utf8,
+                        "address_kind": pl.Utf8,
+                    },
+                    orient="row",
+                )
+                conn.register("address_index_rows", address_frame)
+                conn.execute(
+                    """
+                    INSERT INTO address_index (
+                        address, artifact_path, work_id, segment_id, address_kind
+                    )
+                    SELECT address, artifact_path, work_id, segment_id, address_kind
+                    FROM address_index_rows
+                    """
+                )
+                conn.unregister("address_index_rows")
+            if address_counts:
+                conn.executemany(
+                    """
+                    INSERT INTO address_index_books (artifact_path, work_id, address_count)
+                    VALUES (?, ?, ?)
+                    """,
+                    [
+                        (artifact_path, work_id, count)
+                        for work_id, count in sorted(address_counts.items())
+                    ],
+                )
             conn.execute("COMMIT")
         except Exception:
             conn.execute("ROLLBACK")
@@ -2624,24 +3093,57 @@ def _null_work_classification_select_columns() -> str:
 
 
 def _catalog_artifacts(catalog_path: Path) -> list[dict[str, Any]]:
+    return list(
+        _catalog_memo(
+            catalog_path, "artifacts", None, lambda: _load_catalog_artifacts(catalog_path)
+        )
+    )
+
+
+def _load_catalog_artifacts(catalog_path: Path) -> list[dict[str, Any]]:
+    snapshot = catalog_snapshot(catalog_path)
+    if snapshot is not None:
+        return snapshot.table("artifacts", lambda: _query_catalog_artifacts(catalog_path))
+    return _query_catalog_artifacts(catalog_path)
+
+
+def _query_catalog_artifacts(catalog_path: Path) -> list[dict[str, Any]]:
     if not catalog_path.exists():
         return []
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
-        return _dict_rows(
-            conn,
-            """
-            SELECT artifact_id, work_id, edition_id, artifact_path, source_path, adapter,
-                   source_hash, segment_count, token_count
-            FROM artifacts
-            ORDER BY work_id, edition_id, artifact_id
-            """,
-        )
+    with _catalog_read(catalog_path) as conn:
+        return _query_catalog_artifacts_on(conn)
+
+
+def _query_catalog_artifacts_on(conn: duckdb.DuckDBPyConnection) -> list[dict[str, Any]]:
+    return _dict_rows(
+        conn,
+        """
+        SELECT artifact_id, work_id, edition_id, artifact_path, source_path, adapter,
+               source_hash, segment_count, token_count
+        FROM artifacts
+        ORDER BY work_id, edition_id, artifact_id
+        """,
+    )
 
 
 def _contained_work(catalog_path: Path, work_ref: str) -> dict[str, Any] | None:
+    row = _catalog_memo(
+        catalog_path,
+        "contained_work",
+        work_ref,
+        lambda: _load_contained_work(catalog_path, work_ref),
+    )
+    return dict(row) if row is not None else None
+
+
+def _load_contained_work(catalog_path: Path, work_ref: str) -> dict[str, Any] | None:
+    snapshot = catalog_snapshot(catalog_path)
+    if snapshot is not None:
+        index = snapshot.table("contained_works", lambda: _contained_work_index(catalog_path))
+        return index.get(work_ref)
     if not catalog_path.exists():
         return None
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "contained_works"):
             return None
         rows = _dict_rows(
@@ -2662,6 +3164,32 @@ def _contained_work(catalog_path: Path, work_ref: str) -> dict[str, Any] | None:
     return rows[0] if rows else None
 
 
+def _contained_work_index(catalog_path: Path) -> dict[str, dict[str, Any]]:
+    with _catalog_read(catalog_path) as conn:
+        if not _table_exists(conn, "contained_works"):
+            return {}
+        rows = _dict_rows(
+            conn,
+            """
+            SELECT DISTINCT
+                contained_work_id, parent_work_id, collection_id, language, title, author,
+                source_id, cts_work_urn, start_citation, end_citation, status, confidence,
+                note, source_file
+            FROM contained_works
+            WHERE status = 'accepted'
+            ORDER BY contained_work_id
+            """,
+        )
+    index: dict[str, dict[str, Any]] = {}
+    exact: dict[str, dict[str, Any]] = {}
+    for row in rows:
+        if row["cts_work_urn"]:
+            index.setdefault(str(row["cts_work_urn"]), row)
+        exact.setdefault(str(row["contained_work_id"]), row)
+    index.update(exact)
+    return index
+
+
 def _segment_sort_key_for_work(
     catalog_path: Path,
     work_id: str,
@@ -2673,7 +3201,7 @@ def _segment_sort_key_for_work(
         book_path = Path(str(artifact["artifact_path"]))
         if not book_path.exists():
             continue
-        with duckdb.connect(str(book_path), read_only=True) as conn:
+        with connect_reader_book(book_path) as conn:
             sort_key = _segment_sort_key(conn, work_id, citation_path)
             if sort_key is not None:
                 return sort_key
@@ -2744,9 +3272,24 @@ def _citation_path_lookup_candidates(
 
 
 def _work_accepts_drop_middle_citation_projection(catalog_path: Path, work_id: str) -> bool:
+    return _catalog_memo(
+        catalog_path,
+        "drop_middle_citation_projection",
+        work_id,
+        lambda: _load_work_accepts_drop_middle_citation_projection(catalog_path, work_id),
+    )
+
+
+def _load_work_accepts_drop_middle_citation_projection(catalog_path: Path, work_id: str) -> bool:
+    snapshot = catalog_snapshot(catalog_path)
+    if snapshot is not None:
+        return work_id in snapshot.table(
+            "drop_middle_citation_projection",
+            lambda: _drop_middle_citation_projection_work_ids(catalog_path),
+        )
     if not catalog_path.exists():
         return False
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "citation_maps"):
             return False
         row = conn.execute(
@@ -2765,6 +3308,23 @@ def _work_accepts_drop_middle_citation_projection(catalog_path: Path, work_id: s
     return row is not None
 
 
+def _drop_middle_citation_projection_work_ids(catalog_path: Path) -> frozenset[str]:
+    with _catalog_read(catalog_path) as conn:
+        if not _table_exists(conn, "citation_maps"):
+            return frozenset()
+        rows = conn.execute(
+            """
+            SELECT DISTINCT work_id
+            FROM citation_maps
+            WHERE status = 'accepted'
+              AND projection_rule = 'drop_middle_numeric_part'
+              AND source_pattern = 'book.chapter.section'
+              AND machine_pattern = 'book.section'
+            """
+        ).fetchall()
+    return frozenset(str(row[0]) for row in rows)
+
+
 def _numeric_citation_part(part: str) -> str | None:
     value = part.strip()
     if value.isdigit():
@@ -2788,21 +3348,24 @@ def _roman_citation_to_int(value: str) -> int:
     return total
 
 
-def _address_work_id_from_artifacts(address: str, artifacts: list[dict[str, Any]]) -> str | None:
-    matches = {
-        str(artifact["work_id"])
-        for artifact in artifacts
-        if address.startswith(f"{artifact['work_id']}:")
-    }
-    if not matches:
-        return _cts_work_id(address)
-    return max(matches, key=lambda match: len(match))
+def _address_work_id(conn: duckdb.DuckDBPyConnection, address: str) -> str | None:
+    row = conn.execute(
+        """
+        SELECT work_id
+        FROM artifacts
+        WHERE starts_with(?, work_id || ':')
+        ORDER BY length(work_id) DESC
+        LIMIT 1
+        """,
+        [address],
+    ).fetchone()
+    return str(row[0]) if row else _cts_work_id(address)
 
 
 def _book_has_address(book_path: Path, address: str) -> bool:
     if not book_path.exists():
         return False
-    with duckdb.connect(str(book_path), read_only=True) as conn:
+    with connect_reader_book(book_path) as conn:
         row = conn.execute(
             "SELECT 1 FROM addresses WHERE address = ? LIMIT 1",
             [address],
@@ -2841,29 +3404,109 @@ def lookup_artifact_for_address(catalog_path: Path, address: str) -> dict[str, A
 def _lookup_artifact_and_address_for_address(
     catalog_path: Path, address: str
 ) -> tuple[dict[str, Any], str] | None:
-    artifacts = _catalog_artifacts(catalog_path)
     candidates = _address_lookup_candidates(catalog_path, address)
+    index = _AddressIndexLookup.load(catalog_path, candidates)
     had_work_scoped_candidate = False
     for candidate in candidates:
-        work_id = _address_work_id_from_artifacts(candidate, artifacts)
+        work_id = index.work_ids.get(candidate)
         if work_id is not None:
             had_work_scoped_candidate = True
-            for artifact in artifacts:
-                if artifact["work_id"] == work_id and _book_has_address(
-                    Path(str(artifact["artifact_path"])),
-                    candidate,
-                ):
-                    return artifact, candidate
+            for artifact in index.artifacts_with_address(candidate, work_id):
+                return artifact, candidate
     if had_work_scoped_candidate:
         return None
 
     for candidate in candidates:
-        for artifact in artifacts:
-            if _book_has_address(Path(str(artifact["artifact_path"])), candidate):
-                return artifact, candidate
+        for artifact in index.artifacts_with_address(candidate):
+            return artifact, candidate
     return None
 
 
+_ADDRESS_ARTIFACT_COLUMNS = """
+    a.artifact_id, a.work_id, a.edition_id, a.artifact_path, a.source_path, a.adapter,
+    a.source_hash, a.segment_count, a.token_count
+"""
+
+
+@dataclass(frozen=True)
+class _AddressIndexLookup:
+    """Artifacts holding each candidate address, resolved through `address_index`.
+
+    Hits come from one `address_index JOIN artifacts` query on the indexed
+    `address` column. Artifacts whose book was registered before the index
+    existed are listed in `unindexed` and are still probed by opening the
+    book file.
+    """
+
+    hits: dict[str, list[dict[str, Any]]]
+    unindexed: list[dict[str, Any]]
+    work_ids: dict[str, str | None]
+
+    @classmethod
+    def load(cls, catalog_path: Path, candidates: list[str]) -> _AddressIndexLookup:
+        if not catalog_path.exists() or not candidates:
+            return cls(hits={}, unindexed=[], work_ids={})
+        with _catalog_read(catalog_path) as conn:
+            work_ids = {candidate: _address_work_id(conn, candidate) for candidate in candidates}
+            if not _table_exists(conn, "address_index_books"):
+                return cls(
+                    hits={},
+                    unindexed=_query_catalog_artifacts_on(conn),
+                    work_ids=work_ids,
+                )
+            placeholders = ", ".join("?" for _candidate in candidates)
+            rows = _dict_rows(
+                conn,
+                f"""
+                SELECT DISTINCT i.address AS indexed_address, {_ADDRESS_ARTIFACT_COLUMNS}
+                FROM address_index i
+                JOIN artifacts a
+                  ON a.artifact_path = i.artifact_path AND a.work_id = i.work_id
+                WHERE i.address IN ({placeholders})
+                ORDER BY a.work_id, a.edition_id, a.artifact_id
+                """,
+                candidates,
+            )
+            unindexed = _dict_rows(
+                conn,
+                f"""
+                SELECT {_ADDRESS_ARTIFACT_COLUMNS}
+                FROM artifacts a
+                WHERE NOT EXISTS (
+                    SELECT 1
+                    FROM address_index_books b
+                    WHERE b.artifact_path = a.artifact_path AND b.work_id = a.work_id
+                )
+                ORDER BY a.work_id, a.edition_id, a.artifact_id
+                """,
+            )
+        hits: dict[str, list[dict[str, Any]]] = {}
+        for row in rows:
+            hits.setdefault(str(row.pop("indexed_address")), []).append(row)
+        return cls(hits=hits, unindexed=unindexed, work_ids=work_ids)
+
+    def artifacts_with_address(
+        self, address: str, work_id: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Artifacts containing `address`, optionally limited to one work, in catalog order."""
+        hits = [
+            artifact
+            for artifact in self.hits.get(address, [])
+            if work_id is None or artifact["work_id"] == work_id
+        ]
+        probed = [
+            artifact
+            for artifact in self.unindexed
+            if (work_id is None or artifact["work_id"] == work_id)
+            and _book_has_address(Path(str(artifact["artifact_path"])), address)
+        ]
+        return sorted([*hits, *probed], key=_artifact_catalog_order)
+
+
+def _artifact_catalog_order(artifact: dict[str, Any]) -> tuple[str, str, str]:
+    return (str(artifact["work_id"]), str(artifact["edition_id"]), str(artifact["artifact_id"]))
+
+
 def lookup_segment_by_address(catalog_path: Path, address: str) -> dict[str, Any] | None:
     result = _lookup_artifact_and_address_for_address(catalog_path, address)
     if result is None:
@@ -2872,7 +3515,7 @@ def lookup_segment_by_address(catalog_path: Path, address: str) -> dict[str, Any
     book_path = Path(str(artifact["artifact_path"]))
     if not book_path.exists():
         return None
-    with duckdb.connect(str(book_path), read_only=True) as conn:
+    with connect_reader_book(book_path) as conn:
         source_text_expr = _segment_source_text_expr(conn)
         rows = _dict_rows(
             conn,
@@ -2904,7 +3547,7 @@ def lookup_segments_by_citation_reference(
     if not catalog_path.exists():
         return []
     normalized_ref = normalize_citation_reference(citation_ref)
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "citation_references"):
             return []
         rows = _dict_rows(
@@ -2941,11 +3584,30 @@ def lookup_alias(
     *,
     language: str | None = None,
 ) -> dict[str, Any] | None:
+    row = _catalog_memo(
+        catalog_path,
+        "alias",
+        (alias, language),
+        lambda: _load_alias(catalog_path, alias, language=language),
+    )
+    return dict(row) if row is not None else None
+
+
+def _load_alias(
+    catalog_path: Path,
+    alias: str,
+    *,
+    language: str | None = None,
+) -> dict[str, Any] | None:
+    snapshot = catalog_snapshot(catalog_path)
+    if snapshot is not None:
+        index = snapshot.table("aliases", lambda: _alias_index(catalog_path))
+        return index.get((alias, language or None))
     if not catalog_path.exists():
         return None
     where = "alias = ? AND language = ?" if language else "alias = ?"
     params: list[object] = [alias, language] if language else [alias]
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         rows = _dict_rows(
             conn,
             f"""
@@ -2960,6 +3622,24 @@ def lookup_alias(
     return rows[0] if rows else None
 
 
+def _alias_index(catalog_path: Path) -> dict[tuple[str, str | None], dict[str, Any]]:
+    with _catalog_read(catalog_path) as conn:
+        rows = _dict_rows(
+            conn,
+            """
+            SELECT alias, language, kind, target, display, source_file, sources
+            FROM aliases
+            ORDER BY alias, language, target
+            """,
+        )
+    index: dict[tuple[str, str | None], dict[str, Any]] = {}
+    for row in rows:
+        index.setdefault((str(row["alias"]), None), row)
+        if row["language"]:
+            index.setdefault((str(row["alias"]), str(row["language"])), row)
+    return index
+
+
 def resolve_work_ref(catalog_path: Path, work_ref: str) -> str | None:
     resource = parse_ctsv2_resource(work_ref)
     if resource is not None:
@@ -2980,9 +3660,21 @@ def resolve_work_ref(catalog_path: Path, work_ref: str) -> str | None:
 
 
 def _resolve_work_ref_without_alias(catalog_path: Path, work_ref: str) -> str | None:
+    return _catalog_memo(
+        catalog_path,
+        "work_ref",
+        work_ref,
+        lambda: _load_resolved_work_ref(catalog_path, work_ref),
+    )
+
+
+def _load_resolved_work_ref(catalog_path: Path, work_ref: str) -> str | None:
+    snapshot = catalog_snapshot(catalog_path)
+    if snapshot is not None:
+        return snapshot.table("work_refs", lambda: _work_ref_index(catalog_path)).get(work_ref)
     if not catalog_path.exists():
         return None
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         columns = _table_columns(conn, "works")
         canonical_condition = " OR canonical_text_id = ?" if "canonical_text_id" in columns else ""
         params: list[object] = [work_ref, work_ref]
@@ -3002,6 +3694,25 @@ def _resolve_work_ref_without_alias(catalog_path: Path, work_ref: str) -> str |
     return str(row[0]) if row else None
 
 
+def _work_ref_index(catalog_path: Path) -> dict[str, str]:
+    with _catalog_read(catalog_path) as conn:
+        canonical_select = (
+            "canonical_text_id"
+            if "canonical_text_id" in _table_columns(conn, "works")
+            else "NULL::VARCHAR AS canonical_text_id"
+        )
+        rows = conn.execute(
+            f"SELECT work_id, cts_work_urn, {canonical_select} FROM works ORDER BY work_id"
+        ).fetchall()
+    index: dict[str, str] = {}
+    for work_id, cts_work_urn, canonical_text_id in rows:
+        for ref in (cts_work_urn, canonical_text_id):
+            if ref:
+                index.setdefault(str(ref), str(work_id))
+    index.update((str(row[0]), str(row[0])) for row in rows)
+    return index
+
+
 def resolve_text_work_ref(catalog_path: Path, work_ref: str) -> str | None:
     contained = _contained_work(catalog_path, work_ref)
     if contained is not None:
@@ -3010,6 +3721,11 @@ def resolve_text_work_ref(catalog_path: Path, work_ref: str) -> str | None:
 
 
 def get_work(catalog_path: Path, work_ref: str) -> dict[str, Any] | None:
+    item = _catalog_memo(catalog_path, "work", work_ref, lambda: _load_work(catalog_path, work_ref))
+    return dict(item) if item is not None else None
+
+
+def _load_work(catalog_path: Path, work_ref: str) -> dict[str, Any] | None:
     contained = _contained_work(catalog_path, work_ref)
     if contained is not None:
         item = {
@@ -3033,7 +3749,7 @@ def get_work(catalog_path: Path, work_ref: str) -> dict[str, Any] | None:
     work_id = resolve_work_ref(catalog_path, work_ref)
     if not work_id:
         return None
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         canonical_select = (
             "canonical_text_id"
             if "canonical_text_id" in _table_columns(conn, "works")
@@ -3072,7 +3788,7 @@ def lookup_segment_by_work_and_citation(
         book_path = Path(str(artifact["artifact_path"]))
         if not book_path.exists():
             continue
-        with duckdb.connect(str(book_path), read_only=True) as conn:
+        with connect_reader_book(book_path) as conn:
             source_text_expr = _segment_source_text_expr(conn)
             rows = _dict_rows(
                 conn,
@@ -3119,7 +3835,7 @@ def segment_navigation(catalog_path: Path, segment: dict[str, Any]) -> dict[str,
     book_path = Path(str(artifact["artifact_path"]))
     if not book_path.exists():
         return {"previous": None, "next": None}
-    with duckdb.connect(str(book_path), read_only=True) as conn:
+    with connect_reader_book(book_path) as conn:
         previous_rows = _dict_rows(
             conn,
             """
@@ -3173,7 +3889,7 @@ def _navigation_item(rows: list[dict[str, Any]], base_address: str) -> dict[str,
 def list_collections(catalog_path: Path) -> list[dict[str, Any]]:
     if not catalog_path.exists():
         return []
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         rows = _dict_rows(
             conn,
             """
@@ -3282,7 +3998,7 @@ def list_authors(
     limit_sql = "LIMIT ? OFFSET ?" if limit is not None else ""
     if limit is not None:
         params.extend([limit, offset])
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         rows = _dict_rows(
             conn,
             f"""
@@ -3303,7 +4019,7 @@ def _add_contained_word_counts_to_author_rows(
     catalog_path: Path,
     rows: list[dict[str, Any]],
 ) -> None:
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "contained_works"):
             return
         contained_rows = _dict_rows(
@@ -3331,6 +4047,7 @@ def _add_contained_word_counts_to_author_rows(
                 row["word_count_method"] = "whitespace_tokens"
 
 
+@_snapshot_cached
 def list_author_index(  # noqa: PLR0913
     catalog_path: Path,
     *,
@@ -3534,24 +4251,14 @@ def _attach_author_classifications(
     languages = sorted({str(item["language"]) for item in items})
     if not languages:
         return
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
-        if not _table_exists(conn, "author_classifications"):
-            return
-        rows = _dict_rows(
-            conn,
-            f"""
-            SELECT
-                author_id, language, source_author_id,
-                canonical_name, agent_kind, historicity_status,
-                period, date_range, region, cultural_context, bio,
-                prominence_score, prominence_tier,
-                confidence, note, generator_models, generator_run_id, source_file
-            FROM author_classifications
-            WHERE language IN ({", ".join("?" for _ in languages)})
-            """,
-            languages,
+    snapshot = catalog_snapshot(catalog_path)
+    if snapshot is not None:
+        by_key = snapshot.table(
+            "author_classifications",
+            lambda: _author_classification_rows_by_key(catalog_path, None),
         )
-    by_key = {(str(row["author_id"]), str(row["language"])): row for row in rows}
+    else:
+        by_key = _author_classification_rows_by_key(catalog_path, languages)
     for item in items:
         row = by_key.get((str(item["author_id"]), str(item["language"])))
         if row is None:
@@ -3574,6 +4281,31 @@ def _attach_author_classifications(
         item["author_classification_source_file"] = row["source_file"]
 
 
+def _author_classification_rows_by_key(
+    catalog_path: Path,
+    languages: list[str] | None,
+) -> dict[tuple[str, str], dict[str, Any]]:
+    where = f"WHERE language IN ({', '.join('?' for _ in languages)})" if languages else ""
+    with _catalog_read(catalog_path) as conn:
+        if not _table_exists(conn, "author_classifications"):
+            return {}
+        rows = _dict_rows(
+            conn,
+            f"""
+            SELECT
+                author_id, language, source_author_id,
+                canonical_name, agent_kind, historicity_status,
+                period, date_range, region, cultural_context, bio,
+                prominence_score, prominence_tier,
+                confidence, note, generator_models, generator_run_id, source_file
+            FROM author_classifications
+            {where}
+            """,
+            languages or [],
+        )
+    return {(str(row["author_id"]), str(row["language"])): row for row in rows}
+
+
 def _attach_canonical_author_authorities(items: list[dict[str, Any]]) -> None:
     for item in items:
         source_author_id = str(item.get("source_author_id") or "")
@@ -3678,9 +4410,18 @@ def _author_disambiguation_suffix(
 
 
 def _tlg_canon_author_metadata(catalog_path: Path) -> dict[str, dict[str, str]]:
+    snapshot = catalog_snapshot(catalog_path)
+    if snapshot is not None:
+        return snapshot.table(
+            "tlg_canon_author_metadata", lambda: _load_tlg_canon_author_metadata(catalog_path)
+        )
+    return _load_tlg_canon_author_metadata(catalog_path)
+
+
+def _load_tlg_canon_author_metadata(catalog_path: Path) -> dict[str, dict[str, str]]:
     if not catalog_path.exists():
         return {}
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "source_metadata"):
             return {}
         rows = conn.execute(
@@ -3762,7 +4503,7 @@ def list_duplicate_audit(
 ) -> list[dict[str, Any]]:
     if not catalog_path.exists():
         return []
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if kind == "titles":
             return _dict_rows(
                 conn,
@@ -3857,7 +4598,7 @@ def _raw_author_rows(
         conditions.append("s.language = ?")
         params.append(language)
     where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         contained_union = ""
         if _table_exists(conn, "contained_works"):
             contained_union = """
@@ -4013,6 +4754,7 @@ SOURCE_METADATA_SUMMARY_KEYS = (
 )
 
 
+@_snapshot_cached
 def list_works(  # noqa: C901, PLR0912, PLR0913, PLR0915
     catalog_path: Path,
     *,
@@ -4031,7 +4773,7 @@ def list_works(  # noqa: C901, PLR0912, PLR0913, PLR0915
 ) -> list[dict[str, Any]]:
     if not catalog_path.exists():
         return []
-    with duckdb.connect(str(catalog_path), read_only=True) as schema_conn:
+    with _catalog_read(catalog_path) as schema_conn:
         works_columns = _table_columns(schema_conn, "works")
     has_canonical_text_id = "canonical_text_id" in works_columns
     include_contained = collection_id is None or collection_id == "contained"
@@ -4143,7 +4885,7 @@ def list_works(  # noqa: C901, PLR0912, PLR0913, PLR0915
     limit_sql = "LIMIT ? OFFSET ?" if should_limit_base_query else ""
     if should_limit_base_query:
         where_params.extend([limit, offset])
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if attributed_to and not _table_exists(conn, "metadata_attributions"):
             attribution_cte = """
                 WITH attribution_work_ids AS (
@@ -4305,7 +5047,7 @@ def list_discovery_group_summaries(
 ) -> list[dict[str, Any]]:
     if not catalog_path.exists():
         return []
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "work_classifications"):
             return []
         columns = _table_columns(conn, "work_classifications")
@@ -4370,7 +5112,7 @@ def list_discovery_tag_summaries(
 ) -> list[dict[str, Any]]:
     if not catalog_path.exists():
         return []
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "work_classifications"):
             return []
         columns = _table_columns(conn, "work_classifications")
@@ -4453,6 +5195,7 @@ def _reader_author_count_identity(author_id: object, author: object) -> str:
     return ""
 
 
+@_snapshot_cached
 def list_discovery_shelves(
     catalog_path: Path,
     *,
@@ -4515,7 +5258,7 @@ def _discovery_shelf_sample_works(
 ) -> dict[str, list[dict[str, Any]]]:
     if not catalog_path.exists() or not group_ids or sample_limit <= 0:
         return {}
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "work_classifications"):
             return {}
         columns = _table_columns(conn, "work_classifications")
@@ -4603,7 +5346,7 @@ def _discovery_shelf_sample_works(
 def reader_discovery_coverage(catalog_path: Path) -> list[dict[str, Any]]:
     if not catalog_path.exists():
         return []
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         base_rows = _dict_rows(
             conn,
             """
@@ -4731,11 +5474,22 @@ def list_source_index(  # noqa: PLR0913
     query: str | None = None,
     limit: int = 500,
     offset: int = 0,
+    after: Sequence[Any] | None = None,
 ) -> list[dict[str, Any]]:
+    """
+    List catalog editions with file and artifact metrics.
+
+    `after` is `source_index_sort_key()` of the last row already shown; when
+    given, the query seeks past it and `offset` is ignored.
+    """
     if not catalog_path.exists():
         return []
     conditions = []
     params: list[object] = []
+    if after is not None:
+        conditions.append(_keyset_after_condition(_SOURCE_INDEX_ORDER))
+        params.extend(_keyset_after_params(after))
+        offset = 0
     if collection_id:
         conditions.append("w.collection_id = ?")
         params.append(collection_id)
@@ -4776,7 +5530,7 @@ def list_source_index(  # noqa: PLR0913
         params.extend([query_like] * 8)
     where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
     params.extend([limit, offset])
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         return _dict_rows(
             conn,
             f"""
@@ -4834,13 +5588,52 @@ def list_source_index(  # noqa: PLR0913
             LEFT JOIN source_files sf ON sf.source_path = e.source_path
             LEFT JOIN witness_counts wc ON wc.canonical_text_id = w.canonical_text_id
             {where}
-            ORDER BY w.collection_id, w.language, w.author, w.title, e.label, w.work_id
+            ORDER BY {", ".join(_SOURCE_INDEX_ORDER)}
             LIMIT ? OFFSET ?
             """,
             params,
         )
 
 
+_SOURCE_INDEX_ORDER = (
+    "w.collection_id",
+    "w.language",
+    "w.author",
+    "w.title",
+    "coalesce(e.label, '')",
+    "w.work_id",
+    "coalesce(e.edition_id, '')",
+)
+
+
+def source_index_sort_key(row: Mapping[str, Any]) -> tuple[str, ...]:
+    """Keyset tuple for a `list_source_index` row, in `ORDER BY` order."""
+    return (
+        str(row.get("collection_id") or ""),
+        str(row.get("language") or ""),
+        str(row.get("author") or ""),
+        str(row.get("title") or ""),
+        str(row.get("edition_label") or ""),
+        str(row.get("work_id") or ""),
+        str(row.get("edition_id") or ""),
+    )
+
+
+def _keyset_after_condition(columns: Sequence[str]) -> str:
+    """`(c1, c2, ...) > (?, ?, ...)` spelled out so it works on every column type."""
+    head, *rest = columns
+    if not rest:
+        return f"{head} > ?"
+    return f"({head} > ? OR ({head} = ? AND {_keyset_after_condition(rest)}))"
+
+
+def _keyset_after_params(values: Sequence[Any]) -> list[object]:
+    head, *rest = values
+    if not rest:
+        return [head]
+    return [head, head, *_keyset_after_params(rest)]
+
+
 def _merge_discovery_counts(
     rows: list[dict[str, Any]],
     taxonomy: Mapping[str, Any],
@@ -4997,7 +5790,7 @@ def _source_author_metadata_names(
         return {}
     collection_placeholders = ", ".join("?" for _ in collection_ids)
     subject_placeholders = ", ".join("?" for _ in subject_ids)
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "source_metadata"):
             return {}
         metadata_rows = _dict_rows(
@@ -5127,7 +5920,7 @@ def _attach_source_metadata_summaries(  # noqa: C901, PLR0912
             candidates.update(_source_metadata_candidate_subjects(row))
     if not candidates_by_collection:
         return
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "source_metadata"):
             return
         clauses: list[str] = []
@@ -5214,7 +6007,7 @@ def _attach_work_metadata_attributions(
     if not collection_ids:
         return
     collection_placeholders = ", ".join("?" for _ in collection_ids)
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "metadata_attributions"):
             return
         attribution_rows = _dict_rows(
@@ -5401,7 +6194,7 @@ def _list_contained_work_rows(  # noqa: C901, PLR0911, PLR0912, PLR0913
         return []
     if not catalog_path.exists():
         return []
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "contained_works"):
             return []
         conditions = ["status = 'accepted'"]
@@ -5541,7 +6334,14 @@ def list_segments_for_work(  # noqa: PLR0913
     from_citation: str | None = None,
     around: str | None = None,
     radius: int = 20,
+    after: Sequence[Any] | None = None,
 ) -> list[dict[str, Any]]:
+    """
+    Page through a work's segments in `(sort_key, citation_path)` order.
+
+    `after` is the sort tuple of the last segment already shown (from a keyset
+    cursor); when given, the query seeks past it and `offset` is ignored.
+    """
     contained = _contained_work(catalog_path, work_id)
     resolved_work_id = (
         str(contained["parent_work_id"])
@@ -5558,7 +6358,7 @@ def list_segments_for_work(  # noqa: PLR0913
         book_path = Path(str(artifact["artifact_path"]))
         if not book_path.exists():
             continue
-        with duckdb.connect(str(book_path), read_only=True) as conn:
+        with connect_reader_book(book_path) as conn:
             if around:
                 rows.extend(
                     _dict_rows(
@@ -5593,35 +6393,17 @@ def list_segments_for_work(  # noqa: PLR0913
                     _attach_segments_canonical_addresses(catalog_path, rows)
                     return rows[: (radius * 2) + 1]
                 continue
-            conditions = ["work_id = ?"]
-            params: list[object] = [resolved_work_id]
-            query_offset = offset
-            query_limit = limit
-            if contained is not None:
-                start_sort_key = _segment_sort_key(
-                    conn,
-                    resolved_work_id,
-                    str(contained["start_citation"]),
-                )
-                end_sort_key = _segment_sort_key(
-                    conn,
-                    resolved_work_id,
-                    str(contained["end_citation"]),
-                )
-                if start_sort_key is None or end_sort_key is None:
-                    continue
-                conditions.append("sort_key BETWEEN ? AND ?")
-                params.extend([start_sort_key, end_sort_key])
-                query_offset = offset
-            if from_citation:
-                anchor_sort_key = _segment_sort_key(conn, resolved_work_id, from_citation)
-                if anchor_sort_key is None:
-                    continue
-                conditions.append("sort_key >= ?")
-                params.append(anchor_sort_key)
-                query_offset = 0
-            where = " AND ".join(conditions)
-            params.extend([query_limit, query_offset])
+            page_filter = _segment_page_filter(
+                conn,
+                resolved_work_id,
+                contained=contained,
+                from_citation=from_citation,
+                after=after,
+            )
+            if page_filter is None:
+                continue
+            where, params, seeks = page_filter
+            params.extend([limit, 0 if seeks else offset])
             rows.extend(
                 _dict_rows(
                     conn,
@@ -5643,6 +6425,44 @@ def list_segments_for_work(  # noqa: PLR0913
     return rows
 
 
+def _segment_page_filter(
+    conn: duckdb.DuckDBPyConnection,
+    work_id: str,
+    *,
+    contained: Mapping[str, Any] | None,
+    from_citation: str | None,
+    after: Sequence[Any] | None,
+) -> tuple[str, list[object], bool] | None:
+    """
+    Build the `WHERE` clause for one book's page of segments.
+
+    Returns `None` when an anchor citation is missing from the book, and whether
+    the clause already seeks to the page start (so `OFFSET` must not apply).
+    """
+    conditions = ["work_id = ?"]
+    params: list[object] = [work_id]
+    seeks = False
+    if contained is not None:
+        start_sort_key = _segment_sort_key(conn, work_id, str(contained["start_citation"]))
+        end_sort_key = _segment_sort_key(conn, work_id, str(contained["end_citation"]))
+        if start_sort_key is None or end_sort_key is None:
+            return None
+        conditions.append("sort_key BETWEEN ? AND ?")
+        params.extend([start_sort_key, end_sort_key])
+    if from_citation:
+        anchor_sort_key = _segment_sort_key(conn, work_id, from_citation)
+        if anchor_sort_key is None:
+            return None
+        conditions.append("sort_key >= ?")
+        params.append(anchor_sort_key)
+        seeks = True
+    if after is not None:
+        conditions.append(_keyset_after_condition(("sort_key", "citation_path")))
+        params.extend(_keyset_after_params(after))
+        seeks = True
+    return " AND ".join(conditions), params, seeks
+
+
 def _attach_segments_canonical_addresses(
     catalog_path: Path,
     rows: list[dict[str, Any]],
@@ -5669,7 +6489,7 @@ def work_map_for_work(catalog_path: Path, work_ref: str) -> list[dict[str, Any]]
         candidates.append(resolved)
     candidates = list(dict.fromkeys(candidates))
     placeholders = ", ".join("?" for _ in candidates)
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "work_map_nodes"):
             return []
         rows = _dict_rows(
@@ -5707,7 +6527,7 @@ def division_metadata_for_work(catalog_path: Path, work_ref: str) -> list[dict[s
         candidates.append(resolved)
     candidates = list(dict.fromkeys(candidates))
     placeholders = ", ".join("?" for _ in candidates)
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "division_metadata"):
             return []
         return _dict_rows(
@@ -5730,6 +6550,16 @@ def division_metadata_for_work(catalog_path: Path, work_ref: str) -> list[dict[s
 
 
 def structure_for_work(catalog_path: Path, work_ref: str) -> list[dict[str, Any]]:
+    items = _catalog_memo(
+        catalog_path,
+        "structure",
+        work_ref,
+        lambda: _load_structure_for_work(catalog_path, work_ref),
+    )
+    return [dict(item) for item in items]
+
+
+def _load_structure_for_work(catalog_path: Path, work_ref: str) -> list[dict[str, Any]]:
     nodes = work_map_for_work(catalog_path, work_ref)
     metadata = {
         (str(row["work_id"]), str(row["node_id"])): row
@@ -5802,7 +6632,7 @@ def _match_global_traditional_reference(
     address_key = _structure_reference_key(address)
     if not address_key:
         return None
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "division_metadata"):
             return None
         rows = _dict_rows(
@@ -5889,7 +6719,7 @@ def citation_maps_for_work(
     if source_id:
         where.append("source_id = ?")
         params.append(source_id)
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "citation_maps"):
             return []
         rows = _dict_rows(
@@ -5977,7 +6807,7 @@ def _word_count_for_citation_range(
         book_path = Path(str(artifact["artifact_path"]))
         if not book_path.exists():
             continue
-        with duckdb.connect(str(book_path), read_only=True) as conn:
+        with connect_reader_book(book_path) as conn:
             start_sort_key = _segment_sort_key(conn, resolved_work_id, start_citation)
             end_sort_key = _segment_sort_key(conn, resolved_work_id, end_citation)
             if start_sort_key is None or end_sort_key is None:
@@ -5999,7 +6829,7 @@ def _word_count_for_citation_range(
 def list_aliases(catalog_path: Path) -> list[dict[str, Any]]:
     if not catalog_path.exists():
         return []
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         return _dict_rows(
             conn,
             """
@@ -6053,7 +6883,7 @@ def list_metadata_overlays(  # noqa: PLR0913
         params.append(match_value)
     where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
     params.append(limit)
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "metadata_overlays"):
             return []
         return _dict_rows(
@@ -6102,7 +6932,7 @@ def list_metadata_attributions(  # noqa: PLR0913
         params.append(match_value)
     where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
     params.append(limit)
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "metadata_attributions"):
             return []
         return _dict_rows(
@@ -6145,7 +6975,7 @@ def list_source_files(
         params.append(file_status)
     where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
     params.append(limit)
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         return _dict_rows(
             conn,
             f"""
@@ -6183,7 +7013,7 @@ def list_source_metadata(
         params.append(subject_id)
     where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
     params.append(limit)
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         return _dict_rows(
             conn,
             f"""
@@ -6216,7 +7046,7 @@ def list_source_witnesses(
         params.append(collection_id)
     where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
     params.append(limit)
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "source_witnesses"):
             return []
         return _dict_rows(
@@ -6256,7 +7086,7 @@ def list_work_relations(
         params.append(relation_type)
     where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
     params.append(limit)
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         if not _table_exists(conn, "work_relations"):
             return []
         return _dict_rows(
@@ -6285,7 +7115,7 @@ def reader_summary(catalog_path: Path) -> dict[str, object]:
             "source_file_count": 0,
             "metadata_count": 0,
         }
-    with duckdb.connect(str(catalog_path), read_only=True) as conn:
+    with _catalog_read(catalog_path) as conn:
         collection_count = _scalar_int(conn, "SELECT COUNT(DISTINCT collection_id) FROM works")
         work_count = _scalar_int(conn, "SELECT COUNT(*) FROM works")
         artifact_count = _scalar_int(conn, "SELECT COUNT(*) FROM artifacts")
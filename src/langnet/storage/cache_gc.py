@@ -0,0 +1,400 @@
+"""Eviction and compaction for the langnet.duckdb evidence cache.
+
+The cache is a chain: plan/normalization entries point at raw responses, which
+feed extractions → derivations → claims → provenance. `collect_garbage` expires
+entry-point rows by TTL and LRU (`last_accessed`), drops extractions and
+derivations written by superseded handler versions, and then sweeps every row
+whose parent is gone, top to bottom. `compact_cache` checkpoints the file and
+can rewrite it to return freed blocks to the filesystem.
+
+Readers refresh `last_accessed` through `access_touch_due`/`touch_access`, at
+most once per `ACCESS_TOUCH_INTERVAL_SECONDS` per row, so warm lookups do not
+take the writer lock on every hit.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import duckdb
+import structlog
+from filelock import FileLock
+
+from langnet.storage.db import _duckdb_lock_timeout_seconds, connect_duckdb
+
+logger = structlog.get_logger(__name__)
+
+ACCESS_TOUCH_INTERVAL_SECONDS = 24 * 60 * 60
+LRU_TABLE_KEYS: dict[str, str] = {
+    "query_normalization_index": "query_hash",
+    "query_plan_index": "query_hash",
+    "plan_response_index": "plan_hash",
+}
+DEFAULT_TTL_DAYS: dict[str, int] = {
+    "query_normalization_index": 180,
+    "query_plan_index": 90,
+    "plan_response_index": 90,
+}
+DEFAULT_ORPHAN_GRACE_HOURS = 24
+LAST_USED_SQL = "COALESCE(last_accessed, created_at)"
+NOW_SQL = "CAST(CURRENT_TIMESTAMP AS TIMESTAMP)"
+VERSIONED_STAGE_TABLES = ("extraction_index", "derivation_index")
+CLAIM_VERSION_GROUP = "derivation_id"
+
+# (table, child key, parent table, parent key), in sweep order.
+_ORPHAN_EDGES: tuple[tuple[str, str, str, str], ...] = (
+    ("extraction_index", "response_id", "raw_response_index", "response_id"),
+    ("derivation_index", "extraction_id", "extraction_index", "extraction_id"),
+    ("claims", "derivation_id", "derivation_index", "derivation_id"),
+    ("provenance", "claim_id", "claims", "claim_id"),
+    ("raw_response_body_ref", "response_id", "raw_response_index", "response_id"),
+    ("raw_response_body", "body_hash", "raw_response_body_ref", "body_hash"),
+)
+_REPORT_TABLES = (
+    *LRU_TABLE_KEYS,
+    "raw_response_index",
+    "raw_response_body",
+    "extraction_index",
+    "derivation_index",
+    "claims",
+    "provenance",
+)
+
+
+def _table_exists(conn: duckdb.DuckDBPyConnection, table: str) -> bool:
+    row = conn.execute(
+        "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?", [table]
+    ).fetchone()
+    return bool(row and row[0])
+
+
+def _affected(result: duckdb.DuckDBPyConnection) -> int:
+    row = result.fetchone()
+    return int(row[0]) if row else 0
+
+
+def access_touch_due(conn: duckdb.DuckDBPyConnection, table: str, key: str) -> bool:
+    """True when `key` exists in `table` and its `last_accessed` is worth refreshing."""
+    key_column = LRU_TABLE_KEYS[table]
+    try:
+        row = conn.execute(
+            f"""
+            SELECT 1 FROM {table}
+            WHERE {key_column} = ?
+              AND (last_accessed IS NULL
+                   OR last_accessed < {NOW_SQL} - to_seconds(CAST(? AS BIGINT)))
+            """,
+            [key, ACCESS_TOUCH_INTERVAL_SECONDS],
+        ).fetchone()
+    except duckdb.Error:
+        return False
+    return row is not None
+
+
+def touch_access(conn: duckdb.DuckDBPyConnection, table: str, keys: Sequence[str]) -> int:
+    """Mark rows as used now; returns the number of rows updated."""
+    if not keys:
+        return 0
+    key_column = LRU_TABLE_KEYS[table]
+    placeholders = ", ".join("?" for _ in keys)
+    return _affected(
+        conn.execute(
+            f"UPDATE {table} SET last_accessed = CURRENT_TIMESTAMP "
+            f"WHERE {key_column} IN ({placeholders})",
+            list(keys),
+        )
+    )
+
+
+def touch_access_path(path: Path, table: str, keys: Sequence[str]) -> None:
+    """Best-effort `touch_access` under the writer lock; failures only cost LRU accuracy."""
+    try:
+        with connect_duckdb(path, read_only=False, lock=True, allow_create=False) as conn:
+            touch_access(conn, table, keys)
+    except Exception:
+        logger.debug("cache_gc.touch_failed", path=str(path), table=table, exc_info=True)
+
+
+@dataclass(frozen=True, slots=True)
+class CacheGcPolicy:
+    """
+    What `collect_garbage` may delete.
+
+    `ttl_days` and `max_rows` are keyed by LRU table name. `handler_versions`
+    maps a tool name to its current handler version. Extractions and
+    derivations for that tool written by any other version are pruned. Claims
+    keep only the newest handler version per derivation.
+    """
+
+    ttl_days: Mapping[str, int] = field(default_factory=lambda: dict(DEFAULT_TTL_DAYS))
+    max_rows: Mapping[str, int] = field(default_factory=dict)
+    handler_versions: Mapping[str, str] = field(default_factory=dict)
+    prune_handler_versions: bool = True
+    sweep_orphans: bool = True
+    orphan_grace_hours: int = DEFAULT_ORPHAN_GRACE_HOURS
+
+
+@dataclass(slots=True)
+class CacheGcReport:
+    dry_run: bool
+    deleted: dict[str, int] = field(default_factory=dict)
+    remaining: dict[str, int] = field(default_factory=dict)
+
+    def add(self, table: str, count: int) -> None:
+        if count:
+            self.deleted[table] = self.deleted.get(table, 0) + count
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "dry_run": self.dry_run,
+            "deleted": dict(sorted(self.deleted.items())),
+            "deleted_total": sum(self.deleted.values()),
+            "remaining": dict(sorted(self.remaining.items())),
+        }
+
+
+def _expire_entry_points(
+    conn: duckdb.DuckDBPyConnection, policy: CacheGcPolicy, report: CacheGcReport
+) -> None:
+    for table, key_column in LRU_TABLE_KEYS.items():
+        if not _table_exists(conn, table):
+            continue
+        ttl = policy.ttl_days.get(table)
+        if ttl is not None and ttl > 0:
+            report.add(
+                table,
+                _affected(
+                    conn.execute(
+                        f"DELETE FROM {table} WHERE {LAST_USED_SQL} "
+                        f"< {NOW_SQL} - to_days(CAST(? AS INTEGER))",
+                        [ttl],
+                    )
+                ),
+            )
+        limit = policy.max_rows.get(table)
+        if limit is not None and limit >= 0:
+            report.add(
+                table,
+                _affected(
+                    conn.execute(
+                        f"""
+                        DELETE FROM {table} WHERE {key_column} IN (
+                            SELECT {key_column} FROM {table}
+                            ORDER BY {LAST_USED_SQL} DESC, {key_column}
+                            OFFSET ?
+                        )
+                        """,
+                        [limit],
+                    )
+                ),
+            )
+
+
+def _prune_handler_versions(
+    conn: duckdb.DuckDBPyConnection, policy: CacheGcPolicy, report: CacheGcReport
+) -> None:
+    for table in VERSIONED_STAGE_TABLES:
+        if not _table_exists(conn, table):
+            continue
+        for tool, version in sorted(policy.handler_versions.items()):
+            report.add(
+                table,
+                _affected(
+                    conn.execute(
+                        f"DELETE FROM {table} "
+                        "WHERE tool = ? AND handler_version IS DISTINCT FROM ?",
+                        [tool, version],
+                    )
+                ),
+            )
+    if _table_exists(conn, "claims"):
+        report.add(
+            "claims",
+            _affected(
+                conn.execute(
+                    f"""
+                    DELETE FROM claims WHERE claim_id IN (
+                        SELECT c.claim_id
+                        FROM claims c
+                        JOIN (
+                            SELECT {CLAIM_VERSION_GROUP},
+                                   arg_max(handler_version, created_at) AS newest
+                            FROM claims
+                            WHERE handler_version IS NOT NULL
+                            GROUP BY {CLAIM_VERSION_GROUP}
+                        ) latest USING ({CLAIM_VERSION_GROUP})
+                        WHERE c.handler_version IS DISTINCT FROM latest.newest
+                    )
+                    """
+                )
+            ),
+        )
+
+
+def _sweep_unreferenced_raw_responses(
+    conn: duckdb.DuckDBPyConnection, policy: CacheGcPolicy, report: CacheGcReport
+) -> None:
+    """Drop raw responses no plan or normalization entry points at any more."""
+    if not _table_exists(conn, "raw_response_index"):
+        return
+    sources: list[str] = []
+    if _table_exists(conn, "plan_response_index"):
+        sources.append(
+            """
+            SELECT unnest(list_concat(
+                json_extract_string(tool_response_ids, '$[*].responseId'),
+                json_extract_string(tool_response_ids, '$[*].response_id')
+            )) AS response_id
+            FROM plan_response_index
+            WHERE tool_response_ids IS NOT NULL
+            """
+        )
+    if _table_exists(conn, "query_normalization_index"):
+        sources.append(
+            """
+            SELECT unnest(json_extract_string(source_response_ids, '$[*]')) AS response_id
+            FROM query_normalization_index
+            WHERE source_response_ids IS NOT NULL
+            """
+        )
+    live = " UNION ".join(sources) if sources else "SELECT NULL::VARCHAR AS response_id"
+    report.add(
+        "raw_response_index",
+        _affected(
+            conn.execute(
+                f"""
+                DELETE FROM raw_response_index
+                WHERE created_at < {NOW_SQL} - to_hours(CAST(? AS BIGINT))
+                  AND response_id NOT IN (
+                      SELECT response_id FROM ({live}) WHERE response_id IS NOT NULL
+                  )
+                """,
+                [policy.orphan_grace_hours],
+            )
+        ),
+    )
+
+
+def _sweep_orphans(conn: duckdb.DuckDBPyConnection, report: CacheGcReport) -> None:
+    for table, column, parent, parent_column in _ORPHAN_EDGES:
+        if not (_table_exists(conn, table) and _table_exists(conn, parent)):
+            continue
+        report.add(
+            table,
+            _affected(
+                conn.execute(
+                    f"""
+                    DELETE FROM {table}
+                    WHERE {column} NOT IN (
+                        SELECT {parent_column} FROM {parent} WHERE {parent_column} IS NOT NULL
+                    )
+                    """
+                )
+            ),
+        )
+
+
+def table_row_counts(conn: duckdb.DuckDBPyConnection) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for table in _REPORT_TABLES:
+        if _table_exists(conn, table):
+            row = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()
+            counts[table] = int(row[0]) if row else 0
+    return counts
+
+
+def collect_garbage(
+    conn: duckdb.DuckDBPyConnection, policy: CacheGcPolicy, *, dry_run: bool = False
+) -> CacheGcReport:
+    """
+    Apply `policy` in one transaction; with `dry_run` the deletes are rolled back.
+
+    Steps run top-down (entry points, handler versions, raw responses, then
+    each child table), so one pass removes everything an expired plan owned.
+    """
+    report = CacheGcReport(dry_run=dry_run)
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        _expire_entry_points(conn, policy, report)
+        if policy.prune_handler_versions:
+            _prune_handler_versions(conn, policy, report)
+        if policy.sweep_orphans:
+            _sweep_unreferenced_raw_responses(conn, policy, report)
+            _sweep_orphans(conn, report)
+        report.remaining = table_row_counts(conn)
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("ROLLBACK" if dry_run else "COMMIT")
+    return report
+
+
+def collect_garbage_path(
+    path: Path, policy: CacheGcPolicy, *, dry_run: bool = False
+) -> CacheGcReport:
+    with connect_duckdb(path, read_only=False, lock=True, allow_create=False) as conn:
+        return collect_garbage(conn, policy, dry_run=dry_run)
+
+
+@dataclass(frozen=True, slots=True)
+class CacheCompactReport:
+    path: str
+    size_before: int
+    size_after: int
+    rewritten: bool
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "path": self.path,
+            "size_before": self.size_before,
+            "size_after": self.size_after,
+            "reclaimed": self.size_before - self.size_after,
+            "rewritten": self.rewritten,
+        }
+
+
+def _file_size(path: Path) -> int:
+    wal = path.with_name(f"{path.name}.wal")
+    return sum(p.stat().st_size for p in (path, wal) if p.exists())
+
+
+def compact_cache(path: Path, *, rewrite: bool = False) -> CacheCompactReport:
+    """
+    CHECKPOINT the cache; with `rewrite`, copy it into a fresh file and swap it in.
+
+    DuckDB reuses freed blocks but rarely shrinks the file, so `rewrite` is the
+    way to give space back after a large gc. The writer lock is held for the
+    whole copy and swap; read-only pools notice the new inode and reopen.
+    """
+    size_before = _file_size(path)
+    lock = FileLock(f"{path}.lock")
+    timeout = _duckdb_lock_timeout_seconds()
+    lock.acquire(timeout=timeout, blocking=timeout > 0)
+    try:
+        if not rewrite:
+            with connect_duckdb(path, read_only=False, lock=False, allow_create=False) as conn:
+                conn.execute("CHECKPOINT")
+        else:
+            compacted = path.with_name(f"{path.name}.compact")
+            compacted.unlink(missing_ok=True)
+            with connect_duckdb(path, read_only=False, lock=False, allow_create=False) as conn:
+                source = conn.execute("SELECT current_database()").fetchone()
+                conn.execute(f"ATTACH '{compacted}' AS gc_compacted")
+                try:
+                    conn.execute(f'COPY FROM DATABASE "{source[0]}" TO gc_compacted')
+                finally:
+                    conn.execute("DETACH gc_compacted")
+            os.replace(compacted, path)
+    finally:
+        lock.release()
+    report = CacheCompactReport(
+        path=str(path),
+        size_before=size_before,
+        size_after=_file_size(path),
+        rewritten=rewrite,
+    )
+    logger.info("cache_gc.compacted", **report.to_dict())
+    return report
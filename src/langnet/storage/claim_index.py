@@ -1,14 +1,21 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import asdict
 from pathlib import Path
 
 import duckdb
 import orjson
 
-from langnet.execution.effects import ClaimEffect
+from langnet.execution.effects import ClaimEffect, ProvenanceLink
 
 SCHEMA_PATH = Path(__file__).resolve().parent / "schemas" / "langnet.sql"
+INSERT_CLAIM_SQL = """
+    INSERT OR REPLACE INTO claims
+    (claim_id, derivation_id, subject, predicate, value, provenance_chain,
+     handler_version, load_duration_ms, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
 
 
 def apply_schema(conn: duckdb.DuckDBPyConnection) -> None:
@@ -16,14 +23,27 @@ def apply_schema(conn: duckdb.DuckDBPyConnection) -> None:
     conn.execute(sql)
 
 
+def claim_row(effect: ClaimEffect) -> list[object]:
+    return [
+        effect.claim_id,
+        effect.derivation_id,
+        effect.subject,
+        effect.predicate,
+        orjson.dumps(effect.value or {}).decode("utf-8"),
+        orjson.dumps([asdict(pc) for pc in effect.provenance_chain]).decode("utf-8"),
+        effect.handler_version,
+        effect.load_duration_ms,
+    ]
+
+
 class ClaimIndex:
     """
     DuckDB-backed index for universal claims emitted after derivations.
     """
 
-    def __init__(self, conn: duckdb.DuckDBPyConnection) -> None:
+    def __init__(self, conn: duckdb.DuckDBPyConnection, *, schema_applied: bool = False) -> None:
         self.conn = conn
-        self._schema_applied = False
+        self._schema_applied = schema_applied
 
     def _ensure_schema(self) -> None:
         if not self._schema_applied:
@@ -32,22 +52,55 @@ class ClaimIndex:
 
     def store_effect(self, effect: ClaimEffect) -> str:
         self._ensure_schema()
-        self.conn.execute(
-            """
-            INSERT OR REPLACE INTO claims
-            (claim_id, derivation_id, subject, predicate, value, provenance_chain,
-             handler_version, load_duration_ms, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """,
-            [
-                effect.claim_id,
-                effect.derivation_id,
-                effect.subject,
-                effect.predicate,
-                orjson.dumps(effect.value or {}).decode("utf-8"),
-                orjson.dumps([asdict(pc) for pc in effect.provenance_chain]).decode("utf-8"),
-                effect.handler_version,
-                effect.load_duration_ms,
-            ],
-        )
+        self.conn.execute(INSERT_CLAIM_SQL, claim_row(effect))
         return effect.claim_id
+
+    def store_effects(self, effects: Sequence[ClaimEffect]) -> list[str]:
+        if not effects:
+            return []
+        self._ensure_schema()
+        self.conn.executemany(INSERT_CLAIM_SQL, [claim_row(effect) for effect in effects])
+        return [effect.claim_id for effect in effects]
+
+    def get_memoized(  # noqa: PLR0913
+        self,
+        derivation_id: str,
+        tool: str,
+        handler_version: str,
+        *,
+        effect_id: str,
+        call_id: str,
+        source_call_id: str,
+    ) -> ClaimEffect | None:
+        """
+        Return the stored claim `effect_id` if it matches this derivation/handler version.
+
+        `effect_id` is the id this call's handler would produce; one row is read
+        by primary key.
+        """
+        try:
+            row = self.conn.execute(
+                """
+                SELECT subject, predicate, value, provenance_chain, load_duration_ms
+                FROM claims
+                WHERE claim_id = ? AND derivation_id = ? AND handler_version = ?
+                """,
+                [effect_id, derivation_id, handler_version],
+            ).fetchone()
+        except duckdb.CatalogException:
+            return None
+        if row is None:
+            return None
+        return ClaimEffect(
+            claim_id=effect_id,
+            tool=tool,
+            call_id=call_id,
+            source_call_id=source_call_id,
+            derivation_id=derivation_id,
+            subject=row[0],
+            predicate=row[1],
+            value=orjson.loads(row[2]) if row[2] else None,
+            provenance_chain=[ProvenanceLink(**link) for link in orjson.loads(row[3] or "[]")],
+            handler_version=handler_version,
+            load_duration_ms=row[4] if row[4] is not None else 0,
+        )
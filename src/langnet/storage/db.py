@@ -2,16 +2,24 @@ from __future__ import annotations
 
 import contextlib
 import os
+import threading
 import time
+from collections import OrderedDict
 from collections.abc import Iterator
+from dataclasses import dataclass
 from pathlib import Path
 
 import duckdb
 from filelock import FileLock
 
+from langnet.storage.pooling import duckdb_pool_default
+
 DEFAULT_DUCKDB_LOCK_TIMEOUT_SECONDS = 30.0
 DEFAULT_DUCKDB_CONNECT_RETRY_SECONDS = 2.0
 DEFAULT_DUCKDB_CONNECT_RETRY_INTERVAL_SECONDS = 0.05
+DUCKDB_POOL_ENV = "LANGNET_DUCKDB_POOL"
+DEFAULT_DUCKDB_POOL_MAX_DATABASES = 32
+DEFAULT_DUCKDB_POOL_DRAIN_TIMEOUT_SECONDS = 5.0
 
 
 def _duckdb_lock_timeout_seconds() -> float:
@@ -44,6 +52,13 @@ def _duckdb_connect_retry_interval_seconds() -> float:
         return DEFAULT_DUCKDB_CONNECT_RETRY_INTERVAL_SECONDS
 
 
+def _duckdb_pool_enabled() -> bool:
+    raw = os.getenv(DUCKDB_POOL_ENV, "").strip().casefold()
+    if not raw:
+        return duckdb_pool_default()
+    return raw in {"1", "true", "yes", "on"}
+
+
 def _duckdb_connect_with_retry(
     *,
     database: str,
@@ -93,6 +108,9 @@ def connect_duckdb(
         raise FileNotFoundError(f"DuckDB path does not exist: {path_obj}")
 
     lock_handle: FileLock | None = None
+    if not read_only:
+        # DuckDB refuses a read-write open while this process holds the file read-only.
+        READ_ONLY_POOL.release(path_obj)
     if lock and not read_only:
         lock_handle = FileLock(f"{path_obj}.lock")
 
@@ -129,3 +147,199 @@ def connect_duckdb_rw(path: Path) -> Iterator[duckdb.DuckDBPyConnection]:
     path.parent.mkdir(parents=True, exist_ok=True)
     with connect_duckdb(path, read_only=False, lock=True, allow_create=True) as conn:
         yield conn
+
+
+def _file_signature(path: Path) -> tuple[int, int, int, int]:
+    stat = path.stat()
+    return (stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+
+class PooledDatabaseBusyError(RuntimeError):
+    """A pooled read-only handle still had cursors out when it had to be closed."""
+
+
+@dataclass(slots=True)
+class _PooledDatabase:
+    conn: duckdb.DuckDBPyConnection
+    signature: tuple[int, int, int, int]
+    leases: int = 0
+    retired: bool = False
+
+
+class ReadOnlyConnectionPool:
+    """
+    Process-wide read-only DuckDB connections, one database handle per path.
+
+    Each checkout yields a cursor on the shared handle, so concurrent threads
+    never share a connection object. A handle is reopened when the file's
+    inode, mtime, or size changes (for example after a databuild), and idle
+    handles beyond `max_databases` are closed least-recently-used first.
+
+    DuckDB caches database instances by path, so a stale handle must be
+    closed before the file can be reopened; retired handles are closed once
+    their outstanding cursors are returned. If they are not returned within
+    `drain_timeout_seconds`, the checkout or `release()` raises
+    `PooledDatabaseBusyError` instead of serving stale data or leaving the
+    file open read-only.
+    """
+
+    def __init__(
+        self,
+        max_databases: int = DEFAULT_DUCKDB_POOL_MAX_DATABASES,
+        drain_timeout_seconds: float = DEFAULT_DUCKDB_POOL_DRAIN_TIMEOUT_SECONDS,
+    ) -> None:
+        self.max_databases = max_databases
+        self.drain_timeout_seconds = drain_timeout_seconds
+        self._entries: OrderedDict[str, _PooledDatabase] = OrderedDict()
+        self._cond = threading.Condition()
+        self._counters = {"opens": 0, "hits": 0, "reopens": 0, "evictions": 0, "releases": 0}
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._reset_after_fork)
+
+    @contextlib.contextmanager
+    def connect(self, path: Path) -> Iterator[duckdb.DuckDBPyConnection]:
+        if not path.exists():
+            raise FileNotFoundError(f"DuckDB path does not exist: {path}")
+        entry = self._acquire(path)
+        try:
+            cursor = entry.conn.cursor()
+            try:
+                yield cursor
+            finally:
+                cursor.close()
+        finally:
+            self._return(entry)
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return {
+                **self._counters,
+                "databases": len(self._entries),
+                "leased": sum(entry.leases for entry in self._entries.values()),
+            }
+
+    def release(self, path: Path) -> None:
+        """
+        Close the pooled handle for `path`, e.g. before opening it read-write.
+
+        Raises `PooledDatabaseBusyError` if its cursors are not returned in time.
+        """
+        key = self._key(path)
+        with self._cond:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            self._counters["releases"] += 1
+            self._drain_and_close(key, entry)
+
+    def close_all(self) -> None:
+        with self._cond:
+            for key, entry in list(self._entries.items()):
+                self._drain_and_close(key, entry)
+
+    def _reset_after_fork(self) -> None:
+        # Handles and locks inherited from the parent must not be used by a
+        # forked worker; it opens its own on first checkout.
+        self._entries = OrderedDict()
+        self._cond = threading.Condition()
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return str(path.expanduser().resolve())
+
+    def _acquire(self, path: Path) -> _PooledDatabase:
+        key = self._key(path)
+        signature = _file_signature(path)
+        with self._cond:
+            entry = self._entries.get(key)
+            if entry is not None and not entry.retired and entry.signature == signature:
+                self._entries.move_to_end(key)
+                self._counters["hits"] += 1
+                entry.leases += 1
+                return entry
+            if entry is not None:
+                if not entry.retired:
+                    self._counters["reopens"] += 1
+                self._drain_and_close(key, entry)
+            conn = _duckdb_connect_with_retry(database=str(path), read_only=True)
+            entry = _PooledDatabase(conn=conn, signature=signature, leases=1)
+            self._entries[key] = entry
+            self._counters["opens"] += 1
+            self._evict_idle()
+            return entry
+
+    def _return(self, entry: _PooledDatabase) -> None:
+        with self._cond:
+            entry.leases -= 1
+            if entry.retired and entry.leases == 0:
+                self._close(entry)
+            self._cond.notify_all()
+
+    def _close(self, entry: _PooledDatabase) -> None:
+        for key, current in list(self._entries.items()):
+            if current is entry:
+                del self._entries[key]
+        entry.conn.close()
+
+    def _drain_and_close(self, key: str, entry: _PooledDatabase) -> None:
+        """
+        Retire `entry` and wait for its cursors to come back; caller holds the lock.
+
+        The retired entry stays registered until it is closed so other threads
+        wait on it instead of reopening the path, which would hand them DuckDB's
+        cached (stale) instance. It is closed when its last cursor is returned
+        even if this wait gives up.
+        """
+        entry.retired = True
+        drained = self._cond.wait_for(
+            lambda: self._entries.get(key) is not entry or entry.leases == 0,
+            self.drain_timeout_seconds,
+        )
+        if not drained:
+            raise PooledDatabaseBusyError(
+                f"read-only DuckDB handle for {key} still has {entry.leases} open cursor(s) "
+                f"after {self.drain_timeout_seconds:g}s; it cannot be reopened or written "
+                "until they are closed"
+            )
+        if self._entries.get(key) is entry:
+            self._close(entry)
+        self._cond.notify_all()
+
+    def _evict_idle(self) -> None:
+        for key in list(self._entries):
+            if len(self._entries) <= self.max_databases:
+                return
+            entry = self._entries[key]
+            if entry.leases == 0:
+                del self._entries[key]
+                entry.conn.close()
+                self._counters["evictions"] += 1
+
+
+READ_ONLY_POOL = ReadOnlyConnectionPool()
+
+
+@contextlib.contextmanager
+def connect_duckdb_pooled(
+    path: Path, *, pool: ReadOnlyConnectionPool | None = None
+) -> Iterator[duckdb.DuckDBPyConnection]:
+    """
+    Read-only connection from the process-wide pool; same contract as `connect_duckdb_ro`.
+
+    Pooling is enabled by `enable_duckdb_pool()` (the `langnet-cli` entrypoint
+    and `serve` call it) or with LANGNET_DUCKDB_POOL=1; LANGNET_DUCKDB_POOL=0
+    turns it off. It is off by default for library callers because a
+    pooled read-only handle stops this process from opening the same file
+    read-write with plain `duckdb.connect`. `pool` selects a dedicated pool
+    (such as the reader's book pool) instead of `READ_ONLY_POOL`.
+    """
+    if not _duckdb_pool_enabled():
+        with connect_duckdb_ro(path) as conn:
+            yield conn
+        return
+    with (pool or READ_ONLY_POOL).connect(path) as conn:
+        yield conn
+
+
+def duckdb_pool_stats() -> dict[str, int]:
+    return READ_ONLY_POOL.stats()
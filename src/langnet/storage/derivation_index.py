@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from dataclasses import asdict
 from pathlib import Path
 
 import duckdb
 import orjson
 
-from langnet.execution.effects import DerivationEffect
+from langnet.execution.effects import DerivationEffect, ProvenanceLink
 
 SCHEMA_PATH = Path(__file__).resolve().parent / "schemas" / "langnet.sql"
+INSERT_DERIVATION_SQL = """
+    INSERT OR REPLACE INTO derivation_index
+    (derivation_id, extraction_id, tool, kind, canonical, payload,
+     handler_version, derive_duration_ms, provenance_chain, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
 
 
 def apply_schema(conn: duckdb.DuckDBPyConnection) -> None:
@@ -15,14 +23,28 @@ def apply_schema(conn: duckdb.DuckDBPyConnection) -> None:
     conn.execute(sql)
 
 
+def derivation_row(effect: DerivationEffect) -> list[object]:
+    return [
+        effect.derivation_id,
+        effect.extraction_id,
+        effect.tool,
+        effect.kind,
+        effect.canonical,
+        orjson.dumps(effect.payload or {}).decode("utf-8"),
+        effect.handler_version,
+        effect.derive_duration_ms,
+        orjson.dumps([asdict(pc) for pc in effect.provenance_chain or []]).decode("utf-8"),
+    ]
+
+
 class DerivationIndex:
     """
     DuckDB-backed index for derivations produced from parsed extractions.
     """
 
-    def __init__(self, conn: duckdb.DuckDBPyConnection) -> None:
+    def __init__(self, conn: duckdb.DuckDBPyConnection, *, schema_applied: bool = False) -> None:
         self.conn = conn
-        self._schema_applied = False
+        self._schema_applied = schema_applied
 
     def _ensure_schema(self) -> None:
         if not self._schema_applied:
@@ -31,22 +53,56 @@ class DerivationIndex:
 
     def store_effect(self, effect: DerivationEffect) -> str:
         self._ensure_schema()
-        self.conn.execute(
-            """
-            INSERT OR REPLACE INTO derivation_index
-            (derivation_id, extraction_id, tool, kind, canonical, payload,
-             handler_version, derive_duration_ms, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """,
-            [
-                effect.derivation_id,
-                effect.extraction_id,
-                effect.tool,
-                effect.kind,
-                effect.canonical,
-                orjson.dumps(effect.payload or {}).decode("utf-8"),
-                effect.handler_version,
-                effect.derive_duration_ms,
-            ],
-        )
+        self.conn.execute(INSERT_DERIVATION_SQL, derivation_row(effect))
         return effect.derivation_id
+
+    def store_effects(self, effects: Sequence[DerivationEffect]) -> list[str]:
+        if not effects:
+            return []
+        self._ensure_schema()
+        self.conn.executemany(INSERT_DERIVATION_SQL, [derivation_row(effect) for effect in effects])
+        return [effect.derivation_id for effect in effects]
+
+    def get_memoized(  # noqa: PLR0913
+        self,
+        extraction_id: str,
+        tool: str,
+        handler_version: str,
+        *,
+        effect_id: str,
+        call_id: str,
+        source_call_id: str,
+    ) -> DerivationEffect | None:
+        """
+        Return the stored derivation `effect_id` if it matches this extraction/tool/version.
+
+        `effect_id` is the id this call's handler would produce; one row is read
+        by primary key.
+        """
+        try:
+            row = self.conn.execute(
+                """
+                SELECT kind, canonical, payload, derive_duration_ms, provenance_chain
+                FROM derivation_index
+                WHERE derivation_id = ? AND extraction_id = ? AND tool = ? AND handler_version = ?
+                """,
+                [effect_id, extraction_id, tool, handler_version],
+            ).fetchone()
+        except (duckdb.CatalogException, duckdb.BinderException):
+            # Missing table, or a pre-provenance_chain database opened read-only.
+            return None
+        if row is None:
+            return None
+        return DerivationEffect(
+            derivation_id=effect_id,
+            tool=tool,
+            call_id=call_id,
+            source_call_id=source_call_id,
+            extraction_id=extraction_id,
+            kind=row[0],
+            canonical=row[1],
+            payload=orjson.loads(row[2]) if row[2] else None,
+            handler_version=handler_version,
+            derive_duration_ms=row[3] if row[3] is not None else 0,
+            provenance_chain=[ProvenanceLink(**link) for link in orjson.loads(row[4] or "[]")],
+        )
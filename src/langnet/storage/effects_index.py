@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import hashlib
+import importlib
+import zlib
+from collections.abc import Sequence
 from pathlib import Path
+from types import ModuleType
 
 import duckdb
 import orjson
@@ -9,6 +14,80 @@ from query_spec import ToolResponseRef
 from langnet.clients.base import RawResponseEffect
 
 SCHEMA_PATH = Path(__file__).resolve().parent / "schemas" / "langnet.sql"
+BODY_CODEC_ZSTD = "zstd"
+BODY_CODEC_ZLIB = "zlib"
+BODY_CODEC_IDENTITY = "identity"
+BODY_COMPRESSION_MIN_BYTES = 256
+ZSTD_LEVEL = 9
+ZLIB_LEVEL = 6
+INSERT_RAW_RESPONSE_SQL = """
+    INSERT OR REPLACE INTO raw_response_index
+    (
+        response_id,
+        tool,
+        call_id,
+        endpoint,
+        status_code,
+        content_type,
+        headers,
+        body,
+        fetch_duration_ms,
+        created_at
+    )
+    VALUES (?, ?, ?, ?, ?, ?, ?, NULL, ?, CURRENT_TIMESTAMP)
+"""
+INSERT_RAW_BODY_REF_SQL = """
+    INSERT OR REPLACE INTO raw_response_body_ref (response_id, body_hash) VALUES (?, ?)
+"""
+INSERT_RAW_BODY_SQL = """
+    INSERT OR IGNORE INTO raw_response_body
+    (body_hash, codec, size_bytes, stored_bytes, body, created_at)
+    VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
+
+
+def _zstandard() -> ModuleType | None:
+    try:
+        return importlib.import_module("zstandard")
+    except ImportError:
+        return None
+
+
+def raw_body_hash(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()
+
+
+def encode_raw_body(body: bytes) -> tuple[str, bytes]:
+    """
+    Compress a response body for content-addressed storage.
+
+    Uses zstd through the declared `zstandard` dependency. zlib is kept as a
+    fallback for installs that are missing it. Tiny bodies, and bodies that do
+    not shrink, are stored as-is.
+    """
+    if len(body) < BODY_COMPRESSION_MIN_BYTES:
+        return BODY_CODEC_IDENTITY, body
+    zstd = _zstandard()
+    if zstd is not None:
+        codec, packed = BODY_CODEC_ZSTD, zstd.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+    else:
+        codec, packed = BODY_CODEC_ZLIB, zlib.compress(body, ZLIB_LEVEL)
+    if len(packed) >= len(body):
+        return BODY_CODEC_IDENTITY, body
+    return codec, packed
+
+
+def decode_raw_body(codec: str, stored: bytes) -> bytes:
+    if codec == BODY_CODEC_IDENTITY:
+        return stored
+    if codec == BODY_CODEC_ZLIB:
+        return zlib.decompress(stored)
+    if codec == BODY_CODEC_ZSTD:
+        zstd = _zstandard()
+        if zstd is None:
+            raise RuntimeError("zstandard is required to read zstd-compressed raw responses")
+        return zstd.ZstdDecompressor().decompress(stored)
+    raise ValueError(f"Unknown raw response body codec: {codec}")
 
 
 def apply_schema(conn: duckdb.DuckDBPyConnection) -> None:
@@ -16,15 +95,37 @@ def apply_schema(conn: duckdb.DuckDBPyConnection) -> None:
     conn.execute(sql)
 
 
+def raw_response_row(effect: RawResponseEffect) -> list[object]:
+    return [
+        effect.response_id,
+        effect.tool,
+        effect.call_id,
+        effect.endpoint,
+        effect.status_code,
+        effect.content_type,
+        orjson.dumps(effect.headers).decode("utf-8"),
+        effect.fetch_duration_ms,
+    ]
+
+
+def raw_response_ref(effect: RawResponseEffect) -> ToolResponseRef:
+    return ToolResponseRef(
+        tool=effect.tool,
+        call_id=effect.call_id,
+        response_id=effect.response_id,
+        cached=False,
+    )
+
+
 class RawResponseIndex:
     """
     DuckDB-backed index for transport-level raw responses.
     """
 
-    def __init__(self, conn: duckdb.DuckDBPyConnection) -> None:
+    def __init__(self, conn: duckdb.DuckDBPyConnection, *, schema_applied: bool = False) -> None:
         self.conn = conn
         # Schema will be applied lazily on first write
-        self._schema_applied = False
+        self._schema_applied = schema_applied
 
     def _ensure_schema(self) -> None:
         """Apply schema lazily - only when needed for writes."""
@@ -32,60 +133,68 @@ class RawResponseIndex:
             apply_schema(self.conn)
             self._schema_applied = True
 
-    def store(self, effect: RawResponseEffect) -> ToolResponseRef:
-        self._ensure_schema()
-        self.conn.execute(
-            """
-            INSERT OR REPLACE INTO raw_response_index
-            (
-                response_id,
-                tool,
-                call_id,
-                endpoint,
-                status_code,
-                content_type,
-                headers,
-                body,
-                fetch_duration_ms,
-                created_at
-            )
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """,
+    def _store_bodies(self, effects: Sequence[RawResponseEffect]) -> None:
+        """Write each distinct body once; bodies already stored are not recompressed."""
+        hashes = [raw_body_hash(effect.body) for effect in effects]
+        bodies = {body_hash: effect.body for body_hash, effect in zip(hashes, effects, strict=True)}
+        placeholders = ", ".join("?" for _ in bodies)
+        existing = {
+            row[0]
+            for row in self.conn.execute(
+                f"SELECT body_hash FROM raw_response_body WHERE body_hash IN ({placeholders})",
+                list(bodies),
+            ).fetchall()
+        }
+        rows: list[list[object]] = []
+        for body_hash, body in bodies.items():
+            if body_hash in existing:
+                continue
+            codec, stored = encode_raw_body(body)
+            rows.append([body_hash, codec, len(body), len(stored), stored])
+        if rows:
+            self.conn.executemany(INSERT_RAW_BODY_SQL, rows)
+        self.conn.executemany(
+            INSERT_RAW_BODY_REF_SQL,
             [
-                effect.response_id,
-                effect.tool,
-                effect.call_id,
-                effect.endpoint,
-                effect.status_code,
-                effect.content_type,
-                orjson.dumps(effect.headers).decode("utf-8"),
-                effect.body,
-                effect.fetch_duration_ms,
+                [effect.response_id, body_hash]
+                for effect, body_hash in zip(effects, hashes, strict=True)
             ],
         )
-        return ToolResponseRef(
-            tool=effect.tool,
-            call_id=effect.call_id,
-            response_id=effect.response_id,
-            cached=False,
-        )
+
+    def store(self, effect: RawResponseEffect) -> ToolResponseRef:
+        self._ensure_schema()
+        self._store_bodies([effect])
+        self.conn.execute(INSERT_RAW_RESPONSE_SQL, raw_response_row(effect))
+        return raw_response_ref(effect)
+
+    def store_many(self, effects: Sequence[RawResponseEffect]) -> list[ToolResponseRef]:
+        if not effects:
+            return []
+        self._ensure_schema()
+        self._store_bodies(effects)
+        self.conn.executemany(INSERT_RAW_RESPONSE_SQL, [raw_response_row(e) for e in effects])
+        return [raw_response_ref(effect) for effect in effects]
 
     def get(self, response_id: str) -> RawResponseEffect | None:
         try:
             row = self.conn.execute(
                 """
-                SELECT tool, call_id, endpoint, status_code, content_type,
-                       headers, body, fetch_duration_ms
-                FROM raw_response_index
-                WHERE response_id = ?
+                SELECT r.tool, r.call_id, r.endpoint, r.status_code, r.content_type,
+                       r.headers, r.body, r.fetch_duration_ms, b.codec, b.body
+                FROM raw_response_index r
+                LEFT JOIN raw_response_body_ref ref ON ref.response_id = r.response_id
+                LEFT JOIN raw_response_body b ON b.body_hash = ref.body_hash
+                WHERE r.response_id = ?
                 """,
                 [response_id],
             ).fetchone()
         except duckdb.CatalogException:
-            return None
+            row = self._get_legacy(response_id)
         if not row:
             return None
         headers = orjson.loads(row[5]) if row[5] else {}
+        # Rows written before content-addressed storage keep their body inline.
+        body = decode_raw_body(row[8], row[9]) if row[8] is not None else row[6]
         return RawResponseEffect(
             response_id=response_id,
             tool=row[0],
@@ -94,6 +203,22 @@ class RawResponseIndex:
             status_code=row[3],
             content_type=row[4] or "",
             headers=headers,
-            body=row[6],
+            body=body if body is not None else b"",
             fetch_duration_ms=row[7] if row[7] is not None else 0,
         )
+
+    def _get_legacy(self, response_id: str) -> tuple | None:
+        """Read a cache file whose schema predates `raw_response_body`."""
+        try:
+            row = self.conn.execute(
+                """
+                SELECT tool, call_id, endpoint, status_code, content_type,
+                       headers, body, fetch_duration_ms
+                FROM raw_response_index
+                WHERE response_id = ?
+                """,
+                [response_id],
+            ).fetchone()
+        except duckdb.CatalogException:
+            return None
+        return (*row, None, None) if row else None
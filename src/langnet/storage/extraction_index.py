@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import uuid
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 
 import duckdb
@@ -11,6 +11,12 @@ from langnet.clients.base import RawResponseEffect
 from langnet.execution.effects import ExtractionEffect
 
 SCHEMA_PATH = Path(__file__).resolve().parent / "schemas" / "langnet.sql"
+INSERT_EXTRACTION_SQL = """
+    INSERT OR REPLACE INTO extraction_index
+    (extraction_id, response_id, tool, kind, canonical, payload,
+     handler_version, load_duration_ms, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+"""
 
 
 def apply_schema(conn: duckdb.DuckDBPyConnection) -> None:
@@ -22,14 +28,27 @@ def _new_extraction_id() -> str:
     return str(uuid.uuid4())
 
 
+def extraction_row(effect: ExtractionEffect) -> list[object]:
+    return [
+        effect.extraction_id,
+        effect.response_id,
+        effect.tool,
+        effect.kind,
+        effect.canonical,
+        orjson.dumps(effect.payload or {}).decode("utf-8"),
+        effect.handler_version,
+        effect.load_duration_ms,
+    ]
+
+
 class ExtractionIndex:
     """
     DuckDB-backed index for parsed extractions derived from raw responses.
     """
 
-    def __init__(self, conn: duckdb.DuckDBPyConnection) -> None:
+    def __init__(self, conn: duckdb.DuckDBPyConnection, *, schema_applied: bool = False) -> None:
         self.conn = conn
-        self._schema_applied = False
+        self._schema_applied = schema_applied
 
     def _ensure_schema(self) -> None:
         if not self._schema_applied:
@@ -68,26 +87,60 @@ class ExtractionIndex:
     def store_effect(self, effect: ExtractionEffect) -> str:
         """Store a prebuilt ExtractionEffect."""
         self._ensure_schema()
-        self.conn.execute(
-            """
-            INSERT OR REPLACE INTO extraction_index
-            (extraction_id, response_id, tool, kind, canonical, payload,
-             handler_version, load_duration_ms, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-            """,
-            [
-                effect.extraction_id,
-                effect.response_id,
-                effect.tool,
-                effect.kind,
-                effect.canonical,
-                orjson.dumps(effect.payload or {}).decode("utf-8"),
-                effect.handler_version,
-                effect.load_duration_ms,
-            ],
-        )
+        self.conn.execute(INSERT_EXTRACTION_SQL, extraction_row(effect))
         return effect.extraction_id
 
+    def store_effects(self, effects: Sequence[ExtractionEffect]) -> list[str]:
+        """Store several prebuilt ExtractionEffects with one executemany."""
+        if not effects:
+            return []
+        self._ensure_schema()
+        self.conn.executemany(INSERT_EXTRACTION_SQL, [extraction_row(effect) for effect in effects])
+        return [effect.extraction_id for effect in effects]
+
+    def get_memoized(  # noqa: PLR0913
+        self,
+        response_id: str,
+        tool: str,
+        handler_version: str,
+        *,
+        effect_id: str,
+        call_id: str,
+        source_call_id: str,
+    ) -> ExtractionEffect | None:
+        """
+        Return the stored extraction `effect_id` if it matches this response/tool/version.
+
+        `effect_id` is the id this call's handler would produce, so the lookup
+        reads one row by primary key and the effect's id and downstream
+        provenance stay tied to `call_id`.
+        """
+        try:
+            row = self.conn.execute(
+                """
+                SELECT kind, canonical, payload, load_duration_ms
+                FROM extraction_index
+                WHERE extraction_id = ? AND response_id = ? AND tool = ? AND handler_version = ?
+                """,
+                [effect_id, response_id, tool, handler_version],
+            ).fetchone()
+        except duckdb.CatalogException:
+            return None
+        if row is None:
+            return None
+        return ExtractionEffect(
+            extraction_id=effect_id,
+            tool=tool,
+            call_id=call_id,
+            source_call_id=source_call_id,
+            response_id=response_id,
+            kind=row[0],
+            canonical=row[1],
+            payload=orjson.loads(row[2]) if row[2] else None,
+            handler_version=handler_version,
+            load_duration_ms=row[3] if row[3] is not None else 0,
+        )
+
     def get_by_canonical(self, canonical: str) -> Iterable[tuple[str, str]]:
         self._ensure_schema()
         rows = self.conn.execute(
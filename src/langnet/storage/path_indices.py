@@ -1,28 +1,58 @@
 from __future__ import annotations
 
+import threading
 from collections.abc import Iterator, Sequence
-from contextlib import contextmanager
-from dataclasses import dataclass
+from contextlib import AbstractContextManager, contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
+from types import TracebackType
 
 import duckdb
+import structlog
 from query_spec import ExecutedPlan, ToolResponseRef
 
 from langnet.clients.base import RawResponseEffect
 from langnet.execution.effects import ClaimEffect, DerivationEffect, ExtractionEffect
+from langnet.storage.cache_gc import access_touch_due, touch_access
 from langnet.storage.claim_index import ClaimIndex
 from langnet.storage.db import connect_duckdb, connect_duckdb_ro
 from langnet.storage.derivation_index import DerivationIndex
-from langnet.storage.effects_index import RawResponseIndex, apply_schema
+from langnet.storage.effects_index import RawResponseIndex, apply_schema, raw_response_ref
 from langnet.storage.extraction_index import ExtractionIndex
 from langnet.storage.plan_index import PlanResponseIndex
 
+logger = structlog.get_logger(__name__)
+
+_SCHEMA_READY: set[tuple[str, int, int]] = set()
+_SCHEMA_READY_LOCK = threading.Lock()
+
+
+def _schema_key(path: Path) -> tuple[str, int, int]:
+    stat = path.stat()
+    return (str(path.resolve()), stat.st_dev, stat.st_ino)
+
+
+def _ensure_schema_once(conn: duckdb.DuckDBPyConnection, path: Path) -> None:
+    """
+    Apply langnet.sql once per database file per process.
+
+    Keyed by device/inode so a cache file that is deleted and recreated gets
+    its schema again.
+    """
+    key = _schema_key(path)
+    with _SCHEMA_READY_LOCK:
+        if key in _SCHEMA_READY:
+            return
+    apply_schema(conn)
+    with _SCHEMA_READY_LOCK:
+        _SCHEMA_READY.add(key)
+
 
 @contextmanager
 def _locked_rw_connection(path: Path) -> Iterator[duckdb.DuckDBPyConnection]:
     path.parent.mkdir(parents=True, exist_ok=True)
     with connect_duckdb(path, read_only=False, lock=True) as conn:
-        apply_schema(conn)
+        _ensure_schema_once(conn, path)
         yield conn
 
 
@@ -46,7 +76,7 @@ class PathRawResponseIndex:
 
     def store(self, effect: RawResponseEffect) -> ToolResponseRef:
         with _locked_rw_connection(self.path) as conn:
-            return RawResponseIndex(conn).store(effect)
+            return RawResponseIndex(conn, schema_applied=True).store(effect)
 
 
 @dataclass(frozen=True, slots=True)
@@ -57,7 +87,29 @@ class PathExtractionIndex:
 
     def store_effect(self, effect: ExtractionEffect) -> str:
         with _locked_rw_connection(self.path) as conn:
-            return ExtractionIndex(conn).store_effect(effect)
+            return ExtractionIndex(conn, schema_applied=True).store_effect(effect)
+
+    def get_memoized(  # noqa: PLR0913
+        self,
+        response_id: str,
+        tool: str,
+        handler_version: str,
+        *,
+        effect_id: str,
+        call_id: str,
+        source_call_id: str,
+    ) -> ExtractionEffect | None:
+        if not self.path.exists():
+            return None
+        with _read_only_connection(self.path) as conn:
+            return ExtractionIndex(conn).get_memoized(
+                response_id,
+                tool,
+                handler_version,
+                effect_id=effect_id,
+                call_id=call_id,
+                source_call_id=source_call_id,
+            )
 
 
 @dataclass(frozen=True, slots=True)
@@ -68,7 +120,29 @@ class PathDerivationIndex:
 
     def store_effect(self, effect: DerivationEffect) -> str:
         with _locked_rw_connection(self.path) as conn:
-            return DerivationIndex(conn).store_effect(effect)
+            return DerivationIndex(conn, schema_applied=True).store_effect(effect)
+
+    def get_memoized(  # noqa: PLR0913
+        self,
+        extraction_id: str,
+        tool: str,
+        handler_version: str,
+        *,
+        effect_id: str,
+        call_id: str,
+        source_call_id: str,
+    ) -> DerivationEffect | None:
+        if not self.path.exists():
+            return None
+        with _read_only_connection(self.path) as conn:
+            return DerivationIndex(conn).get_memoized(
+                extraction_id,
+                tool,
+                handler_version,
+                effect_id=effect_id,
+                call_id=call_id,
+                source_call_id=source_call_id,
+            )
 
 
 @dataclass(frozen=True, slots=True)
@@ -79,7 +153,29 @@ class PathClaimIndex:
 
     def store_effect(self, effect: ClaimEffect) -> str:
         with _locked_rw_connection(self.path) as conn:
-            return ClaimIndex(conn).store_effect(effect)
+            return ClaimIndex(conn, schema_applied=True).store_effect(effect)
+
+    def get_memoized(  # noqa: PLR0913
+        self,
+        derivation_id: str,
+        tool: str,
+        handler_version: str,
+        *,
+        effect_id: str,
+        call_id: str,
+        source_call_id: str,
+    ) -> ClaimEffect | None:
+        if not self.path.exists():
+            return None
+        with _read_only_connection(self.path) as conn:
+            return ClaimIndex(conn).get_memoized(
+                derivation_id,
+                tool,
+                handler_version,
+                effect_id=effect_id,
+                call_id=call_id,
+                source_call_id=source_call_id,
+            )
 
 
 @dataclass(frozen=True, slots=True)
@@ -94,6 +190,17 @@ class PathPlanResponseIndex:
         with _read_only_connection(self.path) as conn:
             return PlanResponseIndex(conn).get(plan_hash)
 
+    def get_tracked(self, plan_hash: str) -> tuple[ExecutedPlan | None, bool]:
+        """Like `get`, plus whether the hit's `last_accessed` is due a refresh."""
+        if not self.path.exists():
+            return None, False
+        with _read_only_connection(self.path) as conn:
+            cached = PlanResponseIndex(conn).get(plan_hash)
+            touch_due = cached is not None and access_touch_due(
+                conn, "plan_response_index", plan_hash
+            )
+        return cached, touch_due
+
     def upsert(
         self, plan_hash: str, plan_id: str, response_refs: Sequence[ToolResponseRef]
     ) -> None:
@@ -103,3 +210,275 @@ class PathPlanResponseIndex:
                 plan_id=plan_id,
                 response_refs=response_refs,
             )
+
+
+@dataclass(slots=True)
+class PathEffectBatch:
+    """
+    Unit of work for one executor run against a path-backed cache.
+
+    The `*_index` views buffer every store/upsert in memory and delegate reads
+    (cache lookups, stage memo lookups) to the path-backed indices. `flush()`
+    writes everything in one locked DuckDB transaction with `executemany`, so
+    an encounter takes the file lock once instead of once per effect. Use it as
+    a context manager; effects buffered before an error are still flushed so
+    completed fetches stay cached.
+    """
+
+    path: Path
+    raw_responses: dict[str, RawResponseEffect] = field(default_factory=dict)
+    extractions: dict[str, ExtractionEffect] = field(default_factory=dict)
+    derivations: dict[str, DerivationEffect] = field(default_factory=dict)
+    claims: dict[str, ClaimEffect] = field(default_factory=dict)
+    plan_responses: dict[str, tuple[str, list[ToolResponseRef]]] = field(default_factory=dict)
+    touched_plans: set[str] = field(default_factory=set)
+    memo_conn: duckdb.DuckDBPyConnection | None = field(default=None, init=False, repr=False)
+
+    @contextmanager
+    def memo_reads(self) -> Iterator[None]:
+        """
+        Share one read-only connection across the stage memo lookups in this block.
+
+        The executor opens one per wave of extract/derive/claim calls. Fetches
+        run outside it, so the cache file is not held open during network I/O.
+        """
+        if self.memo_conn is not None or not self.path.exists():
+            yield
+            return
+        with _read_only_connection(self.path) as conn:
+            self.memo_conn = conn
+            try:
+                yield
+            finally:
+                self.memo_conn = None
+
+    @property
+    def raw_index(self) -> _BatchRawResponseIndex:
+        return _BatchRawResponseIndex(self)
+
+    @property
+    def extraction_index(self) -> _BatchExtractionIndex:
+        return _BatchExtractionIndex(self)
+
+    @property
+    def derivation_index(self) -> _BatchDerivationIndex:
+        return _BatchDerivationIndex(self)
+
+    @property
+    def claim_index(self) -> _BatchClaimIndex:
+        return _BatchClaimIndex(self)
+
+    @property
+    def plan_response_index(self) -> _BatchPlanResponseIndex:
+        return _BatchPlanResponseIndex(self)
+
+    def pending_count(self) -> int:
+        return (
+            len(self.raw_responses)
+            + len(self.extractions)
+            + len(self.derivations)
+            + len(self.claims)
+            + len(self.plan_responses)
+        )
+
+    def flush(self) -> int:
+        """
+        Write buffered effects in a single transaction; returns rows written.
+
+        Plan cache hits due an LRU refresh ride along in the same transaction.
+        """
+        written = self.pending_count()
+        if not written and not self.touched_plans:
+            return 0
+        with _locked_rw_connection(self.path) as conn:
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                RawResponseIndex(conn, schema_applied=True).store_many(
+                    list(self.raw_responses.values())
+                )
+                ExtractionIndex(conn, schema_applied=True).store_effects(
+                    list(self.extractions.values())
+                )
+                DerivationIndex(conn, schema_applied=True).store_effects(
+                    list(self.derivations.values())
+                )
+                ClaimIndex(conn, schema_applied=True).store_effects(list(self.claims.values()))
+                plan_index = PlanResponseIndex(conn)
+                for plan_hash, (plan_id, refs) in self.plan_responses.items():
+                    plan_index.upsert(plan_hash=plan_hash, plan_id=plan_id, response_refs=refs)
+                # Upserted plans already carry a fresh last_accessed.
+                touched = sorted(self.touched_plans - set(self.plan_responses))
+                touch_access(conn, "plan_response_index", touched)
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        self.raw_responses.clear()
+        self.extractions.clear()
+        self.derivations.clear()
+        self.claims.clear()
+        self.plan_responses.clear()
+        self.touched_plans.clear()
+        return written
+
+    def __enter__(self) -> PathEffectBatch:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.flush()
+            return
+        try:
+            self.flush()
+        except Exception:
+            logger.warning("effect_batch.flush_failed", path=str(self.path), exc_info=True)
+
+
+@dataclass(frozen=True, slots=True)
+class _BatchRawResponseIndex:
+    batch: PathEffectBatch
+
+    def get(self, response_id: str) -> RawResponseEffect | None:
+        buffered = self.batch.raw_responses.get(response_id)
+        if buffered is not None:
+            return buffered
+        return PathRawResponseIndex(self.batch.path).get(response_id)
+
+    def store(self, effect: RawResponseEffect) -> ToolResponseRef:
+        self.batch.raw_responses[effect.response_id] = effect
+        return raw_response_ref(effect)
+
+
+@dataclass(frozen=True, slots=True)
+class _BatchExtractionIndex:
+    batch: PathEffectBatch
+
+    def store_effect(self, effect: ExtractionEffect) -> str:
+        self.batch.extractions[effect.extraction_id] = effect
+        return effect.extraction_id
+
+    def get_memoized(  # noqa: PLR0913
+        self,
+        response_id: str,
+        tool: str,
+        handler_version: str,
+        *,
+        effect_id: str,
+        call_id: str,
+        source_call_id: str,
+    ) -> ExtractionEffect | None:
+        if self.batch.memo_conn is not None:
+            return ExtractionIndex(self.batch.memo_conn).get_memoized(
+                response_id,
+                tool,
+                handler_version,
+                effect_id=effect_id,
+                call_id=call_id,
+                source_call_id=source_call_id,
+            )
+        return PathExtractionIndex(self.batch.path).get_memoized(
+            response_id,
+            tool,
+            handler_version,
+            effect_id=effect_id,
+            call_id=call_id,
+            source_call_id=source_call_id,
+        )
+
+    def memo_reads(self) -> AbstractContextManager[None]:
+        return self.batch.memo_reads()
+
+
+@dataclass(frozen=True, slots=True)
+class _BatchDerivationIndex:
+    batch: PathEffectBatch
+
+    def store_effect(self, effect: DerivationEffect) -> str:
+        self.batch.derivations[effect.derivation_id] = effect
+        return effect.derivation_id
+
+    def get_memoized(  # noqa: PLR0913
+        self,
+        extraction_id: str,
+        tool: str,
+        handler_version: str,
+        *,
+        effect_id: str,
+        call_id: str,
+        source_call_id: str,
+    ) -> DerivationEffect | None:
+        if self.batch.memo_conn is not None:
+            return DerivationIndex(self.batch.memo_conn).get_memoized(
+                extraction_id,
+                tool,
+                handler_version,
+                effect_id=effect_id,
+                call_id=call_id,
+                source_call_id=source_call_id,
+            )
+        return PathDerivationIndex(self.batch.path).get_memoized(
+            extraction_id,
+            tool,
+            handler_version,
+            effect_id=effect_id,
+            call_id=call_id,
+            source_call_id=source_call_id,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _BatchClaimIndex:
+    batch: PathEffectBatch
+
+    def store_effect(self, effect: ClaimEffect) -> str:
+        self.batch.claims[effect.claim_id] = effect
+        return effect.claim_id
+
+    def get_memoized(  # noqa: PLR0913
+        self,
+        derivation_id: str,
+        tool: str,
+        handler_version: str,
+        *,
+        effect_id: str,
+        call_id: str,
+        source_call_id: str,
+    ) -> ClaimEffect | None:
+        if self.batch.memo_conn is not None:
+            return ClaimIndex(self.batch.memo_conn).get_memoized(
+                derivation_id,
+                tool,
+                handler_version,
+                effect_id=effect_id,
+                call_id=call_id,
+                source_call_id=source_call_id,
+            )
+        return PathClaimIndex(self.batch.path).get_memoized(
+            derivation_id,
+            tool,
+            handler_version,
+            effect_id=effect_id,
+            call_id=call_id,
+            source_call_id=source_call_id,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _BatchPlanResponseIndex:
+    batch: PathEffectBatch
+
+    def get(self, plan_hash: str) -> ExecutedPlan | None:
+        cached, touch_due = PathPlanResponseIndex(self.batch.path).get_tracked(plan_hash)
+        if touch_due:
+            self.batch.touched_plans.add(plan_hash)
+        return cached
+
+    def upsert(
+        self, plan_hash: str, plan_id: str, response_refs: Sequence[ToolResponseRef]
+    ) -> None:
+        self.batch.plan_responses[plan_hash] = (plan_id, list(response_refs))
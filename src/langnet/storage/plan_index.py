@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
+from contextlib import suppress
 from pathlib import Path
 
 import duckdb
@@ -8,6 +9,8 @@ import orjson
 from google.protobuf.json_format import MessageToDict, ParseDict
 from query_spec import ExecutedPlan, ToolPlan, ToolResponseRef
 
+from langnet.storage.cache_gc import access_touch_due, touch_access
+
 SCHEMA_PATH = Path(__file__).resolve().parent / "schemas" / "langnet.sql"
 
 
@@ -26,6 +29,7 @@ class PlanIndex:
         self.conn = conn
 
     def get(self, query_hash: str) -> ToolPlan | None:
+        """Return the cached plan, refreshing its `last_accessed` when a touch is due."""
         row = self.conn.execute(
             """
             SELECT plan_data
@@ -36,6 +40,10 @@ class PlanIndex:
         ).fetchone()
         if not row:
             return None
+        if access_touch_due(self.conn, "query_plan_index", query_hash):
+            # Read-only handles cannot refresh; that only costs LRU accuracy.
+            with suppress(duckdb.Error):
+                touch_access(self.conn, "query_plan_index", [query_hash])
         plan_data = orjson.loads(row[0])
         return ParseDict(plan_data, ToolPlan())
 
@@ -0,0 +1,21 @@
+"""
+Process-level switch for read-only DuckDB pooling.
+
+This module does not import duckdb, so the lazy `langnet-cli` entrypoint can
+turn pooling on before a subcommand loads `langnet.storage.db`. The switch is
+process-local and is not inherited by subprocesses; `LANGNET_DUCKDB_POOL`, when
+set, still takes precedence.
+"""
+
+from __future__ import annotations
+
+_POOL_DEFAULT = {"enabled": False}
+
+
+def enable_duckdb_pool(enabled: bool = True) -> None:
+    """Pool read-only DuckDB connections in this process unless the env var says otherwise."""
+    _POOL_DEFAULT["enabled"] = enabled
+
+
+def duckdb_pool_default() -> bool:
+    return _POOL_DEFAULT["enabled"]
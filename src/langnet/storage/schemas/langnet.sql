@@ -52,6 +52,23 @@ CREATE TABLE IF NOT EXISTS raw_response_index (
 );
 CREATE INDEX IF NOT EXISTS idx_raw_response_tool ON raw_response_index(tool, created_at);
 
+-- Content-addressed response bodies (sha256 of the uncompressed body). New
+-- raw_response_index rows leave body NULL; rows written earlier keep it inline.
+CREATE TABLE IF NOT EXISTS raw_response_body (
+    body_hash VARCHAR PRIMARY KEY,
+    codec VARCHAR NOT NULL,  -- zstd | zlib | identity
+    size_bytes BIGINT NOT NULL,
+    stored_bytes BIGINT NOT NULL,
+    body BLOB NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Response → body hash references
+CREATE TABLE IF NOT EXISTS raw_response_body_ref (
+    response_id VARCHAR PRIMARY KEY,
+    body_hash VARCHAR NOT NULL
+);
+
 -- Parsed extractions derived from raw responses
 CREATE TABLE IF NOT EXISTS extraction_index (
     extraction_id VARCHAR PRIMARY KEY,
@@ -66,6 +83,7 @@ CREATE TABLE IF NOT EXISTS extraction_index (
 );
 CREATE INDEX IF NOT EXISTS idx_extraction_tool ON extraction_index(tool, created_at);
 CREATE INDEX IF NOT EXISTS idx_extraction_canonical ON extraction_index(canonical);
+CREATE INDEX IF NOT EXISTS idx_extraction_memo ON extraction_index(response_id, tool, handler_version);
 
 -- Derived facts after extractions
 CREATE TABLE IF NOT EXISTS derivation_index (
@@ -77,10 +95,13 @@ CREATE TABLE IF NOT EXISTS derivation_index (
     payload JSON,
     handler_version VARCHAR,  -- Handler version for cache invalidation
     derive_duration_ms INTEGER,  -- Content parsing/derivation time
+    provenance_chain JSON,  -- Needed to rebuild claims from a memoized derivation
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+ALTER TABLE derivation_index ADD COLUMN IF NOT EXISTS provenance_chain JSON;
 CREATE INDEX IF NOT EXISTS idx_derivation_tool ON derivation_index(tool, created_at);
 CREATE INDEX IF NOT EXISTS idx_derivation_canonical ON derivation_index(canonical);
+CREATE INDEX IF NOT EXISTS idx_derivation_memo ON derivation_index(extraction_id, tool, handler_version);
 
 -- Universal claims emitted after derivation/transform
 CREATE TABLE IF NOT EXISTS claims (
@@ -96,6 +117,7 @@ CREATE TABLE IF NOT EXISTS claims (
 );
 CREATE INDEX IF NOT EXISTS idx_claims_subject ON claims(subject);
 CREATE INDEX IF NOT EXISTS idx_claims_predicate ON claims(predicate);
+CREATE INDEX IF NOT EXISTS idx_claims_derivation ON claims(derivation_id, handler_version);
 
 -- Provenance records for auditing stages
 CREATE TABLE IF NOT EXISTS provenance (
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import time
+from collections.abc import Sequence
 from dataclasses import asdict, dataclass
 
 import duckdb
@@ -238,8 +239,23 @@ class TranslationCache:
         ).fetchone()
 
     def upsert(self, record: TranslationRecord) -> str:
+        self._ensure_schema()
+        return self._upsert(record, time.time())
+
+    def upsert_many(self, records: Sequence[TranslationRecord]) -> list[str]:
+        """Upsert `records` in a single transaction."""
         self._ensure_schema()
         now = time.time()
+        self.conn.execute("BEGIN TRANSACTION")
+        try:
+            translation_ids = [self._upsert(record, now) for record in records]
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        return translation_ids
+
+    def _upsert(self, record: TranslationRecord, now: float) -> str:
         key = record.key
         self.conn.execute(
             """
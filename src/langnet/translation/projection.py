@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import hashlib
 import re
-import time
 from collections.abc import Callable, Mapping, Sequence
 from copy import deepcopy
 from dataclasses import dataclass, replace
@@ -17,6 +16,7 @@ from langnet.translation.cache import (
     build_translation_key,
 )
 from langnet.translation.prompts import BASE_SYSTEM, default_hints_for_language
+from langnet.translation.scheduler import TranslationOutcome, TranslationScheduler
 from langnet.translation.structured import (
     StructuredTranslationError,
     decode_cached_translation_text,
@@ -298,54 +298,73 @@ def populate_missing_translations(  # noqa: PLR0913
     cache: TranslationCache,
     translate: Callable[[TranslationProjection], str],
     raise_on_error: bool = True,
+    scheduler: TranslationScheduler | None = None,
 ) -> int:
-    """Translate French glosses that are missing from the cache."""
-    written = 0
-    for projection in _translation_projections(claims=claims, language=language, model=model):
-        existing = cache.get(projection.key)
-        if _is_usable_translation_record(projection, existing):
-            continue
-
-        start = time.perf_counter()
-        try:
-            translated_text = _translate_projection(projection, translate)
-        except Exception as exc:  # noqa: BLE001
-            duration_ms = int((time.perf_counter() - start) * 1000)
-            cache.upsert(
-                TranslationRecord(
-                    key=projection.key,
-                    translated_text=None,
-                    status="error",
-                    error=str(exc),
-                    duration_ms=duration_ms,
-                )
-            )
-            if raise_on_error:
-                raise
-            continue
+    """
+    Translate French glosses that are missing from the cache.
+
+    Missing projections run concurrently on `scheduler` (from the environment
+    by default). Their records are written in one transaction once the run
+    finishes. They are also written when a failure is re-raised.
+    """
+    pending = [
+        projection
+        for projection in _translation_projections(claims=claims, language=language, model=model)
+        if not _is_usable_translation_record(projection, cache.get(projection.key))
+    ]
+    if not pending:
+        return 0
+    scheduler = scheduler or TranslationScheduler.from_env()
+
+    def job(projection: TranslationProjection, deadline: float | None) -> str:
+        return _translate_projection(projection, scheduler.limited(translate, deadline))
+
+    records: list[TranslationRecord] = []
+    outcomes = scheduler.run(pending, job)
+    try:
+        for projection, outcome in outcomes:
+            records.append(_translation_record(projection, outcome))
+            if outcome.error is not None and raise_on_error:
+                raise outcome.error
+    finally:
+        outcomes.close()
+        _upsert_translation_records(cache, records)
+    return sum(1 for record in records if record.status == "ok")
+
+
+def _translation_record(
+    projection: TranslationProjection,
+    outcome: TranslationOutcome[str],
+) -> TranslationRecord:
+    if outcome.error is not None:
+        return TranslationRecord(
+            key=projection.key,
+            translated_text=None,
+            status="error",
+            error=str(outcome.error),
+            duration_ms=outcome.duration_ms,
+        )
+    if not outcome.result:
+        return TranslationRecord(
+            key=projection.key,
+            translated_text=None,
+            status="empty",
+            duration_ms=outcome.duration_ms,
+        )
+    return TranslationRecord(
+        key=projection.key,
+        translated_text=outcome.result,
+        status="ok",
+        duration_ms=outcome.duration_ms,
+    )
 
-        duration_ms = int((time.perf_counter() - start) * 1000)
-        if not translated_text:
-            cache.upsert(
-                TranslationRecord(
-                    key=projection.key,
-                    translated_text=None,
-                    status="empty",
-                    duration_ms=duration_ms,
-                )
-            )
-            continue
 
-        cache.upsert(
-            TranslationRecord(
-                key=projection.key,
-                translated_text=translated_text,
-                status="ok",
-                duration_ms=duration_ms,
-            )
-        )
-        written += 1
-    return written
+def _upsert_translation_records(
+    cache: TranslationCache,
+    records: Sequence[TranslationRecord],
+) -> None:
+    if records:
+        cache.upsert_many(records)
 
 
 def _is_usable_translation_record(
@@ -0,0 +1,279 @@
+"""
+Scheduling for translation-cache population.
+
+Each missing gloss costs one or more model calls (segment batches, structured
+retries), and projections do not depend on each other. `TranslationScheduler`
+runs them on a small thread pool, passes every model call through a shared
+`TokenBucket` so the pool cannot outrun the provider's rate limit, and gives each
+projection its own deadline that starts when a worker picks it up. Results
+come back in completion order. The caller decides how to persist them.
+
+A model call made through `limited` can read the time its job has left with
+`translation_request_timeout()` and pass it on as the provider request
+timeout. Once a run is abandoned (closed early, or re-raising a failure),
+`limited` refuses further calls from jobs that are still running.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Generic, TypeVar
+
+TRANSLATION_WORKERS_ENV = "LANGNET_TRANSLATION_WORKERS"
+TRANSLATION_RATE_ENV = "LANGNET_TRANSLATION_RATE"
+TRANSLATION_TIMEOUT_ENV = "LANGNET_TRANSLATION_TIMEOUT_SECONDS"
+DEFAULT_TRANSLATION_WORKERS = 4
+DEFAULT_TRANSLATION_RATE = 4.0
+DEFAULT_TRANSLATION_TIMEOUT_SECONDS = 180.0
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+_call_state = threading.local()
+
+
+class TranslationDeadlineExceeded(TimeoutError):
+    """A projection ran past its per-request deadline."""
+
+
+class TranslationRunAbandoned(RuntimeError):
+    """A job tried to make a model call after its run was closed."""
+
+
+def translation_request_timeout() -> float | None:
+    """Seconds left for the model call `limited` is making on this thread; None without one."""
+    deadline = getattr(_call_state, "deadline", None)
+    if deadline is None:
+        return None
+    return max(0.0, deadline - _call_state.clock())
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket allowing `rate` acquisitions per second.
+
+    Up to `capacity` tokens bank while idle, so a burst of that size goes out
+    immediately. A `rate` of zero disables limiting.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def acquire(self, deadline: float | None = None) -> bool:
+        """Take one token, waiting for it; False if it cannot arrive before `deadline`."""
+        if self.rate <= 0:
+            return True
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                delay = (1 - self._tokens) / self.rate
+            if deadline is not None and now + delay > deadline:
+                return False
+            self._sleep(delay)
+
+
+@dataclass(frozen=True)
+class TranslationOutcome(Generic[_R]):
+    result: _R | None
+    error: Exception | None
+    duration_ms: int
+
+
+@dataclass
+class TranslationScheduler:
+    """
+    Run independent translation jobs under a worker, rate, and deadline budget.
+
+    `timeout_seconds` of zero means no deadline. A job that overruns is
+    reported as a `TranslationDeadlineExceeded` outcome and its worker's late
+    result is discarded.
+    """
+
+    max_workers: int = DEFAULT_TRANSLATION_WORKERS
+    rate_per_second: float = DEFAULT_TRANSLATION_RATE
+    timeout_seconds: float = DEFAULT_TRANSLATION_TIMEOUT_SECONDS
+    clock: Callable[[], float] = time.monotonic
+    bucket: TokenBucket = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.bucket = TokenBucket(self.rate_per_second, self.max_workers, clock=self.clock)
+
+    @classmethod
+    def from_env(cls) -> TranslationScheduler:
+        return cls(
+            max_workers=_env_int(TRANSLATION_WORKERS_ENV, DEFAULT_TRANSLATION_WORKERS),
+            rate_per_second=_env_float(TRANSLATION_RATE_ENV, DEFAULT_TRANSLATION_RATE),
+            timeout_seconds=_env_float(
+                TRANSLATION_TIMEOUT_ENV, DEFAULT_TRANSLATION_TIMEOUT_SECONDS
+            ),
+        )
+
+    def limited(self, call: Callable[[_T], _R], deadline: float | None) -> Callable[[_T], _R]:
+        """
+        Wrap one model call so it waits for a token and respects `deadline`.
+
+        The wrapped call can read its remaining time with
+        `translation_request_timeout()`. Calls made after the job's run was
+        abandoned raise `TranslationRunAbandoned` without reaching the model.
+        """
+
+        def limited_call(item: _T) -> _R:
+            _raise_if_abandoned()
+            if not self.bucket.acquire(deadline) or (
+                deadline is not None and self.clock() >= deadline
+            ):
+                raise TranslationDeadlineExceeded(
+                    f"translation exceeded {self.timeout_seconds:g}s deadline"
+                )
+            _raise_if_abandoned()
+            _call_state.deadline, _call_state.clock = deadline, self.clock
+            try:
+                return call(item)
+            finally:
+                _call_state.deadline = None
+
+        return limited_call
+
+    def run(
+        self,
+        items: Sequence[_T],
+        job: Callable[[_T, float | None], _R],
+    ) -> Iterator[tuple[_T, TranslationOutcome[_R]]]:
+        """
+        Run `job(item, deadline)` for each item, yielding outcomes as they finish.
+
+        Closing the iterator early cancels jobs that have not started.
+        """
+        if not items:
+            return
+        abandoned = threading.Event()
+        if self.max_workers <= 1 or len(items) == 1:
+            for item in items:
+                yield item, self._timed(job, item, {}, 0, abandoned)
+            return
+        started: dict[int, float] = {}
+        pool = ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(items)), thread_name_prefix="translation"
+        )
+        try:
+            futures: dict[Future[TranslationOutcome[_R]], int] = {
+                pool.submit(self._timed, job, item, started, index, abandoned): index
+                for index, item in enumerate(items)
+            }
+            pending = set(futures)
+            while pending:
+                done, pending = wait(
+                    pending, timeout=self._next_expiry(started), return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    started.pop(futures[future], None)
+                    yield items[futures[future]], future.result()
+                for future in self._expired(pending, futures, started):
+                    pending.discard(future)
+                    yield items[futures[future]], self._deadline_outcome()
+        finally:
+            abandoned.set()
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _timed(
+        self,
+        job: Callable[[_T, float | None], _R],
+        item: _T,
+        started: dict[int, float],
+        index: int,
+        abandoned: threading.Event,
+    ) -> TranslationOutcome[_R]:
+        start = self.clock()
+        started[index] = start
+        deadline = start + self.timeout_seconds if self.timeout_seconds > 0 else None
+        _call_state.abandoned = abandoned
+        try:
+            result = job(item, deadline)
+        except Exception as exc:  # noqa: BLE001
+            return TranslationOutcome(None, exc, _elapsed_ms(self.clock, start))
+        finally:
+            _call_state.abandoned = None
+        return TranslationOutcome(result, None, _elapsed_ms(self.clock, start))
+
+    def _next_expiry(self, started: dict[int, float]) -> float | None:
+        if self.timeout_seconds <= 0:
+            return None
+        running = started.copy()
+        if not running:
+            return self.timeout_seconds
+        earliest = min(running.values()) + self.timeout_seconds
+        return max(0.0, earliest - self.clock())
+
+    def _expired(
+        self,
+        pending: set[Future[TranslationOutcome[_R]]],
+        futures: dict[Future[TranslationOutcome[_R]], int],
+        started: dict[int, float],
+    ) -> list[Future[TranslationOutcome[_R]]]:
+        if self.timeout_seconds <= 0:
+            return []
+        now = self.clock()
+        snapshot = started.copy()
+        expired = [
+            future
+            for future in pending
+            if futures[future] in snapshot
+            and now - snapshot[futures[future]] >= self.timeout_seconds
+        ]
+        for future in expired:
+            del started[futures[future]]
+        return sorted(expired, key=futures.__getitem__)
+
+    def _deadline_outcome(self) -> TranslationOutcome[_R]:
+        return TranslationOutcome(
+            None,
+            TranslationDeadlineExceeded(f"translation exceeded {self.timeout_seconds:g}s deadline"),
+            int(self.timeout_seconds * 1000),
+        )
+
+
+def _raise_if_abandoned() -> None:
+    abandoned = getattr(_call_state, "abandoned", None)
+    if abandoned is not None and abandoned.is_set():
+        raise TranslationRunAbandoned("translation run was abandoned")
+
+
+def _elapsed_ms(clock: Callable[[], float], started: float) -> int:
+    return int((clock() - started) * 1000)
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ[name]))
+    except (KeyError, ValueError):
+        return default
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return max(0.0, float(os.environ[name]))
+    except (KeyError, ValueError):
+        return default
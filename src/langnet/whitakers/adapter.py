@@ -5,9 +5,11 @@ import re
 import shutil
 from dataclasses import dataclass
 
+from langnet.clients.base import RawResponseEffect, _new_response_id
 from langnet.clients.subprocess import SubprocessToolClient
 from langnet.storage.effects_index import RawResponseIndex
 from langnet.storage.extraction_index import ExtractionIndex
+from langnet.whitakers.pool import shared_whitaker_pool
 
 logger = logging.getLogger(__name__)
 
@@ -49,8 +51,7 @@ class WhitakerAdapter:
         if not self.binary:
             return WhitakerResult(lemmas=[], response_id=None, extraction_id=None)
 
-        client = SubprocessToolClient(tool="whitakers", command=[self.binary, query])
-        effect = client.execute(call_id=call_id)
+        effect = self._execute(self.binary, call_id, query)
         ref = self.raw_index.store(effect)
         lemmas = self._parse_lemmas(effect.body.decode("utf-8", errors="ignore"))
         extraction_id = self.extraction_index.store(
@@ -63,6 +64,22 @@ class WhitakerAdapter:
             lemmas=lemmas, response_id=ref.response_id, extraction_id=extraction_id
         )
 
+    def _execute(self, binary: str, call_id: str, query: str) -> RawResponseEffect:
+        pool = shared_whitaker_pool(binary)
+        if pool is None:
+            client = SubprocessToolClient(tool="whitakers", command=[binary, query])
+            return client.execute(call_id=call_id)
+        return RawResponseEffect(
+            response_id=_new_response_id(),
+            tool="whitakers",
+            call_id=call_id,
+            endpoint=f"{binary} {query}",
+            status_code=0,
+            content_type="text/plain",
+            headers={},
+            body=pool.lookup(query),
+        )
+
     def _parse_lemmas(self, text: str) -> list[str]:
         lemmas: list[str] = []
         for line in text.splitlines():
@@ -6,6 +6,7 @@ import shutil
 from pathlib import Path
 
 from langnet.clients.subprocess import SubprocessToolClient
+from langnet.whitakers.pool import shared_whitaker_pool
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +42,9 @@ class WhitakerClient:
         if not self.binary:
             return []
 
+        pool = shared_whitaker_pool(self.binary)
+        if pool is not None:
+            return self._parse_lemmas(pool.lookup(query).decode("utf-8", errors="ignore"))
         client = SubprocessToolClient(tool="whitakers", command=[self.binary, query])
         effect = client.execute(call_id=f"whitakers-{query}")
         text = effect.body.decode("utf-8", errors="ignore")
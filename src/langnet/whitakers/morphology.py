@@ -0,0 +1,553 @@
+"""In-process Latin morphology over the Whitaker's Words DuckDB build.
+
+`databuild whitakers-index` loads DICTLINE.GEN stems, INFLECTS.LAT endings and
+ADDONS.LAT tackons. `WhitakerMorphology` analyzes a form the way
+whitakers-words does for regular words: it splits the form into every
+stem + ending pair, looks the ending up in an in-memory index of inflections,
+fetches the candidate stems from `entry_stems`, and keeps the pairs whose
+part of speech, declension/conjugation, variant and stem key agree.
+
+`analyze` returns the `WhitakerWord` dicts that `_parse_whitaker_output`
+builds from binary output (term facts, codeline, senses), and `render` prints
+them back in the binary's line format, so the Whitaker handlers work on
+either source. UNIQUES.LAT, prefixes, suffixes and the binary's spelling
+tricks are not applied; forms that need them come back empty, so an empty
+analysis is inconclusive rather than a miss (see `NATIVE_INCOMPLETE_STATUS`).
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+WHITAKER_ENGINE_ENV = "LANGNET_WHITAKER_ENGINE"
+ENGINE_AUTO = "auto"
+ENGINE_BINARY = "binary"
+ENGINE_NATIVE = "native"
+WHITAKER_ENGINES = (ENGINE_AUTO, ENGINE_BINARY, ENGINE_NATIVE)
+NATIVE_CONTENT_TYPE = "application/vnd.langnet.whitakers+json"
+# Partial Content: the analyzer found nothing, but it does not model every form.
+NATIVE_INCOMPLETE_STATUS = 206
+
+STEM_SLOTS = 4
+_FLAG_COUNT = 5
+_TERM_COLUMN_WIDTH = 21
+_POS_COLUMN_WIDTH = 7
+_GENDER_QUALIFIER_INDEX = 2
+
+_CLASS_POS = frozenset({"N", "PRON", "ADJ", "NUM", "V", "VPAR", "SUPINE"})
+_VERB_FORMS = frozenset({"V", "VPAR", "SUPINE"})
+_VERB_KIND_LABELS = frozenset({"DEP", "SEMIDEP", "PERFDEF", "IMPERS"})
+_ORDINALS = {1: "1st", 2: "2nd", 3: "3rd", 4: "4th", 5: "5th"}
+_PART_OF_SPEECH = {
+    "N": "noun",
+    "PRON": "pronoun",
+    "ADJ": "adjective",
+    "V": "verb",
+    "VPAR": "verb-participle",
+    "SUPINE": "supine",
+    "ADV": "adverb",
+    "PREP": "preposition",
+    "CONJ": "conjunction",
+    "INTERJ": "interjection",
+}
+# INFLECTS.LAT qualifier order per part of speech; None marks a literal such as PPL.
+_QUALIFIER_FIELDS: dict[str, tuple[str | None, ...]] = {
+    "N": ("case", "number", "gender"),
+    "PRON": ("case", "number", "gender"),
+    "ADJ": ("case", "number", "gender", "comparison"),
+    "NUM": ("case", "number", "gender", None),
+    "SUPINE": ("case", "number", "gender"),
+    "V": ("tense", "voice", "mood", "person", "number"),
+    "VPAR": ("case", "number", "gender", "tense", "voice", None),
+    "ADV": ("comparison",),
+    "PREP": ("case",),
+}
+_MASC = frozenset({"M", "C", "X"})
+_FEM = frozenset({"F", "C", "X"})
+_NEUT = frozenset({"N", "X"})
+# Inflections that spell the dictionary form: (pos, qualifier pattern, suffix).
+_PRINCIPAL_PARTS: dict[str, tuple[tuple[str, tuple[object, ...], str], ...]] = {
+    "N": (("N", ("NOM", "S"), ""), ("N", ("GEN", "S"), "")),
+    "ADJ": (
+        ("ADJ", ("NOM", "S", _MASC, "POS"), ""),
+        ("ADJ", ("NOM", "S", _FEM, "POS"), ""),
+        ("ADJ", ("NOM", "S", _NEUT, "POS"), ""),
+    ),
+    "V": (
+        ("V", ("PRES", "ACTIVE", "IND", "1", "S"), ""),
+        ("V", ("PRES", "ACTIVE", "INF", "0", "X"), ""),
+        ("V", ("PERF", "ACTIVE", "IND", "1", "S"), ""),
+        ("VPAR", ("NOM", "S", _MASC, "PERF", "PASSIVE", "PPL"), ""),
+    ),
+    "DEP": (
+        ("V", ("PRES", "PASSIVE", "IND", "1", "S"), ""),
+        ("V", ("PRES", "PASSIVE", "INF", "0", "X"), ""),
+        ("VPAR", ("NOM", "S", _MASC, "PERF", "PASSIVE", "PPL"), " sum"),
+    ),
+}
+
+WhitakerWord = dict[str, Any]
+StemLookup = Callable[[Sequence[str]], list["StemHit"]]
+
+
+def whitaker_key(text: str) -> str:
+    """Lookup key for stems and endings: lower case, with i/j and u/v merged."""
+    return text.strip().lower().replace("j", "i").replace("v", "u")
+
+
+def whitaker_engine() -> str:
+    """
+    Engine for fetch.whitakers from `LANGNET_WHITAKER_ENGINE`.
+
+    `binary` always runs whitakers-words, `native` prefers the DuckDB analyzer,
+    and `auto` (default) uses the binary when installed and the analyzer
+    otherwise.
+    """
+    value = os.getenv(WHITAKER_ENGINE_ENV, "").strip().lower()
+    return value if value in WHITAKER_ENGINES else ENGINE_AUTO
+
+
+@dataclass(frozen=True)
+class Inflection:
+    """One INFLECTS.LAT record."""
+
+    pos: str
+    which: int
+    variant: int
+    qualifiers: tuple[str, ...]
+    stem_key: int
+    ending: str
+    age: str = "X"
+    freq: str = "A"
+
+
+@dataclass(frozen=True)
+class Tackon:
+    """One ADDONS.LAT TACKON record (enclitics such as -que, -ne, -ve)."""
+
+    fix: str
+    meaning: str
+
+
+@dataclass(frozen=True)
+class DictEntry:
+    """One DICTLINE.GEN entry with its four stems and split codes."""
+
+    entry_id: int
+    pos: str
+    stems: tuple[str, ...]
+    codes: tuple[str, ...]
+    flags: tuple[str, ...]
+    plain_text: str
+    headword: str
+
+    @classmethod
+    def from_row(cls, row: Sequence[Any], stems: Mapping[int, str]) -> DictEntry:
+        """Build from an `(entry_id, pos, codes, plain_text, headword_raw)` row."""
+        entry_id, pos, codes, plain_text, headword = row
+        tokens = (codes or "").split()
+        split_at = max(0, len(tokens) - _FLAG_COUNT)
+        return cls(
+            entry_id=int(entry_id),
+            pos=pos or "",
+            stems=tuple(stems.get(slot, "") for slot in range(1, STEM_SLOTS + 1)),
+            codes=tuple(tokens[:split_at]),
+            flags=tuple(tokens[split_at:]),
+            plain_text=plain_text or "",
+            headword=headword or "",
+        )
+
+    @property
+    def which(self) -> int:
+        return _code_int(self.codes, 0) if self.pos in _CLASS_POS else 0
+
+    @property
+    def variant(self) -> int:
+        return _code_int(self.codes, 1) if self.pos in _CLASS_POS else 0
+
+    @property
+    def gender(self) -> str:
+        return self.codes[2] if self.pos == "N" and len(self.codes) > 2 else ""  # noqa: PLR2004
+
+    @property
+    def kind(self) -> str:
+        return self.codes[2] if self.pos == "V" and len(self.codes) > 2 else ""  # noqa: PLR2004
+
+    def stem(self, stem_key: int) -> str:
+        return self.stems[stem_key - 1] if 1 <= stem_key <= len(self.stems) else ""
+
+
+@dataclass(frozen=True)
+class StemHit:
+    """An `entry_stems` row matching a candidate stem."""
+
+    stem_norm: str
+    stem_key: int
+    entry: DictEntry
+
+
+def _code_int(codes: Sequence[str], index: int) -> int:
+    try:
+        return int(codes[index])
+    except (IndexError, ValueError):
+        return 0
+
+
+def _qualifier_matches(qualifiers: Sequence[str], pattern: Sequence[object]) -> bool:
+    if len(qualifiers) < len(pattern):
+        return False
+    for value, wanted in zip(qualifiers, pattern, strict=False):
+        if isinstance(wanted, frozenset):
+            if value not in wanted:
+                return False
+        elif value != wanted:
+            return False
+    return True
+
+
+def _sense_and_note(text: str) -> tuple[str, str]:
+    """Split `(...)`/`[...]` notes out of one sense, as the senses grammar does."""
+    working = text.replace("(", "{").replace(")", "}").replace("[", "(").replace("]", ")")
+    extracted = " ".join(re.findall(r"\((.*?)\)", working, re.DOTALL))
+    cleaned = re.sub(r"\s*\(.*?\)\s*", " ", working, flags=re.DOTALL).strip()
+    return cleaned.replace("{", "(").replace("}", ")"), extracted.strip()
+
+
+def _add_senses(word: WhitakerWord, text: str) -> None:
+    for chunk in text.split(";"):
+        sense, note = _sense_and_note(chunk.strip())
+        if sense and sense not in word.setdefault("senses", []):
+            word["senses"].append(sense)
+        if note and note not in word.setdefault("notes", []):
+            word["notes"].append(note)
+    if not word.get("notes"):
+        word.pop("notes", None)
+    if not word.get("senses"):
+        word.pop("senses", None)
+
+
+class WhitakerMorphology:
+    """
+    Whitaker's Words analysis of regular Latin forms, without the binary.
+
+    `inflections` and `tackons` are small and held in memory, indexed by
+    ending; `stem_lookup` fetches dictionary entries for candidate stems
+    (normally an indexed `entry_stems` query, see `from_path`).
+    """
+
+    def __init__(
+        self,
+        inflections: Iterable[Inflection],
+        stem_lookup: StemLookup,
+        tackons: Iterable[Tackon] = (),
+    ) -> None:
+        self.inflections = list(inflections)
+        self.tackons = sorted(tackons, key=lambda tackon: -len(tackon.fix))
+        self._stem_lookup = stem_lookup
+        self._by_ending: dict[str, list[Inflection]] = {}
+        self._by_pos: dict[str, list[Inflection]] = {}
+        for inflection in self.inflections:
+            self._by_ending.setdefault(whitaker_key(inflection.ending), []).append(inflection)
+            self._by_pos.setdefault(inflection.pos, []).append(inflection)
+        self._max_ending = max((len(ending) for ending in self._by_ending), default=0)
+        self._dictionary_forms: dict[int, str] = {}
+
+    @classmethod
+    def from_path(cls, path: Path) -> WhitakerMorphology | None:
+        """Analyzer over a built `lex_whitakers.duckdb`, or None without inflection tables."""
+        import duckdb  # noqa: PLC0415
+
+        from langnet.storage.db import connect_duckdb_pooled  # noqa: PLC0415
+
+        if not path.exists():
+            return None
+        try:
+            with connect_duckdb_pooled(path) as conn:
+                inflection_rows = conn.execute(
+                    """
+                    SELECT pos, which, variant, qualifiers, stem_key, ending, age, freq
+                    FROM inflections
+                    ORDER BY inflection_id
+                    """
+                ).fetchall()
+                tackon_rows = conn.execute(
+                    "SELECT fix, meaning FROM addons WHERE kind = 'TACKON' ORDER BY addon_id"
+                ).fetchall()
+        except duckdb.CatalogException:
+            return None
+        if not inflection_rows:
+            return None
+        inflections = [
+            Inflection(
+                pos=pos,
+                which=int(which),
+                variant=int(variant),
+                qualifiers=tuple(str(qualifiers).split()),
+                stem_key=int(stem_key),
+                ending=ending,
+                age=age or "X",
+                freq=freq or "A",
+            )
+            for pos, which, variant, qualifiers, stem_key, ending, age, freq in inflection_rows
+        ]
+        tackons = [Tackon(fix=fix, meaning=meaning or "") for fix, meaning in tackon_rows]
+
+        def lookup(stems: Sequence[str]) -> list[StemHit]:
+            with connect_duckdb_pooled(path) as conn:
+                return _query_stem_hits(conn, stems)
+
+        return cls(inflections, lookup, tackons)
+
+    def analyze(self, form: str) -> list[WhitakerWord]:
+        """`WhitakerWord` dicts for `form`, one per matching dictionary entry."""
+        key = whitaker_key(form)
+        if not key:
+            return []
+        words = self._analyze_key(key)
+        if words:
+            return words
+        for tackon in self.tackons:
+            fix = whitaker_key(tackon.fix)
+            if len(key) > len(fix) and key.endswith(fix):
+                base = self._analyze_key(key[: -len(fix)])
+                if base:
+                    return [*base, self._tackon_word(tackon)]
+        return []
+
+    def render(self, words: Iterable[WhitakerWord]) -> str:
+        """Whitaker's Words text for `words`, in the binary's line layout."""
+        lines = [line for word in words for line in word.get("raw_lines", [])]
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _analyze_key(self, key: str) -> list[WhitakerWord]:
+        splits: list[tuple[str, str]] = []
+        for ending_len in range(min(self._max_ending, len(key) - 1), -1, -1):
+            ending = key[len(key) - ending_len :]
+            if ending in self._by_ending:
+                splits.append((key[: len(key) - ending_len], ending))
+        if not splits:
+            return []
+        hits_by_stem: dict[str, list[StemHit]] = {}
+        for hit in self._stem_lookup(sorted({stem for stem, _ in splits})):
+            hits_by_stem.setdefault(hit.stem_norm, []).append(hit)
+
+        matches: dict[int, list[tuple[Inflection, DictEntry]]] = {}
+        for stem, ending in splits:
+            for inflection in self._by_ending[ending]:
+                for hit in hits_by_stem.get(stem, []):
+                    if hit.stem_key == inflection.stem_key and _entry_accepts(
+                        hit.entry, inflection
+                    ):
+                        matches.setdefault(hit.entry.entry_id, []).append((inflection, hit.entry))
+        return [self._entry_word(pairs) for _, pairs in sorted(matches.items())]
+
+    def _entry_word(self, pairs: list[tuple[Inflection, DictEntry]]) -> WhitakerWord:
+        entry = pairs[0][1]
+        terms: list[dict[str, object]] = []
+        lines: list[str] = []
+        for inflection, _ in pairs:
+            term, line = _term_facts(entry, inflection)
+            if line not in lines:
+                terms.append(term)
+                lines.append(line)
+        codeline, code_text = self._codeline(entry)
+        lines.append(code_text)
+        word: WhitakerWord = {"terms": terms, "raw_lines": lines, "codeline": codeline}
+        if entry.plain_text:
+            lines.append(entry.plain_text)
+            _add_senses(word, entry.plain_text)
+        return word
+
+    def _tackon_word(self, tackon: Tackon) -> WhitakerWord:
+        lines = [f"{tackon.fix:<{_TERM_COLUMN_WIDTH}}TACKON"]
+        word: WhitakerWord = {
+            "terms": [{"part_of_speech": "tackon", "term": tackon.fix}],
+            "raw_lines": lines,
+        }
+        if tackon.meaning:
+            lines.append(tackon.meaning)
+            _add_senses(word, tackon.meaning)
+        return word
+
+    def _codeline(self, entry: DictEntry) -> tuple[dict[str, object], str]:
+        term = self._dictionary_form(entry)
+        codeline: dict[str, object] = {"term": term, "pos_code": entry.pos}
+        text = f"{term}  {entry.pos}"
+        if entry.pos in {"N", "V"} and entry.which in _ORDINALS:
+            codeline["declension"] = _ORDINALS[entry.which]
+            text += f" ({_ORDINALS[entry.which]})"
+        pos_form = entry.gender or (entry.kind if entry.kind in _VERB_KIND_LABELS else "")
+        if pos_form:
+            codeline["pos_form"] = pos_form
+            text += f" {pos_form}"
+        flags = entry.flags if len(entry.flags) == _FLAG_COUNT else ("X",) * _FLAG_COUNT
+        for name, flag in zip(("age", "area", "geo", "freq", "source"), flags, strict=True):
+            if flag != "X":
+                codeline[name] = flag
+        return codeline, f"{text}   [{''.join(flags)}]"
+
+    def _dictionary_form(self, entry: DictEntry) -> str:
+        cached = self._dictionary_forms.get(entry.entry_id)
+        if cached is not None:
+            return cached
+        parts_key = "DEP" if entry.pos == "V" and entry.kind == "DEP" else entry.pos
+        parts: list[str] = []
+        for pos, pattern, suffix in _PRINCIPAL_PARTS.get(parts_key, ()):
+            form = self._principal_part(entry, pos, pattern)
+            if form and (not parts or parts[-1] != form + suffix):
+                parts.append(form + suffix)
+        form = ", ".join(parts) or entry.headword or next((s for s in entry.stems if s), "")
+        self._dictionary_forms[entry.entry_id] = form
+        return form
+
+    def _principal_part(self, entry: DictEntry, pos: str, pattern: tuple[object, ...]) -> str:
+        candidates = [
+            inflection
+            for inflection in self._by_pos.get(pos, [])
+            if _class_accepts(entry, inflection)
+            and _qualifier_matches(inflection.qualifiers, pattern)
+            and entry.stem(inflection.stem_key)
+        ]
+        if not candidates:
+            return ""
+        best = min(
+            candidates,
+            key=lambda inflection: (
+                inflection.which != entry.which,
+                inflection.variant != entry.variant,
+                inflection.freq,
+            ),
+        )
+        return entry.stem(best.stem_key) + best.ending
+
+
+def _class_accepts(entry: DictEntry, inflection: Inflection) -> bool:
+    if inflection.pos not in _CLASS_POS:
+        return True
+    return inflection.which in {0, entry.which} and inflection.variant in {0, entry.variant}
+
+
+def _pos_accepts(entry: DictEntry, inflection: Inflection) -> bool:
+    if entry.pos != "V":
+        return inflection.pos == ("PRON" if entry.pos == "PACK" else entry.pos)
+    if inflection.pos not in _VERB_FORMS:
+        return False
+    # Deponents only take passive finite endings.
+    return not (entry.kind == "DEP" and inflection.pos == "V" and "ACTIVE" in inflection.qualifiers)
+
+
+def _entry_accepts(entry: DictEntry, inflection: Inflection) -> bool:
+    """True when `inflection` can attach to `entry` (part of speech, class, gender, case)."""
+    if not (_pos_accepts(entry, inflection) and _class_accepts(entry, inflection)):
+        return False
+    if entry.pos == "N" and len(inflection.qualifiers) > _GENDER_QUALIFIER_INDEX:
+        gender = inflection.qualifiers[_GENDER_QUALIFIER_INDEX]
+        return gender in {"X", entry.gender} or (gender == "C" and entry.gender in {"M", "F"})
+    if entry.pos == "PREP" and entry.codes and inflection.qualifiers:
+        return inflection.qualifiers[0] == entry.codes[0]
+    return True
+
+
+def _term_facts(entry: DictEntry, inflection: Inflection) -> tuple[dict[str, object], str]:
+    stem = entry.stem(inflection.stem_key)
+    term = f"{stem}.{inflection.ending}" if inflection.ending else stem
+    qualifiers = list(inflection.qualifiers)
+    if (
+        entry.pos == "N"
+        and len(qualifiers) > _GENDER_QUALIFIER_INDEX
+        and entry.gender
+        and qualifiers[_GENDER_QUALIFIER_INDEX] in {"C", "X"}
+    ):
+        qualifiers[_GENDER_QUALIFIER_INDEX] = entry.gender
+
+    part_of_speech = _PART_OF_SPEECH.get(inflection.pos, inflection.pos.lower())
+    if inflection.pos == "NUM":
+        part_of_speech = "cardinal" if "CARD" in qualifiers else "numerator"
+    facts: dict[str, object] = {"part_of_speech": part_of_speech, "term": term}
+    if inflection.ending:
+        facts["term_analysis"] = {"stem": stem, "ending": inflection.ending}
+    codes: list[str] = []
+    if inflection.pos in _CLASS_POS:
+        class_field = "conjugation" if inflection.pos in {"V", "VPAR"} else "declension"
+        facts[class_field] = str(inflection.which)
+        facts["variant"] = str(inflection.variant)
+        codes = [str(inflection.which), str(inflection.variant)]
+    for field, value in zip(_QUALIFIER_FIELDS.get(inflection.pos, ()), qualifiers, strict=False):
+        if field is not None:
+            facts[field] = value
+    line = f"{term:<{_TERM_COLUMN_WIDTH}}{inflection.pos:<{_POS_COLUMN_WIDTH}}"
+    return facts, (line + " ".join([*codes, *qualifiers])).rstrip()
+
+
+def _query_stem_hits(conn: Any, stems: Sequence[str]) -> list[StemHit]:
+    if not stems:
+        return []
+    placeholders = ", ".join("?" for _ in stems)
+    hit_rows = conn.execute(
+        f"""
+        SELECT s.stem_norm, s.stem_key, e.entry_id, e.pos, e.codes, e.plain_text, e.headword_raw
+        FROM entry_stems s
+        JOIN entries e ON e.entry_id = s.entry_id
+        WHERE s.stem_norm IN ({placeholders})
+        ORDER BY e.entry_id, s.stem_key
+        """,
+        list(stems),
+    ).fetchall()
+    if not hit_rows:
+        return []
+    entry_ids = sorted({row[2] for row in hit_rows})
+    stem_rows = conn.execute(
+        f"""
+        SELECT entry_id, stem_key, stem
+        FROM entry_stems
+        WHERE entry_id IN ({", ".join("?" for _ in entry_ids)})
+        """,
+        entry_ids,
+    ).fetchall()
+    stems_by_entry: dict[int, dict[int, str]] = {}
+    for entry_id, stem_key, stem in stem_rows:
+        stems_by_entry.setdefault(entry_id, {})[int(stem_key)] = stem
+    entries: dict[int, DictEntry] = {}
+    hits: list[StemHit] = []
+    for stem_norm, stem_key, *entry_row in hit_rows:
+        entry_id = entry_row[0]
+        entry = entries.get(entry_id)
+        if entry is None:
+            entry = DictEntry.from_row(entry_row, stems_by_entry.get(entry_id, {}))
+            entries[entry_id] = entry
+        hits.append(StemHit(stem_norm=stem_norm, stem_key=int(stem_key), entry=entry))
+    return hits
+
+
+_SHARED: dict[Path, tuple[tuple[int, int], WhitakerMorphology | None]] = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def shared_whitaker_morphology(path: Path | None = None) -> WhitakerMorphology | None:
+    """
+    Process-wide analyzer for the Whitaker build, or None when it has no inflections.
+
+    Reloaded when the DuckDB file changes, so a rebuild is picked up.
+    """
+    if path is None:
+        from langnet.databuild.paths import default_whitakers_path  # noqa: PLC0415
+
+        path = default_whitakers_path()
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    signature = (stat.st_mtime_ns, stat.st_size)
+    with _SHARED_LOCK:
+        cached = _SHARED.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        morphology = WhitakerMorphology.from_path(path)
+        _SHARED[path] = (signature, morphology)
+        return morphology
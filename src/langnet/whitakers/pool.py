@@ -0,0 +1,272 @@
+"""Long-lived whitakers-words processes fed over stdin/stdout.
+
+Run without arguments, whitakers-words prints a banner and an `=>` prompt, then
+answers one input line per prompt until it reads an empty line. `WhitakerPool`
+keeps a few of these interactive processes warm and sends each Latin form as
+its own line, so the answer read back up to the next prompt belongs to exactly
+one form. Callers get the same text a `whitakers-words <form>` run prints,
+without paying a process start (and dictionary load) per form.
+
+If a worker cannot be started or stops answering, the pool falls back to one
+process per form, so a binary that does not speak the interactive protocol
+keeps working, just slower.
+"""
+
+from __future__ import annotations
+
+import atexit
+import logging
+import os
+import select
+import subprocess
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+WHITAKER_WORKERS_ENV = "LANGNET_WHITAKER_WORKERS"
+DEFAULT_WHITAKER_WORKERS = 2
+STARTUP_TIMEOUT_SECONDS = 5.0
+QUERY_TIMEOUT_SECONDS = 10.0
+CLOSE_TIMEOUT_SECONDS = 1.0
+
+PROMPT = b"=>"
+MORE_PROMPT = b"MORE - hit RETURN/ENTER to continue"
+_READ_CHUNK_BYTES = 65536
+
+_SHARED_POOLS: dict[str, WhitakerPool] = {}
+_SHARED_POOLS_LOCK = threading.Lock()
+
+
+def whitaker_pool_workers() -> int:
+    """Persistent whitakers-words processes; `0` runs one process per form."""
+    raw = os.getenv(WHITAKER_WORKERS_ENV, "")
+    try:
+        return max(0, int(raw)) if raw else DEFAULT_WHITAKER_WORKERS
+    except ValueError:
+        return DEFAULT_WHITAKER_WORKERS
+
+
+def poolable_form(word: str) -> bool:
+    """
+    True when `word` can be sent as one interactive input line.
+
+    Empty lines end the session and lines starting with `#` or `!` are
+    parameter commands, so those forms go through a one-shot process instead.
+    """
+    text = word.strip()
+    return bool(text) and text[0].isalnum() and text.isprintable()
+
+
+def run_whitaker_once(binary: str, word: str) -> bytes:
+    """Run `binary word` in a fresh process and return its stdout."""
+    proc = subprocess.run([binary, word], check=False, capture_output=True)
+    return proc.stdout or b""
+
+
+class WhitakerWorkerError(RuntimeError):
+    """An interactive whitakers-words process exited or stopped answering."""
+
+
+class WhitakerWorker:
+    """One interactive whitakers-words process, answering a form per prompt."""
+
+    def __init__(self, binary: str, *, startup_timeout: float = STARTUP_TIMEOUT_SECONDS) -> None:
+        self.binary = binary
+        self._proc = subprocess.Popen(  # noqa: S603
+            [binary],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        try:
+            self._read_answer(startup_timeout)
+        except WhitakerWorkerError:
+            self.close()
+            raise
+
+    def query(self, word: str, *, timeout: float = QUERY_TIMEOUT_SECONDS) -> bytes:
+        self._write(word.strip().encode("utf-8") + b"\n")
+        return self._read_answer(timeout)
+
+    def _write(self, data: bytes) -> None:
+        stdin = self._proc.stdin
+        if stdin is None:
+            raise WhitakerWorkerError("whitakers-words worker has no stdin")
+        try:
+            stdin.write(data)
+            stdin.flush()
+        except (BrokenPipeError, ValueError) as exc:
+            raise WhitakerWorkerError("whitakers-words worker closed its input") from exc
+
+    def _read_answer(self, timeout: float) -> bytes:
+        """Read output up to the next `=>` prompt, paging through `MORE` pauses."""
+        stdout = self._proc.stdout
+        if stdout is None:
+            raise WhitakerWorkerError("whitakers-words worker has no stdout")
+        fd = stdout.fileno()
+        deadline = time.monotonic() + timeout
+        buf = bytearray()
+        while True:
+            tail = buf.rstrip()
+            if tail.endswith(PROMPT):
+                answer = bytes(tail[: -len(PROMPT)]).strip(b"\r\n")
+                return answer + b"\n" if answer else b""
+            if tail.endswith(MORE_PROMPT):
+                del buf[len(tail) - len(MORE_PROMPT) :]
+                self._write(b"\n")
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise WhitakerWorkerError("whitakers-words worker timed out")
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if not ready:
+                raise WhitakerWorkerError("whitakers-words worker timed out")
+            chunk = os.read(fd, _READ_CHUNK_BYTES)
+            if not chunk:
+                raise WhitakerWorkerError("whitakers-words worker exited")
+            buf.extend(chunk)
+
+    def close(self) -> None:
+        if self._proc.poll() is None:
+            try:
+                self._write(b"\n")
+                self._proc.wait(timeout=CLOSE_TIMEOUT_SECONDS)
+            except (WhitakerWorkerError, subprocess.TimeoutExpired):
+                self._proc.kill()
+                self._proc.wait()
+        for stream in (self._proc.stdin, self._proc.stdout):
+            if stream is not None:
+                stream.close()
+
+
+class WhitakerPool:
+    """
+    Up to `workers` interactive whitakers-words processes, started on demand.
+
+    Concurrent lookups each take an idle worker, starting one while fewer than
+    `workers` are running and otherwise waiting for one to come back.
+    """
+
+    def __init__(
+        self,
+        binary: str,
+        workers: int = DEFAULT_WHITAKER_WORKERS,
+        *,
+        startup_timeout: float = STARTUP_TIMEOUT_SECONDS,
+        query_timeout: float = QUERY_TIMEOUT_SECONDS,
+    ) -> None:
+        self.binary = binary
+        self.workers = max(1, workers)
+        self.startup_timeout = startup_timeout
+        self.query_timeout = query_timeout
+        self.disabled = False
+        self._closed = False
+        self._idle: list[WhitakerWorker] = []
+        self._started = 0
+        self._cond = threading.Condition()
+
+    def lookup(self, word: str) -> bytes:
+        """The text a one-shot `whitakers-words <word>` run prints for `word`."""
+        worker = self._acquire() if poolable_form(word) else None
+        if worker is None:
+            return run_whitaker_once(self.binary, word)
+        try:
+            answer = worker.query(word, timeout=self.query_timeout)
+        except WhitakerWorkerError as exc:
+            logger.warning("whitakers_worker_failed word=%s error=%s", word, exc)
+            self._release(worker, healthy=False)
+            return run_whitaker_once(self.binary, word)
+        self._release(worker, healthy=True)
+        return answer
+
+    def _acquire(self) -> WhitakerWorker | None:
+        with self._cond:
+            while True:
+                if self.disabled or self._closed:
+                    return None
+                if self._idle:
+                    return self._idle.pop()
+                if self._started < self.workers:
+                    self._started += 1
+                    break
+                self._cond.wait()
+        try:
+            return WhitakerWorker(self.binary, startup_timeout=self.startup_timeout)
+        except (OSError, WhitakerWorkerError) as exc:
+            logger.warning("whitakers_pool_disabled binary=%s error=%s", self.binary, exc)
+            with self._cond:
+                self._started -= 1
+                self.disabled = True
+                self._cond.notify_all()
+            return None
+
+    def _release(self, worker: WhitakerWorker, *, healthy: bool) -> None:
+        with self._cond:
+            keep = healthy and not self._closed
+            if keep:
+                self._idle.append(worker)
+            else:
+                self._started -= 1
+            self._cond.notify()
+        if not keep:
+            worker.close()
+
+    def close(self) -> None:
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._cond.notify_all()
+        for worker in idle:
+            worker.close()
+
+    def __enter__(self) -> WhitakerPool:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+
+def shared_whitaker_pool(binary: str) -> WhitakerPool | None:
+    """
+    Process-wide pool for `binary` sized by `LANGNET_WHITAKER_WORKERS`, or None when off.
+
+    Workers start on the first lookup and live until interpreter exit, so the
+    serve worker, reader passages, and repeated lookups pay the dictionary load
+    once per worker.
+    """
+    workers = whitaker_pool_workers()
+    if workers <= 0:
+        return None
+    with _SHARED_POOLS_LOCK:
+        pool = _SHARED_POOLS.get(binary)
+        if pool is None:
+            pool = WhitakerPool(binary, workers)
+            _SHARED_POOLS[binary] = pool
+        return pool
+
+
+def whitaker_lookup_text(binary: str, word: str) -> str:
+    """Whitaker's Words output for one form, through the shared pool when enabled."""
+    pool = shared_whitaker_pool(binary)
+    body = pool.lookup(word) if pool is not None else run_whitaker_once(binary, word)
+    return body.decode("utf-8", errors="ignore")
+
+
+def close_shared_whitaker_pools() -> None:
+    with _SHARED_POOLS_LOCK:
+        pools = list(_SHARED_POOLS.values())
+        _SHARED_POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+def _forget_inherited_pools() -> None:
+    # A forked child shares the parent's worker pipes; start fresh pools instead.
+    global _SHARED_POOLS_LOCK  # noqa: PLW0603
+    _SHARED_POOLS_LOCK = threading.Lock()
+    _SHARED_POOLS.clear()
+
+
+atexit.register(close_shared_whitaker_pools)
+os.register_at_fork(after_in_child=_forget_inherited_pools)
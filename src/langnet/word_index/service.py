@@ -30,7 +30,7 @@ from langnet.execution.handlers.dico import normalize_dico_headword
 from langnet.execution.handlers.gaffiot import normalize_gaffiot_headword
 from langnet.execution.handlers.georges_1913 import normalize_georges_1913_headword
 from langnet.heritage.velthuis_converter import to_heritage_velthuis
-from langnet.storage.db import connect_duckdb_ro
+from langnet.storage.db import connect_duckdb_pooled
 from langnet.tool_catalog import LANGUAGE_LABELS, LanguageCode, canonical_language
 
 WORD_INDEX_SCHEMA_VERSION = "langnet.word_index.v1"
@@ -1333,7 +1333,7 @@ def _list_cdsl(
         sql += " LIMIT ?"
         params.append(limit)
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(sql, params).fetchall()
     except Exception as exc:  # noqa: BLE001
         _warn_error(warnings, "cdsl", path, exc)
@@ -1357,7 +1357,7 @@ def _neighborhood_cdsl(
     if not keys and section_prefix is None:
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             if section_prefix is not None:
                 prefix_sql, prefix_params = _cdsl_exact_prefix_predicate(section_prefix)
                 anchor_rows = conn.execute(
@@ -1441,7 +1441,7 @@ def _wheel_cdsl(
         _warn_missing(warnings, "cdsl", path)
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(
                 """
                 SELECT h.key, h.key_normalized, h.lnum, h.hom, h.search_key, e.page_ref
@@ -1485,7 +1485,7 @@ def _list_dico(
         sql += " LIMIT ?"
         params.append(limit)
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(sql, params).fetchall()
     except Exception as exc:  # noqa: BLE001
         _warn_error(warnings, "dico", path, exc)
@@ -1507,7 +1507,7 @@ def _neighborhood_dico(
     if not keys:
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             anchor_rows = conn.execute(
                 f"""
                 SELECT entry_id, occurrence, headword_deva, headword_roma, headword_norm,
@@ -1607,7 +1607,7 @@ def _wheel_dico(
         _warn_missing(warnings, "dico", path)
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(
                 """
                 SELECT
@@ -1651,7 +1651,7 @@ def _list_gaffiot(
         sql += " LIMIT ?"
         params.append(limit)
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(sql, params).fetchall()
     except Exception as exc:  # noqa: BLE001
         _warn_error(warnings, "gaffiot", path, exc)
@@ -1673,7 +1673,7 @@ def _neighborhood_gaffiot(
     if not keys:
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             anchor_rows = conn.execute(
                 f"""
                 SELECT entry_id, headword_raw, headword_norm, variant_num
@@ -1730,7 +1730,7 @@ def _wheel_gaffiot(
         _warn_missing(warnings, "gaffiot", path)
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(
                 """
                 SELECT entry_id, headword_raw, headword_norm, variant_num
@@ -1772,7 +1772,7 @@ def _list_lewis_1890(
         sql += " LIMIT ?"
         params.append(limit)
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(sql, params).fetchall()
     except Exception as exc:  # noqa: BLE001
         _warn_error(warnings, "lewis_1890", path, exc)
@@ -1794,7 +1794,7 @@ def _neighborhood_lewis_1890(
     if not keys:
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             anchor_rows = conn.execute(
                 f"""
                 SELECT entry_id, headword_raw, headword_norm, source_key, entry_hash
@@ -1852,7 +1852,7 @@ def _wheel_lewis_1890(
         _warn_missing(warnings, "lewis_1890", path)
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(
                 """
                 SELECT entry_id, headword_raw, headword_norm, source_key, entry_hash
@@ -1894,7 +1894,7 @@ def _list_georges_1913(
         sql += " LIMIT ?"
         params.append(limit)
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(sql, params).fetchall()
     except Exception as exc:  # noqa: BLE001
         _warn_error(warnings, "georges_1913", path, exc)
@@ -1916,7 +1916,7 @@ def _neighborhood_georges_1913(
     if not keys:
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             anchor_rows = conn.execute(
                 f"""
                 SELECT entry_id, occurrence, headword_roma, headword_norm, source_page
@@ -2011,7 +2011,7 @@ def _wheel_georges_1913(
         _warn_missing(warnings, "georges_1913", path)
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(
                 """
                 SELECT entry_id, occurrence, headword_roma, headword_norm, source_page
@@ -2055,7 +2055,7 @@ def _list_whitakers(
         sql += " LIMIT ?"
         params.append(limit)
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(sql, params).fetchall()
     except Exception as exc:  # noqa: BLE001
         _warn_error(warnings, "whitakers", path, exc)
@@ -2077,7 +2077,7 @@ def _neighborhood_whitakers(
     if not keys:
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             anchor_rows = conn.execute(
                 f"""
                 SELECT entry_id, headword_raw, headword_norm, source_stem, pos, codes
@@ -2135,7 +2135,7 @@ def _wheel_whitakers(
         _warn_missing(warnings, "whitakers", path)
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(
                 """
                 SELECT entry_id, headword_raw, headword_norm, source_stem, pos, codes
@@ -2195,7 +2195,7 @@ def _list_diogenes(
         sql += " LIMIT ?"
         params.append(limit)
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(sql, params).fetchall()
     except Exception as exc:  # noqa: BLE001
         _warn_error(warnings, "diogenes", path, exc)
@@ -2218,7 +2218,7 @@ def _neighborhood_diogenes(
     if not keys:
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             source_prefix = _greek_section_source_prefix(query) if language == "grc" else None
             if source_prefix is None:
                 anchor_rows = conn.execute(
@@ -2322,7 +2322,7 @@ def _wheel_diogenes(
         _warn_missing(warnings, "diogenes", path)
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(
                 """
                 SELECT
@@ -2367,7 +2367,7 @@ def _list_bailly(
         sql += " LIMIT ?"
         params.append(limit)
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(sql, params).fetchall()
     except Exception as exc:  # noqa: BLE001
         _warn_error(warnings, "bailly", path, exc)
@@ -2389,7 +2389,7 @@ def _neighborhood_bailly(
     if not keys:
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             anchor_rows = conn.execute(
                 f"""
                 SELECT entry_id, lemma, lemma_norm, page_start, page_end
@@ -2446,7 +2446,7 @@ def _wheel_bailly(
         _warn_missing(warnings, "bailly", path)
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(
                 """
                 SELECT entry_id, lemma, lemma_norm, page_start, page_end
@@ -2502,7 +2502,7 @@ def _list_strongs_greek(
         sql += " LIMIT ?"
         params.append(limit)
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(sql, params).fetchall()
     except Exception as exc:  # noqa: BLE001
         _warn_error(warnings, "strongs_greek", path, exc)
@@ -2524,7 +2524,7 @@ def _neighborhood_strongs_greek(
     if not keys:
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             anchor_rows = conn.execute(
                 f"""
                 SELECT
@@ -2591,7 +2591,7 @@ def _wheel_strongs_greek(
         _warn_missing(warnings, "strongs_greek", path)
         return []
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             rows = conn.execute(
                 """
                 SELECT
@@ -3535,7 +3535,7 @@ def _duckdb_status(  # noqa: PLR0913
         payload["message"] = "index database is missing"
         return payload
     try:
-        with connect_duckdb_ro(path) as conn:
+        with connect_duckdb_pooled(path) as conn:
             sql = f"SELECT COUNT(*) FROM {table}"
             if where:
                 sql += f" WHERE {where}"
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import click
+import orjson
+from click.testing import CliRunner
+
+from langnet.cli_entry import LAZY_COMMANDS, STARTUP_PROFILE_SCHEMA_VERSION, LazyCommandGroup
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+@click.command("ping")
+def _ping() -> None:
+    click.echo("pong")
+
+
+@click.group("full")
+def _full() -> None:
+    """Fake full CLI."""
+
+
+@_full.command("heavy")
+def _heavy() -> None:
+    click.echo("heavy ran")
+
+
+def test_lazy_group_resolves_registered_and_fallback_commands() -> None:
+    group = LazyCommandGroup(
+        "lazy",
+        lazy_commands={"ping": f"{__name__}:_ping"},
+        full_cli=f"{__name__}:_full",
+    )
+
+    assert CliRunner().invoke(group, ["ping"]).output == "pong\n"
+    assert CliRunner().invoke(group, ["heavy"]).output == "heavy ran\n"
+    assert group.list_commands(click.Context(group)) == ["heavy", "ping"]
+
+
+def test_reader_group_starts_without_importing_full_cli() -> None:
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR), "LANGNET_PROFILE_STARTUP": "1"}
+    result = subprocess.run(
+        [sys.executable, "-m", "langnet.cli_entry", "reader", "--help"],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+
+    profile = orjson.loads(result.stderr.strip().splitlines()[-1])
+    assert profile["schema_version"] == STARTUP_PROFILE_SCHEMA_VERSION
+    assert profile["target"] == LAZY_COMMANDS["reader"]
+    assert "langnet.cli" not in profile["heavy_modules"]
+    assert "langnet.execution.executor" not in profile["heavy_modules"]
+    assert "works" in result.stdout
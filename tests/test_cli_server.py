@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+import orjson
+import pytest
+from starlette.testclient import TestClient
+
+from langnet.cli_server import CLI_SERVER_SCHEMA_VERSION, create_app, run_cli_command
+
+HTTP_OK = 200
+HTTP_BAD_REQUEST = 400
+HTTP_FORBIDDEN = 403
+USAGE_EXIT_CODE = 2
+
+
+@click.group()
+def _fake_cli() -> None:
+    """Fake CLI."""
+
+
+@_fake_cli.command("encounter")
+@click.argument("language")
+@click.argument("text")
+@click.option("--output", default="pretty")
+def _fake_encounter(language: str, text: str, output: str) -> None:
+    click.echo(orjson.dumps({"language": language, "text": text, "output": output}).decode())
+    click.echo("progress", err=True)
+
+
+@_fake_cli.command("reader")
+@click.option("--fail", is_flag=True)
+def _fake_reader(fail: bool) -> None:
+    if fail:
+        raise click.ClickException("reader failed")
+    click.echo('{"ok": true}')
+
+
+@_fake_cli.command("word-index")
+@click.argument("token")
+def _fake_word_index(token: str) -> None:
+    _barrier.wait(timeout=5)
+    click.echo(orjson.dumps({"token": token, "thread": threading.get_ident()}).decode())
+
+
+@_fake_cli.command("databuild")
+def _fake_databuild() -> None:
+    click.echo("should not run")
+
+
+_barrier = threading.Barrier(1)
+
+
+def test_run_cli_command_captures_stdout_stderr_and_exit_codes() -> None:
+    ok = run_cli_command(_fake_cli, ["encounter", "lat", "lupus", "--output", "json"])
+    assert ok.exit_code == 0
+    assert orjson.loads(ok.stdout) == {"language": "lat", "text": "lupus", "output": "json"}
+    assert ok.stderr == "progress\n"
+
+    failed = run_cli_command(_fake_cli, ["reader", "--fail"])
+    assert failed.exit_code == 1
+    assert "reader failed" in failed.stderr
+
+    usage = run_cli_command(_fake_cli, ["encounter"])
+    assert usage.exit_code == USAGE_EXIT_CODE
+    assert "Missing argument" in usage.stderr
+
+
+def test_worker_app_runs_served_commands_with_cli_json_contract() -> None:
+    client = TestClient(create_app(_fake_cli))
+
+    response = client.post("/v1/run", json={"argv": ["encounter", "grc", "logos"]})
+
+    assert response.status_code == HTTP_OK
+    payload = response.json()
+    assert payload["schema_version"] == CLI_SERVER_SCHEMA_VERSION
+    assert payload["ok"] is True
+    assert payload["exit_code"] == 0
+    assert orjson.loads(payload["stdout"])["text"] == "logos"
+
+
+def test_worker_app_rejects_unserved_commands_and_bad_bodies() -> None:
+    client = TestClient(create_app(_fake_cli))
+
+    forbidden = client.post("/v1/run", json={"argv": ["databuild"]})
+    bad = client.post("/v1/run", json={"argv": []})
+    health = client.get("/health").json()
+
+    assert forbidden.status_code == HTTP_FORBIDDEN
+    assert bad.status_code == HTTP_BAD_REQUEST
+    assert health["stats"]["rejected"] == 2  # noqa: PLR2004
+    assert "databuild" not in health["commands"]
+    assert {"opens", "hits", "databases"} <= set(health["duckdb_pool"])
+
+
+def test_worker_app_isolates_output_of_concurrent_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    workers = 3
+    monkeypatch.setattr(sys.modules[__name__], "_barrier", threading.Barrier(workers))
+    client = TestClient(create_app(_fake_cli, max_concurrency=workers))
+
+    def call(token: str) -> dict[str, object]:
+        response = client.post("/v1/run", json={"argv": ["word-index", token]})
+        return orjson.loads(response.json()["stdout"])
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(call, ["a", "b", "c"]))
+
+    assert [item["token"] for item in results] == ["a", "b", "c"]
+    assert len({item["thread"] for item in results}) == workers
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from langnet.encounter_lookups import EncounterLookupScheduler, PerThreadClients
+
+FALLBACK_TERMS = ["deva", "agni", "soma"]
+
+
+def test_run_many_overlaps_fallback_terms_and_keeps_term_order() -> None:
+    barrier = threading.Barrier(len(FALLBACK_TERMS))
+    scheduler: EncounterLookupScheduler[str] = EncounterLookupScheduler(max_workers=4)
+
+    def lookup(term: str) -> str:
+        # Every term must be in flight at once for the barrier to open.
+        barrier.wait(timeout=5)
+        time.sleep(0.01 * (len(FALLBACK_TERMS) - FALLBACK_TERMS.index(term)))
+        return term.upper()
+
+    primary = scheduler.run("primary", "devagni", lambda: "primary")
+    results = scheduler.run_many("sanskrit-morphology-fallback", FALLBACK_TERMS, lookup)
+
+    assert primary == "primary"
+    assert results == [(term, term.upper()) for term in FALLBACK_TERMS]
+    payload = scheduler.payload()
+    assert [(row["path"], row["term"], row["status"]) for row in payload["paths"]] == [
+        ("primary", "devagni", "ok"),
+        *[("sanskrit-morphology-fallback", term, "ok") for term in FALLBACK_TERMS],
+    ]
+
+
+def test_run_many_drops_terms_past_the_budget_and_reraises_errors() -> None:
+    release = threading.Event()
+    scheduler: EncounterLookupScheduler[str] = EncounterLookupScheduler(
+        max_workers=2, budget_seconds=0.05
+    )
+
+    def lookup(term: str) -> str:
+        if term == "soma":
+            release.wait(timeout=5)
+        return term
+
+    try:
+        results = scheduler.run_many("fallback", ["agni", "soma"], lookup)
+    finally:
+        release.set()
+    time.sleep(0.06)
+    skipped = scheduler.run_many("late-fallback", ["deva"], lookup)
+
+    assert results == [("agni", "agni")]
+    assert skipped == []
+    assert [(row.term, row.status) for row in scheduler.paths] == [
+        ("agni", "ok"),
+        ("soma", "timeout"),
+        ("deva", "skipped"),
+    ]
+
+    def failing(term: str) -> str:
+        raise RuntimeError(term)
+
+    with pytest.raises(RuntimeError, match="agni"):
+        EncounterLookupScheduler().run_many("fallback", ["agni"], failing)
+
+
+def test_run_many_stops_taking_queued_terms_after_an_error() -> None:
+    called: list[str] = []
+
+    def failing(term: str) -> str:
+        called.append(term)
+        raise RuntimeError(term)
+
+    with pytest.raises(RuntimeError, match="deva"):
+        EncounterLookupScheduler(max_workers=1).run_many("fallback", FALLBACK_TERMS, failing)
+    time.sleep(0.02)
+
+    assert called == ["deva"]
+
+
+def test_run_many_records_failures_past_the_budget_as_timeouts() -> None:
+    now = [0.0]
+    scheduler: EncounterLookupScheduler[str] = EncounterLookupScheduler(
+        budget_seconds=1.0, clock=lambda: now[0]
+    )
+
+    def lookup(term: str) -> str:
+        now[0] += scheduler.remaining_seconds()
+        raise TimeoutError(term)
+
+    results = scheduler.run_many("fallback", ["agni"], lookup)
+
+    assert results == []
+    assert [(row.term, row.status) for row in scheduler.paths] == [("agni", "timeout")]
+
+
+def test_run_many_budget_starts_at_first_fanout_on_daemon_threads() -> None:
+    scheduler: EncounterLookupScheduler[bool] = EncounterLookupScheduler(budget_seconds=0.05)
+    scheduler.run("primary", "devagni", lambda: time.sleep(0.06))
+
+    results = scheduler.run_many(
+        "fallback", FALLBACK_TERMS, lambda _term: threading.current_thread().daemon
+    )
+
+    assert results == [(term, True) for term in FALLBACK_TERMS]
+
+
+def test_per_thread_clients_never_share_a_client_cache_across_threads() -> None:
+    clients = PerThreadClients()
+    barrier = threading.Barrier(len(FALLBACK_TERMS))
+
+    def lookup(term: str) -> dict[str, object]:
+        barrier.wait(timeout=5)
+        cache = clients.current()
+        assert clients.current() is cache
+        cache["term"] = term
+        return cache
+
+    results = EncounterLookupScheduler[dict[str, object]]().run_many(
+        "fallback", FALLBACK_TERMS, lookup
+    )
+
+    assert [cache["term"] for _term, cache in results] == FALLBACK_TERMS
+    assert clients.current() == {}
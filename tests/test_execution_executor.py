@@ -25,8 +25,16 @@ from langnet.execution.effects import (
     ProvenanceLink,
     stable_effect_id,
 )
-from langnet.execution.executor import ExecutionArtifacts, ToolRegistry, execute_plan_staged
+from langnet.execution.executor import (
+    HTTP_PARTIAL_CONTENT,
+    ExecutionArtifacts,
+    ToolRegistry,
+    execute_plan_staged,
+)
+from langnet.execution.handler_pool import HandlerPool
 from langnet.execution.registry import default_registry
+from langnet.execution.versioning import versioned
+from langnet.storage import path_indices
 from langnet.storage.claim_index import ClaimIndex
 from langnet.storage.derivation_index import DerivationIndex
 from langnet.storage.effects_index import RawResponseIndex
@@ -34,6 +42,7 @@ from langnet.storage.extraction_index import ExtractionIndex
 from langnet.storage.path_indices import (
     PathClaimIndex,
     PathDerivationIndex,
+    PathEffectBatch,
     PathExtractionIndex,
     PathPlanResponseIndex,
     PathRawResponseIndex,
@@ -41,11 +50,13 @@ from langnet.storage.path_indices import (
 from langnet.storage.plan_index import PlanResponseIndex, apply_schema
 
 EXPECTED_PARALLEL_FETCHES = 2
+EXPECTED_POOLED_HANDLER_CALLS = 6
 
 
 class _FakeClient:
-    def __init__(self, tool: str) -> None:
+    def __init__(self, tool: str, status_code: int = 200) -> None:
         self.tool = tool
+        self.status_code = status_code
         self.calls: list[str] = []
 
     def execute(
@@ -58,7 +69,7 @@ class _FakeClient:
             tool=self.tool,
             call_id=call_id,
             endpoint=endpoint,
-            status_code=200,
+            status_code=self.status_code,
             content_type="text/plain",
             headers={},
             body=body,
@@ -204,7 +215,9 @@ def _registry() -> ToolRegistry:
     )
 
 
-def _execute(conn: duckdb.DuckDBPyConnection, allow_cache: bool = True) -> ExecutionArtifacts:
+def _execute(
+    conn: duckdb.DuckDBPyConnection, allow_cache: bool = True, *, status_code: int = 200
+) -> ExecutionArtifacts:
     apply_schema(conn)
     raw_index = RawResponseIndex(conn)
     extraction_index = ExtractionIndex(conn)
@@ -212,7 +225,7 @@ def _execute(conn: duckdb.DuckDBPyConnection, allow_cache: bool = True) -> Execu
     claim_index = ClaimIndex(conn)
     plan_response_index = PlanResponseIndex(conn)
 
-    client = _FakeClient(tool="fetch.dummy")
+    client = _FakeClient(tool="fetch.dummy", status_code=status_code)
     plan = _build_plan()
     return execute_plan_staged(
         plan=plan,
@@ -331,6 +344,149 @@ def test_executor_runs_all_stages_and_caches_fetch() -> None:
     assert second.from_cache is True
 
 
+def test_executor_does_not_cache_plans_with_partial_responses() -> None:
+    conn = duckdb.connect(database=":memory:")
+    first = _execute(conn, allow_cache=True, status_code=HTTP_PARTIAL_CONTENT)
+    assert first.claims
+
+    second = _execute(conn, allow_cache=True, status_code=HTTP_PARTIAL_CONTENT)
+    assert second.claims
+    assert second.from_cache is False
+
+
+def _versioned_registry(
+    counts: dict[str, int], extract_version: str = "v1", *, with_prefixes: bool = True
+) -> ToolRegistry:
+    base = _registry()
+    prefixes = {"extract": "ext", "derive": "drv", "claim": "clm"} if with_prefixes else {}
+
+    def _counted(stage: str, handler, version: str):
+        @versioned(version, effect_prefix=prefixes.get(stage))
+        def wrapper(call, source):
+            counts[stage] = counts.get(stage, 0) + 1
+            return handler(call, source)
+
+        return wrapper
+
+    return ToolRegistry(
+        extract_handlers={
+            "extract.dummy": _counted(
+                "extract", base.extract_handlers["extract.dummy"], extract_version
+            )
+        },
+        derive_handlers={
+            "derive.dummy": _counted("derive", base.derive_handlers["derive.dummy"], "v1")
+        },
+        claim_handlers={"claim.dummy": _counted("claim", base.claim_handlers["claim.dummy"], "v1")},
+    )
+
+
+def _execute_path(db_path: Path, registry: ToolRegistry) -> ExecutionArtifacts:
+    client = _FakeClient(tool="fetch.dummy")
+    return execute_plan_staged(
+        plan=_build_plan(),
+        clients={client.tool: client},
+        registry=registry,
+        raw_index=PathRawResponseIndex(db_path),
+        extraction_index=PathExtractionIndex(db_path),
+        derivation_index=PathDerivationIndex(db_path),
+        claim_index=PathClaimIndex(db_path),
+        plan_response_index=PathPlanResponseIndex(db_path),
+        allow_cache=True,
+    )
+
+
+def test_executor_memoizes_versioned_stages_on_warm_plan(tmp_path) -> None:
+    db_path = tmp_path / "runtime.duckdb"
+    counts: dict[str, int] = {}
+
+    first = _execute_path(db_path, _versioned_registry(counts))
+    second = _execute_path(db_path, _versioned_registry(counts))
+
+    assert counts == {"extract": 1, "derive": 1, "claim": 1}
+    assert first.memoized_calls == []
+    assert second.memoized_calls == ["call-extract", "call-derive", "call-claim"]
+    assert [c.claim_id for c in second.claims] == [c.claim_id for c in first.claims]
+    assert second.claims[0].value == {"lemma": "lupus"}
+    assert [link.stage for link in second.claims[0].provenance_chain] == ["extract", "derive"]
+    assert second.claims[0].handler_version == "v1"
+
+
+def test_executor_handler_version_bump_invalidates_downstream_memo(tmp_path) -> None:
+    db_path = tmp_path / "runtime.duckdb"
+    counts: dict[str, int] = {}
+
+    _execute_path(db_path, _versioned_registry(counts))
+    bumped = _execute_path(db_path, _versioned_registry(counts, extract_version="v2"))
+
+    # Stable effect ids do not change with the extract version, so derive/claim
+    # must re-run rather than reuse rows built from the old extraction.
+    assert counts == {"extract": 2, "derive": 2, "claim": 2}
+    assert bumped.memoized_calls == []
+    assert bumped.extractions[0].handler_version == "v2"
+
+
+def test_executor_does_not_memoize_handlers_without_effect_prefix(tmp_path) -> None:
+    db_path = tmp_path / "runtime.duckdb"
+    counts: dict[str, int] = {}
+
+    _execute_path(db_path, _versioned_registry(counts, with_prefixes=False))
+    second = _execute_path(db_path, _versioned_registry(counts, with_prefixes=False))
+
+    assert counts == {"extract": 2, "derive": 2, "claim": 2}
+    assert second.memoized_calls == []
+
+
+def test_stage_memo_only_reuses_effects_built_for_the_same_call(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "runtime.duckdb"
+    stored = ExtractionEffect(
+        extraction_id=stable_effect_id("ext", "call-a", "resp-1"),
+        tool="extract.dummy",
+        call_id="call-a",
+        source_call_id="fetch-a",
+        response_id="resp-1",
+        kind="dummy",
+        canonical="lupus",
+        payload={"lemma": "lupus"},
+        handler_version="v1",
+    )
+    with PathEffectBatch(db_path) as batch:
+        batch.extraction_index.store_effect(stored)
+
+    opened: list[Path] = []
+    connect_ro = path_indices.connect_duckdb_ro
+
+    def counting_connect_ro(path: Path):
+        opened.append(path)
+        return connect_ro(path)
+
+    monkeypatch.setattr(path_indices, "connect_duckdb_ro", counting_connect_ro)
+    batch = PathEffectBatch(db_path)
+    index = batch.extraction_index
+    with index.memo_reads():
+        hit = index.get_memoized(
+            "resp-1",
+            "extract.dummy",
+            "v1",
+            effect_id=stable_effect_id("ext", "call-a", "resp-1"),
+            call_id="call-a",
+            source_call_id="fetch-a",
+        )
+        other_call = index.get_memoized(
+            "resp-1",
+            "extract.dummy",
+            "v1",
+            effect_id=stable_effect_id("ext", "call-b", "resp-1"),
+            call_id="call-b",
+            source_call_id="fetch-b",
+        )
+
+    assert hit is not None
+    assert hit.extraction_id == stored.extraction_id
+    assert other_call is None
+    assert opened == [db_path]
+
+
 def test_executor_overlaps_independent_fetch_calls() -> None:
     conn = duckdb.connect(database=":memory:")
     apply_schema(conn)
@@ -428,6 +584,50 @@ def test_path_indexes_do_not_hold_file_lock_during_fetch(tmp_path) -> None:
     assert second_client.calls == []
 
 
+def test_path_effect_batch_flushes_run_in_one_transaction(tmp_path) -> None:
+    db_path = tmp_path / "runtime.duckdb"
+    client = _FakeClient(tool="fetch.dummy")
+
+    with PathEffectBatch(db_path) as batch:
+        first = execute_plan_staged(
+            plan=_build_plan(),
+            clients={client.tool: client},
+            registry=_registry(),
+            raw_index=batch.raw_index,
+            extraction_index=batch.extraction_index,
+            derivation_index=batch.derivation_index,
+            claim_index=batch.claim_index,
+            plan_response_index=batch.plan_response_index,
+            allow_cache=True,
+        )
+        # raw + extraction + derivation + claim + plan response
+        assert batch.pending_count() == 5  # noqa: PLR2004
+        assert not db_path.exists()
+
+    assert batch.pending_count() == 0
+    assert PathPlanResponseIndex(db_path).get(first.plan.plan_hash) is not None
+    second = _execute_path(db_path, _registry())
+    assert second.from_cache is True
+    assert [c.claim_id for c in second.claims] == [c.claim_id for c in first.claims]
+
+
+def test_path_indices_apply_schema_once_per_database(tmp_path, monkeypatch) -> None:
+    db_path = tmp_path / "runtime.duckdb"
+    applied: list[object] = []
+    original = path_indices.apply_schema
+
+    def counting_apply_schema(conn) -> None:
+        applied.append(conn)
+        original(conn)
+
+    monkeypatch.setattr(path_indices, "apply_schema", counting_apply_schema)
+    first = _execute_path(db_path, _registry())
+    _execute_path(db_path, _registry())
+
+    assert first.claims
+    assert len(applied) == 1
+
+
 def test_path_response_cache_reads_do_not_take_write_lock() -> None:
     with TemporaryDirectory() as tmp_dir:
         db_path = Path(tmp_dir) / "runtime.duckdb"
@@ -498,3 +698,118 @@ def test_tool_registry_with_stubs() -> None:
     assert callable(reg.get_extract("anything"))
     assert callable(reg.get_derive("anything"))
     assert callable(reg.get_claim("anything"))
+
+
+class _CountingHandlerPool(HandlerPool):
+    def __init__(self, workers: int) -> None:
+        super().__init__(workers, use_stubs=True)
+        self.submitted: list[str] = []
+
+    def submit(self, stage, call, source):
+        self.submitted.append(call.call_id)
+        return super().submit(stage, call, source)
+
+
+def _fan_out_plan() -> ToolPlan:
+    normalized = NormalizedQuery(
+        original="logos",
+        language=LanguageHint.LANGUAGE_HINT_GRC,
+        candidates=[],
+        normalizations=[],
+    )
+    calls: list[ToolCallSpec] = []
+    deps: list[PlanDependency] = []
+    for name in ("alpha", "beta"):
+        previous = f"fetch-{name}"
+        calls.append(
+            ToolCallSpec(
+                tool=f"fetch.{name}",
+                call_id=previous,
+                endpoint=f"internal://{name}",
+                params={"q": "logos"},
+                stage=ToolStage.TOOL_STAGE_FETCH,
+            )
+        )
+        for stage_name, stage in (
+            ("extract", ToolStage.TOOL_STAGE_EXTRACT),
+            ("derive", ToolStage.TOOL_STAGE_DERIVE),
+            ("claim", ToolStage.TOOL_STAGE_CLAIM),
+        ):
+            call_id = f"{stage_name}-{name}"
+            calls.append(
+                ToolCallSpec(
+                    tool=f"{stage_name}.{name}",
+                    call_id=call_id,
+                    endpoint=f"internal://{stage_name}",
+                    params={"source_call_id": previous},
+                    stage=stage,
+                )
+            )
+            deps.append(PlanDependency(from_call_id=previous, to_call_id=call_id))
+            previous = call_id
+    return ToolPlan(
+        plan_id="plan-fan-out",
+        plan_hash="",
+        query=normalized,
+        tool_calls=calls,
+        dependencies=deps,
+    )
+
+
+def _execute_fan_out(registry: ToolRegistry, pool: HandlerPool | None) -> ExecutionArtifacts:
+    conn = duckdb.connect(database=":memory:")
+    apply_schema(conn)
+    return execute_plan_staged(
+        plan=_fan_out_plan(),
+        clients={
+            "fetch.alpha": _FakeClient("fetch.alpha"),
+            "fetch.beta": _FakeClient("fetch.beta"),
+        },
+        registry=registry,
+        raw_index=RawResponseIndex(conn),
+        extraction_index=ExtractionIndex(conn),
+        derivation_index=DerivationIndex(conn),
+        claim_index=ClaimIndex(conn),
+        plan_response_index=PlanResponseIndex(conn),
+        allow_cache=False,
+        handler_pool=pool,
+    )
+
+
+def test_executor_handler_pool_matches_serial_effects() -> None:
+    with _CountingHandlerPool(workers=2) as pool:
+        pooled = _execute_fan_out(pool.registry, pool)
+    serial = _execute_fan_out(default_registry(use_stubs=True), None)
+
+    assert len(pool.submitted) == EXPECTED_POOLED_HANDLER_CALLS
+    assert [e.extraction_id for e in pooled.extractions] == [
+        e.extraction_id for e in serial.extractions
+    ]
+    assert [d.derivation_id for d in pooled.derivations] == [
+        d.derivation_id for d in serial.derivations
+    ]
+    assert [c.claim_id for c in pooled.claims] == [c.claim_id for c in serial.claims]
+    assert [c.call_id for c in pooled.claims] == ["claim-alpha", "claim-beta"]
+
+
+def test_executor_handler_pool_runs_unregistered_handlers_inline() -> None:
+    with _CountingHandlerPool(workers=2) as pool:
+        result = _execute(duckdb.connect(database=":memory:"), allow_cache=False)
+        conn = duckdb.connect(database=":memory:")
+        apply_schema(conn)
+        client = _FakeClient(tool="fetch.dummy")
+        pooled = execute_plan_staged(
+            plan=_build_plan(),
+            clients={client.tool: client},
+            registry=_registry(),
+            raw_index=RawResponseIndex(conn),
+            extraction_index=ExtractionIndex(conn),
+            derivation_index=DerivationIndex(conn),
+            claim_index=ClaimIndex(conn),
+            plan_response_index=PlanResponseIndex(conn),
+            allow_cache=False,
+            handler_pool=pool,
+        )
+
+    assert pool.submitted == []
+    assert [c.claim_id for c in pooled.claims] == [c.claim_id for c in result.claims]
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import cast
+
+import pytest
+
+from langnet.clients.base import RawResponseEffect, ToolClient
+from langnet.diogenes.adapter import DiogenesWordListAdapter
+from langnet.diogenes.client import DiogenesClient
+from langnet.diogenes.parse_adapter import DiogenesParseAdapter
+from langnet.execution.handlers.diogenes import _parse_diogenes_html, _parse_fallback_lemmas
+from langnet.execution.handlers.heritage import _extract_lemma_from_response
+from langnet.heritage.client import HeritageHTTPClient
+from langnet.heritage.html_extractor import extract_solutions
+from langnet.heritage.user_feedback import parse_user_feedback
+from langnet.paradigm.diogenes import parse_diogenes_inflect_html
+from langnet.paradigm.heritage import (
+    parse_heritage_conjugation_html,
+    parse_heritage_declension_html,
+)
+from langnet.parsing.html_soup import HTML_PARSER_ENV, html_parser_backend, make_soup
+
+FIXTURE_DIR = Path("tests/fixtures/html")
+GOLDEN_PATH = FIXTURE_DIR / "golden_outputs.json"
+BACKENDS = ("html.parser", "lxml")
+
+_NO_CLIENT = cast(ToolClient, None)
+
+
+class _RecordedClient:
+    def __init__(self, body: bytes) -> None:
+        self.body = body
+
+    def execute(self, call_id: str, endpoint: str, params: object = None) -> RawResponseEffect:
+        return RawResponseEffect(
+            response_id="resp",
+            tool="fetch.heritage",
+            call_id=call_id,
+            endpoint=endpoint,
+            status_code=200,
+            content_type="text/html",
+            headers={},
+            body=self.body,
+        )
+
+
+def _sktsearch(body: bytes) -> object:
+    client = HeritageHTTPClient(tool_client=cast(ToolClient, _RecordedClient(body)))
+    return client.fetch_all_matches("agni")
+
+
+def _word_list(body: bytes) -> object:
+    return DiogenesClient(_NO_CLIENT, "http://localhost/Diogenes.cgi")._parse_word_list(
+        body, "logos", None
+    )
+
+
+def _word_list_adapter(body: bytes) -> object:
+    adapter = DiogenesWordListAdapter(_NO_CLIENT, None, None, "")  # type: ignore[arg-type]
+    return adapter._parse_lemmas(body)
+
+
+def _parse_adapter(body: bytes) -> object:
+    adapter = DiogenesParseAdapter(_NO_CLIENT, None, None, "")  # type: ignore[arg-type]
+    return adapter._parse_lemmas(body)
+
+
+def _parse_output(body: bytes) -> object:
+    return DiogenesClient(_NO_CLIENT, "http://localhost/Diogenes.cgi")._parse_parse_output(
+        body, "lupus"
+    )
+
+
+def _text(body: bytes) -> str:
+    return body.decode("utf-8")
+
+
+EXTRACTORS: dict[str, list[tuple[str, Callable[[bytes], object]]]] = {
+    "diogenes_parse_lupus.html": [
+        ("handler", lambda body: _parse_diogenes_html(_text(body))),
+        ("fallback_lemmas", _parse_fallback_lemmas),
+        ("parse_adapter", _parse_adapter),
+        ("client_parse", _parse_output),
+    ],
+    "diogenes_parse_logos.html": [
+        ("handler", lambda body: _parse_diogenes_html(_text(body))),
+    ],
+    "diogenes_word_list.html": [
+        ("client_word_list", _word_list),
+        ("word_list_adapter", _word_list_adapter),
+    ],
+    "diogenes_inflect_logos.html": [
+        (
+            "paradigm",
+            lambda body: parse_diogenes_inflect_html(
+                _text(body), language="grc", lemma="λόγος", kind="declension"
+            ),
+        ),
+    ],
+    "heritage_sktreader_agni.html": [
+        ("solutions", lambda body: extract_solutions(_text(body))),
+        ("lemma", lambda body: _extract_lemma_from_response(make_soup(_text(body)), {})),
+    ],
+    "heritage_sktreader_loose.html": [
+        ("solutions", lambda body: extract_solutions(_text(body))),
+    ],
+    "heritage_sktsearch.html": [("matches", _sktsearch)],
+    "heritage_user_feedback.html": [("matches", lambda body: parse_user_feedback(_text(body)))],
+    "heritage_declension_putra.html": [
+        (
+            "paradigm",
+            lambda body: parse_heritage_declension_html(_text(body), lemma="putra", gender="Mas"),
+        ),
+    ],
+    "heritage_conjugation_gam.html": [
+        (
+            "paradigm",
+            lambda body: parse_heritage_conjugation_html(
+                _text(body), root="gam", present_class="1"
+            ),
+        ),
+    ],
+}
+
+
+def _jsonable(value: object) -> object:
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return _jsonable(dataclasses.asdict(value))
+    if isinstance(value, dict):
+        return {str(key): _jsonable(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(item) for item in value]
+    return value
+
+
+def _outputs() -> dict[str, object]:
+    outputs: dict[str, object] = {}
+    for fixture, extractors in EXTRACTORS.items():
+        body = (FIXTURE_DIR / fixture).read_bytes()
+        for name, extract in extractors:
+            outputs[f"{fixture}::{name}"] = _jsonable(extract(body))
+    return outputs
+
+
+def test_html_backends_match_golden_outputs(monkeypatch: pytest.MonkeyPatch) -> None:
+    golden = json.loads(GOLDEN_PATH.read_text(encoding="utf-8"))
+
+    for backend in BACKENDS:
+        monkeypatch.setenv(HTML_PARSER_ENV, backend)
+        assert html_parser_backend() == backend
+        assert _outputs() == golden, backend
+
+
+def test_html_parser_backend_defaults_to_lxml_and_falls_back(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.delenv(HTML_PARSER_ENV, raising=False)
+    assert html_parser_backend() == "lxml"
+
+    monkeypatch.setenv(HTML_PARSER_ENV, "no-such-builder")
+    assert html_parser_backend() == "html.parser"
+    assert make_soup("<p>salve</p>").get_text() == "salve"
@@ -1,19 +1,27 @@
 from __future__ import annotations
 
+import threading
+import time
 from dataclasses import dataclass
 from pathlib import Path
 
 import duckdb
+import requests
 from heritage_spec import MonierWilliamsResult, SktSearchResult
 from query_spec import CanonicalCandidate, LanguageHint, NormalizationStep, NormalizedQuery
 
 from langnet.diogenes.client import ParseResult, WordListResult
+from langnet.heritage.client import HeritageHTTPClient
 from langnet.normalizer.core import (
     QueryNormalizer,
     _hash_query,
     normalize_with_index,
 )
-from langnet.normalizer.sanskrit import HeritageClientProtocol, SanskritNormalizer
+from langnet.normalizer.sanskrit import (
+    HERITAGE_PROBE_WORKERS_ENV,
+    HeritageClientProtocol,
+    SanskritNormalizer,
+)
 from langnet.normalizer.service import NormalizationService
 from langnet.storage.normalization_index import NormalizationIndex, apply_schema
 
@@ -376,6 +384,95 @@ def test_sanskrit_normalizer_retries_reader_ascii_long_vowels_for_dhimata() -> N
     )
 
 
+class _SlowDhimataHeritage(_DhimataHeritage):
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+
+    def fetch_all_matches(self, query: str) -> list[HeritageMatch]:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.02)
+        with self.lock:
+            self.active -= 1
+        return super().fetch_all_matches(query)
+
+
+def test_sanskrit_parallel_heritage_probes_keep_sequential_ranking(monkeypatch) -> None:
+    results = {}
+    for workers in ("1", "4"):
+        monkeypatch.setenv(HERITAGE_PROBE_WORKERS_ENV, workers)
+        heritage = _SlowDhimataHeritage()
+        steps: list[NormalizationStep] = []
+        candidates = SanskritNormalizer(heritage_client=heritage).canonical_candidates(
+            "dhimata", steps
+        )
+        results[workers] = (
+            [candidate.lemma for candidate in candidates],
+            [(step.operation, step.input, step.output) for step in steps],
+            heritage.peak,
+        )
+
+    sequential, parallel = results["1"], results["4"]
+    assert parallel[0] == sequential[0]
+    assert parallel[1] == sequential[1]
+    assert sequential[2] == 1
+    assert parallel[2] > 1
+
+
+class _RecordingHeritage(_FakeHeritage):
+    def __init__(self, *, hit_first: bool) -> None:
+        self.hit_first = hit_first
+        self.queries: list[str] = []
+        self.threads: set[str] = set()
+
+    def fetch_all_matches(self, query: str) -> list[HeritageMatch]:
+        self.queries.append(query)
+        self.threads.add(threading.current_thread().name)
+        if self.hit_first and len(self.queries) == 1:
+            return [HeritageMatch(canonical=query, display=query, entry_url="")]
+        return []
+
+
+def test_sanskrit_retry_waves_start_with_one_probe_and_reuse_one_pool(monkeypatch) -> None:
+    monkeypatch.setenv(HERITAGE_PROBE_WORKERS_ENV, "4")
+    hit = _RecordingHeritage(hit_first=True)
+    misses = _RecordingHeritage(hit_first=False)
+
+    first_hit = SanskritNormalizer(heritage_client=hit)._heritage_retry_with_variants(  # noqa: SLF001
+        "dhimata", []
+    )
+    normalizer = SanskritNormalizer(heritage_client=misses)
+    for _attempt in range(3):
+        normalizer._heritage_retry_with_variants("dhimata", [])  # noqa: SLF001
+
+    assert first_hit
+    assert len(hit.queries) == 1
+    assert len(misses.queries) > 1
+    assert len(misses.threads) <= 4  # noqa: PLR2004
+
+
+def test_heritage_client_gives_each_probe_thread_its_own_session() -> None:
+    client = HeritageHTTPClient()
+    sessions: dict[str, object] = {}
+
+    def grab(name: str) -> None:
+        sessions[name] = client.session
+
+    threads = [threading.Thread(target=grab, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    shared = requests.Session()
+
+    assert sessions["a"] is not sessions["b"]
+    assert client.session is client.session
+    assert HeritageHTTPClient(session=shared).session is shared
+
+
 def test_sanskrit_normalizer_converts_heritage_bare_f_to_cdsl_nasal() -> None:
     normalizer = SanskritNormalizer(heritage_client=_TinantaHeritage())
 
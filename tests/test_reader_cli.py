@@ -667,6 +667,24 @@ def test_reader_cli_lists_works_and_retrieves_segment_json() -> None:  # noqa: P
         assert friendly_payload["segment"]["citation_path"] == "1.8"
 
 
+def test_reader_cli_search_index_build_rejects_incremental_limit() -> None:
+    result = CliRunner().invoke(
+        main,
+        [
+            "reader",
+            "search-index",
+            "build",
+            "--index",
+            "reader-search.lance",
+            "--incremental",
+            "--limit",
+            "5",
+        ],
+    )
+    assert result.exit_code != 0
+    assert "--limit and --incremental cannot be combined" in result.output
+
+
 def test_reader_cli_builds_and_searches_reader_text_index() -> None:
     with tempfile.TemporaryDirectory() as tmpdir:
         root = Path(tmpdir)
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import os
 import tempfile
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from os import chdir
 from pathlib import Path
+from typing import Any
+from unittest import mock
 
 import duckdb
+import pytest
 
 from langnet.reader.models import (
     ReaderBookArtifact,
@@ -16,12 +22,25 @@ from langnet.reader.models import (
     ReaderWorkClassification,
 )
 from langnet.reader.search_index import (
+    SEARCH_BUILD_INFLIGHT_PER_WORKER,
+    _apply_incremental_artifact_changes,
+    _attach_book_context_by_sort_key,
+    _attach_context_windows,
+    _catalog_artifact_rows,
+    _expanding_postfilter_rows,
+    _index_search_dataset,
+    _lance_fts_search,
+    _normalized_artifacts,
+    _write_normalized_artifacts,
+    _write_search_index_manifest,
     build_reader_search_index,
+    clear_reader_search_index_status_cache,
     inspect_reader_search_query,
     reader_search_index_status,
     search_reader_segments,
 )
 from langnet.reader.storage import (
+    connect_reader_book,
     create_book_db,
     create_catalog_db,
     register_book,
@@ -30,9 +49,11 @@ from langnet.reader.storage import (
 )
 
 SEARCH_FIXTURE_SEGMENT_COUNT = 5
+SEARCH_FIXTURE_ARTIFACT_COUNT = 3
 SEARCH_FIXTURE_LANGUAGE_COUNTS = {"grc": 2, "lat": 2, "san": 1}
 SEARCH_APPENDED_SEGMENT_COUNT = 4
 SEARCH_LATE_OPTIONAL_COLUMN_SEGMENT_COUNT = 106
+CONTEXT_FIXTURE_LINES = 8
 
 
 @contextmanager
@@ -62,6 +83,9 @@ def test_build_reader_search_index_writes_normalized_segment_rows() -> None:
         assert status["backend"] == "duckdb-lance"
         assert status["segment_count"] == SEARCH_FIXTURE_SEGMENT_COUNT
         assert status["normalizer_version"] == "reader-search-normalizer-v1"
+        assert status["status_source"] == "manifest"
+        assert status["work_count"] == summary["work_count"]
+        assert Path(summary["manifest_path"]).exists()
         assert set(status["fts_indexes"]) == {
             "search_text_folded_idx",
             "search_text_idx",
@@ -97,6 +121,183 @@ def test_build_reader_search_index_appends_to_existing_dataset() -> None:
         assert status["language_counts"] == {"grc": 2, "lat": 2}
 
 
+def test_build_reader_search_index_incremental_reindexes_changed_artifacts() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        catalog_path = _write_search_fixture(root)
+        index_path = root / "reader-search.lance"
+        build_reader_search_index(catalog_path, index_path, replace=True)
+        _register_fixture_work(
+            root,
+            catalog_path,
+            work_id="lat.work",
+            collection_id="latin_fixture",
+            language="lat",
+            title="Latin Work",
+            author="Latin Author",
+            source_id="lat001",
+            segments=[("lat-1", "1", "Lupus venit.", "lupus venit", 1)],
+            source_hash="hash-v2",
+        )
+
+        summary = build_reader_search_index(catalog_path, index_path, incremental=True)
+        unchanged = build_reader_search_index(catalog_path, index_path, incremental=True)
+        status = reader_search_index_status(index_path)
+        lupus = search_reader_segments(catalog_path, index_path, "lupus", language="lat")
+        iulius = search_reader_segments(catalog_path, index_path, "iulius", language="lat")
+
+        assert summary["artifacts_changed"] == 1
+        assert summary["artifacts_unchanged"] == SEARCH_FIXTURE_ARTIFACT_COUNT - 1
+        assert summary["rows_deleted"] == 2  # noqa: PLR2004
+        assert summary["segment_count"] == 1
+        assert unchanged["artifacts_changed"] == 0
+        assert unchanged["segment_count"] == 0
+        assert status["segment_count"] == SEARCH_FIXTURE_SEGMENT_COUNT - 1
+        assert [item["citation_path"] for item in lupus["items"]] == ["1"]
+        assert iulius["items"] == []
+
+
+def test_incremental_build_rejects_segment_limit() -> None:
+    with pytest.raises(ValueError, match="cannot be limited"):
+        build_reader_search_index(
+            Path("reader-catalog.duckdb"),
+            Path("reader-search.lance"),
+            incremental=True,
+            limit=5,
+        )
+
+
+def test_incremental_artifact_changes_delete_changed_and_removed_rows() -> None:
+    artifacts = [
+        {"artifact_id": "same", "source_hash": "h1"},
+        {"artifact_id": "changed", "source_hash": "h2-new"},
+        {"artifact_id": "new", "source_hash": "h3"},
+    ]
+    indexed = {"same": "h1", "changed": "h2", "gone": "h4"}
+    with (
+        mock.patch(
+            "langnet.reader.search_index._indexed_artifact_hashes",
+            return_value=indexed,
+        ),
+        mock.patch(
+            "langnet.reader.search_index._delete_lance_artifact_rows",
+            return_value=7,
+        ) as delete_rows,
+    ):
+        changed, counts = _apply_incremental_artifact_changes(
+            None,  # type: ignore[arg-type]
+            Path("reader-search.lance"),
+            artifacts,
+            language="lat",
+            collection_id=None,
+        )
+
+    assert [artifact["artifact_id"] for artifact in changed] == ["changed", "new"]
+    assert counts == {
+        "artifacts_changed": 2,
+        "artifacts_unchanged": 1,
+        "artifacts_removed": 1,
+        "rows_deleted": 7,
+    }
+    delete_rows.assert_called_once_with(Path("reader-search.lance"), ["changed", "gone"])
+
+
+def test_unchanged_incremental_build_skips_fts_index_optimization() -> None:
+    existing = {"search_text_idx", "search_text_folded_idx", "token_text_idx"}
+    with (
+        mock.patch("langnet.reader.search_index._optimize_lance_fts_indexes") as optimize,
+        mock.patch("langnet.reader.search_index._scan_search_index_status", return_value={}),
+        mock.patch(
+            "langnet.reader.search_index._write_search_index_manifest",
+            return_value={"segment_count": 3},
+        ),
+    ):
+        for dataset_changed in (False, True):
+            _index_search_dataset(
+                None,  # type: ignore[arg-type]
+                Path("reader-search.lance"),
+                catalog_path=Path("catalog.duckdb"),
+                existing_indexes=existing,
+                dataset_changed=dataset_changed,
+            )
+
+    optimize.assert_called_once_with(Path("reader-search.lance"))
+
+
+def test_parallel_normalization_matches_serial_and_writes_in_batches() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        catalog_path = _write_search_fixture(root)
+        artifacts = _catalog_artifact_rows(catalog_path, language=None, collection_id=None)
+
+        def normalized(workers: int) -> list:
+            return list(
+                _normalized_artifacts(
+                    artifacts,
+                    catalog_path=catalog_path,
+                    indexed_at="2026-01-01T00:00:00+00:00",
+                    limit=None,
+                    workers=workers,
+                )
+            )
+
+        serial = normalized(1)
+        parallel = normalized(2)
+        written: list[int] = []
+        with mock.patch(
+            "langnet.reader.search_index._write_lance_frame",
+            side_effect=lambda _conn, _path, frame, append: written.append(frame.height),
+        ):
+            stats = _write_normalized_artifacts(
+                None,  # type: ignore[arg-type]
+                root / "reader-search.lance",
+                iter(parallel),
+                batch_size=2,
+                limit=4,
+            )
+
+    assert [result.work_id for result in parallel] == [result.work_id for result in serial]
+    assert all(
+        left.frame is not None and right.frame is not None and left.frame.equals(right.frame)
+        for left, right in zip(serial, parallel, strict=True)
+    )
+    assert stats.segment_count == 4  # noqa: PLR2004
+    assert written == [2, 2]
+    throughput = stats.throughput(workers=2, started=0.0)
+    assert set(throughput["stages"]) == {"read", "normalize", "write", "index"}
+
+
+def test_parallel_normalization_stops_submitting_once_limit_is_covered() -> None:
+    submitted: list[str] = []
+
+    class CountingPool(ThreadPoolExecutor):
+        def __init__(self, max_workers: int, mp_context: object) -> None:
+            assert mp_context.get_start_method() == "spawn"  # type: ignore[attr-defined]
+            super().__init__(max_workers=max_workers)
+
+        def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
+            submitted.append(str(args[0]["artifact_id"]))
+            return super().submit(fn, *args, **kwargs)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        catalog_path = _write_search_fixture(root)
+        artifacts = _catalog_artifact_rows(catalog_path, language=None, collection_id=None) * 4
+        with mock.patch("langnet.reader.search_index.ProcessPoolExecutor", CountingPool):
+            results = list(
+                _normalized_artifacts(
+                    artifacts,
+                    catalog_path=catalog_path,
+                    indexed_at="2026-01-01T00:00:00+00:00",
+                    limit=1,
+                    workers=2,
+                )
+            )
+
+    assert len(results) == 1
+    assert len(submitted) == 2 * SEARCH_BUILD_INFLIGHT_PER_WORKER
+
+
 def test_build_reader_search_index_handles_late_non_null_optional_columns() -> None:
     with tempfile.TemporaryDirectory() as tmpdir:
         root = Path(tmpdir)
@@ -125,6 +326,59 @@ def test_build_reader_search_index_handles_late_non_null_optional_columns() -> N
         assert status["segment_count"] == SEARCH_LATE_OPTIONAL_COLUMN_SEGMENT_COUNT
 
 
+def test_reader_search_index_status_trusts_manifest_until_dataset_changes() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        dataset_path = root / "reader-search.lance"
+        versions_path = dataset_path / "_versions"
+        versions_path.mkdir(parents=True)
+        (versions_path / "1.manifest").write_bytes(b"")
+        _write_search_index_manifest(
+            dataset_path,
+            {
+                "segment_count": 3,
+                "work_count": 2,
+                "language_counts": {"grc": 1, "lat": 2},
+                "schema_version": "langnet.reader_search_index.v1",
+                "normalizer_version": "reader-search-normalizer-v1",
+                "catalog_path": str(root / "catalog.duckdb"),
+                "indexed_at": "2026-01-01T00:00:00+00:00",
+                "fts_indexes": ["search_text_idx"],
+            },
+            catalog_path=root / "catalog.duckdb",
+        )
+        scanned = {
+            "exists": True,
+            "segment_count": 4,
+            "language_counts": {"grc": 2, "lat": 2},
+            "fts_indexes": [],
+            "status_source": "scan",
+        }
+        clear_reader_search_index_status_cache()
+
+        with (
+            mock.patch("langnet.reader.search_index._load_lance"),
+            mock.patch(
+                "langnet.reader.search_index._scan_search_index_status",
+                return_value=scanned,
+            ) as scan,
+        ):
+            from_manifest = reader_search_index_status(dataset_path)
+            (versions_path / "2.manifest").write_bytes(b"")
+            stat = versions_path.stat()
+            os.utime(versions_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+            after_append = reader_search_index_status(dataset_path)
+            cached = reader_search_index_status(dataset_path)
+
+    assert from_manifest["status_source"] == "manifest"
+    assert from_manifest["segment_count"] == 3  # noqa: PLR2004
+    assert from_manifest["language_counts"] == {"grc": 1, "lat": 2}
+    assert after_append["status_source"] == "scan"
+    assert after_append["segment_count"] == SEARCH_APPENDED_SEGMENT_COUNT
+    assert cached == after_append
+    assert scan.call_count == 1
+
+
 def test_search_reader_segments_matches_folded_language_queries_and_filters() -> None:
     with tempfile.TemporaryDirectory() as tmpdir:
         root = Path(tmpdir)
@@ -209,6 +463,103 @@ def test_search_reader_segments_reads_context_from_book_artifacts() -> None:
         assert [row["text"] for row in item["context_after"]] == ["Canonical context after."]
 
 
+def test_context_windows_open_each_book_once_and_match_per_hit_lookups() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        catalog_path = root / "catalog.duckdb"
+        create_catalog_db(catalog_path)
+        _register_fixture_work(
+            root,
+            catalog_path,
+            work_id="lat.long",
+            collection_id="latin_fixture",
+            language="lat",
+            title="Long Work",
+            author="Latin Author",
+            source_id="lat_long",
+            segments=[
+                (f"long-{line}", str(line), f"Line {line}.", f"line {line}", line)
+                for line in range(1, CONTEXT_FIXTURE_LINES + 1)
+            ],
+        )
+        _register_fixture_work(
+            root,
+            catalog_path,
+            work_id="lat.short",
+            collection_id="latin_fixture",
+            language="lat",
+            title="Short Work",
+            author="Latin Author",
+            source_id="lat_short",
+            segments=[("short-1", "1", "Only line.", "only line", 1)],
+        )
+        hits = [
+            {"artifact_id": "lat.long.artifact", "work_id": "lat.long", "sort_key": 1},
+            {"artifact_id": "lat.long.artifact", "work_id": "lat.long", "sort_key": 4},
+            {"artifact_id": "lat.long.artifact", "work_id": "lat.long", "sort_key": 8},
+            {"artifact_id": "lat.long.artifact", "work_id": "lat.long", "sort_key": 99},
+            {"artifact_id": "lat.short.artifact", "work_id": "lat.short", "sort_key": 1},
+        ]
+        batched = [dict(hit) for hit in hits]
+        per_hit = [dict(hit) for hit in hits]
+
+        with (
+            duckdb.connect(":memory:") as conn,
+            mock.patch(
+                "langnet.reader.search_index.connect_reader_book",
+                side_effect=connect_reader_book,
+            ) as book_connect,
+        ):
+            _attach_context_windows(catalog_path, conn, root / "unused.lance", batched, context=2)
+            book_opens = book_connect.call_count
+        for item in per_hit:
+            book_path = root / "books" / f"{item['work_id'].replace('.', '_')}.duckdb"
+            with duckdb.connect(str(book_path), read_only=True) as book_conn:
+                _attach_book_context_by_sort_key(book_conn, item, context=2)
+
+    assert book_opens == len({hit["artifact_id"] for hit in hits})
+    assert batched == per_hit
+    assert [row["citation_path"] for row in batched[1]["context_before"]] == ["2", "3"]
+    assert [row["citation_path"] for row in batched[1]["context_after"]] == ["5", "6"]
+    assert batched[0]["context_before"] == []
+    assert [row["citation_path"] for row in batched[3]["context_before"]] == ["7", "8"]
+    assert batched[4]["context_before"] == batched[4]["context_after"] == []
+
+
+def test_context_windows_cross_sort_key_gaps_and_skip_tied_rows() -> None:
+    sort_keys = [1, 2, 3, 3, 40, 41, 42, 500]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        catalog_path = root / "catalog.duckdb"
+        create_catalog_db(catalog_path)
+        _register_fixture_work(
+            root,
+            catalog_path,
+            work_id="lat.sparse",
+            collection_id="latin_fixture",
+            language="lat",
+            title="Sparse Work",
+            author="Latin Author",
+            source_id="lat_sparse",
+            segments=[
+                (f"sparse-{index}", f"{index}", f"Line {index}.", f"line {index}", sort_key)
+                for index, sort_key in enumerate(sort_keys)
+            ],
+        )
+        hits = [
+            {"artifact_id": "lat.sparse.artifact", "work_id": "lat.sparse", "sort_key": 3},
+            {"artifact_id": "lat.sparse.artifact", "work_id": "lat.sparse", "sort_key": 41},
+        ]
+
+        with duckdb.connect(":memory:") as conn:
+            _attach_context_windows(catalog_path, conn, root / "unused.lance", hits, context=2)
+
+    assert [row["citation_path"] for row in hits[0]["context_before"]] == ["0", "1"]
+    assert [row["citation_path"] for row in hits[0]["context_after"]] == ["4", "5"]
+    assert [row["citation_path"] for row in hits[1]["context_before"]] == ["3", "4"]
+    assert [row["citation_path"] for row in hits[1]["context_after"]] == ["6", "7"]
+
+
 def test_search_reader_segments_resolves_repo_relative_book_artifacts() -> None:
     with tempfile.TemporaryDirectory() as tmpdir:
         root = Path(tmpdir)
@@ -358,6 +709,112 @@ def test_search_reader_segments_work_filter_recalls_deep_common_term_hits() -> N
         assert payload["items"][0]["citation_path"] == "4.5"
 
 
+def test_empty_prefiltered_search_grows_k_geometrically_up_to_cap() -> None:
+    ks: list[int] = []
+
+    def fake_page(*_args: object, k: int, **_kwargs: object) -> tuple[list[dict], int]:
+        ks.append(k)
+        return ([{"segment_id": "hit"}] if k >= 800 else [], k)  # noqa: PLR2004
+
+    strategy = {"attempts": 1, "capped": False}
+    strategy_capped = {"attempts": 1, "capped": False}
+    with (
+        mock.patch("langnet.reader.search_index._lance_fts_postfilter_page", side_effect=fake_page),
+        mock.patch("langnet.reader.search_index._dataset_row_count", return_value=10_000),
+    ):
+        rows = _expanding_postfilter_rows(
+            None,  # type: ignore[arg-type]
+            Path("reader-search.lance"),
+            "search_text",
+            "rare",
+            where="WHERE s.work_id = ?",
+            params=["work"],
+            start_k=50,
+            max_k=100_000,
+            limit=1,
+            offset=0,
+            strategy=strategy,
+        )
+        capped_rows = _expanding_postfilter_rows(
+            None,  # type: ignore[arg-type]
+            Path("reader-search.lance"),
+            "search_text",
+            "rare",
+            where="WHERE s.work_id = ?",
+            params=["work"],
+            start_k=50,
+            max_k=300,
+            limit=1,
+            offset=0,
+            strategy=strategy_capped,
+        )
+
+    assert rows == [{"segment_id": "hit"}]
+    assert ks == [200, 800, 200, 300]
+    assert strategy == {"attempts": 3, "capped": False, "strategy": "postfilter_expand", "k": 800}
+    assert capped_rows == []
+    assert strategy_capped["capped"] is True
+    assert strategy_capped["k"] == 300  # noqa: PLR2004
+
+
+def test_postfilter_expansion_stops_when_unfiltered_matches_run_out() -> None:
+    ks: list[int] = []
+
+    def fake_page(*_args: object, k: int, **_kwargs: object) -> tuple[list[dict], int]:
+        ks.append(k)
+        return [], 120
+
+    strategy = {"attempts": 1, "capped": False}
+    with (
+        mock.patch("langnet.reader.search_index._lance_fts_postfilter_page", side_effect=fake_page),
+        mock.patch("langnet.reader.search_index._dataset_row_count", return_value=10_000),
+    ):
+        rows = _expanding_postfilter_rows(
+            None,  # type: ignore[arg-type]
+            Path("reader-search.lance"),
+            "search_text",
+            "rare",
+            where="WHERE s.work_id = ?",
+            params=["work"],
+            start_k=50,
+            max_k=100_000,
+            limit=1,
+            offset=0,
+            strategy=strategy,
+        )
+
+    assert rows == []
+    assert ks == [200]
+    assert strategy == {"attempts": 2, "capped": False, "strategy": "postfilter_expand", "k": 200}
+
+
+def test_lance_fts_search_reports_strategy_for_each_query() -> None:
+    strategy_log: list[dict] = []
+    with (
+        mock.patch("langnet.reader.search_index._lance_fts_rows", return_value=[]),
+        mock.patch("langnet.reader.search_index._dataset_row_count", return_value=0),
+    ):
+        items = _lance_fts_search(
+            None,  # type: ignore[arg-type]
+            Path("reader-search.lance"),
+            "search_text",
+            "rare",
+            language="lat",
+            collection_id=None,
+            work_id="lat.work",
+            author_id=None,
+            group=None,
+            tag=None,
+            limit=5,
+            offset=0,
+            strategy_log=strategy_log,
+        )
+
+    assert items == []
+    assert [entry["strategy"] for entry in strategy_log] == ["postfilter_expand"]
+    assert strategy_log[0]["query"] == "rare"
+
+
 def test_search_reader_segments_fuzzy_expands_curated_concept_aliases() -> None:
     with tempfile.TemporaryDirectory() as tmpdir:
         root = Path(tmpdir)
@@ -506,6 +963,7 @@ def _register_fixture_work(  # noqa: PLR0913
     source_id: str,
     segments: list[tuple[str, str, str, str, int]],
     cts_work_urn: str | None = None,
+    source_hash: str = "hash",
 ) -> None:
     book_path = root / "books" / f"{source_id}.duckdb"
     create_book_db(book_path)
@@ -536,7 +994,7 @@ def _register_fixture_work(  # noqa: PLR0913
             artifact_path=book_path,
             source_path=edition.source_path,
             adapter="fixture",
-            source_hash="hash",
+            source_hash=source_hash,
             segment_count=len(segments),
             token_count=sum(len(text.split()) for _, _, text, _, _ in segments),
         ),
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import tempfile
 from dataclasses import replace
 from pathlib import Path
@@ -27,13 +28,22 @@ from langnet.reader.models import (
     ReaderWorkClassification,
     ReaderWorkMapNode,
 )
+from langnet.reader.pagination import decode_reader_cursor, encode_reader_cursor
 from langnet.reader.paths import reader_book_path, reader_catalog_path, reader_root
 from langnet.reader.storage import (
+    READER_BOOK_POOL,
+    READER_CATALOG_SNAPSHOT_ENV,
+    CatalogSnapshot,
     _book_has_address,
+    catalog_session,
+    catalog_snapshot,
     create_book_db,
     create_catalog_db,
     current_divisions_for_segment,
+    delete_reader_works,
     division_metadata_for_work,
+    enable_catalog_snapshot,
+    invalidate_catalog_snapshot,
     list_author_index,
     list_collections,
     list_discovery_group_summaries,
@@ -43,6 +53,7 @@ from langnet.reader.storage import (
     list_metadata_attributions,
     list_metadata_overlays,
     list_segments_for_work,
+    list_source_index,
     list_works,
     lookup_artifact_for_address,
     lookup_segment_by_address,
@@ -65,8 +76,12 @@ from langnet.reader.storage import (
     register_work_classifications,
     register_work_map_nodes,
     repair_work_languages,
+    resolve_work_ref,
+    segment_navigation,
+    source_index_sort_key,
     work_map_for_work,
 )
+from langnet.storage.db import DUCKDB_POOL_ENV
 
 ODYSSEY_FIXTURE_WORD_COUNT = 8
 CONTAINED_BHG_FIXTURE_WORD_COUNT = 4
@@ -79,6 +94,11 @@ AUTHOR_CANONICAL_PROMINENCE_SCORE = 100
 PYTHAGORAS_MERGED_WORK_COUNT = 2
 MANDANA_FIXTURE_WORK_COUNT = 2
 SANSKRIT_MEDICINE_FIXTURE_COUNT = 2
+CATALOG_SESSION_PAGE_SIZE = 50
+CATALOG_SESSION_MAX_QUERIES = 10
+BOOK_POOL_FIXTURE_LINES = 6
+KEYSET_FIXTURE_LINES = 7
+KEYSET_PAGE_SIZE = 3
 
 
 def _register_fixture_work(  # noqa: PLR0913
@@ -4499,6 +4519,124 @@ def test_shared_book_db_can_hold_multiple_work_artifacts() -> None:
     book_has_address.assert_not_called()
 
 
+def _register_indexed_fixture_work(
+    catalog_path: Path,
+    book_path: Path,
+    work_id: str,
+    *,
+    index: int,
+) -> None:
+    work = ReaderWork(
+        work_id=work_id,
+        collection_id="tlg",
+        language="grc",
+        title=f"Work {index}",
+        author="Homer",
+        author_id=None,
+        source_id=f"fixture.{index}",
+        cts_work_urn=None,
+    )
+    edition = ReaderEdition(
+        edition_id=f"{work_id}:edition",
+        work_id=work_id,
+        label="fixture",
+        language="grc",
+        source_path=book_path.parent / f"fixture-{index}.txt",
+        cts_edition_urn=None,
+    )
+    register_segment_rows(
+        book_path,
+        segments=[
+            ReaderSegment(
+                segment_id=f"{work_id}:1.1",
+                work_id=work_id,
+                edition_id=edition.edition_id,
+                segment_kind="line",
+                citation_path="1.1",
+                text=f"text {index}",
+                normalized_text=f"text {index}",
+                sort_key=index,
+            )
+        ],
+        addresses=[
+            ReaderSegmentAddress(
+                segment_id=f"{work_id}:1.1",
+                address=f"{work_id}:1.1",
+                address_kind="langnet",
+                citation_path="1.1",
+            ),
+            ReaderSegmentAddress(
+                segment_id=f"{work_id}:1.1",
+                address=f"fixture-ref-{index}",
+                address_kind="alias",
+                citation_path="1.1",
+            ),
+        ],
+        replace_work_id=work_id,
+        catalog_path=catalog_path,
+    )
+    register_book(
+        catalog_path,
+        work,
+        edition,
+        ReaderBookArtifact(
+            artifact_id=f"artifact-{index}",
+            work_id=work_id,
+            edition_id=edition.edition_id,
+            artifact_path=book_path,
+            source_path=edition.source_path,
+            adapter="fixture",
+            source_hash="hash",
+            segment_count=1,
+            token_count=2,
+        ),
+    )
+
+
+def test_catalog_address_index_resolves_without_probing_book_files() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        catalog_path = root / "catalog.duckdb"
+        shared_book_path = root / "books" / "shared.duckdb"
+        other_book_path = root / "books" / "other.duckdb"
+        _register_indexed_fixture_work(
+            catalog_path, shared_book_path, "langnet:reader:tlg:fixture.001", index=1
+        )
+        _register_indexed_fixture_work(
+            catalog_path, shared_book_path, "langnet:reader:tlg:fixture.002", index=2
+        )
+        _register_indexed_fixture_work(
+            catalog_path, other_book_path, "langnet:reader:tlg:fixture.003", index=3
+        )
+
+        with (
+            mock.patch("langnet.reader.storage._book_has_address") as book_has_address,
+            mock.patch("langnet.reader.storage._catalog_artifacts") as catalog_artifacts,
+        ):
+            scoped = lookup_segment_by_address(catalog_path, "langnet:reader:tlg:fixture.002:1.1")
+            unscoped = lookup_artifact_for_address(catalog_path, "fixture-ref-3")
+            missing = lookup_artifact_for_address(catalog_path, "fixture-ref-9")
+
+        delete_reader_works(catalog_path, ["langnet:reader:tlg:fixture.003"])
+        with duckdb.connect(str(catalog_path), read_only=True) as conn:
+            indexed_works = conn.execute(
+                "SELECT DISTINCT work_id FROM address_index ORDER BY work_id"
+            ).fetchall()
+
+    book_has_address.assert_not_called()
+    catalog_artifacts.assert_not_called()
+    assert scoped is not None
+    assert scoped["text"] == "text 2"
+    assert scoped["artifact"]["artifact_id"] == "artifact-2"
+    assert unscoped is not None
+    assert unscoped["artifact_path"] == str(other_book_path)
+    assert missing is None
+    assert indexed_works == [
+        ("langnet:reader:tlg:fixture.001",),
+        ("langnet:reader:tlg:fixture.002",),
+    ]
+
+
 def test_repair_work_languages_dry_run_uses_read_only_catalog_connection() -> None:
     with tempfile.TemporaryDirectory() as tmpdir:
         root = Path(tmpdir)
@@ -4550,3 +4688,341 @@ def test_repair_work_languages_uses_phi_source_family_after_author_overlay() ->
 
     assert result["candidate_count"] == 1
     assert result["repairs"][0]["to_language"] == "grc"
+
+
+def test_catalog_session_reuses_one_connection_for_a_contents_page() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        catalog_path = root / "catalog.duckdb"
+        work_id = "urn:cts:greekLit:tlg0012.tlg002"
+        _register_fixture_work(
+            catalog_path,
+            root,
+            work_id=work_id,
+            collection_id="tlg",
+            language="grc",
+            title="Odyssey",
+            author="Homer",
+            author_id="tlg0012",
+            source_id="tlg0012.tlg002",
+            canonical_text_id="ctsv2:greekLit:tlg0012.tlg002",
+        )
+        register_segment_rows(
+            root / "books" / "tlg0012_tlg002.duckdb",
+            segments=[
+                ReaderSegment(
+                    segment_id=f"{work_id}:1.{line}",
+                    work_id=work_id,
+                    edition_id=f"{work_id}:edition",
+                    segment_kind="line",
+                    citation_path=f"1.{line}",
+                    text=f"line {line}",
+                    normalized_text=f"line {line}",
+                    sort_key=line,
+                )
+                for line in range(1, CATALOG_SESSION_PAGE_SIZE + 1)
+            ],
+            addresses=[],
+        )
+        register_work_map_nodes(
+            catalog_path,
+            [
+                ReaderWorkMapNode(
+                    work_id=work_id,
+                    node_id="od-01",
+                    parent_node_id=None,
+                    level=1,
+                    kind="book",
+                    label="Book 1",
+                    native_label=None,
+                    ordinal=1,
+                    start_citation="1.1",
+                    end_citation=f"1.{CATALOG_SESSION_PAGE_SIZE}",
+                    provenance="curated",
+                    confidence="high",
+                    status="accepted",
+                    note="fixture",
+                    source_file="fixture",
+                    evidence=(
+                        ReaderMetadataOverlayEvidence(
+                            source_type="fixture",
+                            citation="fixture",
+                            label="fixture",
+                        ),
+                    ),
+                )
+            ],
+        )
+        opened: list[str] = []
+        real_connect = duckdb.connect
+
+        def counting_connect(database: str, *args: object, **kwargs: object):
+            opened.append(str(database))
+            return real_connect(database, *args, **kwargs)
+
+        def render_page() -> list[tuple[dict[str, object], list[dict[str, object]]]]:
+            rows = list_segments_for_work(catalog_path, work_id, limit=CATALOG_SESSION_PAGE_SIZE)
+            return [
+                (row, current_divisions_for_segment(catalog_path, work_id, row["citation_path"]))
+                for row in rows
+            ]
+
+        with mock.patch("langnet.reader.storage.duckdb.connect", side_effect=counting_connect):
+            unscoped = render_page()
+            unscoped_catalog_opens = opened.count(str(catalog_path))
+            opened.clear()
+            with catalog_session(catalog_path) as session:
+                scoped = render_page()
+                stats = session.stats()
+            scoped_catalog_opens = opened.count(str(catalog_path))
+
+    assert scoped == unscoped
+    assert len(scoped) == CATALOG_SESSION_PAGE_SIZE
+    assert scoped[0][0]["canonical_address"] == "ctsv2:greekLit:tlg0012.tlg002?ref=1.1"
+    assert [division["node_id"] for division in scoped[-1][1]] == ["od-01"]
+    assert unscoped_catalog_opens > CATALOG_SESSION_PAGE_SIZE
+    assert scoped_catalog_opens == 1
+    assert stats["connections_opened"] == 1
+    assert stats["queries"] < CATALOG_SESSION_MAX_QUERIES
+
+
+def test_catalog_snapshot_serves_browse_queries_until_catalog_changes() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        catalog_path = root / "catalog.duckdb"
+        _register_fixture_work(
+            catalog_path,
+            root,
+            work_id="urn:cts:greekLit:tlg0012.tlg001",
+            collection_id="tlg",
+            language="grc",
+            title="Iliad",
+            author="Homer",
+            author_id="tlg0012",
+            source_id="tlg0012.tlg001",
+            canonical_text_id="ctsv2:greekLit:tlg0012.tlg001",
+        )
+        opened: list[str] = []
+        real_connect = duckdb.connect
+
+        def counting_connect(database: str, *args: object, **kwargs: object):
+            opened.append(str(database))
+            return real_connect(database, *args, **kwargs)
+
+        with mock.patch.dict(os.environ, {READER_CATALOG_SNAPSHOT_ENV: "1"}):
+            try:
+                first = list_works(catalog_path, language="grc")
+                first[0]["title"] = "mutated by caller"
+                authors = list_author_index(catalog_path, language="grc")
+                resolve_work_ref(catalog_path, "ctsv2:greekLit:tlg0012.tlg001")
+                with mock.patch(
+                    "langnet.reader.storage.duckdb.connect", side_effect=counting_connect
+                ):
+                    warm = list_works(catalog_path, language="grc")
+                    warm_authors = list_author_index(catalog_path, language="grc")
+                    resolved = resolve_work_ref(catalog_path, "ctsv2:greekLit:tlg0012.tlg001")
+                warm_opens = list(opened)
+                _register_fixture_work(
+                    catalog_path,
+                    root,
+                    work_id="urn:cts:greekLit:tlg0012.tlg002",
+                    collection_id="tlg",
+                    language="grc",
+                    title="Odyssey",
+                    author="Homer",
+                    author_id="tlg0012",
+                    source_id="tlg0012.tlg002",
+                )
+                refreshed = list_works(catalog_path, language="grc")
+            finally:
+                invalidate_catalog_snapshot()
+
+    assert warm_opens == []
+    assert [row["title"] for row in warm] == ["Iliad"]
+    assert warm_authors == authors
+    assert resolved == "urn:cts:greekLit:tlg0012.tlg001"
+    assert [row["title"] for row in refreshed] == ["Iliad", "Odyssey"]
+
+
+def test_enable_catalog_snapshot_is_process_local_and_yields_to_the_env_var(
+    tmp_path: Path,
+) -> None:
+    catalog_path = tmp_path / "catalog.duckdb"
+    create_catalog_db(catalog_path)
+
+    with mock.patch.dict(os.environ, clear=False):
+        os.environ.pop(READER_CATALOG_SNAPSHOT_ENV, None)
+        try:
+            assert catalog_snapshot(catalog_path) is None
+            enable_catalog_snapshot()
+            assert catalog_snapshot(catalog_path) is not None
+            assert READER_CATALOG_SNAPSHOT_ENV not in os.environ
+            os.environ[READER_CATALOG_SNAPSHOT_ENV] = "0"
+            assert catalog_snapshot(catalog_path) is None
+        finally:
+            enable_catalog_snapshot(False)
+            invalidate_catalog_snapshot()
+
+
+def test_catalog_snapshot_keeps_only_most_recently_used_results() -> None:
+    snapshot = CatalogSnapshot(Path("catalog.duckdb"), (0,), max_results=2)
+    loads: list[str] = []
+
+    def load(query: str):
+        return lambda: loads.append(query) or [query]
+
+    snapshot.result(("list_works", "a"), load("a"))
+    snapshot.result(("list_works", "b"), load("b"))
+    snapshot.result(("list_works", "a"), load("a"))
+    snapshot.result(("list_works", "c"), load("c"))
+    snapshot.result(("list_works", "a"), load("a"))
+    snapshot.result(("list_works", "b"), load("b"))
+
+    assert loads == ["a", "b", "c", "b"]
+    assert snapshot.stats()["results"] == 2  # noqa: PLR2004
+    assert snapshot.stats()["result_evictions"] == 2  # noqa: PLR2004
+
+
+def test_reader_book_pool_reuses_book_handles_and_releases_them_for_writes() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        catalog_path = root / "catalog.duckdb"
+        work_id = "urn:cts:greekLit:tlg0012.tlg001"
+        book_path = root / "books" / "tlg0012_tlg001.duckdb"
+        _register_fixture_work(
+            catalog_path,
+            root,
+            work_id=work_id,
+            collection_id="tlg",
+            language="grc",
+            title="Iliad",
+            author="Homer",
+            author_id="tlg0012",
+            source_id="tlg0012.tlg001",
+        )
+
+        def register_lines(count: int) -> None:
+            register_segment_rows(
+                book_path,
+                segments=[
+                    ReaderSegment(
+                        segment_id=f"{work_id}:1.{line}",
+                        work_id=work_id,
+                        edition_id=f"{work_id}:edition",
+                        segment_kind="line",
+                        citation_path=f"1.{line}",
+                        text=f"line {line}",
+                        normalized_text=f"line {line}",
+                        sort_key=line,
+                    )
+                    for line in range(1, count + 1)
+                ],
+                addresses=[
+                    ReaderSegmentAddress(
+                        segment_id=f"{work_id}:1.{line}",
+                        address=f"{work_id}:1.{line}",
+                        address_kind="langnet",
+                        citation_path=f"1.{line}",
+                    )
+                    for line in range(1, count + 1)
+                ],
+                replace_work_id=work_id,
+            )
+
+        register_lines(BOOK_POOL_FIXTURE_LINES)
+        READER_BOOK_POOL.close_all()
+        before = READER_BOOK_POOL.stats()
+        with mock.patch.dict(os.environ, {DUCKDB_POOL_ENV: "1"}):
+            try:
+                pages = [
+                    list_segments_for_work(catalog_path, work_id, limit=2, offset=offset)
+                    for offset in range(0, BOOK_POOL_FIXTURE_LINES, 2)
+                ]
+                segment = lookup_segment_by_address(catalog_path, f"{work_id}:1.3")
+                assert segment is not None
+                navigation = segment_navigation(catalog_path, segment)
+                warm = READER_BOOK_POOL.stats()
+
+                register_lines(BOOK_POOL_FIXTURE_LINES + 1)
+                extended = list_segments_for_work(catalog_path, work_id, limit=100)
+            finally:
+                READER_BOOK_POOL.close_all()
+
+    assert [row["citation_path"] for page in pages for row in page] == [
+        f"1.{line}" for line in range(1, BOOK_POOL_FIXTURE_LINES + 1)
+    ]
+    assert navigation["previous"]["citation_path"] == "1.2"
+    assert navigation["next"]["citation_path"] == "1.4"
+    assert warm["opens"] - before["opens"] == 1
+    assert warm["hits"] - before["hits"] > BOOK_POOL_FIXTURE_LINES // 2
+    assert len(extended) == BOOK_POOL_FIXTURE_LINES + 1
+
+
+def test_keyset_cursors_page_segments_and_source_index_like_offsets() -> None:
+    with tempfile.TemporaryDirectory() as tmpdir:
+        root = Path(tmpdir)
+        catalog_path = root / "catalog.duckdb"
+        work_id = "urn:cts:greekLit:tlg0012.tlg001"
+        for fixture_id, title in [("tlg001", "Iliad"), ("tlg002", "Odyssey"), ("tlg003", "Hymns")]:
+            _register_fixture_work(
+                catalog_path,
+                root,
+                work_id=f"urn:cts:greekLit:tlg0012.{fixture_id}",
+                collection_id="tlg",
+                language="grc",
+                title=title,
+                author="Homer",
+                author_id="tlg0012",
+                source_id=f"tlg0012.{fixture_id}",
+            )
+        # Pairs of lines share a sort_key so the citation_path tie-break is exercised.
+        register_segment_rows(
+            root / "books" / "tlg0012_tlg001.duckdb",
+            segments=[
+                ReaderSegment(
+                    segment_id=f"{work_id}:1.{line}",
+                    work_id=work_id,
+                    edition_id=f"{work_id}:edition",
+                    segment_kind="line",
+                    citation_path=f"1.{line}",
+                    text=f"line {line}",
+                    normalized_text=f"line {line}",
+                    sort_key=(line + 1) // 2,
+                )
+                for line in range(1, KEYSET_FIXTURE_LINES + 1)
+            ],
+            addresses=[],
+            replace_work_id=work_id,
+        )
+
+        by_offset = list_segments_for_work(catalog_path, work_id, limit=100)
+        by_keyset: list[dict[str, object]] = []
+        cursor: str | None = None
+        while True:
+            page = decode_reader_cursor(cursor)
+            rows = list_segments_for_work(
+                catalog_path, work_id, limit=KEYSET_PAGE_SIZE, after=page.after
+            )
+            by_keyset.extend(rows)
+            if len(rows) < KEYSET_PAGE_SIZE:
+                break
+            cursor = encode_reader_cursor(
+                page.offset + len(rows), (rows[-1]["sort_key"], rows[-1]["citation_path"])
+            )
+
+        sources = list_source_index(catalog_path, limit=100)
+        first_sources = list_source_index(catalog_path, limit=2)
+        rest_sources = list_source_index(
+            catalog_path, limit=100, after=source_index_sort_key(first_sources[-1])
+        )
+
+    assert [row["citation_path"] for row in by_keyset] == [
+        row["citation_path"] for row in by_offset
+    ]
+    assert len(by_keyset) == KEYSET_FIXTURE_LINES
+    assert decode_reader_cursor(cursor).offset == KEYSET_PAGE_SIZE * 2
+    assert decode_reader_cursor("40").offset == 40  # noqa: PLR2004
+    assert decode_reader_cursor("k1.not-json").after is None
+    assert [row["work_id"] for row in first_sources + rest_sources] == [
+        row["work_id"] for row in sources
+    ]
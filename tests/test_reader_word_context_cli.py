@@ -217,7 +217,7 @@ def test_reader_word_context_cli_passes_lexical_evidence_provider() -> None:
             }
 
     with (
-        patch("langnet.cli._reader_service_from_context", return_value=FakeReaderService()),
+        patch("langnet.cli_reader._reader_service_from_context", return_value=FakeReaderService()),
         patch(
             "langnet.cli._reader_word_context_lexical_evidence_provider",
             return_value=lexical_provider,
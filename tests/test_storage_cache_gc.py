@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import duckdb
+from query_spec import ToolPlan, ToolResponseRef
+
+from langnet.clients.base import RawResponseEffect
+from langnet.execution.effects import ClaimEffect, DerivationEffect, ExtractionEffect
+from langnet.storage.cache_gc import (
+    CacheGcPolicy,
+    access_touch_due,
+    collect_garbage,
+    compact_cache,
+    touch_access,
+)
+from langnet.storage.claim_index import ClaimIndex
+from langnet.storage.derivation_index import DerivationIndex
+from langnet.storage.effects_index import RawResponseIndex, apply_schema
+from langnet.storage.extraction_index import ExtractionIndex
+from langnet.storage.plan_index import PlanIndex, PlanResponseIndex
+
+
+def _store_chain(conn: duckdb.DuckDBPyConnection, response_id: str, version: str) -> None:
+    RawResponseIndex(conn, schema_applied=True).store(
+        RawResponseEffect(
+            response_id=response_id,
+            tool="fetch.diogenes",
+            call_id=f"fetch-{response_id}",
+            endpoint="http://localhost:8888",
+            status_code=200,
+            content_type="text/html",
+            headers={},
+            body=f"<html>{response_id}</html>".encode(),
+        )
+    )
+    _store_effects(conn, response_id, version)
+
+
+def _store_effects(conn: duckdb.DuckDBPyConnection, response_id: str, version: str) -> None:
+    suffix = f"{response_id}-{version}"
+    ExtractionIndex(conn, schema_applied=True).store_effect(
+        ExtractionEffect(
+            extraction_id=f"ext-{suffix}",
+            tool="extract.diogenes.html",
+            call_id="extract",
+            source_call_id=f"fetch-{response_id}",
+            response_id=response_id,
+            kind="html",
+            canonical="lupus",
+            payload={},
+            handler_version=version,
+        )
+    )
+    DerivationIndex(conn, schema_applied=True).store_effect(
+        DerivationEffect(
+            derivation_id=f"drv-{suffix}",
+            tool="derive.diogenes.morph",
+            call_id="derive",
+            source_call_id="extract",
+            extraction_id=f"ext-{suffix}",
+            kind="morph",
+            canonical="lupus",
+            payload={},
+            handler_version=version,
+        )
+    )
+    ClaimIndex(conn, schema_applied=True).store_effect(
+        ClaimEffect(
+            claim_id=f"clm-{suffix}",
+            tool="claim.diogenes.morph",
+            call_id="claim",
+            source_call_id="derive",
+            derivation_id=f"drv-{suffix}",
+            subject="lupus",
+            predicate="has_lemmas",
+            value={},
+            provenance_chain=[],
+            handler_version=version,
+        )
+    )
+
+
+def _ids(conn: duckdb.DuckDBPyConnection, table: str, column: str) -> list[str]:
+    return [row[0] for row in conn.execute(f"SELECT {column} FROM {table} ORDER BY 1").fetchall()]
+
+
+def _seed(conn: duckdb.DuckDBPyConnection) -> None:
+    apply_schema(conn)
+    _store_chain(conn, "resp-live", "v2")
+    _store_effects(conn, "resp-live", "v1")
+    _store_chain(conn, "resp-expired", "v2")
+    _store_chain(conn, "resp-stray", "v2")
+    plans = PlanResponseIndex(conn)
+    for plan_hash, response_id in (("plan-live", "resp-live"), ("plan-old", "resp-expired")):
+        plans.upsert(
+            plan_hash=plan_hash,
+            plan_id=plan_hash,
+            response_refs=[
+                ToolResponseRef(tool="fetch.diogenes", call_id="fetch", response_id=response_id)
+            ],
+        )
+    conn.execute(
+        "UPDATE plan_response_index SET last_accessed = now()::TIMESTAMP - INTERVAL 200 DAY "
+        "WHERE plan_hash = 'plan-old'"
+    )
+    conn.execute("UPDATE raw_response_index SET created_at = now()::TIMESTAMP - INTERVAL 2 DAY")
+
+
+def test_collect_garbage_walks_the_provenance_chain() -> None:
+    conn = duckdb.connect(database=":memory:")
+    _seed(conn)
+
+    report = collect_garbage(
+        conn,
+        CacheGcPolicy(
+            handler_versions={"extract.diogenes.html": "v2", "derive.diogenes.morph": "v2"}
+        ),
+    )
+
+    assert _ids(conn, "plan_response_index", "plan_hash") == ["plan-live"]
+    assert _ids(conn, "raw_response_index", "response_id") == ["resp-live"]
+    assert _ids(conn, "extraction_index", "extraction_id") == ["ext-resp-live-v2"]
+    assert _ids(conn, "claims", "claim_id") == ["clm-resp-live-v2"]
+    assert _ids(conn, "raw_response_body_ref", "response_id") == ["resp-live"]
+    assert report.deleted["raw_response_index"] == 2  # noqa: PLR2004
+    assert report.deleted["raw_response_body"] == 2  # noqa: PLR2004
+    assert report.remaining["claims"] == 1
+
+
+def test_collect_garbage_dry_run_rolls_back() -> None:
+    conn = duckdb.connect(database=":memory:")
+    _seed(conn)
+
+    report = collect_garbage(conn, CacheGcPolicy(), dry_run=True)
+
+    assert report.deleted["plan_response_index"] == 1
+    assert len(_ids(conn, "raw_response_index", "response_id")) == 3  # noqa: PLR2004
+
+
+def test_max_rows_keeps_most_recently_used_entries() -> None:
+    conn = duckdb.connect(database=":memory:")
+    _seed(conn)
+
+    collect_garbage(
+        conn,
+        CacheGcPolicy(ttl_days={}, max_rows={"plan_response_index": 1}, sweep_orphans=False),
+    )
+
+    assert _ids(conn, "plan_response_index", "plan_hash") == ["plan-live"]
+
+
+def test_access_touch_is_throttled() -> None:
+    conn = duckdb.connect(database=":memory:")
+    _seed(conn)
+
+    assert access_touch_due(conn, "plan_response_index", "plan-old")
+    assert not access_touch_due(conn, "plan_response_index", "plan-live")
+    assert not access_touch_due(conn, "plan_response_index", "plan-missing")
+    assert touch_access(conn, "plan_response_index", ["plan-old"]) == 1
+    assert not access_touch_due(conn, "plan_response_index", "plan-old")
+
+
+def test_plan_index_hit_refreshes_last_accessed() -> None:
+    conn = duckdb.connect(database=":memory:")
+    apply_schema(conn)
+    plans = PlanIndex(conn)
+    plans.upsert("query-hot", "lupus", "lat", ToolPlan(plan_id="plan-hot"))
+    conn.execute("UPDATE query_plan_index SET last_accessed = now()::TIMESTAMP - INTERVAL 200 DAY")
+
+    assert plans.get("query-hot") is not None
+    assert not access_touch_due(conn, "query_plan_index", "query-hot")
+    collect_garbage(conn, CacheGcPolicy(sweep_orphans=False))
+    assert _ids(conn, "query_plan_index", "query_hash") == ["query-hot"]
+
+
+def test_compact_cache_rewrite_keeps_rows(tmp_path) -> None:
+    path = tmp_path / "langnet.duckdb"
+    with duckdb.connect(str(path)) as conn:
+        _seed(conn)
+
+    report = compact_cache(path, rewrite=True)
+
+    assert report.rewritten
+    with duckdb.connect(str(path), read_only=True) as conn:
+        assert len(_ids(conn, "claims", "claim_id")) == 4  # noqa: PLR2004
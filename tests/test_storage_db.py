@@ -1,14 +1,24 @@
 from __future__ import annotations
 
 import os
+import threading
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest import mock
 
 import duckdb
+import pytest
 from filelock import FileLock, Timeout
 
-from langnet.storage.db import connect_duckdb
+from langnet.storage.db import (
+    READ_ONLY_POOL,
+    PooledDatabaseBusyError,
+    ReadOnlyConnectionPool,
+    connect_duckdb,
+    connect_duckdb_pooled,
+    duckdb_pool_stats,
+)
+from langnet.storage.pooling import enable_duckdb_pool
 
 EXPECTED_TRANSIENT_LOCK_CONNECT_ATTEMPTS = 2
 
@@ -62,3 +72,123 @@ def test_connect_duckdb_retries_transient_duckdb_lock_error() -> None:
 
     assert attempts == EXPECTED_TRANSIENT_LOCK_CONNECT_ATTEMPTS
     assert row == (1,)
+
+
+def _write_table(db_path: Path, value: int) -> None:
+    with duckdb.connect(str(db_path)) as conn:
+        conn.execute("CREATE OR REPLACE TABLE t AS SELECT ? AS a", [value])
+
+
+def test_read_only_pool_reuses_one_handle_per_path(tmp_path) -> None:
+    db_path = tmp_path / "lex.duckdb"
+    _write_table(db_path, 1)
+    pool = ReadOnlyConnectionPool()
+    rows: list[int] = []
+
+    def read() -> None:
+        for _ in range(10):
+            with pool.connect(db_path) as conn:
+                rows.append(conn.execute("SELECT a FROM t").fetchone()[0])
+
+    threads = [threading.Thread(target=read) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = pool.stats()
+    assert rows == [1] * 40
+    assert stats["opens"] == 1
+    assert stats["hits"] == 39  # noqa: PLR2004
+    assert stats["leased"] == 0
+    pool.close_all()
+
+
+def test_read_only_pool_reopens_after_file_is_rebuilt(tmp_path) -> None:
+    db_path = tmp_path / "lex.duckdb"
+    _write_table(db_path, 1)
+    pool = ReadOnlyConnectionPool()
+    with pool.connect(db_path) as conn:
+        assert conn.execute("SELECT a FROM t").fetchone() == (1,)
+
+    pool.release(db_path)
+    db_path.unlink()
+    _write_table(db_path, 2)
+
+    with pool.connect(db_path) as conn:
+        assert conn.execute("SELECT a FROM t").fetchone() == (2,)
+    assert pool.stats()["opens"] == 2  # noqa: PLR2004
+    pool.close_all()
+
+
+def test_read_only_pool_detects_replacement_without_release(tmp_path) -> None:
+    db_path = tmp_path / "lex.duckdb"
+    staged = tmp_path / "staged.duckdb"
+    _write_table(db_path, 1)
+    _write_table(staged, 2)
+    pool = ReadOnlyConnectionPool()
+    with pool.connect(db_path) as conn:
+        conn.execute("SELECT a FROM t").fetchone()
+
+    staged.replace(db_path)
+
+    with pool.connect(db_path) as conn:
+        assert conn.execute("SELECT a FROM t").fetchone() == (2,)
+    assert pool.stats()["reopens"] == 1
+    pool.close_all()
+
+
+def test_read_only_pool_refuses_stale_handle_while_a_cursor_is_out(tmp_path) -> None:
+    db_path = tmp_path / "lex.duckdb"
+    staged = tmp_path / "staged.duckdb"
+    _write_table(db_path, 1)
+    _write_table(staged, 2)
+    pool = ReadOnlyConnectionPool(drain_timeout_seconds=0.05)
+    with pool.connect(db_path) as held:
+        staged.replace(db_path)
+        with pytest.raises(PooledDatabaseBusyError), pool.connect(db_path):
+            pass
+        with pytest.raises(PooledDatabaseBusyError):
+            pool.release(db_path)
+        assert held.execute("SELECT a FROM t").fetchone() == (1,)
+
+    with pool.connect(db_path) as conn:
+        assert conn.execute("SELECT a FROM t").fetchone() == (2,)
+    assert pool.stats()["opens"] == 2  # noqa: PLR2004
+    pool.close_all()
+
+
+def test_read_write_connect_releases_pooled_read_only_handle(tmp_path, monkeypatch) -> None:
+    monkeypatch.setenv("LANGNET_DUCKDB_POOL", "1")
+    db_path = tmp_path / "lex.duckdb"
+    _write_table(db_path, 1)
+    with connect_duckdb_pooled(db_path) as conn:
+        conn.execute("SELECT a FROM t").fetchone()
+
+    with connect_duckdb(db_path, read_only=False, lock=False) as conn:
+        conn.execute("INSERT INTO t VALUES (3)")
+
+    with connect_duckdb_pooled(db_path) as conn:
+        assert conn.execute("SELECT count(*) FROM t").fetchone() == (2,)
+
+
+def test_enable_duckdb_pool_pools_without_touching_environment(tmp_path, monkeypatch) -> None:
+    monkeypatch.delenv("LANGNET_DUCKDB_POOL", raising=False)
+    db_path = tmp_path / "lex.duckdb"
+    _write_table(db_path, 1)
+    opens = duckdb_pool_stats()["opens"]
+    enable_duckdb_pool()
+    try:
+        with connect_duckdb_pooled(db_path) as conn:
+            conn.execute("SELECT a FROM t").fetchone()
+        assert duckdb_pool_stats()["opens"] == opens + 1
+        assert "LANGNET_DUCKDB_POOL" not in os.environ
+
+        monkeypatch.setenv("LANGNET_DUCKDB_POOL", "0")
+        READ_ONLY_POOL.release(db_path)
+        with connect_duckdb_pooled(db_path) as conn:
+            conn.execute("SELECT a FROM t").fetchone()
+        assert duckdb_pool_stats()["opens"] == opens + 1
+    finally:
+        enable_duckdb_pool(False)
+        READ_ONLY_POOL.release(db_path)
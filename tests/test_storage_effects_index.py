@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import duckdb
+
+from langnet.clients.base import RawResponseEffect
+from langnet.storage.effects_index import (
+    BODY_CODEC_IDENTITY,
+    RawResponseIndex,
+    apply_schema,
+    decode_raw_body,
+    encode_raw_body,
+)
+
+HTML_BODY = b"<html><body>" + b"<div class='entry'>lupus, i, m. wolf</div>" * 200 + b"</body>"
+
+
+def _effect(response_id: str, body: bytes = HTML_BODY) -> RawResponseEffect:
+    return RawResponseEffect(
+        response_id=response_id,
+        tool="fetch.diogenes",
+        call_id=f"call-{response_id}",
+        endpoint="http://localhost:8888/Diogenes.cgi",
+        status_code=200,
+        content_type="text/html",
+        headers={"content-type": "text/html"},
+        body=body,
+    )
+
+
+def test_raw_response_bodies_are_stored_once_and_compressed() -> None:
+    conn = duckdb.connect(database=":memory:")
+    index = RawResponseIndex(conn)
+
+    index.store(_effect("resp-1"))
+    index.store_many([_effect("resp-2"), _effect("resp-3", body=b"short")])
+
+    body_rows = conn.execute(
+        "SELECT codec, size_bytes, stored_bytes FROM raw_response_body ORDER BY size_bytes"
+    ).fetchall()
+    assert len(body_rows) == 2  # noqa: PLR2004
+    assert body_rows[0] == (BODY_CODEC_IDENTITY, 5, 5)
+    assert body_rows[1][2] < body_rows[1][1]
+    inline = conn.execute("SELECT count(*) FROM raw_response_index WHERE body IS NOT NULL")
+    assert inline.fetchone() == (0,)
+
+    loaded = index.get("resp-2")
+    assert loaded is not None
+    assert loaded.body == HTML_BODY
+    assert loaded.headers == {"content-type": "text/html"}
+    short = index.get("resp-3")
+    assert short is not None
+    assert short.body == b"short"
+
+
+def test_raw_response_get_reads_rows_with_inline_bodies() -> None:
+    conn = duckdb.connect(database=":memory:")
+    apply_schema(conn)
+    conn.execute(
+        """
+        INSERT INTO raw_response_index
+        (response_id, tool, call_id, endpoint, status_code, content_type, headers, body)
+        VALUES ('legacy', 'fetch.heritage', 'call-legacy', 'http://h', 200, 'text/html', '{}', ?)
+        """,
+        [b"<html>legacy</html>"],
+    )
+
+    loaded = RawResponseIndex(conn, schema_applied=True).get("legacy")
+
+    assert loaded is not None
+    assert loaded.body == b"<html>legacy</html>"
+
+
+def test_encode_raw_body_round_trips() -> None:
+    codec, stored = encode_raw_body(HTML_BODY)
+
+    assert codec != BODY_CODEC_IDENTITY
+    assert decode_raw_body(codec, stored) == HTML_BODY
@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import time
 from pathlib import Path
 from typing import cast
 
+import pytest
 import requests
 
 from langnet.clients import (
@@ -69,6 +71,19 @@ def test_http_tool_client_accepts_explicit_timeout() -> None:
     assert fake_session.timeout == CUSTOM_HTTP_TIMEOUT
 
 
+def test_http_tool_client_caps_timeout_at_its_deadline() -> None:
+    fake_session = _FakeSession(_FakeResponse(b"ok"))
+    client = HttpToolClient(tool="dummy", session=cast(requests.Session, fake_session))
+
+    client.deadline = time.monotonic() + CUSTOM_HTTP_TIMEOUT
+    client.execute(call_id="call-1", endpoint="http://example.com")
+    assert 0 < fake_session.timeout <= CUSTOM_HTTP_TIMEOUT
+
+    client.deadline = time.monotonic() - 1
+    with pytest.raises(requests.Timeout):
+        client.execute(call_id="call-2", endpoint="http://example.com")
+
+
 def test_file_tool_client_reads_bytes(tmp_path: Path) -> None:
     path = tmp_path / "sample.txt"
     path.write_text("hello", encoding="utf-8")
@@ -3,7 +3,9 @@ from __future__ import annotations
 import json
 import os
 import sys
-from collections.abc import Mapping
+import threading
+import time
+from collections.abc import Mapping, Sequence
 from pathlib import Path
 from types import SimpleNamespace
 from typing import Any, cast
@@ -11,7 +13,11 @@ from unittest.mock import patch
 
 import duckdb
 
-from langnet.cli import _openrouter_translation_callback, _translation_model_candidates
+from langnet.cli import (
+    _create_translation_completion_with_model_fallback,
+    _openrouter_translation_callback,
+    _translation_model_candidates,
+)
 from langnet.reduction import reduce_claims
 from langnet.translation import (
     BASE_SYSTEM,
@@ -23,6 +29,12 @@ from langnet.translation import (
     project_cached_translations,
     translation_cache_status_counts,
 )
+from langnet.translation.scheduler import (
+    TokenBucket,
+    TranslationRunAbandoned,
+    TranslationScheduler,
+    translation_request_timeout,
+)
 from langnet.translation.structured import structured_translation_user_content
 
 TRANSLATION_DURATION_MS = 7
@@ -30,6 +42,8 @@ ORIGINAL_TRIPLE_COUNT = 2
 EXPECTED_RETRY_CALL_COUNT = 2
 EXPECTED_DICO_SEGMENT_BATCH_LIMIT = 900
 FIXTURE_PATH = Path("tests/fixtures/translation_cache_golden_rows.json")
+STUB_TRANSLATION_LATENCY_SECONDS = 0.1
+CONCURRENT_PROJECTION_COUNT = 8
 
 
 def _gaffiot_claim() -> Mapping[str, Any]:
@@ -2260,3 +2274,204 @@ def test_golden_translation_row_does_not_project_for_stale_source_text() -> None
 
     assert len(triples) == ORIGINAL_TRIPLE_COUNT
     assert all(triple.get("object") != "wolf" for triple in triples)
+
+
+class _CountingTranslationCache(TranslationCache):
+    def __init__(self, conn: duckdb.DuckDBPyConnection) -> None:
+        super().__init__(conn)
+        self.upserts = 0
+        self.batches: list[int] = []
+
+    def upsert(self, record: TranslationRecord) -> str:
+        self.upserts += 1
+        return super().upsert(record)
+
+    def upsert_many(self, records: Sequence[TranslationRecord]) -> list[str]:
+        self.batches.append(len(records))
+        return super().upsert_many(records)
+
+
+def _gaffiot_claims(count: int) -> list[Mapping[str, Any]]:
+    return [
+        _claim_from_fixture_row(
+            {
+                "source_lexicon": "gaffiot",
+                "entry_id": f"gaffiot_{index}",
+                "occurrence": 1,
+                "headword_norm": f"lupus{index}",
+                "source_ref": f"gaffiot:gaffiot_{index}",
+                "source_text": f"loup numéro {index}",
+            }
+        )
+        for index in range(count)
+    ]
+
+
+def test_translation_population_overlaps_slow_translator_calls() -> None:
+    cache = _CountingTranslationCache(duckdb.connect(database=":memory:"))
+    claims = _gaffiot_claims(CONCURRENT_PROJECTION_COUNT)
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def translate(projection) -> str:
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(STUB_TRANSLATION_LATENCY_SECONDS)
+        with lock:
+            active -= 1
+        return projection.source_text.replace("loup numéro", "wolf number")
+
+    started = time.perf_counter()
+    written = populate_missing_translations(
+        claims=claims,
+        language="lat",
+        model="test:model",
+        cache=cache,
+        translate=translate,
+        scheduler=TranslationScheduler(max_workers=4, rate_per_second=0),
+    )
+    elapsed = time.perf_counter() - started
+
+    assert written == CONCURRENT_PROJECTION_COUNT
+    assert peak > 1
+    assert elapsed < STUB_TRANSLATION_LATENCY_SECONDS * CONCURRENT_PROJECTION_COUNT
+    assert cache.batches == [CONCURRENT_PROJECTION_COUNT]
+    assert cache.upserts == 0
+    assert translation_cache_status_counts(
+        claims=claims, language="lat", model="test:model", cache=cache
+    ) == {"total": 8, "hits": 8, "missing": 0, "errors": 0, "empty": 0}
+
+
+def test_translation_population_records_deadline_misses_as_errors() -> None:
+    cache = TranslationCache(duckdb.connect(database=":memory:"))
+    claims = _gaffiot_claims(3)
+
+    def translate(projection) -> str:
+        if "numéro 1" in projection.source_text:
+            time.sleep(STUB_TRANSLATION_LATENCY_SECONDS * 5)
+        return "wolf"
+
+    written = populate_missing_translations(
+        claims=claims,
+        language="lat",
+        model="test:model",
+        cache=cache,
+        translate=translate,
+        raise_on_error=False,
+        scheduler=TranslationScheduler(
+            max_workers=3,
+            rate_per_second=0,
+            timeout_seconds=STUB_TRANSLATION_LATENCY_SECONDS,
+        ),
+    )
+    errors = cache.conn.execute(
+        "SELECT entry_id, error FROM entry_translations WHERE status = 'error'"
+    ).fetchall()
+
+    assert written == len(claims) - 1
+    assert [entry_id for entry_id, _ in errors] == ["gaffiot_1"]
+    assert "deadline" in errors[0][1]
+
+
+def test_translation_scheduler_passes_remaining_time_to_model_calls() -> None:
+    scheduler = TranslationScheduler(max_workers=1, rate_per_second=0, timeout_seconds=5)
+    timeouts: list[float | None] = []
+
+    def job(item: str, deadline: float | None) -> None:
+        scheduler.limited(lambda _item: timeouts.append(translation_request_timeout()), deadline)(
+            item
+        )
+
+    list(scheduler.run(["lupus"], job))
+
+    assert timeouts[0] is not None
+    assert 0 < timeouts[0] <= 5  # noqa: PLR2004
+    assert translation_request_timeout() is None
+
+
+def test_translation_scheduler_refuses_model_calls_after_run_is_abandoned() -> None:
+    scheduler = TranslationScheduler(max_workers=2, rate_per_second=0, timeout_seconds=0)
+    slow_started = threading.Event()
+    release = threading.Event()
+    finished = threading.Event()
+    calls: list[str] = []
+    refused: list[Exception] = []
+
+    def job(item: str, deadline: float | None) -> str:
+        call = scheduler.limited(calls.append, deadline)
+        if item == "slow":
+            slow_started.set()
+            try:
+                release.wait(5)
+                call(item)
+            except TranslationRunAbandoned as exc:
+                refused.append(exc)
+            finally:
+                finished.set()
+            return item
+        slow_started.wait(5)
+        call(item)
+        return item
+
+    outcomes = scheduler.run(["fast", "slow"], job)
+    first, _ = next(outcomes)
+    outcomes.close()
+    release.set()
+
+    assert first == "fast"
+    assert finished.wait(5)
+    assert calls == ["fast"]
+    assert len(refused) == 1
+
+
+def test_translation_fallback_passes_scheduler_deadline_as_request_timeout() -> None:
+    timeouts: list[float | None] = []
+
+    class FakeCompletions:
+        def create(
+            self,
+            *,
+            model: str,
+            messages: list[dict[str, str]],
+            timeout: float | None = None,
+        ) -> object:
+            timeouts.append(timeout)
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content="wolf"))]
+            )
+
+    scheduler = TranslationScheduler(max_workers=1, rate_per_second=0, timeout_seconds=5)
+
+    def create(_item: str) -> object:
+        return _create_translation_completion_with_model_fallback(
+            FakeCompletions(), model_candidates=["test:model"], request_kwargs={"messages": []}
+        )
+
+    def job(item: str, deadline: float | None) -> object:
+        return scheduler.limited(create, deadline)(item)
+
+    list(scheduler.run(["lupus"], job))
+    create("lupus")
+
+    assert timeouts[0] is not None
+    assert 0 < timeouts[0] <= 5  # noqa: PLR2004
+    assert timeouts[1] is None
+
+
+def test_token_bucket_paces_calls_after_burst() -> None:
+    now = [0.0]
+    sleeps: list[float] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+        now[0] += seconds
+
+    bucket = TokenBucket(2.0, 2, clock=lambda: now[0], sleep=sleep)
+
+    assert all(bucket.acquire() for _ in range(4))
+    assert sleeps == [0.5, 0.5]
+    assert not bucket.acquire(deadline=now[0] + 0.1)
+    assert TokenBucket(0.0).acquire(deadline=0.0)
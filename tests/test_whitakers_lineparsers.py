@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+from typing import cast
+
+from lark import Lark
+
 from langnet.parsing.whitakers import CodesReducer, FactsReducer, SensesReducer
+from langnet.parsing.whitakers.lineparsers import _grammar, _reduce_sense_line
 
 
 def test_whitaker_senses_reducer_parses_senses_and_notes() -> None:
@@ -39,3 +44,42 @@ def test_whitaker_facts_reducer_parses_verb_features() -> None:
         "person": "1",
         "number": "S",
     }
+
+
+def test_whitaker_lalr_parsers_match_earley_grammars() -> None:
+    samples = {
+        SensesReducer: [
+            "rose; rose bush [poetic];",
+            "Caesar; (Julian gens cognomen); [Gaius Julius ~ => general/dictator, 100-44 BC];",
+        ],
+        CodesReducer: [
+            "in  PREP  ABL   [XXXAX]",
+            "lupus, lupi  N (2nd) M   [XXXAX]    lesser",
+            "Caesar, Caesaris  N (3rd) M   [XXXAX]",
+            "[XXXAO]",
+        ],
+        FactsReducer: [
+            "lup.us               N      2 1 NOM S M          rare",
+            "amat.us              VPAR   1 1 NOM S M PERF PASSIVE PPL",
+            "un.us                NUM    1 1 NOM S M CARD",
+            "am.are               V      1 1 PRES ACTIVE  INF 0 X",
+            "bene                 ADV    POS",
+        ],
+    }
+
+    for reducer, lines in samples.items():
+        earley = Lark(_grammar(reducer.parser.grammar))
+        for line in lines:
+            assert reducer.reduce(line) == reducer.xformer.transform(earley.parse(line)), line
+
+
+def test_whitaker_reduce_memoizes_lines_but_returns_fresh_copies() -> None:
+    line = "wolf; grappling iron;"
+    _reduce_sense_line.cache_clear()
+
+    first = SensesReducer.reduce(line)
+    cast(list[str], first["senses"]).append("mutated")
+    second = SensesReducer.reduce(line)
+
+    assert second == {"senses": ["wolf", "grappling iron"]}
+    assert _reduce_sense_line.cache_info().hits == 1
@@ -0,0 +1,180 @@
+from __future__ import annotations
+
+from collections.abc import Mapping
+from pathlib import Path
+from typing import cast
+
+import orjson
+from query_spec import ToolStage
+
+from langnet.clients.base import RawResponseEffect
+from langnet.databuild.base import BuildStatus
+from langnet.databuild.whitakers import WhitakersBuildConfig, WhitakersBuilder
+from langnet.execution.clients import WhitakerNativeFetchClient
+from langnet.execution.handlers.whitakers import _parse_whitaker_output, extract_lines
+from langnet.whitakers.morphology import NATIVE_INCOMPLETE_STATUS, WhitakerMorphology
+from tests.claim_contract import make_call
+
+DICTLINE_ROWS = [
+    ("lup", "lup", "", "", "N      2 1 M T          X X X A X wolf; grappling iron;"),
+    ("am", "am", "amav", "amat", "V      1 1 X            X X X A O love, like; be fond of;"),
+    ("ros", "ros", "", "", "N      1 1 F T          X X X A X rose; rose bush [poetic];"),
+]
+INFLECTS = """\
+-- nouns
+N      1 1 NOM S C  1 1 a         X A
+N      1 1 GEN S C  2 2 ae        X A
+N      1 1 ABL S C  2 1 a         X A
+N      2 1 NOM S C  1 2 us        X A
+N      2 1 GEN S C  2 1 i         X A
+N      2 1 ACC S C  2 2 um        X A
+-- verbs
+V      1 1 PRES ACTIVE  IND  1 S  1 1 o         X A
+V      1 1 PRES ACTIVE  INF  0 X  2 3 are       X A
+V      1 1 IMPF ACTIVE  SUB  1 S  2 4 arem      X A
+V      0 0 PERF ACTIVE  IND  1 S  3 1 i         X A
+VPAR   0 0 NOM S M PERF PASSIVE PPL 4 2 us    X A
+"""
+ADDONS = """\
+-- enclitics
+TACKON que
+-que = and (enclitic, translated before attached word);
+"""
+
+
+def _build(tmp_path: Path) -> Path:
+    source = tmp_path / "DICTLINE.GEN"
+    lines = [f"{s1:<19}{s2:<19}{s3:<19}{s4:<19}{tail}\n" for s1, s2, s3, s4, tail in DICTLINE_ROWS]
+    source.write_text("".join(lines), encoding="utf-8")
+    (tmp_path / "INFLECTS.LAT").write_text(INFLECTS, encoding="utf-8")
+    (tmp_path / "ADDONS.LAT").write_text(ADDONS, encoding="utf-8")
+    output = tmp_path / "lex_whitakers.duckdb"
+    result = WhitakersBuilder(
+        WhitakersBuildConfig(source_path=source, output_path=output, wipe_existing=True)
+    ).build()
+    assert result.status == BuildStatus.SUCCESS, result.message
+    return output
+
+
+def _morphology(tmp_path: Path) -> WhitakerMorphology:
+    morphology = WhitakerMorphology.from_path(_build(tmp_path))
+    assert morphology is not None
+    return morphology
+
+
+def test_analyze_joins_stems_and_endings(tmp_path: Path) -> None:
+    morphology = _morphology(tmp_path)
+
+    words = morphology.analyze("amarem")
+
+    assert len(words) == 1
+    assert words[0]["terms"] == [
+        {
+            "part_of_speech": "verb",
+            "term": "am.arem",
+            "term_analysis": {"stem": "am", "ending": "arem"},
+            "conjugation": "1",
+            "variant": "1",
+            "tense": "IMPF",
+            "voice": "ACTIVE",
+            "mood": "SUB",
+            "person": "1",
+            "number": "S",
+        }
+    ]
+    assert words[0]["codeline"] == {
+        "term": "amo, amare, amavi, amatus",
+        "pos_code": "V",
+        "declension": "1st",
+        "freq": "A",
+        "source": "O",
+    }
+    assert words[0]["senses"] == ["love, like", "be fond of"]
+
+
+def test_analyze_uses_entry_gender_and_tackons(tmp_path: Path) -> None:
+    morphology = _morphology(tmp_path)
+
+    rosa = morphology.analyze("rosa")
+    lupumque = morphology.analyze("Lupumque")
+
+    assert [term["case"] for term in rosa[0]["terms"]] == ["NOM", "ABL"]
+    assert {term["gender"] for term in rosa[0]["terms"]} == {"F"}
+    assert rosa[0]["notes"] == ["poetic"]
+    assert [word["terms"][0]["term"] for word in lupumque] == ["lup.um", "que"]
+    assert morphology.analyze("xyzzy") == []
+
+
+def test_rendered_text_parses_to_the_same_words(tmp_path: Path) -> None:
+    morphology = _morphology(tmp_path)
+
+    for form in ("amarem", "rosa", "lupi", "amavi"):
+        words = morphology.analyze(form)
+        assert words
+        assert _parse_whitaker_output(morphology.render(words)) == words
+
+
+def test_native_fetch_client_feeds_extract_without_reparsing(tmp_path: Path) -> None:
+    morphology = _morphology(tmp_path)
+    raw = WhitakerNativeFetchClient(morphology).execute(
+        call_id="ww-1", endpoint="", params={"word": "lupus"}
+    )
+    call = make_call(
+        "extract.whitakers.lines",
+        "ww-ext-1",
+        cast(ToolStage, ToolStage.TOOL_STAGE_EXTRACT),
+        params={"source_call_id": "ww-1"},
+    )
+
+    extraction = extract_lines(call, raw)
+
+    assert extraction.canonical == "lupus"
+    assert extraction.payload["wordlist"] == morphology.analyze("lupus")
+    assert extraction.payload["raw_text"].startswith("lup.us")
+
+
+class _BinaryClient:
+    tool = "fetch.whitakers"
+
+    def __init__(self) -> None:
+        self.words: list[str] = []
+
+    def execute(
+        self, call_id: str, endpoint: str, params: Mapping[str, str] | None = None
+    ) -> RawResponseEffect:
+        word = (params or {}).get("word", "")
+        self.words.append(word)
+        return RawResponseEffect(
+            response_id="binary",
+            tool=self.tool,
+            call_id=call_id,
+            endpoint=endpoint,
+            status_code=0,
+            content_type="text/plain",
+            headers={},
+            body=b"",
+        )
+
+
+def test_native_fetch_client_hands_unanalyzed_forms_to_the_binary(tmp_path: Path) -> None:
+    morphology = _morphology(tmp_path)
+    binary = _BinaryClient()
+    client = WhitakerNativeFetchClient(morphology, fallback=binary)
+
+    native = client.execute(call_id="ww-1", endpoint="", params={"word": "lupus"})
+    fallback = client.execute(call_id="ww-2", endpoint="", params={"word": "xyzzy"})
+
+    assert native.content_type != "text/plain"
+    assert fallback.response_id == "binary"
+    assert binary.words == ["xyzzy"]
+
+
+def test_native_fetch_client_marks_empty_analysis_incomplete(tmp_path: Path) -> None:
+    client = WhitakerNativeFetchClient(_morphology(tmp_path))
+
+    found = client.execute(call_id="ww-1", endpoint="", params={"word": "lupus"})
+    empty = client.execute(call_id="ww-2", endpoint="", params={"word": "xyzzy"})
+
+    assert "incomplete" not in orjson.loads(found.body)
+    assert empty.status_code == NATIVE_INCOMPLETE_STATUS
+    assert orjson.loads(empty.body)["incomplete"] is True
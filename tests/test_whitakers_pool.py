@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from langnet.execution.clients import WhitakerFetchClient
+from langnet.whitakers.pool import WhitakerPool, poolable_form
+
+FAKE_WORDS = """#!/usr/bin/env python3
+import os
+import sys
+
+with open(sys.argv[0] + ".starts", "a", encoding="utf-8") as log:
+    log.write(f"{os.getpid()}\\n")
+if len(sys.argv) > 1:
+    sys.stdout.write(f"oneshot {' '.join(sys.argv[1:])}\\n")
+    sys.exit(0)
+sys.stdout.write("WORDS banner\\n")
+while True:
+    sys.stdout.write("=>")
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line.strip():
+        break
+    word = line.strip()
+    sys.stdout.write(f"\\n{word}.us  N 2 1 NOM S M\\n{word}  [XXXAX] :: {word}\\n\\n")
+"""
+
+
+def _fake_binary(tmp_path: Path, source: str = FAKE_WORDS) -> Path:
+    script = tmp_path / "whitakers-words"
+    script.write_text(source, encoding="utf-8")
+    script.chmod(0o755)
+    return script
+
+
+def _starts(script: Path) -> int:
+    log = Path(f"{script}.starts")
+    return len(log.read_text(encoding="utf-8").splitlines()) if log.exists() else 0
+
+
+def test_pool_answers_each_form_and_reuses_workers(tmp_path: Path) -> None:
+    script = _fake_binary(tmp_path)
+    words = ["lupus", "amo", "#param", "rosa", "arma", "virum"]
+
+    with WhitakerPool(str(script), workers=2) as pool:
+        answers = [pool.lookup(word) for word in words]
+        again = pool.lookup("cano")
+
+    assert answers[0] == b"lupus.us  N 2 1 NOM S M\nlupus  [XXXAX] :: lupus\n"
+    assert answers[2] == b"oneshot #param\n"
+    assert [answer.split(b".", 1)[0] for answer in answers[3:]] == [b"rosa", b"arma", b"virum"]
+    assert again.startswith(b"cano.us")
+    assert _starts(script) == 2  # noqa: PLR2004 - one reused worker plus the one-shot "#param"
+
+
+def test_pool_falls_back_when_binary_is_not_interactive(tmp_path: Path) -> None:
+    script = _fake_binary(
+        tmp_path,
+        "#!/usr/bin/env python3\nimport sys\nsys.stdout.write(' '.join(sys.argv[1:]) + '\\n')\n",
+    )
+
+    with WhitakerPool(str(script), workers=2, startup_timeout=2.0) as pool:
+        answers = [pool.lookup("lupus"), pool.lookup("amo")]
+
+    assert answers == [b"lupus\n", b"amo\n"]
+    assert pool.disabled
+
+
+def test_whitaker_fetch_client_uses_pool(tmp_path: Path) -> None:
+    script = _fake_binary(tmp_path)
+
+    with WhitakerPool(str(script), workers=1) as pool:
+        client = WhitakerFetchClient(str(script), pool=pool)
+        effect = client.execute(call_id="ww-call", endpoint="", params={"word": "lupus"})
+
+    assert effect.tool == "fetch.whitakers"
+    assert effect.call_id == "ww-call"
+    assert effect.endpoint == f"{script} lupus"
+    assert effect.body.startswith(b"lupus.us")
+
+
+def test_poolable_form_rejects_session_commands() -> None:
+    assert poolable_form("lupus")
+    assert not poolable_form("")
+    assert not poolable_form("#trim")
+    assert not poolable_form("lupus\namo")
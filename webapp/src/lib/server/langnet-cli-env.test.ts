@@ -1,6 +1,11 @@
 import assert from 'node:assert/strict';
 import path from 'node:path';
-import { buildCliEnvironment, resolveCliDirectory } from './langnet-cli';
+import {
+	buildCliEnvironment,
+	cliWorkerArgv,
+	resolveCliDirectory,
+	resolveCliWorkerUrl
+} from './langnet-cli';
 
 const env = buildCliEnvironment({
 	HOME: '/home/learner',
@@ -32,3 +37,17 @@ assert.equal(
 	}),
 	'/opt/langnet-cli'
 );
+
+assert.equal(resolveCliWorkerUrl({}), undefined);
+assert.equal(
+	resolveCliWorkerUrl({ LANGNET_CLI_WORKER_URL: 'http://127.0.0.1:8765/' }),
+	'http://127.0.0.1:8765'
+);
+assert.deepEqual(cliWorkerArgv(['cli', 'word-index', 'list', 'lat', '--output', 'json']), [
+	'word-index',
+	'list',
+	'lat',
+	'--output',
+	'json'
+]);
+assert.equal(cliWorkerArgv(['cli', 'word-of-day', 'lat']), undefined);
@@ -92,6 +92,64 @@ export function buildCliEnvironment(baseEnv: NodeJS.ProcessEnv = process.env): N
 	};
 }
 
+const cliWorkerCommands = new Set([
+	'encounter',
+	'reader',
+	'word-index',
+	'paradigm',
+	'translation-cache'
+]);
+
+export function resolveCliWorkerUrl(env: NodeJS.ProcessEnv = process.env): string | undefined {
+	const raw = env.LANGNET_CLI_WORKER_URL?.trim();
+	return raw ? raw.replace(/\/+$/, '') : undefined;
+}
+
+export function cliWorkerArgv(args: string[]): string[] | undefined {
+	if (args[0] !== 'cli' || !cliWorkerCommands.has(args[1] ?? '')) return undefined;
+	return args.slice(1);
+}
+
+export async function runCliWorkerJsonCommand(
+	workerUrl: string,
+	argv: string[],
+	timeoutMs: number,
+	options: CliCommandOptions & { label?: string } = {}
+): Promise<JsonObject> {
+	const label = options.label ?? 'langnet-cli';
+	const signals = [AbortSignal.timeout(timeoutMs)];
+	if (options.signal) signals.push(options.signal);
+	let response: Response;
+	try {
+		response = await fetch(`${workerUrl}/v1/run`, {
+			method: 'POST',
+			headers: { 'content-type': 'application/json' },
+			body: JSON.stringify({ argv, stdin: options.stdin ?? '' }),
+			signal: AbortSignal.any(signals)
+		});
+	} catch (error) {
+		if (options.signal?.aborted) throw abortError();
+		if (error instanceof Error && error.name === 'TimeoutError') {
+			throw new Error(`${label} timed out after ${Math.round(timeoutMs / 1000)}s`);
+		}
+		throw error;
+	}
+	const envelope = (await response.json().catch(() => null)) as JsonObject | null;
+	if (!envelope || !response.ok) {
+		throw new Error(stringValue(envelope?.error) || `${label} worker returned ${response.status}`);
+	}
+	const code = typeof envelope.exit_code === 'number' ? envelope.exit_code : 1;
+	const stdout = stringValue(envelope.stdout);
+	const stderr = stringValue(envelope.stderr);
+	const parsed = parseJsonFromOutput(stdout);
+
+	if (code !== 0 && parsed) {
+		throw new Error(errorMessageFromPayload(parsed) || stderr.trim() || `${label} exited ${code}`);
+	}
+	if (!parsed) throw new Error(stderr.trim() || stdout.trim() || `${label} did not return JSON`);
+	return parsed;
+}
+
 export function resolveCliDirectory(
 	cwd: string = process.cwd(),
 	env: NodeJS.ProcessEnv = process.env
@@ -366,6 +424,14 @@ async function runJsonCommand(
 	timeoutMs: number,
 	options: CliCommandOptions = {}
 ): Promise<JsonObject> {
+	// The serve worker handles concurrent requests itself; only spawned CLIs share the queue.
+	const workerUrl = resolveCliWorkerUrl();
+	const workerArgv = workerUrl ? cliWorkerArgv(args) : undefined;
+	if (workerUrl && workerArgv) {
+		if (options.signal?.aborted) throw abortError();
+		return await runCliWorkerJsonCommand(workerUrl, workerArgv, timeoutMs, options);
+	}
+
 	if (options.queued === false) {
 		if (options.signal?.aborted) throw abortError();
 		return await runJsonCommandUnlocked(args, timeoutMs, options);
@@ -23,7 +23,13 @@ import {
 	readerProductCatalogs,
 	resolveReaderCatalogChoice
 } from '$lib/reader';
-import { buildCliEnvironment, resolveCliDirectory } from './langnet-cli';
+import {
+	buildCliEnvironment,
+	cliWorkerArgv,
+	resolveCliDirectory,
+	resolveCliWorkerUrl,
+	runCliWorkerJsonCommand
+} from './langnet-cli';
 import { readerCatalogCache } from './reader-cache';
 
 type JsonValue = null | boolean | number | string | JsonValue[] | { [key: string]: JsonValue };
@@ -748,6 +754,15 @@ async function runReaderJsonCommandWithoutCatalog(
 }
 
 async function runJustJsonCommand(args: string[], options: ReaderCliOptions): Promise<JsonObject> {
+	const workerUrl = resolveCliWorkerUrl();
+	const workerArgv = workerUrl ? cliWorkerArgv(args) : undefined;
+	if (workerUrl && workerArgv) {
+		return runCliWorkerJsonCommand(workerUrl, workerArgv, options.timeoutMs ?? defaultTimeoutMs, {
+			signal: options.signal,
+			label: 'langnet reader command'
+		});
+	}
+
 	return new Promise((resolve, reject) => {
 		if (options.signal?.aborted) {
 			reject(abortError());